@@ -6,12 +6,15 @@ import builtins
 import numpy as np
 import sys
 import inspect
+import importlib
 import os
 from collections.abc import Sequence
 
 
 import ivy.utils.backend.handler
 from ivy.utils import check_for_binaries
+from ivy.utils import _thread_modes
+from ivy.utils._thread_modes import ModeStack
 from ivy._version import __version__ as __version__
 
 _not_imported_backends = list(ivy.utils.backend.handler._backend_dict.keys())
@@ -582,10 +585,10 @@ class Node(str):
     pass
 
 
-array_significant_figures_stack = []
-array_decimal_values_stack = []
-warning_level_stack = []
-nan_policy_stack = []
+array_significant_figures_stack = ModeStack()
+array_decimal_values_stack = ModeStack()
+warning_level_stack = ModeStack()
+nan_policy_stack = ModeStack()
 dynamic_backend_stack = []
 warn_to_regex = {"all": "!.*", "ivy_only": "^(?!.*ivy).*$", "none": ".*"}
 
@@ -782,25 +785,39 @@ from . import stateful
 from .stateful import *
 from ivy.utils.inspection import fn_array_spec, add_array_specs
 
-add_array_specs()
+# the array specs used by the instance methods are inspected when first needed,
+# and the XLA engine and the compiler are imported when first accessed
+_lazy_attrs = {
+    "xla": ("ivy.engines", "XLA"),
+    "ivy2xla": ("ivy.engines", "ivy2xla"),
+    "transpile": ("ivy.compiler.compiler", "transpile"),
+    "trace_graph": ("ivy.compiler.compiler", "trace_graph"),
+    "unify": ("ivy.compiler.compiler", "unify"),
+}
 
-_imported_frameworks_before_compiler = list(sys.modules.keys())
 
-try:
-    from .engines import XLA as xla
-    from .engines import ivy2xla
-except:
-    pass
-try:
-    from .compiler.compiler import transpile, trace_graph, unify
-except:  # noqa: E722
-    pass  # Added for the finally statment
-finally:
-    # Skip framework imports done by Ivy compiler for now
-    for backend_framework in _not_imported_backends.copy():
-        if backend_framework in sys.modules:
-            if backend_framework not in _imported_frameworks_before_compiler:
+def __getattr__(name):
+    if name not in _lazy_attrs:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = _lazy_attrs[name]
+    imported_modules = sys.modules.copy()
+    try:
+        attr = getattr(importlib.import_module(module_name), attr_name)
+    except ImportError as e:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}, importing"
+            f" {module_name} failed: {e}"
+        ) from e
+    finally:
+        # skip the framework imports done by the engines and the compiler
+        for backend_framework in _not_imported_backends.copy():
+            if (
+                backend_framework in sys.modules
+                and backend_framework not in imported_modules
+            ):
                 _not_imported_backends.remove(backend_framework)
+    globals()[name] = attr
+    return attr
 
 
 # add instance methods to Ivy Array and Container
@@ -945,6 +962,8 @@ globals_vars = GlobalsDict(
         "show_func_wrapper_trace_mode_stack": (
             general.show_func_wrapper_trace_mode_stack
         ),
+        "fused_dispatch_mode_stack": general.fused_dispatch_mode_stack,
+        "container_parallelism_stack": general.container_parallelism_stack,
         "min_denominator_stack": general.min_denominator_stack,
         "min_base_stack": general.min_base_stack,
         "tmp_dir_stack": general.tmp_dir_stack,
@@ -1422,6 +1441,9 @@ GLOBAL_PROPS = [
     "inplace_mode",
     "exception_trace_mode",
     "show_func_wrapper_trace_mode",
+    "fused_dispatch_mode",
+    "container_parallelism",
+    "container_parallel_min_size",
     "min_denominator",
     "min_base",
     "queue_timeout",
@@ -1490,17 +1512,41 @@ class LoggingMode:
 
 class IvyWithGlobalProps(sys.modules[__name__].__class__):
     def __setattr__(self, name, value, internal=False):
-        previous_frame = inspect.currentframe().f_back
-        filename = inspect.getframeinfo(previous_frame)[0]
-        internal = internal and _is_from_internal(filename)
+        if internal:
+            # the file name of the code object, as getframeinfo would also read the
+            # source lines of the caller on every call
+            filename = inspect.currentframe().f_back.f_code.co_filename
+            internal = _is_from_internal(filename)
         if not internal and name in GLOBAL_PROPS:
             raise ivy.utils.exceptions.IvyException(
                 f"Property: {name} is read only! Please use the setter: set_{name}()"
                 " for setting its value!"
             )
+        props = _thread_modes.local_props(self)
+        if props is not None and name in props:
+            props[name] = value
+            return
         self.__dict__[name] = value
 
 
+def _global_prop(name):
+    # the global property, as seen by the calling thread, see ivy.utils._thread_modes
+    def _get(self):
+        props = _thread_modes.local_props(self)
+        if props is not None and name in props:
+            return props[name]
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    return property(_get)
+
+
+for _name in GLOBAL_PROPS:
+    setattr(IvyWithGlobalProps, _name, _global_prop(_name))
+
+
 if (
     "ivy" in sys.modules.keys()
     and sys.modules["ivy"].utils._importlib.IS_COMPILING_WITH_BACKEND
@@ -8,6 +8,7 @@ from typing import Optional
 
 # local
 import ivy
+from ivy.utils.backend.handler import _register_dynamic_backend_obj
 from .conversions import args_to_native, to_ivy
 from .activations import _ArrayWithActivations
 from .creation import _ArrayWithCreation
@@ -165,6 +166,8 @@ class Array(
             self._dynamic_backend = dynamic_backend
         else:
             self._dynamic_backend = ivy.dynamic_backend
+        if self._dynamic_backend:
+            _register_dynamic_backend_obj(self)
         self.weak_type = False  # to handle 0-D jax front weak typed arrays
 
     def _view_attributes(self, data):
@@ -209,6 +212,7 @@ class Array(
                 self._data = ivy.array(np_data).data
 
             self._backend = ivy.backend
+            _register_dynamic_backend_obj(self)
 
         self._dynamic_backend = value
 
@@ -471,6 +475,8 @@ class Array(
         ivy.previous_backend()
 
         self.__dict__ = ivy_array.__dict__
+        if self._dynamic_backend:
+            _register_dynamic_backend_obj(self)
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
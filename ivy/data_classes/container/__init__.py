@@ -3,14 +3,12 @@
 # global
 import colorama
 
-try:
-    # noinspection PyPackageRequirements
-    import h5py
-except ModuleNotFoundError:
-    h5py = None
-
 # local
+from ivy.utils.dynamic_import import lazy_import
 from .wrapping import add_ivy_container_instance_methods  # noqa
 from .container import ContainerBase, Container  # noqa
 
+# noinspection PyPackageRequirements
+h5py = lazy_import("h5py")
+
 colorama.init(strip=False)
@@ -1,9 +1,11 @@
 """Base Container Object."""
 
 # global
+import concurrent.futures
 import inspect
 from itertools import chain
 import re
+import threading
 import abc
 import copy
 import termcolor
@@ -11,23 +13,24 @@ import numpy as np
 import json
 
 from ivy.utils.exceptions import IvyBackendException, IvyException
+from ivy.utils.backend.handler import _register_dynamic_backend_obj
+from ivy.utils import _thread_modes
+from ivy.utils.dynamic_import import lazy_import
 
-
-try:
-    # noinspection PyPackageRequirements
-    import h5py
-except ModuleNotFoundError:
-    h5py = None
 import pickle
 import random
 from operator import mul
-from functools import reduce as _reduce
+from types import FunctionType
+from functools import lru_cache, reduce as _reduce, wraps
 from typing import Union, Tuple
 from builtins import set
 
 # local
 import ivy
 
+# noinspection PyPackageRequirements
+h5py = lazy_import("h5py")
+
 
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
@@ -47,6 +50,276 @@ def _repr(x):
         return str(x)
 
 
+# elementwise functions which are applied once to each buffer of packed containers
+# rather than once to each of their leaves, these preserve the shape of their inputs
+# and, for most inputs, their dtype
+# fmt: off
+_PACKED_FN_NAMES = {
+    "abs", "acos", "acosh", "add", "asin", "asinh", "atan", "atan2", "atanh",
+    "bitwise_and", "bitwise_invert", "bitwise_left_shift", "bitwise_or",
+    "bitwise_right_shift", "bitwise_xor", "ceil", "cos", "cosh", "divide", "exp",
+    "gcd", "exp2", "expm1", "floor", "floor_divide", "fmin", "multiply", "log",
+    "log10", "log1p", "log2", "logaddexp", "logaddexp2", "nan_to_num", "negative",
+    "positive", "pow", "remainder", "round", "sign", "sin", "sinh", "sqrt", "square",
+    "subtract", "tan", "tanh", "trunc", "erf", "maximum", "minimum", "reciprocal",
+    "deg2rad", "rad2deg", "trunc_divide", "fmod", "lcm", "relu", "leaky_relu",
+    "gelu", "sigmoid", "softplus", "mish", "hardswish", "clip", "stable_divide",
+    "stable_pow",
+}
+# fmt: on
+
+
+class _ContainerPacking:
+    """
+    The contiguous buffers of a packed container, one per dtype and device.
+
+    The layout holds the dtype and device of each buffer, and the key chain, buffer
+    index, offset and shape of each leaf in iteration order. Leaves holds each leaf
+    with its data when the container was packed, to detect it being modified.
+    """
+
+    def __init__(self, layout, buffers, leaves):
+        self.layout = layout
+        self.buffers = buffers
+        self.leaves = leaves
+
+
+# the first bytes of files saved by cont_to_disk_as_mmap
+_MMAP_MAGIC = b"IVYMMAP1"
+
+
+def _align(offset, alignment):
+    return -(-offset // alignment) * alignment
+
+
+def _h5_dataset_mmap(dataset):
+    # a copy-on-write memory map of the data of a contiguous and uncompressed
+    # dataset, or None if its data isn't stored as one block in the file
+    if dataset.chunks is not None or dataset.dtype.hasobject:
+        return None
+    offset = dataset.id.get_offset()
+    if offset is None:
+        return None
+    return np.memmap(
+        dataset.file.filename,
+        mode="c",
+        dtype=dataset.dtype,
+        offset=offset,
+        shape=dataset.shape,
+    )
+
+
+@lru_cache(maxsize=64)
+def _packed_segment_ids(layout, idx, backend):
+    # the index, among the leaves in buffer idx, of the leaf each element belongs to
+    groups, entries = layout
+    sizes = [_reduce(mul, shape, 1) for _, i, _, shape in entries if i == idx]
+    segment_ids = np.repeat(np.arange(len(sizes), dtype=np.int64), sizes)
+    return ivy.asarray(segment_ids, device=groups[idx][1]), len(sizes)
+
+
+# attributes of a container which aren't shared with the containers derived from it
+_CONT_INSTANCE_ATTRS = {
+    "_queues",
+    "_container_combine_method",
+    "_loaded_containers_from_queues",
+    "_queue_load_sizes_cum",
+    "_queue_timeout",
+    "_dynamic_backend",
+    "_backend",
+    "_cont_ivy",
+    "_cont_packing",
+}
+
+
+@lru_cache(maxsize=1024)
+def _fn_supports_out(fn):
+    # whether fn takes an out argument, inspected once per function
+    return inspect.signature(fn).parameters.get("out") is not None
+
+
+def _key_chain_tree(key_chains):
+    # the key chains as a nested dict of their keys, with True at their last keys
+    tree = dict()
+    for key_chain in key_chains:
+        keys = re.split("[/.]", key_chain)
+        node = tree
+        for key in keys[:-1]:
+            node = node.setdefault(key, dict())
+            if node is True:
+                break
+        else:
+            node[keys[-1]] = True
+    return tree
+
+
+def _cont_structure(cont, leaves):
+    # the keys of cont and of its sub-containers, with None in place of each leaf,
+    # collecting the leaves in the order of the key chains
+    structure = list()
+    for k, v in cont.items():
+        if isinstance(v, ivy.Container):
+            structure.append((k, _cont_structure(v, leaves)))
+        else:
+            structure.append((k, None))
+            leaves.append(v)
+    return tuple(structure)
+
+
+@lru_cache(maxsize=256)
+def _cont_structure_key_chains(structure, prefix=""):
+    # the key chain of each leaf of the structure, in the order of its leaves
+    key_chains = list()
+    for k, sub in structure:
+        key_chain = k if prefix == "" else prefix + "/" + k
+        if sub is None:
+            key_chains.append(key_chain)
+        else:
+            key_chains.extend(_cont_structure_key_chains(sub, key_chain))
+    return tuple(key_chains)
+
+
+def _conts_leaves(conts):
+    # the structure shared by the containers, and the leaves of each of them, or
+    # None if their structures differ
+    leaves0 = list()
+    structure = _cont_structure(conts[0], leaves0)
+    conts_leaves = [leaves0]
+    for cont in conts[1:]:
+        leaves = list()
+        if _cont_structure(cont, leaves) != structure:
+            return None
+        conts_leaves.append(leaves)
+    return structure, conts_leaves
+
+
+def _sum_leaves(leaves, device, start):
+    # the sum of the leaves moved to the device, added to start, with one stack and
+    # one sum when they are arrays of the same shape
+    leaves = [ivy.to_device(x, device) for x in leaves]
+    if (
+        all(isinstance(x, ivy.Array) for x in leaves)
+        and len({tuple(x.shape) for x in leaves}) == 1
+    ):
+        stacked = ivy.stack(leaves)
+        return start + ivy.sum(stacked, axis=0, dtype=stacked.dtype)
+    return sum(leaves, start=start)
+
+
+# the pools of threads which large leaves are dispatched to, by number of threads
+_leaf_pools = dict()
+_leaf_pool_state = threading.local()
+
+
+def _mark_leaf_pool_thread():
+    # containers mapped within the threads of the pools are mapped sequentially, so
+    # that the threads never wait on each other
+    _leaf_pool_state.sequential = True
+
+
+def _sequential_leaves(fn):
+    # fn wrapped so that the containers mapped while it runs in the calling thread
+    # are mapped sequentially, as are those mapped while the functions it returns
+    # run, such as the functions computing gradients, as the tapes of the backends
+    # only record the calls made on their own thread
+    @wraps(fn)
+    def _sequential_fn(*args, **kwargs):
+        prev = getattr(_leaf_pool_state, "sequential", False)
+        _leaf_pool_state.sequential = True
+        try:
+            ret = fn(*args, **kwargs)
+        finally:
+            _leaf_pool_state.sequential = prev
+        if isinstance(ret, FunctionType):
+            return _sequential_leaves(ret)
+        return ret
+
+    return _sequential_fn
+
+
+def _leaf_size(x):
+    # the number of elements of the array x, the largest number of elements of the
+    # arrays in the sequence x, or 0
+    if isinstance(x, (list, tuple)):
+        return max((_leaf_size(v) for v in x), default=0)
+    if isinstance(x, ivy.Array):
+        x = x._data
+    elif isinstance(x, dict):
+        return 0
+    shape = getattr(x, "shape", None)
+    if shape is None:
+        return 0
+    try:
+        return _reduce(mul, shape, 1)
+    except TypeError:
+        return 0
+
+
+class _LeafDispatcher:
+    # fn applied to the small leaves in the calling thread, and submitted to the
+    # pool of threads for the leaves with at least min_size elements, in which case
+    # the future of its result is returned. The threads each apply fn with their own
+    # copy of the modes of the calling thread, as the ivy functions set and unset
+    # modes such as the default device while they run
+    def __init__(self, fn, pool, min_size):
+        self.fn = fn
+        self._pool = pool
+        self._min_size = min_size
+        self._modes = _thread_modes.mode_snapshot()
+
+    def _fn_with_modes(self, x, key_chain):
+        with _thread_modes.local_modes(self._modes):
+            return self.fn(x, key_chain)
+
+    def __call__(self, x, key_chain):
+        if _leaf_size(x) >= self._min_size:
+            return self._pool.submit(self._fn_with_modes, x, key_chain)
+        return self.fn(x, key_chain)
+
+
+def _leaf_dispatcher(fn):
+    # fn wrapped with a _LeafDispatcher if ivy.set_container_parallelism is set,
+    # otherwise None
+    num_threads = ivy.container_parallelism
+    if (
+        num_threads <= 1
+        or isinstance(fn, _LeafDispatcher)
+        or getattr(_leaf_pool_state, "sequential", False)
+    ):
+        return None
+    pool = _leaf_pools.get(num_threads)
+    if pool is None:
+        pool = _leaf_pools.setdefault(
+            num_threads,
+            concurrent.futures.ThreadPoolExecutor(
+                num_threads,
+                thread_name_prefix="ivy_container",
+                initializer=_mark_leaf_pool_thread,
+            ),
+        )
+    return _LeafDispatcher(fn, pool, ivy.container_parallel_min_size)
+
+
+def _leaf_result(x):
+    # the result of a leaf dispatched by a _LeafDispatcher
+    return x.result() if isinstance(x, concurrent.futures.Future) else x
+
+
+def _cont_from_structure(structure, values, template, prune_empty=True):
+    # the container with the structure, holding the next values of the iterator
+    # values, without the sub-containers left empty as cont_multi_map does unless
+    # prune_empty is False, and derived from the template container
+    return_dict = dict()
+    for k, sub in structure:
+        if sub is None:
+            return_dict[k] = next(values)
+        else:
+            ret = _cont_from_structure(sub, values, template, prune_empty)
+            if ret or not prune_empty:
+                return_dict[k] = ret
+    return template._cont_derived(return_dict)
+
+
 # noinspection PyMissingConstructor
 
 
@@ -141,6 +414,8 @@ class ContainerBase(dict, abc.ABC):
             self._dynamic_backend = dynamic_backend
         else:
             self._dynamic_backend = ivy.dynamic_backend
+        if self._dynamic_backend:
+            _register_dynamic_backend_obj(self)
         if dict_in is None:
             if kwargs:
                 dict_in = dict(**kwargs)
@@ -180,29 +455,40 @@ class ContainerBase(dict, abc.ABC):
         out=None,
         **kwargs,
     ) -> Union[Tuple[ivy.Container, ivy.Container], ivy.Container]:
+        if (
+            key_chains is None
+            and to_apply is True
+            and not prune_unapplied
+            and not map_sequences
+            and out is None
+            and (fn if isinstance(fn, str) else getattr(fn, "__name__", None))
+            in _PACKED_FN_NAMES
+        ):
+            ret = ContainerBase._cont_packed_map(fn, args, kwargs)
+            if ret is not None:
+                return ret
         inspect_fn = fn
         if isinstance(fn, str):
             inspect_fn = ivy.__dict__[fn]
-        # retrieve indices where leaves of args are also nested
-        arg_cont_idxs = ivy.nested_argwhere(
-            args, ivy.is_ivy_container, to_ignore=ivy.Container
-        )
-        # retrieve indices where leaves of kwargs are also nested
-        kwarg_cont_idxs = ivy.nested_argwhere(
-            kwargs, ivy.is_ivy_container, to_ignore=ivy.Container
-        )
+        # flatten args and kwargs once, with the containers as leaves, the plans
+        # then rebuild them around the leaves of the containers for each key chain
+        arg_leaves, arg_plan = ivy.flatten_nest(args, to_ignore=ivy.Container)
+        kwarg_leaves, kwarg_plan = ivy.flatten_nest(kwargs, to_ignore=ivy.Container)
 
         # retrieve all the containers in args
-        arg_conts = ivy.multi_index_nest(args, arg_cont_idxs)
+        arg_cont_pos = [
+            i for i, x in enumerate(arg_leaves) if isinstance(x, ivy.Container)
+        ]
+        arg_conts = [arg_leaves[i] for i in arg_cont_pos]
         num_arg_conts = len(arg_conts)
 
         # retrieve all the containers in kwargs
-        kwarg_conts = ivy.multi_index_nest(kwargs, kwarg_cont_idxs)
+        kwarg_cont_pos = [
+            i for i, x in enumerate(kwarg_leaves) if isinstance(x, ivy.Container)
+        ]
+        kwarg_conts = [kwarg_leaves[i] for i in kwarg_cont_pos]
         # Combine the retrieved containers from args and kwargs into a single list
-        with_out = (
-            inspect.signature(inspect_fn).parameters.get("out") is not None
-            and out is not None
-        )
+        with_out = out is not None and _fn_supports_out(inspect_fn)
         if with_out:
             out_conts = [out]
             num_out_conts = 1
@@ -229,12 +515,14 @@ class ContainerBase(dict, abc.ABC):
             if with_out:
                 out = vals[-num_out_conts:]
                 del vals[-num_out_conts:]
-            arg_vals = vals[:num_arg_conts]
-            a = ivy.copy_nest(args)
-            a = ivy.set_nest_at_indices(a, arg_cont_idxs, arg_vals)
-            kwarg_vals = vals[num_arg_conts:]
-            kw = ivy.copy_nest(kwargs)
-            kw = ivy.set_nest_at_indices(kw, kwarg_cont_idxs, kwarg_vals)
+            leaves = list(arg_leaves)
+            for i, v in zip(arg_cont_pos, vals[:num_arg_conts]):
+                leaves[i] = v
+            a = arg_plan.unflatten(leaves)
+            leaves = list(kwarg_leaves)
+            for i, v in zip(kwarg_cont_pos, vals[num_arg_conts:]):
+                leaves[i] = v
+            kw = kwarg_plan.unflatten(leaves)
             if with_out:
                 out = out[0] if len(out) == 1 else out
                 return fn(*a, out=out, **kw)
@@ -244,14 +532,18 @@ class ContainerBase(dict, abc.ABC):
         # Replace each container in arg and kwarg with the arrays at the leaf
         # levels of that container using map_fn and call fn using those arrays
         # as inputs
-        ret = ivy.Container.cont_multi_map(
-            map_fn,
-            conts,
-            key_chains,
-            to_apply,
-            prune_unapplied,
-            map_nests=map_sequences,
-        )
+        ret = None
+        if key_chains is None and to_apply is True and not map_sequences:
+            ret = ContainerBase._cont_structured_map(map_fn, conts)
+        if ret is None:
+            ret = ivy.Container.cont_multi_map(
+                map_fn,
+                conts,
+                key_chains,
+                to_apply,
+                prune_unapplied,
+                map_nests=map_sequences,
+            )
 
         # Multiple containers for functions returning multiple arrays
         if ivy.is_ivy_container(ret):
@@ -270,6 +562,105 @@ class ContainerBase(dict, abc.ABC):
 
         return ret
 
+    @staticmethod
+    def _cont_structured_map(fn, conts):
+        # cont_multi_map of fn over containers which all have the same structure,
+        # flattening each of them once and iterating over the key chains of the
+        # structure, or None if their structures differ
+        structured = _conts_leaves(conts)
+        if structured is None:
+            return None
+        structure, conts_leaves = structured
+        dispatcher = _leaf_dispatcher(fn)
+        values = [
+            (dispatcher or fn)([leaves[i] for leaves in conts_leaves], key_chain)
+            for i, key_chain in enumerate(_cont_structure_key_chains(structure))
+        ]
+        if dispatcher is not None:
+            values = [_leaf_result(value) for value in values]
+        return _cont_from_structure(structure, iter(values), conts[0])
+
+    @staticmethod
+    def _cont_combined(containers, fn, num_workers=None, prune_empty=False):
+        # fn applied once per key chain to the list of the leaves of all of the
+        # containers at that key chain, optionally on a pool of threads, or None if
+        # the structures of the containers differ. Empty sub-containers are kept
+        # unless prune_empty is set
+        structured = _conts_leaves(containers)
+        if structured is None:
+            return None
+        structure, conts_leaves = structured
+        gathered = [list(leaves) for leaves in zip(*conts_leaves)]
+        if num_workers is not None and num_workers > 1 and len(gathered) > 1:
+            with concurrent.futures.ThreadPoolExecutor(num_workers) as pool:
+                values = list(pool.map(fn, gathered))
+        else:
+            values = [fn(leaves) for leaves in gathered]
+        return _cont_from_structure(
+            structure, iter(values), containers[0], prune_empty=prune_empty
+        )
+
+    @staticmethod
+    def _cont_packed_map(fn, args, kwargs, with_segments=False):
+        # apply the elementwise fn once to each buffer of the packed containers in the
+        # arguments. Returns None, for the fn to be applied leaf by leaf instead, if
+        # they aren't all packed with the same layout, if any other argument holds
+        # arrays which would broadcast differently to each leaf, or if fn doesn't
+        # return arrays of the shape, dtype and device of each buffer. With segments,
+        # fn is also passed the segment_ids mapping each element of the buffer to its
+        # leaf, and the num_segments of the buffer
+        containers = [x for x in args if isinstance(x, ivy.Container)]
+        containers += [x for x in kwargs.values() if isinstance(x, ivy.Container)]
+        if not containers:
+            return None
+        packings = [x._cont_valid_packing() for x in containers]
+        if any(packing is None for packing in packings):
+            return None
+        layout = packings[0].layout
+        if any(
+            packing.layout is not layout and packing.layout != layout
+            for packing in packings[1:]
+        ):
+            # the leaves of each container are split into buffers by dtype and
+            # device, so those of other structures or dtypes don't line up
+            return None
+        if any(
+            isinstance(x, (list, tuple, dict)) or getattr(x, "ndim", 0)
+            for x in chain(args, kwargs.values())
+            if not isinstance(x, ivy.Container)
+        ):
+            return None
+        if isinstance(fn, str):
+            fn = containers[0].cont_ivy.__dict__[fn]
+        groups = layout[0]
+
+        def _buffer(x, i):
+            return x._cont_packing.buffers[i] if isinstance(x, ivy.Container) else x
+
+        rets = []
+        for i, buffer in enumerate(packings[0].buffers):
+            buffer_kwargs = {k: _buffer(v, i) for k, v in kwargs.items()}
+            if with_segments:
+                segment_ids, num_segments = _packed_segment_ids(
+                    layout, i, ivy.current_backend_str()
+                )
+                buffer_kwargs.update(segment_ids=segment_ids, num_segments=num_segments)
+            ret = fn(*[_buffer(x, i) for x in args], **buffer_kwargs)
+            ret = tuple(ret) if isinstance(ret, (tuple, list)) else (ret,)
+            # the returned buffers must hold the leaves as laid out in the inputs
+            if any(
+                not ivy.is_array(r)
+                or tuple(r.shape) != tuple(buffer.shape)
+                or (str(ivy.dtype(r)), str(ivy.dev(r))) != groups[i]
+                for r in ret
+            ):
+                return None
+            rets.append(ret)
+        conts = [
+            containers[0]._cont_from_packed(layout, buffers) for buffers in zip(*rets)
+        ]
+        return conts[0] if len(conts) == 1 else tuple(conts)
+
     @staticmethod
     def cont_handle_inplace(ret, out):
         """
@@ -346,6 +737,11 @@ class ContainerBase(dict, abc.ABC):
         """
         container0 = containers[0]
         if not ivy.exists(config):
+            if isinstance(container0, ivy.Container):
+                # the leaves of all containers are gathered in one pass per container
+                ret = ivy.Container._cont_combined(containers, lambda leaves: leaves)
+                if ret is not None:
+                    return ret
             config = (
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
             )
@@ -361,28 +757,58 @@ class ContainerBase(dict, abc.ABC):
             return containers
 
     @staticmethod
-    def _cont_concat_unify(containers, device, axis=0):
-        return ivy.concat(
-            [cont.to_device(device) for cont in containers.values()], axis=axis
+    def _cont_concat_unify(containers, device, axis=0, num_workers=None):
+        conts = list(containers.values())
+        ret = ivy.Container._cont_combined(
+            conts,
+            lambda leaves: ivy.concat(
+                [ivy.to_device(x, device) for x in leaves], axis=axis
+            ),
+            num_workers,
+            prune_empty=True,
         )
+        if ret is not None:
+            return ret
+        return ivy.concat([cont.to_device(device) for cont in conts], axis=axis)
 
     @staticmethod
-    def _cont_sum_unify(containers, device, _=None, _1=None):
-        return sum(
-            [cont.to_device(device) for cont in containers.values()],
-            start=ivy.zeros([]),
+    def _cont_sum_unify(containers, device, _=None, num_workers=None):
+        conts = list(containers.values())
+        start = ivy.zeros([])
+        ret = ivy.Container._cont_combined(
+            conts,
+            lambda leaves: _sum_leaves(leaves, device, start),
+            num_workers,
+            prune_empty=True,
         )
+        if ret is not None:
+            return ret
+        return sum([cont.to_device(device) for cont in conts], start=start)
 
     @staticmethod
-    def _cont_mean_unify(containers, device, _=None, _1=None):
-        return ivy.Container._cont_sum_unify(containers, device) / len(containers)
+    def _cont_mean_unify(containers, device, _=None, num_workers=None):
+        conts = list(containers.values())
+        start = ivy.zeros([])
+        ret = ivy.Container._cont_combined(
+            conts,
+            lambda leaves: _sum_leaves(leaves, device, start) / len(leaves),
+            num_workers,
+            prune_empty=True,
+        )
+        if ret is not None:
+            return ret
+        return sum([cont.to_device(device) for cont in conts], start=start) / len(conts)
 
     @staticmethod
-    def cont_unify(containers, device, mode, axis=0):
+    def cont_unify(containers, device, mode, axis=0, *, num_workers=None):
         """
         Unify a list of containers, on arbitrary devices, to a single container on the
         specified device.
 
+        When the containers all have the same structure, the leaves of all of them at
+        each key chain are combined by one concat, or one stack and sum, rather than
+        combining the containers one at a time.
+
         Parameters
         ----------
         containers
@@ -394,6 +820,9 @@ class ContainerBase(dict, abc.ABC):
         axis
             The axis along which to concattenate the container, if concat mode is set.
             Default is ``0``.
+        num_workers
+            The number of threads combining the leaves of different key chains in
+            parallel. Default is ``None``, in which case they are combined in turn.
 
         Returns
         -------
@@ -403,7 +832,7 @@ class ContainerBase(dict, abc.ABC):
             "concat": ivy.Container._cont_concat_unify,
             "sum": ivy.Container._cont_sum_unify,
             "mean": ivy.Container._cont_mean_unify,
-        }[mode](containers, device, axis)
+        }[mode](containers, device, axis, num_workers=num_workers)
 
     @staticmethod
     def cont_combine(*containers, config=None):
@@ -705,6 +1134,20 @@ class ContainerBase(dict, abc.ABC):
         -------
             Container
         """
+        if key_chain == "" and not map_nests:
+            dispatcher = _leaf_dispatcher(func)
+            if dispatcher is not None:
+                return ivy.Container.cont_multi_map(
+                    dispatcher,
+                    containers,
+                    key_chains,
+                    to_apply,
+                    prune_unapplied,
+                    key_chain,
+                    config,
+                    map_nests,
+                    assert_identical,
+                )._cont_resolve_leaves()
         # retrieve all keys and the first container if it exists
         keys = set([])
         container0 = None
@@ -1147,12 +1590,18 @@ class ContainerBase(dict, abc.ABC):
             return ivy.Container.cont_from_disk_as_pickled(filepath)
         elif format == "h5py":
             return ivy.Container.cont_from_disk_as_hdf5(filepath)
+        elif format == "mmap":
+            return ivy.Container.cont_from_disk_as_mmap(filepath)
         else:
             raise ivy.utils.exceptions.IvyException("Unsupported format")
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        mmap=False,
     ):
         """
         Load container object from disk, as an h5py file, at the specified hdf5
@@ -1170,6 +1619,14 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        mmap
+            Whether to memory-map the contiguous and uncompressed datasets, such as
+            those saved with ``chunks=False``, so that their data is only read from
+            disk when accessed. Other datasets are read in full. With backends other
+            than numpy, the data is read when the arrays are created. As with
+            :meth:`cont_from_disk_as_mmap`, the maps are copy-on-write, so the
+            loaded arrays can be updated in-place without changing the file. Default
+            is ``False``.
 
         Returns
         -------
@@ -1191,11 +1648,14 @@ class ContainerBase(dict, abc.ABC):
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh, mmap
                 )
             elif isinstance(value, h5py.Dataset):
+                data = _h5_dataset_mmap(value) if mmap else None
+                # whole slices are read at once, straight into numpy arrays
+                data = value[slice_obj] if data is None else data[slice_obj]
                 container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
+                    data, dtype=str(data.dtype)
                 )
             else:
                 raise ivy.utils.exceptions.IvyException(
@@ -1226,6 +1686,59 @@ class ContainerBase(dict, abc.ABC):
             ivyh=ivyh,
         ).to_ivy()
 
+    @staticmethod
+    def cont_from_disk_as_mmap(filepath, mode="c", ivyh=None):
+        """
+        Load container object from disk at the specified filepath, as saved by
+        :meth:`cont_to_disk_as_mmap`, memory-mapping the file rather than reading
+        it.
+
+        With the numpy backend, the leaves are views of the memory-mapped file, so
+        loading takes the same time regardless of their size, the data is only read
+        from disk when accessed, and processes loading the same file share its
+        pages. With other backends, the data is read when the arrays are created.
+
+        Parameters
+        ----------
+        filepath
+            Filepath where the container object is saved to disk.
+        mode
+            Mode of the memory map, "r" for read-only leaves, or "c" for leaves which
+            can be written to in memory, copying the written pages rather than
+            writing to the file. Default is "c".
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+        """
+        with open(filepath, "rb") as f:
+            ivy.utils.assertions.check_true(
+                f.read(len(_MMAP_MAGIC)) == _MMAP_MAGIC,
+                f"{filepath} is not a memory-mappable container file",
+            )
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size))
+        data_start = _align(len(_MMAP_MAGIC) + 8 + header_size, header["alignment"])
+        file_buffer = np.memmap(filepath, dtype=np.uint8, mode=mode)
+        container_dict = dict()
+        for leaf in header["leaves"]:
+            dtype = np.dtype(leaf["dtype"])
+            shape = tuple(leaf["shape"])
+            start = data_start + leaf["offset"]
+            data = file_buffer[start : start + dtype.itemsize * _reduce(mul, shape, 1)]
+            value = ivy.default(ivyh, ivy).array(
+                data.view(dtype).reshape(shape), dtype=str(dtype)
+            )
+            *keys, last_key = leaf["key_chain"].split("/")
+            sub_dict = container_dict
+            for key in keys:
+                sub_dict = sub_dict.setdefault(key, dict())
+            sub_dict[last_key] = value
+        return ivy.Container(container_dict, alphabetical_keys=False, ivyh=ivyh)
+
     @staticmethod
     def cont_from_disk_as_json(json_filepath, ivyh=None):
         """
@@ -1331,10 +1844,14 @@ class ContainerBase(dict, abc.ABC):
             h5_obj.close()
 
     @staticmethod
-    def cont_reduce(containers, reduction, config=None):
+    def cont_reduce(containers, reduction, config=None, *, num_workers=None):
         """
         Reduce containers.
 
+        When the containers all have the same structure, the reduction is called once
+        per key chain with the leaves of all the containers, which are gathered in one
+        pass over each container.
+
         Parameters
         ----------
         containers
@@ -1343,6 +1860,9 @@ class ContainerBase(dict, abc.ABC):
             the reduction function
         config
             The configuration for the containers. Default is the same as container0.
+        num_workers
+            The number of threads calling the reduction for different key chains in
+            parallel. Default is ``None``, in which case they are reduced in turn.
 
         Returns
         -------
@@ -1350,6 +1870,14 @@ class ContainerBase(dict, abc.ABC):
         """
         container0 = containers[0]
         if not ivy.exists(config):
+            if isinstance(container0, ivy.Container):
+                ret = ivy.Container._cont_combined(
+                    containers,
+                    lambda leaves: ivy.Container.cont_reduce(leaves, reduction),
+                    num_workers,
+                )
+                if ret is not None:
+                    return ret
             config = (
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
             )
@@ -1595,10 +2123,9 @@ class ContainerBase(dict, abc.ABC):
         return ivy.Container(return_dict, **self._config)
 
     def _cont_prune_key_chains_input_as_seq(self, key_chains):
-        return_cont = self.cont_copy()
-        for kc in key_chains:
-            return_cont = return_cont.cont_prune_key_chain(kc)
-        return return_cont
+        if not key_chains:
+            return self.cont_copy()
+        return self._cont_prune_key_chain_tree(_key_chain_tree(key_chains))
 
     def _cont_prune_key_chains_input_as_dict(self, key_chains, return_cont=None):
         if return_cont is None:
@@ -2019,11 +2546,20 @@ class ContainerBase(dict, abc.ABC):
             self.cont_to_disk_as_pickled(filepath)
         elif format == "h5py":
             self.cont_to_disk_as_hdf5(filepath)
+        elif format == "mmap":
+            self.cont_to_disk_as_mmap(filepath)
         else:
             raise ValueError("Unsupported format")
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=True,
+        compression=None,
+        compression_opts=None,
     ):
         """
         Save container object to disk, as an h5py file, at the specified filepath.
@@ -2041,6 +2577,16 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            Chunk shape of the created datasets, or ``True`` for h5py to guess it.
+            ``False`` creates contiguous datasets instead, which can be memory-mapped
+            when loaded, but cannot be resized or compressed. (Default value = True)
+        compression
+            Compression filter of the created datasets, such as "gzip" or "lzf".
+            (Default value = None)
+        compression_opts
+            Options of the compression filter, such as the gzip level.
+            (Default value = None)
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -2060,7 +2606,13 @@ class ContainerBase(dict, abc.ABC):
                 else:
                     h5_group = h5_obj[key]
                 value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+                    h5_group,
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    chunks,
+                    compression,
+                    compression_opts,
                 )
             else:
                 value_as_np = self._cont_ivy.to_numpy(value)
@@ -2073,16 +2625,24 @@ class ContainerBase(dict, abc.ABC):
                 )
                 if key not in h5_obj.keys():
                     dataset_shape = [max_bs] + list(value_shape[1:])
-                    maxshape = [None for _ in dataset_shape]
+                    maxshape = [None for _ in dataset_shape] if chunks else None
                     h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
+                        key,
+                        dataset_shape,
+                        dtype=value_as_np.dtype,
+                        maxshape=maxshape,
+                        chunks=chunks if chunks else None,
+                        compression=compression,
+                        compression_opts=compression_opts,
                     )
                 space_left = max_bs - starting_index
                 amount_to_write = min(this_batch_size, space_left)
-                for i in range(amount_to_write):
-                    h5_obj[key][starting_index + i : starting_index + i + 1] = (
-                        value_as_np[i : i + 1]
-                    )
+                # one write of the whole slice, rather than one per row
+                h5_obj[key][starting_index : starting_index + amount_to_write] = (
+                    value_as_np[:amount_to_write]
+                )
+        if isinstance(h5_obj_or_filepath, str):
+            h5_obj.close()
 
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """
@@ -2114,6 +2674,55 @@ class ContainerBase(dict, abc.ABC):
                     return_dict[k] = str(v)
         return return_dict
 
+    def cont_to_disk_as_mmap(self, filepath, alignment=64):
+        """
+        Save container object to disk, as a flat file which can be memory-mapped by
+        :meth:`cont_from_disk_as_mmap`, at the specified filepath.
+
+        The file starts with a json header holding the key chain, dtype, shape and
+        offset of each array leaf, followed by the raw bytes of the leaves.
+
+        Parameters
+        ----------
+        filepath
+            Filepath for where to save the container to disk.
+        alignment
+            The number of bytes which the data of each leaf is aligned to.
+            (Default value = 64)
+        """
+        leaves = list()
+        arrays = list()
+        offset = 0
+        for key_chain, value in self.cont_to_iterator():
+            ivy.utils.assertions.check_true(
+                ivy.is_array(value),
+                "only containers of arrays can be saved as memory-mappable files, "
+                f"found {type(value)} at {key_chain}",
+            )
+            value_as_np = np.asarray(self._cont_ivy.to_numpy(value), order="C")
+            offset = _align(offset, alignment)
+            leaves.append(
+                {
+                    "key_chain": key_chain,
+                    "dtype": value_as_np.dtype.str,
+                    "shape": list(value_as_np.shape),
+                    "offset": offset,
+                }
+            )
+            arrays.append(value_as_np)
+            offset += value_as_np.nbytes
+        header = json.dumps({"alignment": alignment, "leaves": leaves}).encode()
+        data_start = _align(len(_MMAP_MAGIC) + 8 + len(header), alignment)
+        with open(filepath, "wb") as f:
+            f.write(_MMAP_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for leaf, array in zip(leaves, arrays):
+                f.seek(data_start + leaf["offset"])
+                f.write(array.data)
+            # the file spans the data of all leaves, even if the last ones are empty
+            f.truncate(data_start + offset)
+
     def cont_to_disk_as_json(self, json_filepath):
         """
         Save container object to disk, as an json file, at the specified filepath.
@@ -2905,27 +3514,26 @@ class ContainerBase(dict, abc.ABC):
         ret
             Container with keys in key chain pruned.
         """
-        keys_in_chain = re.split("[/.]", key_chain)
+        return self._cont_prune_key_chain_tree(_key_chain_tree([key_chain]))
+
+    def _cont_prune_key_chain_tree(self, tree):
+        # prune the key chains of the tree built by _key_chain_tree in one pass,
+        # dropping the sub-containers left empty, and the empty ones not pruned from
         out_dict = dict()
         for key, value in self.items():
+            sub_tree = tree.get(key)
             if isinstance(value, ivy.Container):
-                if key == keys_in_chain[0]:
-                    if len(keys_in_chain) == 1:
-                        new_val = []
-                    else:
-                        new_val = value.cont_prune_key_chain(
-                            "/".join(keys_in_chain[1:])
-                        )
-                    if len(new_val) > 0:
-                        out_dict[key] = new_val
+                if sub_tree is True:
+                    continue
+                if sub_tree is None:
+                    new_val = value.cont_copy()
                 else:
-                    new_val = value.cont_to_dict()
-                    if len(new_val) > 0:
-                        out_dict[key] = value.cont_to_dict()
-            else:
-                if len(keys_in_chain) != 1 or key != keys_in_chain[0]:
-                    out_dict[key] = value
-        return ivy.Container(out_dict, **self._config)
+                    new_val = value._cont_prune_key_chain_tree(sub_tree)
+                if len(new_val) > 0:
+                    out_dict[key] = new_val
+            elif sub_tree is not True:
+                out_dict[key] = value
+        return self._cont_derived(out_dict)
 
     def cont_prune_key_chains(self, key_chains, ignore_none=True):
         """
@@ -3196,7 +3804,12 @@ class ContainerBase(dict, abc.ABC):
         -------
             A copy of the container
         """
-        return ivy.Container(self.cont_to_dict(), **self._config)
+        return self._cont_derived(
+            {
+                k: v.cont_copy() if isinstance(v, ivy.Container) else v
+                for k, v in self.items()
+            }
+        )
 
     def cont_deep_copy(self):
         """
@@ -3213,6 +3826,183 @@ class ContainerBase(dict, abc.ABC):
     def __deepcopy__(self, memo):
         return self.cont_deep_copy()
 
+    def cont_pack(self):
+        """
+        Return a packed copy of the container, in which the array leaves of each dtype
+        and device are views of one contiguous buffer.
+
+        Elementwise functions and operators applied to packed containers with the same
+        layout, and to scalars, run once on each buffer rather than once on each leaf,
+        and return packed containers. Those which change the dtype of a buffer, such
+        as the true division of integers, and those applied to containers packed with
+        other layouts, run once on each leaf and return unpacked containers.
+        Replacing or updating the data of any leaf unpacks the container, after which
+        functions are applied leaf by leaf again. On backends without views, such as
+        tensorflow and jax, the leaves are copies of their parts of the buffers.
+
+        Returns
+        -------
+        ret
+            The packed container.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([[3.]])})
+        >>> x = x.cont_pack()
+        >>> y = x * 2 + 1
+        >>> print(y.cont_packed_buffers)
+        [ivy.array([3., 5., 7.])]
+        >>> print(y.b.c)
+        ivy.array([[7.]])
+        """
+        # the backend functions are called directly, as packing touches every leaf
+        backend = ivy.current_backend()
+        group_idxs = dict()
+        group_leaves = list()
+        group_sizes = list()
+        entries = list()
+        as_ivy = list()
+        for key_chain, value in self.cont_to_iterator():
+            is_ivy_array = isinstance(value, ivy.Array)
+            ivy.utils.assertions.check_true(
+                is_ivy_array or backend.is_native_array(value),
+                f"only containers of arrays can be packed, found {type(value)} at "
+                f"{key_chain}",
+            )
+            native = value._data if is_ivy_array else value
+            group = (str(backend.dtype(native)), str(backend.dev(native)))
+            if group not in group_idxs:
+                group_idxs[group] = len(group_leaves)
+                group_leaves.append(list())
+                group_sizes.append(0)
+            idx = group_idxs[group]
+            shape = tuple(native.shape)
+            entries.append((key_chain, idx, group_sizes[idx], shape))
+            group_leaves[idx].append(backend.reshape(native, (-1,)))
+            group_sizes[idx] += _reduce(mul, shape, 1)
+            as_ivy.append(is_ivy_array)
+        buffers = [backend.concat(leaves, axis=0) for leaves in group_leaves]
+        layout = (tuple(group_idxs), tuple(entries))
+        return self._cont_from_packed(layout, buffers, as_ivy)
+
+    def cont_unpack(self):
+        """
+        Return a copy of the container whose array leaves are copied out of the
+        buffers of a packed container, no longer sharing memory with them.
+
+        Returns
+        -------
+        ret
+            The unpacked container.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b=ivy.array([3.])).cont_pack()
+        >>> y = x.cont_unpack()
+        >>> print(y.cont_packed_buffers)
+        None
+        """
+        return self.cont_map(
+            lambda x, kc: (
+                ivy.copy_array(x, to_ivy_array=isinstance(x, ivy.Array))
+                if ivy.is_array(x)
+                else x
+            )
+        )
+
+    def _cont_from_packed(self, layout, buffers, as_ivy=None):
+        # build a packed container with the structure of this one, whose leaves are
+        # views of the buffers as described by the layout
+        natives = [ivy.to_native(buffer) for buffer in buffers]
+        backend = ivy.current_backend(natives[0])
+        leaves = list()
+        for i, (_, idx, offset, shape) in enumerate(layout[1]):
+            size = _reduce(mul, shape, 1)
+            leaf = backend.reshape(natives[idx][offset : offset + size], shape)
+            if as_ivy is None or as_ivy[i]:
+                leaf = ivy.Array(leaf)
+            leaves.append(leaf)
+        ret = self._cont_with_leaves(iter(leaves))
+        ret._cont_packing = _ContainerPacking(
+            layout,
+            [ivy.to_ivy(buffer) for buffer in buffers],
+            [
+                (leaf, leaf._data if isinstance(leaf, ivy.Array) else None)
+                for leaf in leaves
+            ],
+        )
+        return ret
+
+    def _cont_derived(self, dict_in):
+        # a new container holding dict_in, equivalent to
+        # ivy.Container(dict_in, **self.cont_config), but sharing the config
+        # attributes of this container rather than setting each of them again, these
+        # are never modified in place, so that updating the config of either
+        # container leaves the other one unchanged
+        ret = dict.__new__(ivy.Container)
+        state = ret.__dict__
+        for k, v in self.__dict__.items():
+            if k not in _CONT_INSTANCE_ATTRS:
+                state[k] = v
+        state["_queues"] = None
+        state["_container_combine_method"] = "list_join"
+        state["_dynamic_backend"] = ivy.dynamic_backend
+        if ivy.dynamic_backend:
+            _register_dynamic_backend_obj(ret)
+        items = sorted(dict_in.items()) if self._alphabetical_keys else dict_in.items()
+        dict_types = tuple([dict] + ivy.container_types())
+        rebuild = self._rebuild_child_containers
+        types_to_nest = self._types_to_iteratively_nest
+        for key, value in items:
+            if (
+                isinstance(value, dict_types)
+                and (not isinstance(value, ivy.Container) or rebuild)
+            ) or (types_to_nest and isinstance(value, types_to_nest)):
+                value = ivy.Container(value, **self._config)
+            dict.__setitem__(ret, key, value)
+        return ret
+
+    def _cont_with_leaves(self, leaves):
+        # rebuild the container with the leaves taken in order from the iterator
+        new_dict = dict()
+        for key, value in self.items():
+            if isinstance(value, ivy.Container):
+                new_dict[key] = value._cont_with_leaves(leaves)
+            else:
+                new_dict[key] = next(leaves)
+        return self._cont_derived(new_dict)
+
+    def _cont_resolve_leaves(self):
+        # replace the leaves dispatched to the threads of ivy.set_container_parallelism
+        # with their results, in place
+        for key, value in self.items():
+            if isinstance(value, ivy.Container):
+                value._cont_resolve_leaves()
+            elif isinstance(value, concurrent.futures.Future):
+                dict.__setitem__(self, key, value.result())
+        return self
+
+    def _cont_valid_packing(self):
+        # return the packing of the container, unless it isn't packed or any of its
+        # leaves has been replaced or updated since it was
+        packing = self.__dict__.get("_cont_packing")
+        if packing is None:
+            return None
+        leaves = packing.leaves
+        num_leaves = 0
+        for value in self.cont_to_iterator_values():
+            if num_leaves == len(leaves):
+                break
+            leaf, data = leaves[num_leaves]
+            if value is not leaf or (data is not None and value._data is not data):
+                break
+            num_leaves += 1
+        else:
+            if num_leaves == len(leaves):
+                return packing
+        self._cont_packing = None
+        return None
+
     def cont_map(
         self,
         func,
@@ -3251,6 +4041,18 @@ class ContainerBase(dict, abc.ABC):
         -------
             New container following the function mapped to each sub-array.
         """
+        if key_chain == "" and not map_sequences:
+            dispatcher = _leaf_dispatcher(func)
+            if dispatcher is not None:
+                return self.cont_map(
+                    dispatcher,
+                    key_chains,
+                    to_apply,
+                    prune_unapplied,
+                    map_sequences,
+                    inplace,
+                    key_chain,
+                )._cont_resolve_leaves()
         return_dict = self if inplace else dict()
         for key, value in self.items():
             this_key_chain = (
@@ -3289,7 +4091,7 @@ class ContainerBase(dict, abc.ABC):
                 return_dict[key] = func(value, this_key_chain)
         if inplace:
             return self
-        return ivy.Container(return_dict, **self._config)
+        return self._cont_derived(return_dict)
 
     def cont_map_sub_conts(
         self,
@@ -3684,7 +4486,8 @@ class ContainerBase(dict, abc.ABC):
         """
         if inplace:
             self._cont_ivy = ivy_backend
-            self._config["ivyh"] = ivy_backend
+            # the config may be shared with derived containers, so it's replaced
+            self._config = dict(self._config, ivyh=ivy_backend)
             return self
         else:
             return ivy.Container(self, ivyh=ivy_backend)
@@ -4175,6 +4978,8 @@ class ContainerBase(dict, abc.ABC):
 
             self.cont_map(func)
             self._dynamic_backend = val
+            if val:
+                _register_dynamic_backend_obj(self)
             return
 
         if isinstance(query, str) and ("/" in query or "." in query):
@@ -4211,6 +5016,8 @@ class ContainerBase(dict, abc.ABC):
             else None
         )
         state_dict["_config"] = config
+        # the leaves no longer share memory with the buffers once unpickled
+        state_dict.pop("_cont_packing", None)
         return state_dict
 
     def __setstate__(self, state_dict):
@@ -4241,6 +5048,8 @@ class ContainerBase(dict, abc.ABC):
                         config["ivyh"] = ivy
             state_dict["_config"] = config
         self.__dict__.update(state_dict)
+        if self.__dict__.get("_dynamic_backend", False):
+            _register_dynamic_backend_obj(self)
 
     # Getters and Setters #
     # --------------------#
@@ -4311,6 +5120,15 @@ class ContainerBase(dict, abc.ABC):
     def cont_config(self):
         return self._config
 
+    @property
+    def cont_packed_buffers(self):
+        """
+        The contiguous buffers holding the leaves of a packed container, one per dtype
+        and device, or None if the container isn't packed.
+        """
+        packing = self._cont_valid_packing()
+        return None if packing is None else list(packing.buffers)
+
     @property
     def cont_max_depth(self):
         kcs = [kc for kc in self.cont_to_iterator_keys(include_empty=True)]
@@ -1,4 +1,5 @@
 # global
+import functools
 import operator
 
 # local
@@ -48,6 +49,24 @@ from ivy.data_classes.container.experimental import (
 )
 
 
+def _fuse_packed(op, reverse=False):
+    # apply the operator once to each buffer when the operands are packed
+    # containers, see ContainerBase.cont_pack
+    def _decorator(method):
+        @functools.wraps(method)
+        def _method(self, *other):
+            if self.__dict__.get("_cont_packing") is not None:
+                args = (*other, self) if reverse else (self, *other)
+                ret = ContainerBase._cont_packed_map(op, args, {})
+                if ret is not None:
+                    return ret
+            return method(self, *other)
+
+        return _method
+
+    return _decorator
+
+
 class Container(
     _ContainerWithActivations,
     _ContainerWithConversions,
@@ -137,9 +156,11 @@ class Container(
     def __pos__(self):
         return self
 
+    @_fuse_packed(operator.neg)
     def __neg__(self):
         return self.cont_map(lambda x, kc: -x, map_sequences=True)
 
+    @_fuse_packed(operator.pow)
     def __pow__(self, power):
         """
         ivy.Container special method for the power operator, calling
@@ -185,6 +206,7 @@ class Container(
             )
         return self.cont_map(lambda x, kc: x**power, map_sequences=True)
 
+    @_fuse_packed(operator.pow, reverse=True)
     def __rpow__(self, power):
         return self.cont_map(lambda x, kc: power**x, map_sequences=True)
 
@@ -195,6 +217,7 @@ class Container(
             )
         return self.cont_map(lambda x, _: operator.ipow(x, power), map_sequences=True)
 
+    @_fuse_packed(operator.add)
     def __add__(self, other):
         """
         ivy.Container special method for the add operator, calling :code:`operator.add`
@@ -260,6 +283,7 @@ class Container(
             lambda xs, _: operator.add(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_fuse_packed(operator.add, reverse=True)
     def __radd__(self, other):
         """
         ivy.Container reverse special method for the add operator, calling
@@ -299,6 +323,7 @@ class Container(
             lambda xs, _: operator.iadd(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_fuse_packed(operator.sub)
     def __sub__(self, other):
         """
         ivy.Container special method for the subtract operator, calling
@@ -369,6 +394,7 @@ class Container(
             lambda xs, _: operator.isub(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_fuse_packed(operator.sub, reverse=True)
     def __rsub__(self, other):
         """
         ivy.Container reverse special method for the subtract operator, calling
@@ -403,11 +429,13 @@ class Container(
             lambda xs, _: operator.sub(xs[0], xs[1]), [other, self], map_nests=True
         )
 
+    @_fuse_packed(operator.mul)
     def __mul__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_fuse_packed(operator.mul, reverse=True)
     def __rmul__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.mul(xs[0], xs[1]), [other, self], map_nests=True
@@ -451,6 +479,7 @@ class Container(
             map_nests=True,
         )
 
+    @_fuse_packed(operator.truediv)
     def __truediv__(self, other):
         """
         ivy.Container special method for the divide operator, calling
@@ -501,6 +530,7 @@ class Container(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [self, other], map_nests=True
         )
 
+    @_fuse_packed(operator.truediv, reverse=True)
     def __rtruediv__(self, other):
         return ivy.Container.cont_multi_map(
             lambda xs, _: operator.truediv(xs[0], xs[1]), [other, self], map_nests=True
@@ -567,6 +597,7 @@ class Container(
             lambda x, kc: operator.imatmul(x, other), map_sequences=True
         )
 
+    @_fuse_packed(operator.abs)
     def __abs__(self):
         """
         ivy.Container special method for the abs operator, calling :code:`operator.abs`
@@ -1,12 +1,15 @@
 import contextlib
 import ivy
 import functools
+import itertools
 import logging
+import threading
 import weakref
 import warnings
 import copy as python_copy
+from collections import UserDict
 from types import FunctionType
-from typing import Callable, Literal
+from typing import Callable, Literal, Optional
 import inspect
 import numpy as np
 
@@ -222,6 +225,11 @@ def try_array_function_override(func, overloaded_args, types, args, kwargs):
 
 
 def _get_first_array(*args, **kwargs):
+    if "array_fn" not in kwargs:
+        info = _lookup_args_info(args, kwargs)
+        if info.simple:
+            arrays = info.flat_arrays()
+            return arrays[0] if arrays else None
     # ToDo: make this more efficient, with function ivy.nested_nth_index_where
     array_fn = ivy.is_array if "array_fn" not in kwargs else kwargs["array_fn"]
     arr = None
@@ -305,6 +313,255 @@ def _get_preferred_device(args, kwargs):
     return ivy.default_device(as_native=True)
 
 
+# Argument Classification #
+# ------------------------#
+
+# argument kinds, cached per backend and per argument type. Without a backend set,
+# each native array is that of the backend inferred from its type, so the kinds
+# still only depend on the argument type
+_PLAIN_ARG, _IVY_ARRAY_ARG, _NATIVE_ARRAY_ARG, _SEQUENCE_ARG, _OTHER_ARG = range(5)
+_ARRAY_ARGS = (_IVY_ARRAY_ARG, _NATIVE_ARRAY_ARG)
+_arg_kind_cache = dict()
+# the classification of the arguments of the call being dispatched, shared by all
+# of the wrappers of the called function
+_args_info_local = threading.local()
+
+
+def _is_native_array(x):
+    # the backend implementation is used directly, as the wrapped
+    # `ivy.is_native_array` may itself need to classify its argument
+    return ivy.current_backend(x).is_native_array(x)
+
+
+def _classify_arg_type(x):
+    if type(x) in (tuple, list):
+        return _SEQUENCE_ARG
+    if isinstance(x, ivy.Array):
+        return _IVY_ARRAY_ARG
+    if _is_native_array(x):
+        return _NATIVE_ARRAY_ARG
+    if (
+        isinstance(
+            x,
+            (
+                ivy.Container,
+                ivy.NestedArray,
+                ivy.Shape,
+                ivy.NativeShape,
+                tuple,
+                list,
+                dict,
+                UserDict,
+                slice,
+                np.ndarray,
+            ),
+        )
+        or hasattr(x, "__ivy_array_function__")
+        or hasattr(x, "is_tracked_proxy")
+    ):
+        return _OTHER_ARG
+    return _PLAIN_ARG
+
+
+def _get_arg_kinds():
+    kinds = _arg_kind_cache.get(ivy.backend)
+    if kinds is None:
+        kinds = _arg_kind_cache[ivy.backend] = dict()
+    return kinds
+
+
+def _arg_kind(x, kinds):
+    kind = kinds.get(type(x))
+    if kind is None:
+        kind = kinds[type(x)] = _classify_arg_type(x)
+    return kind
+
+
+def _flat_arg_kind(x, kinds):
+    """
+    Return the kind of `x`, looking one level into tuples and lists.
+
+    Sequences holding only plain values count as plain, sequences which also hold
+    arrays are reported as sequences, and anything deeper is reported as other.
+    """
+    kind = _arg_kind(x, kinds)
+    if kind != _SEQUENCE_ARG:
+        return kind
+    kind = _PLAIN_ARG
+    for item in x:
+        item_kind = _arg_kind(item, kinds)
+        if item_kind in _ARRAY_ARGS:
+            kind = _SEQUENCE_ARG
+        elif item_kind != _PLAIN_ARG:
+            return _OTHER_ARG
+    return kind
+
+
+def _flat_arrays(x, x_kind, kinds):
+    # the arrays which are either `x` itself or held one level deep in `x`
+    if x_kind in _ARRAY_ARGS:
+        return (x,)
+    if x_kind == _SEQUENCE_ARG:
+        return tuple(item for item in x if _arg_kind(item, kinds) in _ARRAY_ARGS)
+    return ()
+
+
+def _map_flat_arrays(fn, x, x_kind, kinds, source_kind):
+    # apply `fn` to the arrays of kind `source_kind` which are either `x` itself or
+    # held one level deep in `x`, lists are always copied as the nested map would
+    if x_kind == source_kind:
+        return fn(x)
+    if x_kind == _SEQUENCE_ARG or type(x) is list:
+        return type(x)(
+            fn(item) if _arg_kind(item, kinds) == source_kind else item for item in x
+        )
+    return x
+
+
+def _scan_nest(x, info):
+    # a single recursive pass setting every flag of `info`, each equivalent to
+    # `ivy.nested_any` with `check_nests=True` for the corresponding check
+    if isinstance(x, (tuple, list)):
+        for item in x:
+            _scan_nest(item, info)
+    elif isinstance(x, dict):
+        for v in x.values():
+            _scan_nest(v, info)
+    if isinstance(x, ivy.Container):
+        info.has_container = True
+    elif isinstance(x, ivy.NestedArray):
+        info.has_nested_array = True
+    elif isinstance(x, ivy.Array):
+        info.has_ivy_array = True
+    elif _is_native_array(x):
+        info.has_native_array = True
+    elif isinstance(x, np.ndarray):
+        info.has_numpy_array = True
+
+
+class _ArgsInfo:
+    """
+    Classification of the positional and keyword arguments of a single call.
+
+    Each top-level argument is assigned a kind with `_flat_arg_kind`, and the
+    presence of containers, nested arrays, ivy arrays and native arrays anywhere in
+    the arguments is recorded, as is that of numpy arrays which aren't native. When
+    all arguments are plain values, arrays or flat sequences of those, the info is
+    *simple* and no recursive traversal is needed, otherwise the flags are filled by
+    one recursive pass over the remaining arguments.
+    """
+
+    __slots__ = (
+        "args",
+        "kwargs",
+        "kinds",
+        "arg_kinds",
+        "kwarg_kinds",
+        "simple",
+        "has_container",
+        "has_nested_array",
+        "has_ivy_array",
+        "has_native_array",
+        "has_numpy_array",
+    )
+
+    def __init__(self, args, kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.kinds = kinds = _get_arg_kinds()
+        self.arg_kinds = [_flat_arg_kind(x, kinds) for x in args]
+        self.kwarg_kinds = {k: _flat_arg_kind(v, kinds) for k, v in kwargs.items()}
+        self.simple = True
+        self.has_container = self.has_nested_array = False
+        self.has_ivy_array = self.has_native_array = False
+        self.has_numpy_array = False
+        for x, x_kind in zip(
+            itertools.chain(args, kwargs.values()),
+            itertools.chain(self.arg_kinds, self.kwarg_kinds.values()),
+        ):
+            if x_kind == _IVY_ARRAY_ARG:
+                self.has_ivy_array = True
+            elif x_kind == _NATIVE_ARRAY_ARG:
+                self.has_native_array = True
+            elif x_kind == _SEQUENCE_ARG:
+                for item in x:
+                    item_kind = kinds[type(item)]
+                    if item_kind == _IVY_ARRAY_ARG:
+                        self.has_ivy_array = True
+                    elif item_kind == _NATIVE_ARRAY_ARG:
+                        self.has_native_array = True
+            elif x_kind == _OTHER_ARG:
+                self.simple = False
+                _scan_nest(x, self)
+
+    def describes(self, args, kwargs):
+        """Whether the info was computed for exactly these argument objects."""
+        if len(args) != len(self.args) or len(kwargs) != len(self.kwargs):
+            return False
+        for a, b in zip(args, self.args):
+            if a is not b:
+                return False
+        for k, v in kwargs.items():
+            if k not in self.kwargs or self.kwargs[k] is not v:
+                return False
+        return True
+
+    def flat_arrays(self):
+        """Return the arrays held in the arguments, only valid for simple infos."""
+        return tuple(
+            itertools.chain.from_iterable(
+                _flat_arrays(x, x_kind, self.kinds)
+                for x, x_kind in zip(
+                    itertools.chain(self.args, self.kwargs.values()),
+                    itertools.chain(self.arg_kinds, self.kwarg_kinds.values()),
+                )
+            )
+        )
+
+    def map_flat_arrays(self, fn, source_kind, to_skip=()):
+        """
+        Apply `fn` to the arrays of kind `source_kind` held in the arguments,
+        returning new args and kwargs. Only valid for simple infos.
+        """
+        kinds = self.kinds
+        args = tuple(
+            _map_flat_arrays(fn, x, x_kind, kinds, source_kind)
+            for x, x_kind in zip(self.args, self.arg_kinds)
+        )
+        kwargs = {
+            k: (
+                v
+                if k in to_skip
+                else _map_flat_arrays(fn, v, self.kwarg_kinds[k], kinds, source_kind)
+            )
+            for k, v in self.kwargs.items()
+        }
+        return args, kwargs
+
+
+def _lookup_args_info(args, kwargs):
+    # the info shared by the enclosing wrappers if it describes these arguments,
+    # otherwise a new one which is not shared
+    info = getattr(_args_info_local, "info", None)
+    if info is not None and info.describes(args, kwargs):
+        return info
+    return _ArgsInfo(args, kwargs)
+
+
+def _share_args_info(args, kwargs):
+    """
+    Return the info for `args` and `kwargs`, along with the previously shared info.
+
+    The returned info is shared with the wrappers called from within the calling
+    wrapper, which must restore the previously shared info once it returns.
+    """
+    prev = getattr(_args_info_local, "info", None)
+    if prev is not None and prev.describes(args, kwargs):
+        return prev, prev
+    info = _args_info_local.info = _ArgsInfo(args, kwargs)
+    return info, prev
+
+
 # Array Handling #
 # ---------------#
 
@@ -406,6 +663,10 @@ def handle_array_like_without_promotion(fn: Callable) -> Callable:
                     # since asarray throws unpredictable bugs
                     if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
                         continue
+                    # packed containers only hold arrays, and converting them
+                    # would copy every leaf out of the packed buffers
+                    if getattr(arg, "cont_packed_buffers", None) is not None:
+                        continue
                     if not ivy.is_array(arg):
                         args[i] = ivy.array(arg, device=device)
                 elif parameters in kwargs:
@@ -441,6 +702,18 @@ def inputs_to_native_arrays(fn: Callable) -> Callable:
         """
         if not ivy.array_mode:
             return fn(*args, **kwargs)
+        info, prev = _share_args_info(args, kwargs)
+        try:
+            if info.simple:
+                # the out argument is kept as an ivy.Array
+                if not info.has_ivy_array:
+                    return fn(*args, **kwargs)
+                new_args, new_kwargs = info.map_flat_arrays(
+                    lambda x: x.data, _IVY_ARRAY_ARG, to_skip=("out",)
+                )
+                return fn(*new_args, **new_kwargs)
+        finally:
+            _args_info_local.info = prev
         # check if kwargs contains an out argument, and if so, remove it
         has_out = False
         out = None
@@ -486,6 +759,20 @@ def inputs_to_ivy_arrays(fn: Callable) -> Callable:
             )
             return fn(*args, **kwargs)
 
+        info, prev = _share_args_info(args, kwargs)
+        try:
+            # nothing to convert, which also keeps nested containers (and any
+            # packed buffers backing them) as they are, numpy arrays are converted
+            # on any backend
+            if not (info.has_native_array or info.has_numpy_array):
+                return fn(*args, **kwargs)
+            if info.simple:
+                ivy_args, ivy_kwargs = info.map_flat_arrays(
+                    ivy.Array, _NATIVE_ARRAY_ARG, to_skip=("out",)
+                )
+                return fn(*ivy_args, **ivy_kwargs)
+        finally:
+            _args_info_local.info = prev
         has_out = False
         if "out" in kwargs:
             out = kwargs["out"]
@@ -560,12 +847,16 @@ def outputs_to_ivy_arrays(fn: Callable) -> Callable:
         """
         # call unmodified function
         ret = fn(*args, **kwargs)
+        if not ivy.array_mode:
+            return ret
+        # single values are converted without traversing the return
+        ret_kind = _arg_kind(ret, _get_arg_kinds())
+        if ret_kind == _NATIVE_ARRAY_ARG:
+            return ivy.Array(ret)
+        if ret_kind in (_PLAIN_ARG, _IVY_ARRAY_ARG):
+            return ret
         # convert all arrays in the return to `ivy.Array` instances
-        return (
-            ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
-            if ivy.array_mode
-            else ret
-        )
+        return ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
 
     _outputs_to_ivy_arrays.outputs_to_ivy_arrays = True
     return _outputs_to_ivy_arrays
@@ -800,8 +1091,15 @@ def handle_device(fn: Callable) -> Callable:
         if ivy.soft_device_mode:
             with ivy.DefaultDevice(ivy.default_device(dev)):
                 return ivy.handle_soft_device_variable(*args, fn=fn, **kwargs)
-        inputs = args + tuple(kwargs.values())
-        devices = tuple(ivy.dev(x) for x in inputs if ivy.is_native_array(x))
+        info = _lookup_args_info(args, kwargs)
+        devices = tuple(
+            ivy.dev(x)
+            for x, x_kind in zip(
+                itertools.chain(args, kwargs.values()),
+                itertools.chain(info.arg_kinds, info.kwarg_kinds.values()),
+            )
+            if x_kind == _NATIVE_ARRAY_ARG
+        )
         unique_devices = set(devices)
         # check if arrays are on the same device
         if len(unique_devices) <= 1:
@@ -946,24 +1244,22 @@ def handle_nestable(fn: Callable) -> Callable:
         -------
             The return of the function, with the nestable property handled correctly.
         """
-        # if any of the arguments or keyword arguments passed to the function contains
-        # a container, get the container's version of the function and call it using
-        # the passed arguments.
-        if hasattr(ivy.Container, f"_static_{fn_name}"):
-            cont_fn = getattr(ivy.Container, f"_static_{fn_name}")
-        else:
-            cont_fn = lambda *args, **kwargs: ivy.Container.cont_multi_map_in_function(
-                fn, *args, **kwargs
-            )
-        if ivy.nestable_mode and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
-        ):
-            return cont_fn(*args, **kwargs)
-
-        # if the passed arguments does not contain a container, the function using
-        # the passed arguments, returning an ivy or a native array.
-        return fn(*args, **kwargs)
+        info, prev = _share_args_info(args, kwargs)
+        try:
+            # if any of the arguments or keyword arguments passed to the function
+            # contains a container, get the container's version of the function and
+            # call it using the passed arguments.
+            if ivy.nestable_mode and info.has_container:
+                cont_fn = getattr(ivy.Container, f"_static_{fn_name}", None)
+                if cont_fn is None:
+                    return ivy.Container.cont_multi_map_in_function(fn, *args, **kwargs)
+                return cont_fn(*args, **kwargs)
+
+            # if the passed arguments does not contain a container, the function
+            # using the passed arguments, returning an ivy or a native array.
+            return fn(*args, **kwargs)
+        finally:
+            _args_info_local.info = prev
 
     _handle_nestable.handle_nestable = True
     return _handle_nestable
@@ -994,14 +1290,16 @@ def handle_ragged(fn: Callable) -> Callable:
                 fn, *args, **kwargs
             )
         )
-        if ivy.nested_any(
-            args, ivy.is_ivy_nested_array, check_nests=True
-        ) or ivy.nested_any(kwargs, ivy.is_ivy_nested_array, check_nests=True):
-            return nested_fn(*args, **kwargs)
+        info, prev = _share_args_info(args, kwargs)
+        try:
+            if info.has_nested_array:
+                return nested_fn(*args, **kwargs)
 
-        # if the passed arguments does not contain a container, the function using
-        # the passed arguments, returning an ivy or a native array.
-        return fn(*args, **kwargs)
+            # if the passed arguments does not contain a container, the function
+            # using the passed arguments, returning an ivy or a native array.
+            return fn(*args, **kwargs)
+        finally:
+            _args_info_local.info = prev
 
     _handle_ragged.handle_ragged = True
     return _handle_ragged
@@ -1028,6 +1326,329 @@ def handle_partial_mixed_function(fn) -> Callable:
     return _handle_partial_mixed_function
 
 
+# Fused Dispatch #
+# ---------------#
+
+# wrappers which the fused dispatcher can apply in a single pass, functions
+# requiring any other wrapper always go through the decorator stack
+_FUSABLE_DECORATORS = {
+    "handle_complex_input",
+    "handle_device",
+    "infer_dtype",
+    "handle_array_function",
+    "outputs_to_ivy_arrays",
+    "outputs_to_ivy_shapes",
+    "outputs_to_native_arrays",
+    "inputs_to_native_arrays",
+    "inputs_to_native_shapes",
+    "inputs_to_ivy_arrays",
+    "handle_out_argument",
+    "handle_array_like_without_promotion",
+    "handle_nestable",
+    "handle_ragged",
+    "handle_backend_invalid",
+    "handle_exceptions",
+    "handle_nans",
+}
+
+
+def _array_like_indices(fn):
+    # positions of the arguments which `handle_array_like_without_promotion`
+    # converts to arrays, resolved from the signature once instead of per call
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return ()
+    indices = []
+    for i, (parameter, hint) in enumerate(type_hints.items()):
+        annotation_str = str(hint.annotation)
+        if (
+            ("rray" in annotation_str or "Tensor" in annotation_str)
+            and parameter != "out"
+            and all(
+                sq not in annotation_str
+                for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+            )
+        ):
+            indices.append(i)
+    return tuple(indices)
+
+
+def _fuse_wrappers(stacked: Callable, fn: Callable, steps) -> Callable:
+    """
+    Build a single dispatch wrapper for the backend implementation `fn`.
+
+    The returned function performs all of the wrapping `steps` in one pass over
+    the arguments whenever these are made up of plain values, arrays and flat
+    sequences of those. Calls involving containers, nested arrays, deeper nests,
+    the `out` argument or non-default global modes are delegated to `stacked`,
+    the equivalent stack of decorators, so the behaviour matches the unfused
+    function.
+
+    Parameters
+    ----------
+    stacked
+        the backend implementation wrapped with the full decorator stack.
+    fn
+        the raw backend implementation.
+    steps
+        the names of the wrappers applied to `fn` in `stacked`.
+
+    Returns
+    -------
+    ret
+        the fused function.
+    """
+    from ivy.data_classes.array.conversions import _to_ivy
+
+    handle_nans = "handle_nans" in steps
+    check_backend = "handle_backend_invalid" in steps
+    array_like_indices = (
+        _array_like_indices(fn)
+        if "handle_array_like_without_promotion" in steps
+        else ()
+    )
+    handle_out = "handle_out_argument" in steps
+    to_ivy_inputs = "inputs_to_ivy_arrays" in steps
+    to_native_inputs = "inputs_to_native_arrays" in steps
+    infer_dtype = "infer_dtype" in steps
+    handle_device = "handle_device" in steps
+    handle_complex = "handle_complex_input" in steps
+    to_ivy_outputs = "outputs_to_ivy_arrays" in steps
+    to_native_outputs = "outputs_to_native_arrays" in steps
+    array_mode_dependent = to_ivy_inputs or to_native_inputs or to_ivy_outputs
+    if to_ivy_inputs:
+        convert, source_kind, target_kind = ivy.Array, _NATIVE_ARRAY_ARG, _IVY_ARRAY_ARG
+    elif to_native_inputs:
+        convert, source_kind, target_kind = (
+            lambda x: x.data,
+            _IVY_ARRAY_ARG,
+            _NATIVE_ARRAY_ARG,
+        )
+
+    def _fused_body(args, arg_kinds, kwargs, kwarg_kinds, kinds):
+        if check_backend:
+            for x, x_kind in itertools.chain(
+                zip(args, arg_kinds), zip(kwargs.values(), kwarg_kinds.values())
+            ):
+                for arr in _flat_arrays(x, x_kind, kinds):
+                    if isinstance(arr, ivy.Array):
+                        _check_array_backend(arr)
+        if array_like_indices:
+            device = None
+            for i in array_like_indices:
+                if i >= len(args):
+                    break
+                arg = args[i]
+                if arg_kinds[i] in _ARRAY_ARGS or _check_in_nested_sequence(
+                    arg, value=Ellipsis, _type=slice
+                ):
+                    continue
+                if device is None:
+                    device = _get_preferred_device(args, kwargs)
+                args[i] = ivy.array(arg, device=device)
+                arg_kinds[i] = _IVY_ARRAY_ARG
+        if to_ivy_inputs or to_native_inputs:
+            for i, x_kind in enumerate(arg_kinds):
+                args[i] = _map_flat_arrays(convert, args[i], x_kind, kinds, source_kind)
+                if x_kind == source_kind:
+                    arg_kinds[i] = target_kind
+            for k, x_kind in kwarg_kinds.items():
+                kwargs[k] = _map_flat_arrays(
+                    convert, kwargs[k], x_kind, kinds, source_kind
+                )
+                if x_kind == source_kind:
+                    kwarg_kinds[k] = target_kind
+        if handle_out:
+            kwargs["out"] = None
+        if infer_dtype:
+            dtype = kwargs.pop("dtype", None)
+            arr = None
+            if dtype is None:
+                for x, x_kind in itertools.chain(
+                    zip(args, arg_kinds), zip(kwargs.values(), kwarg_kinds.values())
+                ):
+                    arrays = _flat_arrays(x, x_kind, kinds)
+                    if arrays:
+                        arr = arrays[0]
+                        break
+            dtype = ivy.default_dtype(dtype=dtype, item=arr, as_native=True)
+            ivy.utils.assertions._check_jax_x64_flag(dtype)
+            kwargs["dtype"] = dtype
+        if handle_device:
+            dev = None
+            if "device" in kwargs and kwargs["device"] is not None:
+                dev = ivy.as_native_dev(kwargs["device"])
+            devices = tuple(
+                ivy.dev(x)
+                for x, x_kind in itertools.chain(
+                    zip(args, arg_kinds), zip(kwargs.values(), kwarg_kinds.values())
+                )
+                if x_kind == _NATIVE_ARRAY_ARG
+            )
+            unique_devices = set(devices)
+            if len(unique_devices) > 1:
+                raise ivy.utils.exceptions.IvyException(
+                    "Expected all input arrays to be on the same device, "
+                    f"but found atleast two devices - {devices}, "
+                    "set `ivy.set_soft_device_mode(True)` to handle this problem."
+                )
+            dst_dev = (
+                dev
+                if dev is not None
+                else None if len(unique_devices) == 0 else next(iter(unique_devices))
+            )
+            with ivy.DefaultDevice(ivy.default_device(dst_dev)):
+                ret = ivy.handle_soft_device_variable(*args, fn=fn, **kwargs)
+        else:
+            ret = fn(*args, **kwargs)
+        if to_ivy_outputs:
+            if isinstance(ret, (tuple, list, dict, slice)):
+                return ivy.to_ivy(ret, nested=True, include_derived={"tuple": True})
+            return _to_ivy(ret)
+        if to_native_outputs:
+            return ivy.to_native(ret, nested=True, include_derived={"tuple": True})
+        return ret
+
+    _fused_body.__name__ = fn.__name__
+    if "handle_exceptions" in steps:
+        _fused_body = ivy.utils.exceptions.handle_exceptions(_fused_body)
+
+    @functools.wraps(stacked)
+    def _fused_dispatch(*args, **kwargs):
+        """
+        Dispatch to the fused single-pass wrapper when the arguments allow it,
+        otherwise to the full decorator stack.
+
+        Parameters
+        ----------
+        args
+            The arguments to be passed to the function.
+
+        kwargs
+            The keyword arguments to be passed to the function.
+
+        Returns
+        -------
+            The return of the function.
+        """
+        if (
+            (handle_nans and ivy.nan_policy != "nothing")
+            or (array_mode_dependent and not ivy.array_mode)
+            or (handle_device and ivy.soft_device_mode)
+            or (handle_out and kwargs.get("out", None) is not None)
+            or (handle_complex and (not args or "complex_mode" in kwargs))
+        ):
+            return stacked(*args, **kwargs)
+        info = _ArgsInfo(args, kwargs)
+        if not info.simple:
+            return stacked(*args, **kwargs)
+        if handle_complex and (
+            info.arg_kinds[0] not in _ARRAY_ARGS or ivy.is_complex_dtype(args[0])
+        ):
+            return stacked(*args, **kwargs)
+        return _fused_body(
+            list(args), info.arg_kinds, dict(kwargs), info.kwarg_kinds, info.kinds
+        )
+
+    _fused_dispatch.fused_dispatch = True
+    return _fused_dispatch
+
+
+# Op Instrumentation #
+# -------------------#
+
+
+class _OpHook:
+    """
+    Base class of the hooks which see the calls made to the ivy functions while
+    they are registered with ``_register_op_hook``, such as the profilers of
+    ``ivy.utils.profiler``, the gradient tapes of the numpy backend and the batching
+    traces of ``ivy.vmap``.
+
+    The hook registered last sees each call first, and passes it on to those
+    registered before it through ``call_next``, which takes the positional and
+    keyword arguments to make the call with. ``fn`` is the function eventually
+    called, to inspect rather than call.
+    """
+
+    def call(self, name, fn, args, kwargs, call_next):
+        """Intercept the call to the ivy function ``name``, wrappers included."""
+        return call_next(args, kwargs)
+
+    def call_backend(self, name, fn, args, kwargs, call_next):
+        """Intercept the call to the backend implementation of ``name``."""
+        return call_next(args, kwargs)
+
+
+# the registered hooks, a single hook is installed on each function by
+# `_wrap_function`, which only checks whether any is registered while none is
+_op_hooks = ()
+_op_hooks_lock = threading.Lock()
+
+
+def _register_op_hook(hook: _OpHook):
+    global _op_hooks
+    with _op_hooks_lock:
+        _op_hooks = _op_hooks + (hook,)
+
+
+def _unregister_op_hook(hook: _OpHook):
+    global _op_hooks
+    with _op_hooks_lock:
+        # hooks may be unregistered in any order, the last registration is removed
+        idx = max(i for i, h in enumerate(_op_hooks) if h is hook)
+        _op_hooks = _op_hooks[:idx] + _op_hooks[idx + 1 :]
+
+
+def _call_hooks(hooks, method, name, fn, args, kwargs):
+    # the hooks registered last see the call first, the first one registered
+    # passes it on to fn
+    def _call_next(idx, args, kwargs):
+        if idx < 0:
+            return fn(*args, **kwargs)
+        return getattr(hooks[idx], method)(
+            name, fn, args, kwargs, functools.partial(_call_next, idx - 1)
+        )
+
+    return _call_next(len(hooks) - 1, args, kwargs)
+
+
+def _instrument_backend_fn(fn: Callable, name: str) -> Callable:
+    # hooks the backend implementation itself, only part of the wrapper stacks
+    # called while hooks are registered
+    @functools.wraps(fn)
+    def _hooked_backend_fn(*args, **kwargs):
+        hooks = _op_hooks
+        if not hooks:
+            return fn(*args, **kwargs)
+        return _call_hooks(hooks, "call_backend", name, fn, args, kwargs)
+
+    return _hooked_backend_fn
+
+
+def _instrument_fn(
+    fn: Callable, name: str, build_hooked: Optional[Callable] = None
+) -> Callable:
+    # outermost hook. While hooks are registered, the call is made through a copy of
+    # the wrapper stack built around the hooked backend implementation by
+    # `build_hooked`, so that the backend isn't hooked while none is
+    hooked_fn = None
+
+    @functools.wraps(fn)
+    def _instrumented_fn(*args, **kwargs):
+        nonlocal hooked_fn
+        hooks = _op_hooks
+        if not hooks:
+            return fn(*args, **kwargs)
+        if hooked_fn is None:
+            hooked_fn = fn if build_hooked is None else build_hooked()
+        return _call_hooks(hooks, "call", name, hooked_fn, args, kwargs)
+
+    _instrumented_fn._instrumented = True
+    return _instrumented_fn
+
+
 # Functions #
 
 
@@ -1100,28 +1721,67 @@ def _wrap_function(
             add_wrappers = backend_wrappers.get("to_add")
             skip_wrappers = backend_wrappers.get("to_skip")
 
-        for attr in FN_DECORATORS:
-            if hasattr(original, attr) and not hasattr(to_wrap, attr):
-                if partial_mixed and attr == "handle_partial_mixed_function":
-                    to_wrap.compos = original
-                    to_wrap = handle_partial_mixed_function(to_wrap)
-                if attr not in skip_wrappers:
+        def _wrap_stack(to_wrap):
+            unwrapped, applied_wrappers = to_wrap, []
+            for attr in FN_DECORATORS:
+                if hasattr(original, attr) and not hasattr(to_wrap, attr):
+                    if partial_mixed and attr == "handle_partial_mixed_function":
+                        to_wrap.compos = original
+                        to_wrap = handle_partial_mixed_function(to_wrap)
+                    if attr not in skip_wrappers:
+                        to_wrap = getattr(ivy, attr)(to_wrap)
+                        applied_wrappers.append(attr)
+                if attr in add_wrappers:
                     to_wrap = getattr(ivy, attr)(to_wrap)
-            if attr in add_wrappers:
-                to_wrap = getattr(ivy, attr)(to_wrap)
-
-        # we should remove the all the decorators
-        # after handle_mixed_fuction in FN_DECORATORS
-        # from the compos function because these will
-        # be run from the primary implementation.
-        if partial_mixed:
-            array_spec = to_wrap.compos.__dict__["array_spec"]
-            for attr in FN_DECORATORS[
-                -1 : FN_DECORATORS.index("handle_partial_mixed_function") : -1
-            ]:
-                if hasattr(to_wrap.compos, attr):
-                    to_wrap.compos = to_wrap.compos.__wrapped__
-            to_wrap.compos.__dict__["array_spec"] = array_spec
+
+            # replace the decorator stack with a single fused dispatch wrapper, only
+            # possible if the whole stack was built here and every step is fusable
+            if (
+                ivy.fused_dispatch_mode
+                and applied_wrappers
+                and not mixed_fn
+                and not any(hasattr(unwrapped, attr) for attr in FN_DECORATORS)
+                and _FUSABLE_DECORATORS.issuperset(applied_wrappers)
+            ):
+                to_wrap = _fuse_wrappers(to_wrap, unwrapped, applied_wrappers)
+
+            # we should remove the all the decorators
+            # after handle_mixed_fuction in FN_DECORATORS
+            # from the compos function because these will
+            # be run from the primary implementation.
+            if partial_mixed:
+                array_spec = to_wrap.compos.__dict__.get("array_spec")
+                for attr in FN_DECORATORS[
+                    -1 : FN_DECORATORS.index("handle_partial_mixed_function") : -1
+                ]:
+                    if hasattr(to_wrap.compos, attr):
+                        to_wrap.compos = to_wrap.compos.__wrapped__
+                if array_spec is not None:
+                    to_wrap.compos.__dict__["array_spec"] = array_spec
+
+            # containers are mapped sequentially while gradients are computed
+            if getattr(original, "computes_gradients", False) and not hasattr(
+                to_wrap, "_instrumented"
+            ):
+                from ivy.data_classes.container.base import _sequential_leaves
+
+                to_wrap = _sequential_leaves(to_wrap)
+            return to_wrap
+
+        # the stack hooking the backend implementation is only built once the
+        # function is called while hooks are registered
+        build_hooked = None
+        if any(hasattr(original, attr) for attr in FN_DECORATORS) and not any(
+            hasattr(to_wrap, attr) for attr in FN_DECORATORS
+        ):
+            raw = to_wrap
+            build_hooked = lambda: _wrap_stack(_instrument_backend_fn(raw, key))
+        to_wrap = _wrap_stack(to_wrap)
+
+        if not hasattr(to_wrap, "_instrumented") and any(
+            hasattr(to_wrap, attr) for attr in FN_DECORATORS
+        ):
+            to_wrap = _instrument_fn(to_wrap, key, build_hooked)
     return to_wrap
 
 
@@ -1531,35 +2191,56 @@ def handle_backend_invalid(fn: Callable) -> Callable:
             backend matches the argument backend.
             If not, it raises an InvalidBackendException
         """
-        array_indices = ivy.nested_argwhere(
-            [args, kwargs], lambda x: isinstance(x, ivy.Array)
-        )
-        array_vals = ivy.multi_index_nest([args, kwargs], array_indices)
-
-        def func(x):
-            target_backend = ivy.utils.backend.handler._determine_backend_from_args(x)
-            if (
-                target_backend is not None
-                and ivy.backend != ""
-                and ivy.current_backend_str() != target_backend.backend
-            ):
-                raise ivy.utils.exceptions.IvyInvalidBackendException(
-                    "Operation not allowed. Array was instantiated with backend"
-                    f" {target_backend.backend}. But current backend is"
-                    f" {ivy.backend}. Please set dynamic=True"
-                    " for the array if you want to convert it to the target"
-                    " backend"
-                )
-            return x
-
-        ivy.nested_map(func, array_vals, include_derived=True)
+        info, prev = _share_args_info(args, kwargs)
+        try:
+            if info.simple:
+                for x in info.flat_arrays():
+                    if isinstance(x, ivy.Array):
+                        _check_array_backend(x)
+            elif info.has_ivy_array:
+                # the leaves of packed containers are views of their buffers, so
+                # checking the buffers is enough
+                nest = [
+                    [_packed_buffers_or_self(x) for x in args],
+                    {k: _packed_buffers_or_self(v) for k, v in kwargs.items()},
+                ]
+                for x in ivy.flatten_nest(nest)[0]:
+                    if isinstance(x, ivy.Array):
+                        _check_array_backend(x)
 
-        return fn(*args, **kwargs)
+            return fn(*args, **kwargs)
+        finally:
+            _args_info_local.info = prev
 
     _handle_backend_invalid.handle_backend_invalid = True
     return _handle_backend_invalid
 
 
+def _packed_buffers_or_self(x):
+    if isinstance(x, ivy.Container):
+        buffers = x.cont_packed_buffers
+        if buffers is not None:
+            return buffers
+    return x
+
+
+def _check_array_backend(x):
+    target_backend = ivy.utils.backend.handler._determine_backend_from_args(x)
+    if (
+        target_backend is not None
+        and ivy.backend != ""
+        and ivy.current_backend_str() != target_backend.backend
+    ):
+        raise ivy.utils.exceptions.IvyInvalidBackendException(
+            "Operation not allowed. Array was instantiated with backend"
+            f" {target_backend.backend}. But current backend is"
+            f" {ivy.backend}. Please set dynamic=True"
+            " for the array if you want to convert it to the target"
+            " backend"
+        )
+    return x
+
+
 attribute_dict = {
     "unsupported_dtypes",
     "supported_dtypes",
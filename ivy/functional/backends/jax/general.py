@@ -413,6 +413,8 @@ def vmap(
     func: Callable,
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
     out_axes: int = 0,
+    *,
+    batch_ops: bool = False,
 ) -> Callable:
     func = ivy.output_to_native_arrays(func)
     return ivy.inputs_to_native_arrays(
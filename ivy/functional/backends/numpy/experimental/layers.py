@@ -8,11 +8,9 @@ from typing import Optional, Union, Tuple, List, Literal, Sequence, Callable
 import ivy
 from ivy.functional.ivy.layers import (
     _handle_padding,
-    _get_num_padded_values,
     _validate_max_pool_params,
     _depth_max_pooling_helper,
 )
-from ivy.functional.backends.numpy.layers import _add_dilations
 from ivy.functional.ivy.experimental.layers import (
     _padding_ceil_mode,
 )
@@ -30,36 +28,53 @@ def _determine_depth_max_pooling(x, kernel, strides, dims, data_format="channel_
     return x, kernel, strides, depth_pooling
 
 
-def max_pool1d(
-    x: np.ndarray,
-    kernel: Union[int, Tuple[int, ...]],
-    strides: Union[int, Tuple[int, ...]],
-    padding: Union[str, int, Tuple[int], List[Tuple[int, int]]],
-    /,
-    *,
-    data_format: str = "NWC",
-    dilation: Union[int, Tuple[int]] = 1,
-    ceil_mode: bool = False,
-    out: Optional[np.ndarray] = None,
-) -> np.ndarray:
-    dims = 1
+def _pool_windows(x, kernel, strides, dilation, reduce_fn):
+    # reduces the sliding windows of a padded channel last input one spatial
+    # dimension at a time, every kernel offset being a strided view of the input
+    # so that neither the windows nor the dilated kernel are ever materialized
+    dims = len(kernel)
+    for i in range(dims):
+        span = (kernel[i] - 1) * dilation[i] + 1
+        out_size = (x.shape[i + 1] - span) // strides[i] + 1
+        if out_size <= 0:
+            # the dilated kernel is larger than the input, there are no windows
+            x = x[(slice(None),) * (i + 1) + (slice(0, 0),)]
+            continue
+        windows = [
+            x[
+                (slice(None),) * (i + 1)
+                + (
+                    slice(
+                        j * dilation[i],
+                        j * dilation[i] + (out_size - 1) * strides[i] + 1,
+                        strides[i],
+                    ),
+                )
+            ]
+            for j in range(kernel[i])
+        ]
+        if len(windows) == 1:
+            x = windows[0]
+            continue
+        res = reduce_fn(windows[0], windows[1])
+        for window in windows[2:]:
+            reduce_fn(res, window, out=res)
+        x = res
+    return x
+
+
+def _max_pool(x, kernel, strides, padding, dilation, ceil_mode, dims, channel_first):
     kernel, strides, padding, dilation = _validate_max_pool_params(
         kernel, strides, padding, dilation, ceil_mode, dims=dims
     )
 
-    if data_format == "NCW":
-        x = np.swapaxes(x, 1, 2)
-        kernel = [kernel[i] for i in [0, 2, 1]] if len(kernel) == (dims + 2) else kernel
-        strides = (
-            [strides[i] for i in [0, 2, 1]] if len(strides) == (dims + 2) else strides
-        )
+    if channel_first:
+        perm = [0, *range(2, dims + 2), 1]
+        x = np.transpose(x, perm)
+        kernel = [kernel[i] for i in perm] if len(kernel) == (dims + 2) else kernel
+        strides = [strides[i] for i in perm] if len(strides) == (dims + 2) else strides
         padding = (
-            [padding[i] for i in [0, 2, 1]]
-            if isinstance(padding, list) and len(padding) == (dims + 2)
-            else padding
-        )
-        padding = (
-            [padding[i] for i in [0, 2, 1]]
+            [padding[i] for i in perm]
             if isinstance(padding, list) and len(padding) == (dims + 2)
             else padding
         )
@@ -68,33 +83,30 @@ def max_pool1d(
         x, kernel, strides, dims, data_format="channel_last"
     )
 
-    x_shape = x.shape[1:2]
-    filters = np.ones((list(kernel)), dtype=x.dtype)
     if not depth_pooling:
-        if dilation[0] > 1:
-            filters = _add_dilations(filters, dilation[0], axis=0, values=0)
-        kernel = list(filters.shape)
-        pad_list = padding
+        x_shape = x.shape[1 : dims + 1]
+        # size of the dilated kernel
+        span = [(kernel[i] - 1) * dilation[i] + 1 for i in range(dims)]
         if isinstance(padding, str):
-            pad_w = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
-            pad_list = [
-                (pad_w // 2, pad_w - pad_w // 2),
+            pad_specific = [
+                _handle_padding(x_shape[i], strides[i], span[i], padding)
+                for i in range(dims)
             ]
+            pad_list = [(p // 2, p - p // 2) for p in pad_specific]
+        else:
+            pad_list = list(padding)
         if ceil_mode:
-            pad_list[0] = _padding_ceil_mode(
-                x_shape[0], kernel[0], pad_list[0], strides[0]
+            for i in range(dims):
+                pad_list[i] = _padding_ceil_mode(
+                    x_shape[i], span[i], pad_list[i], strides[i]
+                )
+        if any(any(p) for p in pad_list):
+            x = np.pad(
+                x,
+                [(0, 0), *pad_list, (0, 0)],
+                "constant",
+                constant_values=-math.inf,
             )
-
-        x = np.pad(
-            x,
-            [
-                (0, 0),
-                *pad_list,
-                (0, 0),
-            ],
-            "constant",
-            constant_values=-math.inf,
-        )
     else:
         if isinstance(padding, list) and any(
             [item != 0 for sublist in padding for item in sublist]
@@ -102,145 +114,64 @@ def max_pool1d(
             raise NotImplementedError(
                 "Nonzero explicit padding is not supported for depthwise max pooling"
             )
+        dilation = [1] * dims
 
-    x_shape = x.shape
-    new_w = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OW x KW x I
-    sub_matrices = np.where(
-        filters.reshape([1] * 2 + list(kernel) + [1]), sub_matrices, -math.inf
-    )
-
-    res = sub_matrices.max(axis=(2))
+    res = _pool_windows(x, kernel, strides, dilation, np.maximum)
 
     if depth_pooling:
-        res = np.swapaxes(res, 1, 2)
-    if data_format == "NCW":
-        res = np.swapaxes(res, 1, 2)
+        res = np.transpose(res, (0, *range(2, dims + 2), 1))
+    if channel_first:
+        res = np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
 
 
-def max_pool2d(
+def max_pool1d(
     x: np.ndarray,
     kernel: Union[int, Tuple[int, ...]],
     strides: Union[int, Tuple[int, ...]],
     padding: Union[str, int, Tuple[int], List[Tuple[int, int]]],
     /,
     *,
-    data_format: str = "NHWC",
-    dilation: Union[int, Tuple[int, ...]] = 1,
+    data_format: str = "NWC",
+    dilation: Union[int, Tuple[int]] = 1,
     ceil_mode: bool = False,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    dims = 2
-    kernel, strides, padding, dilation = _validate_max_pool_params(
-        kernel, strides, padding, dilation, ceil_mode, dims=dims
-    )
-
-    if data_format == "NCHW":
-        x = np.transpose(x, (0, 2, 3, 1))
-        kernel = (
-            [kernel[i] for i in [0, 2, 3, 1]] if len(kernel) == (dims + 2) else kernel
-        )
-        strides = (
-            [strides[i] for i in [0, 2, 3, 1]]
-            if len(strides) == (dims + 2)
-            else strides
-        )
-        padding = (
-            [padding[i] for i in [0, 2, 3, 1]]
-            if isinstance(padding, list) and len(padding) == (dims + 2)
-            else padding
-        )
-
-    x, kernel, strides, depth_pooling = _determine_depth_max_pooling(
-        x, kernel, strides, dims, data_format="channel_last"
-    )
-
-    x_shape = list(x.shape[1:3])
-    filters = np.ones((list(kernel)), dtype=x.dtype)
-    if not depth_pooling:
-        for j in range(dims):
-            if dilation[j] > 1:
-                filters = _add_dilations(filters, dilation[j], axis=j, values=0)
-        kernel = list(filters.shape)
-        pad_list = padding
-        if isinstance(padding, str):
-            pad_h = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
-            pad_w = _handle_padding(x_shape[1], strides[1], kernel[1], padding)
-            pad_list = [
-                (pad_h // 2, pad_h - pad_h // 2),
-                (pad_w // 2, pad_w - pad_w // 2),
-            ]
-        pad_list = list(pad_list)
-        if ceil_mode:
-            for i in range(dims):
-                pad_list[i] = _padding_ceil_mode(
-                    x_shape[i], kernel[i], pad_list[i], strides[i]
-                )
-
-        x = np.pad(
-            x,
-            [
-                (0, 0),
-                *pad_list,
-                (0, 0),
-            ],
-            "constant",
-            constant_values=-math.inf,
-        )
-    else:
-        if isinstance(padding, list) and any(
-            [item != 0 for sublist in padding for item in sublist]
-        ):
-            raise NotImplementedError(
-                "Nonzero explicit padding is not supported for depthwise max pooling"
-            )
-
-    x_shape = x.shape
-    new_h = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_w = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
+    return _max_pool(
+        x,
+        kernel,
+        strides,
+        padding,
+        dilation,
+        ceil_mode,
+        1,
+        data_format == "NCW",
     )
 
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
 
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.where(
-        filters.reshape([1] * 3 + list(kernel) + [1]), sub_matrices, -math.inf
+def max_pool2d(
+    x: np.ndarray,
+    kernel: Union[int, Tuple[int, ...]],
+    strides: Union[int, Tuple[int, ...]],
+    padding: Union[str, int, Tuple[int], List[Tuple[int, int]]],
+    /,
+    *,
+    data_format: str = "NHWC",
+    dilation: Union[int, Tuple[int, ...]] = 1,
+    ceil_mode: bool = False,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    return _max_pool(
+        x,
+        kernel,
+        strides,
+        padding,
+        dilation,
+        ceil_mode,
+        2,
+        data_format == "NCHW",
     )
 
-    # B x OH x OW x O
-    res = sub_matrices.max(axis=(3, 4))
-
-    if depth_pooling:
-        res = np.transpose(res, (0, 2, 3, 1))
-    if data_format == "NCHW":
-        return np.transpose(res, (0, 3, 1, 2))
-    return res
-
 
 def max_pool3d(
     x: np.ndarray,
@@ -254,109 +185,17 @@ def max_pool3d(
     ceil_mode: bool = False,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    dims = 3
-    kernel, strides, padding, dilation = _validate_max_pool_params(
-        kernel, strides, padding, dilation, ceil_mode, dims=dims
-    )
-
-    if data_format == "NCDHW":
-        x = np.transpose(x, (0, 2, 3, 4, 1))
-        kernel = (
-            [kernel[i] for i in [0, 2, 3, 4, 1]]
-            if len(kernel) == (dims + 2)
-            else kernel
-        )
-        strides = (
-            [strides[i] for i in [0, 2, 3, 4, 1]]
-            if len(strides) == (dims + 2)
-            else strides
-        )
-        padding = (
-            [padding[i] for i in [0, 2, 3, 4, 1]]
-            if isinstance(padding, list) and len(padding) == (dims + 2)
-            else padding
-        )
-
-    x, kernel, strides, depth_pooling = _determine_depth_max_pooling(
-        x, kernel, strides, dims, data_format="channel_last"
-    )
-
-    x_shape = x.shape[1:4]
-    filters = np.ones((list(kernel)), dtype=x.dtype)
-    if not depth_pooling:
-        for j in range(dims):
-            if dilation[j] > 1:
-                filters = _add_dilations(filters, dilation[j], axis=j, values=0)
-        kernel = list(filters.shape)
-        pad_list = padding
-        if isinstance(padding, str):
-            pad_d = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
-            pad_h = _handle_padding(x_shape[1], strides[1], kernel[1], padding)
-            pad_w = _handle_padding(x_shape[2], strides[2], kernel[2], padding)
-            pad_list = [
-                (pad_d // 2, pad_d - pad_d // 2),
-                (pad_h // 2, pad_h - pad_h // 2),
-                (pad_w // 2, pad_w - pad_w // 2),
-            ]
-        pad_list = list(pad_list)
-        if ceil_mode:
-            for i in range(dims):
-                pad_list[i] = _padding_ceil_mode(
-                    x_shape[i], kernel[i], pad_list[i], strides[i]
-                )
-
-        x = np.pad(
-            x,
-            [
-                (0, 0),
-                *pad_list,
-                (0, 0),
-            ],
-            "constant",
-            constant_values=-math.inf,
-        )
-    else:
-        if isinstance(padding, list) and any(
-            [item != 0 for sublist in padding for item in sublist]
-        ):
-            raise NotImplementedError(
-                "Nonzero explicit padding is not supported for depthwise max pooling"
-            )
-
-    x_shape = x.shape
-    new_d = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_h = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_w = (x_shape[3] - kernel[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD x OH x OW x KD x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OD x OH x OW x KD x KH x KW x I
-    sub_matrices = np.where(
-        filters.reshape([1] * 4 + list(kernel) + [1]), sub_matrices, -math.inf
+    return _max_pool(
+        x,
+        kernel,
+        strides,
+        padding,
+        dilation,
+        ceil_mode,
+        3,
+        data_format == "NCDHW",
     )
 
-    # B x OD x OH x OW x O
-    res = sub_matrices.max(axis=(4, 5, 6))
-
-    if depth_pooling:
-        res = np.transpose(res, (0, 2, 3, 4, 1))
-    if data_format == "NCDHW":
-        return np.transpose(res, (0, 4, 1, 2, 3))
-    return res
-
 
 def _get_padded_values(x_shape, kernel, strides, padding, ceil_mode, dim):
     if isinstance(padding, str):
@@ -382,90 +221,101 @@ def _get_padded_values(x_shape, kernel, strides, padding, ceil_mode, dim):
     return padding, pad_specific, c
 
 
-def avg_pool1d(
-    x: np.ndarray,
-    kernel: Union[int, Tuple[int]],
-    strides: Union[int, Tuple[int]],
-    padding: str,
-    /,
-    *,
-    data_format: str = "NWC",
-    count_include_pad: bool = False,
-    ceil_mode: bool = False,
-    out: Optional[np.ndarray] = None,
-) -> np.ndarray:
+def _avg_pool(
+    x,
+    kernel,
+    strides,
+    padding,
+    dims,
+    channel_first,
+    count_include_pad,
+    ceil_mode,
+    divisor_override=None,
+):
     if isinstance(kernel, int):
-        kernel = [kernel]
+        kernel = [kernel] * dims
     elif len(kernel) == 1:
-        kernel = [kernel[0]]
+        kernel = [kernel[0]] * dims
 
     if isinstance(strides, int):
-        strides = [strides]
+        strides = [strides] * dims
     elif len(strides) == 1:
-        strides = [strides[0]]
+        strides = [strides[0]] * dims
 
-    if data_format in ("NCW", "NCL"):
-        x = np.swapaxes(x, 1, 2)
+    if channel_first:
+        x = np.transpose(x, (0, *range(2, dims + 2), 1))
 
-    x_shape = x.shape[1:-1]
+    x_shape = list(x.shape[1 : dims + 1])
     padding, pad_specific, c = _get_padded_values(
-        x_shape, kernel, strides, padding, ceil_mode, 1
+        x_shape,
+        kernel,
+        strides,
+        padding if isinstance(padding, str) else list(padding),
+        ceil_mode,
+        dims,
     )
+    if any(any(p) for p in padding):
+        x = np.pad(x, [(0, 0), *padding, (0, 0)], constant_values=0.0)
 
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
-    )
+    # half precision windows are summed in single precision, as np.mean does
+    dtype = x.dtype
+    if dtype == np.float16:
+        x = x.astype(np.float32)
+    res = _pool_windows(x, kernel, strides, [1] * dims, np.add)
 
-    x_shape = x.shape
-    new_w = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w, kernel[0]] + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    res = np.mean(sub_matrices, axis=2)
-
-    if (not count_include_pad or ceil_mode) and any(pad_specific):
-        if not count_include_pad:
-            num_padded_values = np.array(
-                ivy.map(
-                    _get_num_padded_values,
-                    constant={
-                        "p": pad_specific[0],
-                        "n": x.shape[1] - pad_specific[0],
-                        "k": kernel[0],
-                        "s": strides[0],
-                    },
-                    unique={
-                        "i": np.arange(res.shape[1]),
-                    },
-                ),
-                dtype=res.dtype,
+    if divisor_override is not None:
+        res = res / divisor_override
+    elif (not count_include_pad or ceil_mode) and any(pad_specific):
+        # the number of values of each window which are not padding, the count
+        # factorizes over the spatial dimensions
+        divisor = np.ones(res.shape[1:-1], dtype=np.int64)
+        for i in range(dims):
+            if not count_include_pad:
+                index = strides[i] * np.arange(res.shape[i + 1])
+                left_padding = pad_specific[i] // 2
+                num_padded_values = np.maximum(0, left_padding - index) + np.maximum(
+                    0, index + kernel[i] - x_shape[i] - left_padding
+                )
+            else:
+                num_padded_values = np.zeros(res.shape[i + 1], dtype=np.int64)
+                num_padded_values[-1] = c[i]
+            divisor = divisor * (kernel[i] - num_padded_values).reshape(
+                [-1] + [1] * (dims - i - 1)
             )
-        else:
-            num_padded_values = np.zeros(res.shape[1], dtype=res.dtype)
-            num_padded_values[-1] = c[0]
-        res = (kernel[0] * res) / (kernel[0] - num_padded_values[:, None])
-
-    if data_format in ("NCW", "NCL"):
-        return res.swapaxes(1, 2)
+        res = res / np.expand_dims(divisor, -1).astype(res.dtype, copy=False)
+    else:
+        res = res / np.prod(kernel)
+    res = res.astype(dtype, copy=False)
 
+    if channel_first:
+        return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
 
 
+def avg_pool1d(
+    x: np.ndarray,
+    kernel: Union[int, Tuple[int]],
+    strides: Union[int, Tuple[int]],
+    padding: str,
+    /,
+    *,
+    data_format: str = "NWC",
+    count_include_pad: bool = False,
+    ceil_mode: bool = False,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    return _avg_pool(
+        x,
+        kernel,
+        strides,
+        padding,
+        1,
+        data_format in ("NCW", "NCL"),
+        count_include_pad,
+        ceil_mode,
+    )
+
+
 def avg_pool2d(
     x: np.ndarray,
     kernel: Union[int, Tuple[int], Tuple[int, int]],
@@ -479,99 +329,18 @@ def avg_pool2d(
     divisor_override: Optional[int] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    if isinstance(kernel, int):
-        kernel = [kernel] * 2
-    elif len(kernel) == 1:
-        kernel = [kernel[0]] * 2
-
-    if isinstance(strides, int):
-        strides = [strides] * 2
-    elif len(strides) == 1:
-        strides = [strides[0]] * 2
-
-    if data_format == "NCHW":
-        x = np.transpose(x, (0, 2, 3, 1))
-
-    x_shape = list(x.shape[1:3])
-    padding, pad_specific, c = _get_padded_values(
-        x_shape, kernel, strides, padding, ceil_mode, 2
-    )
-    x = np.pad(
+    return _avg_pool(
         x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
+        kernel,
+        strides,
+        padding,
+        2,
+        data_format == "NCHW",
+        count_include_pad,
+        ceil_mode,
+        divisor_override=divisor_override,
     )
 
-    x_shape = x.shape
-    new_h = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_w = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OH x OW x O
-    if divisor_override is not None:
-        res = np.sum(sub_matrices, axis=(3, 4)) / divisor_override
-    else:
-        res = np.mean(sub_matrices, axis=(3, 4))
-    if (
-        (not count_include_pad or ceil_mode)
-        and any(pad_specific)
-        and not divisor_override
-    ):
-        if not count_include_pad:
-            num_padded_values = [
-                np.array(
-                    ivy.map(
-                        _get_num_padded_values,
-                        constant={
-                            "p": pad_specific[i],
-                            "n": x.shape[i + 1] - pad_specific[i],
-                            "k": kernel[i],
-                            "s": strides[i],
-                        },
-                        unique={
-                            "i": np.arange(res.shape[i + 1]),
-                        },
-                    ),
-                    dtype=res.dtype,
-                )
-                for i in range(2)
-            ]
-        else:
-            num_padded_values = []
-            for i in range(2):
-                num_pad = np.zeros(res.shape[i + 1], dtype=res.dtype)
-                num_pad[-1] = c[i]
-                num_padded_values.append(num_pad)
-        num_padded_values1 = num_padded_values[0][:, None]
-        num_padded_values2 = num_padded_values[1][None, :]
-        num_padded_values = (
-            num_padded_values1 * kernel[1]
-            + num_padded_values2 * kernel[0]
-            - num_padded_values1 * num_padded_values2
-        )
-        kernel_mul = np.prod(kernel)
-        res = (kernel_mul * res) / (kernel_mul - np.expand_dims(num_padded_values, -1))
-
-    if data_format == "NCHW":
-        return np.transpose(res, (0, 3, 1, 2))
-    return res
-
 
 def avg_pool3d(
     x: np.ndarray,
@@ -586,108 +355,18 @@ def avg_pool3d(
     divisor_override: Optional[int] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    if isinstance(kernel, int):
-        kernel = [kernel] * 3
-    elif len(kernel) == 1:
-        kernel = [kernel[0]] * 3
-
-    if isinstance(strides, int):
-        strides = [strides] * 3
-    elif len(strides) == 1:
-        strides = [strides[0]] * 3
-
-    if data_format == "NCDHW":
-        x = np.transpose(x, (0, 2, 3, 4, 1))
-
-    x_shape = list(x.shape[1:4])
-    padding, pad_specific, c = _get_padded_values(
-        x_shape, kernel, strides, padding, ceil_mode, 3
-    )
-
-    x = np.pad(
+    return _avg_pool(
         x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
-    )
-
-    x_shape = x.shape
-    new_d = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_h = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_w = (x_shape[3] - kernel[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
+        kernel,
+        strides,
+        padding,
+        3,
+        data_format == "NCDHW",
+        count_include_pad,
+        ceil_mode,
+        divisor_override=divisor_override,
     )
 
-    # B x OH x OW x O
-    if divisor_override is not None:
-        res = np.sum(sub_matrices, axis=(4, 5, 6)) / divisor_override
-    else:
-        res = np.mean(sub_matrices, axis=(4, 5, 6))
-
-    if (
-        (not count_include_pad or ceil_mode)
-        and any(pad_specific)
-        and not divisor_override
-    ):
-        if not count_include_pad:
-            num_padded_values = [
-                np.array(
-                    ivy.map(
-                        _get_num_padded_values,
-                        constant={
-                            "p": pad_specific[i],
-                            "n": x.shape[i + 1] - pad_specific[i],
-                            "k": kernel[i],
-                            "s": strides[i],
-                        },
-                        unique={
-                            "i": np.arange(res.shape[i + 1]),
-                        },
-                    ),
-                    dtype=res.dtype,
-                )
-                for i in range(3)
-            ]
-        else:
-            num_padded_values = []
-            for i in range(3):
-                num_pad = np.zeros(res.shape[i + 1], dtype=res.dtype)
-                num_pad[-1] = c[i]
-                num_padded_values.append(num_pad)
-        num_padded_values1 = num_padded_values[0].reshape((-1, 1, 1))
-        num_padded_values2 = num_padded_values[1].reshape((1, -1, 1))
-        num_padded_values3 = num_padded_values[2].reshape((1, 1, -1))
-        num_padded_values = (
-            num_padded_values1 * kernel[1] * kernel[2]
-            + num_padded_values2 * kernel[0] * kernel[2]
-            + num_padded_values3 * kernel[0] * kernel[1]
-            + num_padded_values1 * num_padded_values2 * num_padded_values3
-            - num_padded_values1 * num_padded_values2 * kernel[2]
-            - num_padded_values1 * num_padded_values3 * kernel[1]
-            - num_padded_values2 * num_padded_values3 * kernel[0]
-        )
-        kernel_mul = np.prod(kernel)
-        res = (kernel_mul * res) / (kernel_mul - np.expand_dims(num_padded_values, -1))
-    if data_format == "NCDHW":
-        return np.transpose(res, (0, 4, 1, 2, 3))
-    return res
-
 
 def fft(
     x: np.ndarray,
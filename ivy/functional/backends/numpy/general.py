@@ -14,7 +14,7 @@ from ivy.functional.backends.numpy.device import _to_device
 from ivy.functional.backends.numpy.helpers import _scalar_output_to_0d_array
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
-from ...ivy.general import _broadcast_to
+from ...ivy.general import _broadcast_to, _vmap_batched
 
 
 def array_equal(x0: np.ndarray, x1: np.ndarray, /) -> bool:
@@ -353,7 +353,12 @@ def vmap(
     func: Callable,
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
     out_axes: int = 0,
+    *,
+    batch_ops: bool = False,
 ) -> Callable:
+    # the input signatures which can't be batched, see _vmap_batched
+    unbatchable = set()
+
     @ivy.output_to_native_arrays
     @ivy.inputs_to_native_arrays
     def _vmap(*args):
@@ -399,33 +404,33 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = np.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
         # set up the axis to be mapped to index zero.
-        if isinstance(in_axes, (tuple, list)):
-            for i in range(len(in_axes)):
-                if in_axes[i] is not None:
-                    args[i] = np.moveaxis(args[i], in_axes[i], 0)
-        elif isinstance(in_axes, int):
-            args[0] = np.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
+        axes = in_axes if isinstance(in_axes, (tuple, list)) else [in_axes] * len(args)
+        for i, axis in enumerate(axes):
+            if axis is not None:
+                args[i] = np.moveaxis(args[i], axis, 0)
+
+        # vectorisation, through the batching rules of the ivy functions called by
+        # func if requested, with a loop over the slices otherwise or for the
+        # functions which have none.
+        res = None
+        if batch_ops:
+            res = _vmap_batched(
+                func, args, [axis is not None for axis in axes], unbatchable
+            )
+        if res is None:
+            # Handling None in in_axes by broadcasting the axis_size
+            for i, axis in enumerate(axes):
+                if axis is None:
+                    args[i] = np.broadcast_to(
+                        args[i], (tuple(axis_size) + args[i].shape)
+                    )
+
+            arr_results = []
+            for arrays in zip(*args):
+                single_op = func(*arrays)
+                arr_results.append(single_op)
+            res = np.stack(arr_results)
 
         if out_axes:
             res = np.moveaxis(res, 0, out_axes)
@@ -1,22 +1,791 @@
 """Collection of NumPy gradient functions, wrapped to fit Ivy syntax and signature."""
 
 # global
-import logging
-from typing import Optional, Sequence, Union
+import functools
+import inspect
+import itertools
+import math
+import threading
+from typing import Callable, Optional, Sequence, Union
+
+import numpy as np
+
+# local
 import ivy
+from ivy import func_wrapper
+from ivy.func_wrapper import outputs_to_ivy_arrays, inputs_to_ivy_arrays
+from ivy.functional.ivy.gradients import (
+    _get_required_float_variables,
+    _get_y_and_ret_idxs,
+    _get_native_y,
+    _set_duplicates,
+    _process_func_ret_and_grads,
+)
+from ivy.utils.backend import backend_stack
+from ivy.utils.exceptions import IvyNotImplementedException
+from .layers import _conv_pad_list
+
+
+# Tape #
+# -----#
+
+# NumPy has no autograd, so the backend calls made with tracked arrays are recorded on
+# a tape, through an op hook registered with `ivy.func_wrapper`, and are then
+# differentiated in reverse with the vector-jacobian products registered below. These
+# are written with ivy functions, so that the backward pass of a tape is itself
+# recorded by any enclosing tape, which gives higher order gradients.
+
+
+def _is_float_array(x):
+    return isinstance(x, np.ndarray) and x.dtype.kind in "fc"
+
+
+def _as_list(x):
+    return x if isinstance(x, (list, tuple)) else [x]
+
+
+def _to_native_output(x):
+    # the outputs are tracked as the native arrays the ivy wrappers pass on, some
+    # backend functions return ivy arrays or numpy scalars
+    if isinstance(x, ivy.Array):
+        x = x.data
+    if isinstance(x, np.generic):
+        return np.asarray(x)
+    return x
+
+
+def _native_y(y):
+    # the differentiated output may be an array of another ivy instance, such as one
+    # of the backend handler, which still holds the recorded native array
+    return getattr(y, "_data", y)
+
+
+@functools.lru_cache(maxsize=None)
+def _signature(fn):
+    return inspect.signature(fn)
+
+
+def _to_ivy_argument(x):
+    # saved arrays are wrapped for the vector-jacobian products, keeping the native
+    # arrays, and therefore their tracking by any enclosing tape
+    if isinstance(x, np.ndarray):
+        return ivy.Array(x)
+    if (
+        isinstance(x, (list, tuple))
+        and x
+        and all(isinstance(x_, np.ndarray) for x_ in x)
+    ):
+        return [ivy.Array(x_) for x_ in x]
+    return x
+
+
+class _Tape(func_wrapper._OpHook):
+    def __init__(self, xs):
+        """
+        Record the numpy backend calls which depend on the arrays of ``xs``.
+
+        Only the ivy function calls made while the tape is entered are recorded, not
+        numpy operations on native arrays, and in-place updates of the recorded
+        arrays are not supported. Calls with tracked inputs
+        and floating point outputs which have no vector-jacobian product raise an
+        ``IvyNotImplementedException``, rather than silently returning zero gradients.
+
+        Parameters
+        ----------
+        xs
+            The arrays to differentiate with respect to, possibly nested.
+        """
+        self._tracked = dict()
+        self._nodes = list()
+        # the hook is process-global, so the calls may be made from several threads,
+        # such as those mapping the leaves of containers in parallel, each with its
+        # own depth of nested recorded calls
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        ivy.nested_map(self._watch, xs, include_derived=True)
+
+    def _watch(self, x):
+        x = ivy.to_native(x)
+        if isinstance(x, np.ndarray):
+            self._tracked[id(x)] = x
+        return x
+
+    def __enter__(self):
+        # only the backend functions wrapped by set_backend are hooked, so without a
+        # global backend the numpy backend is set while recording, rather than the
+        # implicitly inferred backend being called unrecorded
+        self._set_backend = not backend_stack
+        if self._set_backend:
+            ivy.set_backend("numpy")
+        # enclosing tapes and profilers stay registered, so they still see every call
+        func_wrapper._register_op_hook(self)
+        return self
+
+    def __exit__(self, *exc):
+        func_wrapper._unregister_op_hook(self)
+        if self._set_backend:
+            ivy.previous_backend()
+
+    def _is_tracked(self, x):
+        return any(id(x_) in self._tracked for x_ in _as_list(x))
+
+    def call_backend(self, name, fn, args, kwargs, call_next):
+        # the calls made within a recorded backend function are not recorded again
+        depth = getattr(self._local, "depth", 0)
+        if depth or not any(
+            map(self._is_tracked, itertools.chain(args, kwargs.values()))
+        ):
+            return call_next(args, kwargs)
+        rules = _VJP_RULES.get(name)
+        if rules is None:
+            # functions without a rule may still be composed of recorded calls
+            ret = call_next(args, kwargs)
+            if name not in _NON_DIFFERENTIABLE and any(
+                _is_float_array(r) and id(r) not in self._tracked
+                for r in map(_to_native_output, _as_list(ret))
+            ):
+                raise IvyNotImplementedException(
+                    f"the numpy backend has no gradient for {name}"
+                )
+            return ret
+        self._local.depth = depth + 1
+        try:
+            ret = call_next(args, kwargs)
+        finally:
+            self._local.depth = depth
+        if isinstance(ret, (list, tuple)):
+            ret = type(ret)(_to_native_output(r) for r in ret)
+            outs = ret
+        else:
+            ret = _to_native_output(ret)
+            outs = [ret]
+        arguments = _signature(fn).bind(*args, **kwargs)
+        arguments.apply_defaults()
+        with self._lock:
+            self._nodes.append((rules, arguments.arguments, ret))
+            for r in outs:
+                if _is_float_array(r):
+                    self._tracked[id(r)] = r
+        return ret
+
+    def _cotangents(self, y, seed):
+        # propagate the seed back through the recorded calls, returning the
+        # cotangents of the tracked arrays by id
+        y = _native_y(y)
+        if id(y) not in self._tracked:
+            return dict()
+        cotangents = {id(y): seed}
+        for rules, arguments, out in reversed(self._nodes):
+            if isinstance(out, (list, tuple)):
+                g = [cotangents.pop(id(o), None) for o in out]
+                if all(g_ is None for g_ in g):
+                    continue
+                g = [ivy.zeros_like(o) if g_ is None else g_ for g_, o in zip(g, out)]
+                out = [ivy.Array(o) for o in out]
+            else:
+                g = cotangents.pop(id(out), None)
+                if g is None:
+                    continue
+                out = ivy.Array(out)
+            a = None
+            for name, rule in rules.items():
+                x = arguments[name]
+                if not self._is_tracked(x):
+                    continue
+                if a is None:
+                    a = {k: _to_ivy_argument(v) for k, v in arguments.items()}
+                ct = rule(g, out, a)
+                pairs = zip(x, ct) if isinstance(x, (list, tuple)) else [(x, ct)]
+                for x_, ct_ in pairs:
+                    if ct_ is None or id(x_) not in self._tracked:
+                        continue
+                    ct_ = _unbroadcast(ct_, x_)
+                    prev = cotangents.get(id(x_))
+                    cotangents[id(x_)] = ct_ if prev is None else ivy.add(prev, ct_)
+        return cotangents
+
+    def gradient(self, y, xs):
+        """
+        Return the gradients of the sum of ``y`` with respect to the arrays of
+        ``xs``, with zeros for the arrays ``y`` does not depend on.
+        """
+        y = _native_y(y)
+        cotangents = self._cotangents(y, ivy.ones_like(y))
+
+        def _grad(x):
+            if not ivy.is_array(x):
+                return x
+            ct = cotangents.get(id(ivy.to_native(x)))
+            return ivy.to_native(ivy.zeros_like(x) if ct is None else ct)
+
+        return ivy.nested_map(_grad, xs, include_derived=True, shallow=False)
+
+    def jacobian(self, y, xs):
+        """
+        Return the jacobians of ``y`` with respect to the arrays of ``xs``, each of
+        shape ``y.shape + x.shape``.
+        """
+        y = _native_y(y)
+        rows = list()
+        for i in range(y.size):
+            seed = np.zeros(y.size, dtype=y.dtype)
+            seed[i] = 1
+            rows.append(self._cotangents(y, ivy.Array(seed.reshape(y.shape))))
+
+        def _jac(x):
+            if not ivy.is_array(x):
+                return x
+            x = ivy.to_native(x)
+            jac = [
+                ivy.zeros_like(x) if row.get(id(x)) is None else row[id(x)]
+                for row in rows
+            ]
+            return ivy.to_native(ivy.reshape(ivy.stack(jac), y.shape + x.shape))
+
+        return ivy.nested_map(_jac, xs, include_derived=True, shallow=False)
+
+
+def _unbroadcast(g, x):
+    # sum the cotangent over the dimensions broadcast in the forward call
+    x_shape = np.shape(x)
+    if tuple(g.shape) != x_shape:
+        extra = g.ndim - len(x_shape)
+        axes = tuple(range(extra)) + tuple(
+            i + extra
+            for i, d in enumerate(x_shape)
+            if d == 1 and g.shape[i + extra] != 1
+        )
+        if axes:
+            g = ivy.sum(g, axis=axes, keepdims=True)
+        g = ivy.reshape(g, x_shape)
+    if g.dtype != ivy.as_ivy_dtype(x.dtype):
+        g = ivy.astype(g, x.dtype)
+    return g
+
+
+# Vector-Jacobian Products #
+# -------------------------#
+
+# each rule maps the name of a differentiable parameter to a function of the output
+# cotangent, the output and the bound arguments, returning the input cotangent, or a
+# list of them for sequence parameters
+
+
+def _mask(g, condition):
+    return g * ivy.astype(condition, g.dtype)
+
+
+def _scale(g, alpha):
+    return g if alpha is None else g * alpha
+
+
+def _reduced_axes(x, axis):
+    if axis is None:
+        return tuple(range(x.ndim))
+    return tuple(a % x.ndim for a in _as_list(axis))
+
+
+def _expand_reduced(g, x, axis, keepdims):
+    # broadcast the cotangent of a reduction back to the shape of its input
+    axes = _reduced_axes(x, axis)
+    if not keepdims and axes:
+        g = ivy.expand_dims(g, axis=axes)
+    return ivy.broadcast_to(g, x.shape)
+
+
+def _reduced_size(x, axis):
+    return math.prod(x.shape[a] for a in _reduced_axes(x, axis))
+
+
+def _vjp_extremum(g, out, a):
+    # the cotangent is split between the maximal or minimal elements
+    x, axis = a["x"], a["axis"]
+    mask = ivy.astype(x == _expand_reduced(out, x, axis, a["keepdims"]), g.dtype)
+    count = ivy.sum(mask, axis=_reduced_axes(x, axis), keepdims=True)
+    return _expand_reduced(g, x, axis, a["keepdims"]) * mask / count
+
+
+def _vjp_var(g, out, a):
+    x, axis = a["x"], a["axis"]
+    centered = x - ivy.mean(x, axis=_reduced_axes(x, axis), keepdims=True)
+    g = _expand_reduced(g, x, axis, a["keepdims"])
+    return g * 2 * centered / (_reduced_size(x, axis) - a["correction"])
+
+
+def _vjp_std(g, out, a):
+    x, axis = a["x"], a["axis"]
+    out = _expand_reduced(out, x, axis, a["keepdims"])
+    return _vjp_var(g, out, a) / (2 * out)
+
+
+def _vjp_matmul(g, a, wrt):
+    x1, x2 = a["x1"], a["x2"]
+    if a["transpose_a"] or a["adjoint_a"]:
+        x1 = ivy.matrix_transpose(x1)
+    if a["transpose_b"] or a["adjoint_b"]:
+        x2 = ivy.matrix_transpose(x2)
+    # promote 1-d operands to matrices, as matmul does
+    if x2.ndim == 1:
+        g = ivy.expand_dims(g, axis=-1)
+    if x1.ndim == 1:
+        g = ivy.expand_dims(g, axis=-2)
+    x1_ = ivy.expand_dims(x1, axis=0) if x1.ndim == 1 else x1
+    x2_ = ivy.expand_dims(x2, axis=-1) if x2.ndim == 1 else x2
+    if wrt == "x1":
+        ct = ivy.matmul(g, ivy.matrix_transpose(x2_))
+        if x1.ndim == 1:
+            return ivy.squeeze(ct, axis=-2)
+        return ivy.matrix_transpose(ct) if a["transpose_a"] or a["adjoint_a"] else ct
+    ct = ivy.matmul(ivy.matrix_transpose(x1_), g)
+    if x2.ndim == 1:
+        return ivy.squeeze(ct, axis=-1)
+    return ivy.matrix_transpose(ct) if a["transpose_b"] or a["adjoint_b"] else ct
+
+
+def _vjp_tensordot(g, a, wrt, axes):
+    # as an einsum, with the contracted dimensions of both operands sharing indices
+    x1, x2 = a["x1"], a["x2"]
+    if isinstance(axes, int):
+        axes = (list(range(x1.ndim - axes, x1.ndim)), list(range(axes)))
+    axes1 = [ax % x1.ndim for ax in _as_list(axes[0])]
+    axes2 = [ax % x2.ndim for ax in _as_list(axes[1])]
+    letters = iter("abcdefghijklmnopqrstuvwxyz")
+    subscripts1 = [next(letters) for _ in range(x1.ndim)]
+    subscripts2 = [next(letters) for _ in range(x2.ndim)]
+    for ax1, ax2 in zip(axes1, axes2):
+        subscripts2[ax2] = subscripts1[ax1]
+    output = [c for i, c in enumerate(subscripts1) if i not in axes1] + [
+        c for i, c in enumerate(subscripts2) if i not in axes2
+    ]
+    subscripts1, subscripts2, output = map("".join, (subscripts1, subscripts2, output))
+    if wrt == "x1":
+        return ivy.einsum(f"{output},{subscripts2}->{subscripts1}", g, x2)
+    return ivy.einsum(f"{subscripts1},{output}->{subscripts2}", x1, g)
+
+
+def _vjp_einsum(g, out, a):
+    equation = a["equation"].replace(" ", "")
+    if "->" not in equation or "." in equation:
+        raise IvyNotImplementedException(
+            "the numpy backend only differentiates einsum equations with an explicit "
+            "output and without ellipses"
+        )
+    inputs, output = equation.split("->")
+    inputs = inputs.split(",")
+    operands = a["operands"]
+    ret = list()
+    for i, (subscripts, x) in enumerate(zip(inputs, operands)):
+        if len(set(subscripts)) != len(subscripts):
+            raise IvyNotImplementedException(
+                "the numpy backend does not differentiate einsum traces"
+            )
+        others = [j for j in range(len(inputs)) if j != i]
+        available = set(output).union(*[inputs[j] for j in others])
+        kept = "".join(c for c in subscripts if c in available)
+        ct = ivy.einsum(
+            ",".join([output] + [inputs[j] for j in others]) + "->" + kept,
+            g,
+            *[operands[j] for j in others],
+        )
+        if kept != subscripts:
+            # indices summed over in this operand only were broadcast
+            axes = [k for k, c in enumerate(subscripts) if c not in available]
+            ct = ivy.broadcast_to(ivy.expand_dims(ct, axis=axes), x.shape)
+        ret.append(ct)
+    return ret
+
+
+def _vjp_tile(g, out, a):
+    x, repeats = a["x"], list(_as_list(a["repeats"]))
+    shape = [1] * (len(repeats) - x.ndim) + list(x.shape)
+    repeats = [1] * (len(shape) - len(repeats)) + repeats
+    g = ivy.reshape(g, [n for r_s in zip(repeats, shape) for n in r_s])
+    g = ivy.sum(g, axis=tuple(range(0, 2 * len(shape), 2)))
+    return ivy.reshape(g, x.shape)
+
+
+def _vjp_pad(g, out, a):
+    x = a["x"]
+    pad_width = np.broadcast_to(np.asarray(a["pad_width"]), (x.ndim, 2))
+    return g[
+        tuple(
+            slice(int(lo), int(g.shape[i] - hi)) for i, (lo, hi) in enumerate(pad_width)
+        )
+    ]
+
+
+def _vjp_get_item(g, out, a):
+    # scatter-add the cotangent, so that repeated indices accumulate
+    ct = np.zeros(a["x"].shape, dtype=ivy.as_native_dtype(g.dtype))
+    np.add.at(ct, ivy.to_native(a["query"], nested=True), ivy.to_numpy(g))
+    return ivy.Array(ct)
+
+
+def _vjp_conv(g, a, wrt, dims, channel_first, groups=1):
+    # computed on the native arrays, with the windows of the padded input taken as
+    # by the forward convolution
+    x_dilations = _as_list(a["x_dilations"])
+    if groups != 1 or any(d != 1 for d in x_dilations):
+        raise IvyNotImplementedException(
+            "the numpy backend does not differentiate grouped or input dilated "
+            "convolutions"
+        )
+    x, filters, g = a["x"].data, a["filters"].data, ivy.to_numpy(g)
+    if channel_first:
+        x, g = np.moveaxis(x, 1, -1), np.moveaxis(g, 1, -1)
+    if a["filter_format"] == "channel_first":
+        filters = np.transpose(filters, (*range(2, dims + 2), 1, 0))
+    if wrt == "bias":
+        return ivy.Array(np.sum(g, axis=tuple(range(g.ndim - 1))))
+    strides, dilations = a["strides"], a["dilations"]
+    strides = [strides] * dims if isinstance(strides, int) else list(strides)
+    dilations = [dilations] * dims if isinstance(dilations, int) else list(dilations)
+    kernel_shape = filters.shape[:dims]
+    pad_list = _conv_pad_list(x, kernel_shape, strides, a["padding"], dilations)
+    x = np.pad(x, [(0, 0), *pad_list, (0, 0)], mode="constant")
+    out_shape = g.shape[1:-1]
+    spatial = list(range(dims + 1))
+    if wrt == "filters":
+        windows = np.lib.stride_tricks.as_strided(
+            x,
+            [x.shape[0], *out_shape, *kernel_shape, x.shape[-1]],
+            (
+                x.strides[0],
+                *[x.strides[i + 1] * strides[i] for i in range(dims)],
+                *[x.strides[i + 1] * dilations[i] for i in range(dims)],
+                x.strides[-1],
+            ),
+            writeable=False,
+        )
+        # K... x Cin x Cout
+        ct = np.tensordot(windows, g, axes=(spatial, spatial))
+        if a["filter_format"] == "channel_first":
+            ct = np.transpose(ct, (dims + 1, dims, *range(dims)))
+        return ivy.Array(ct)
+    # scatter the contribution of each kernel offset to the strided input positions
+    ct = np.zeros(x.shape, np.result_type(g, filters))
+    for k in np.ndindex(*kernel_shape):
+        ct[
+            (slice(None),)
+            + tuple(
+                slice(
+                    k[i] * dilations[i],
+                    k[i] * dilations[i] + strides[i] * (out_shape[i] - 1) + 1,
+                    strides[i],
+                )
+                for i in range(dims)
+            )
+        ] += np.matmul(g, filters[k].T)
+    ct = ct[
+        (slice(None),)
+        + tuple(slice(lo, ct.shape[i + 1] - hi) for i, (lo, hi) in enumerate(pad_list))
+    ]
+    return ivy.Array(np.moveaxis(ct, -1, 1) if channel_first else ct)
+
+
+def _conv_rules(dims, channel_first_format):
+    return {
+        param: functools.partial(
+            lambda g, out, a, param: _vjp_conv(
+                g, a, param, dims, a["data_format"] == channel_first_format
+            ),
+            param=param,
+        )
+        for param in ("x", "filters", "bias")
+    }
+
+
+def _vjp_clip(g, out, a):
+    x, ret = a["x"], g
+    if a["x_min"] is not None:
+        ret = _mask(ret, x >= a["x_min"])
+    if a["x_max"] is not None:
+        ret = _mask(ret, x <= a["x_max"])
+    return ret
+
+
+def _vjp_softplus(g, out, a):
+    beta = 1 if a["beta"] is None else a["beta"]
+    x = a["x"] * beta
+    ret = ivy.sigmoid(x)
+    if a["threshold"] is not None:
+        ret = ivy.where(x > a["threshold"], ivy.ones_like(ret), ret)
+    return g * ret
+
+
+def _vjp_gelu(g, out, a):
+    x = a["x"]
+    if a["approximate"]:
+        c = math.sqrt(2 / math.pi)
+        t = ivy.tanh(c * (x + 0.044715 * x**3))
+        return g * (
+            0.5 * (1 + t) + 0.5 * x * (1 - t**2) * c * (1 + 0.134145 * x**2)
+        )
+    cdf = 0.5 * (1 + ivy.erf(x / math.sqrt(2)))
+    return g * (cdf + x * ivy.exp(-0.5 * x**2) / math.sqrt(2 * math.pi))
+
+
+def _vjp_silu(g, out, a):
+    s = ivy.sigmoid(a["x"])
+    return g * s * (1 + a["x"] * (1 - s))
+
+
+def _vjp_vector_norm(g, out, a):
+    x, axis, keepdims, ord = a["x"], a["axis"], a["keepdims"], a["ord"]
+    if ord == 0:
+        # the number of nonzero elements is piecewise constant
+        return None
+    g = _expand_reduced(g, x, axis, keepdims)
+    out = _expand_reduced(out, x, axis, keepdims)
+    if ord in (math.inf, -math.inf):
+        # the cotangent is split between the elements of extremal magnitude
+        mask = ivy.astype(ivy.abs(x) == out, g.dtype)
+        count = ivy.sum(mask, axis=_reduced_axes(x, axis), keepdims=True)
+        return g * ivy.sign(x) * mask / count
+    # zero norms have the zero subgradient
+    ratio = ivy.abs(x) / ivy.where(out == 0, ivy.ones_like(out), out)
+    return g * ivy.sign(x) * ratio ** (ord - 1)
+
+
+def _vjp_l2_normalize(g, out, a):
+    x, axis = a["x"], a["axis"]
+    norm = ivy.vector_norm(x, axis=axis, keepdims=True)
+    # the norm is clamped to 1e-12, below which the output is only scaled
+    projected = _mask(out * ivy.sum(g * out, axis=axis, keepdims=True), norm > 1e-12)
+    return (g - projected) / ivy.maximum(norm, 1e-12)
+
+
+def _softmax_axis(a):
+    return -1 if a["axis"] is None else a["axis"]
+
+
+_VJP_RULES = {
+    # elementwise
+    "abs": {"x": lambda g, out, a: g * ivy.sign(a["x"])},
+    "acos": {"x": lambda g, out, a: -g / ivy.sqrt(1 - ivy.square(a["x"]))},
+    "acosh": {"x": lambda g, out, a: g / ivy.sqrt(ivy.square(a["x"]) - 1)},
+    "add": {
+        "x1": lambda g, out, a: g,
+        "x2": lambda g, out, a: _scale(g, a["alpha"]),
+    },
+    "asin": {"x": lambda g, out, a: g / ivy.sqrt(1 - ivy.square(a["x"]))},
+    "asinh": {"x": lambda g, out, a: g / ivy.sqrt(ivy.square(a["x"]) + 1)},
+    "atan": {"x": lambda g, out, a: g / (1 + ivy.square(a["x"]))},
+    "atan2": {
+        "x1": (
+            lambda g, out, a: g * a["x2"] / (ivy.square(a["x1"]) + ivy.square(a["x2"]))
+        ),
+        "x2": (
+            lambda g, out, a: -g * a["x1"] / (ivy.square(a["x1"]) + ivy.square(a["x2"]))
+        ),
+    },
+    "atanh": {"x": lambda g, out, a: g / (1 - ivy.square(a["x"]))},
+    "cos": {"x": lambda g, out, a: -g * ivy.sin(a["x"])},
+    "cosh": {"x": lambda g, out, a: g * ivy.sinh(a["x"])},
+    "divide": {
+        "x1": lambda g, out, a: g / a["x2"],
+        "x2": lambda g, out, a: -g * out / a["x2"],
+    },
+    "erf": {
+        "x": (
+            lambda g, out, a: g
+            * (2 / math.sqrt(math.pi))
+            * ivy.exp(-ivy.square(a["x"]))
+        )
+    },
+    "exp": {"x": lambda g, out, a: g * out},
+    "exp2": {"x": lambda g, out, a: g * out * math.log(2)},
+    "expm1": {"x": lambda g, out, a: g * (out + 1)},
+    "log": {"x": lambda g, out, a: g / a["x"]},
+    "log10": {"x": lambda g, out, a: g / (a["x"] * math.log(10))},
+    "log1p": {"x": lambda g, out, a: g / (a["x"] + 1)},
+    "log2": {"x": lambda g, out, a: g / (a["x"] * math.log(2))},
+    "maximum": {
+        "x1": lambda g, out, a: _mask(g, a["x1"] >= a["x2"]),
+        "x2": lambda g, out, a: _mask(g, a["x1"] < a["x2"]),
+    },
+    "minimum": {
+        "x1": lambda g, out, a: _mask(g, a["x1"] <= a["x2"]),
+        "x2": lambda g, out, a: _mask(g, a["x1"] > a["x2"]),
+    },
+    "multiply": {
+        "x1": lambda g, out, a: g * a["x2"],
+        "x2": lambda g, out, a: g * a["x1"],
+    },
+    "negative": {"x": lambda g, out, a: -g},
+    "positive": {"x": lambda g, out, a: g},
+    "pow": {
+        "x1": lambda g, out, a: g * a["x2"] * a["x1"] ** (a["x2"] - 1),
+        "x2": lambda g, out, a: g * out * ivy.log(a["x1"]),
+    },
+    "reciprocal": {"x": lambda g, out, a: -g * out * out},
+    "sin": {"x": lambda g, out, a: g * ivy.cos(a["x"])},
+    "sinh": {"x": lambda g, out, a: g * ivy.cosh(a["x"])},
+    "sqrt": {"x": lambda g, out, a: g / (2 * out)},
+    "square": {"x": lambda g, out, a: 2 * g * a["x"]},
+    "subtract": {
+        "x1": lambda g, out, a: g,
+        "x2": lambda g, out, a: -_scale(g, a["alpha"]),
+    },
+    "tan": {"x": lambda g, out, a: g * (1 + out * out)},
+    "tanh": {"x": lambda g, out, a: g * (1 - out * out)},
+    "where": {
+        "x1": lambda g, out, a: ivy.where(a["condition"], g, ivy.zeros_like(g)),
+        "x2": lambda g, out, a: ivy.where(a["condition"], ivy.zeros_like(g), g),
+    },
+    # activations
+    "gelu": {"x": _vjp_gelu},
+    "leaky_relu": {
+        "x": lambda g, out, a: ivy.where(a["x"] > 0, g, g * a["alpha"]),
+    },
+    "log_softmax": {
+        "x": lambda g, out, a: g - ivy.exp(out) * ivy.sum(
+            g, axis=_softmax_axis(a), keepdims=True
+        )
+    },
+    "relu": {"x": lambda g, out, a: _mask(g, a["x"] > 0)},
+    "sigmoid": {"x": lambda g, out, a: g * out * (1 - out)},
+    "silu": {"x": _vjp_silu},
+    "softmax": {
+        "x": lambda g, out, a: out * (
+            g - ivy.sum(g * out, axis=_softmax_axis(a), keepdims=True)
+        )
+    },
+    "softplus": {"x": _vjp_softplus},
+    # reductions
+    "cumsum": {
+        "x": lambda g, out, a: ivy.cumsum(
+            g, axis=a["axis"], exclusive=a["exclusive"], reverse=not a["reverse"]
+        )
+    },
+    "einsum": {"operands": _vjp_einsum},
+    "max": {"x": _vjp_extremum},
+    "mean": {
+        "x": lambda g, out, a: _expand_reduced(
+            g, a["x"], a["axis"], a["keepdims"]
+        ) / _reduced_size(a["x"], a["axis"])
+    },
+    "min": {"x": _vjp_extremum},
+    "prod": {
+        "x": (
+            lambda g, out, a: _expand_reduced(g * out, a["x"], a["axis"], a["keepdims"])
+            / a["x"]
+        )
+    },
+    "std": {"x": _vjp_std},
+    "sum": {
+        "x": lambda g, out, a: _expand_reduced(g, a["x"], a["axis"], a["keepdims"])
+    },
+    "var": {"x": _vjp_var},
+    # linear algebra
+    "l2_normalize": {"x": _vjp_l2_normalize},
+    "matmul": {
+        "x1": lambda g, out, a: _vjp_matmul(g, a, "x1"),
+        "x2": lambda g, out, a: _vjp_matmul(g, a, "x2"),
+    },
+    "matrix_transpose": {"x": lambda g, out, a: ivy.matrix_transpose(g)},
+    "outer": {
+        "x1": lambda g, out, a: ivy.matmul(g, a["x2"]),
+        "x2": lambda g, out, a: ivy.matmul(a["x1"], g),
+    },
+    "tensordot": {
+        "x1": lambda g, out, a: _vjp_tensordot(g, a, "x1", a["axes"]),
+        "x2": lambda g, out, a: _vjp_tensordot(g, a, "x2", a["axes"]),
+    },
+    "vecdot": {
+        "x1": lambda g, out, a: _vjp_tensordot(g, a, "x1", (a["axis"], a["axis"])),
+        "x2": lambda g, out, a: _vjp_tensordot(g, a, "x2", (a["axis"], a["axis"])),
+    },
+    "vector_norm": {"x": _vjp_vector_norm},
+    # layers
+    "conv1d": _conv_rules(1, "NCW"),
+    "conv2d": _conv_rules(2, "NCHW"),
+    "conv3d": _conv_rules(3, "NCDHW"),
+    "conv_general_dilated": {
+        param: functools.partial(
+            lambda g, out, a, param: _vjp_conv(
+                g,
+                a,
+                param,
+                a["dims"],
+                a["data_format"] == "channel_first",
+                groups=a["feature_group_count"],
+            ),
+            param=param,
+        )
+        for param in ("x", "filters", "bias")
+    },
+    # manipulation
+    "asarray": {"obj": lambda g, out, a: g},
+    "astype": {"x": lambda g, out, a: g},
+    "broadcast_to": {"x": lambda g, out, a: g},
+    "clip": {"x": _vjp_clip},
+    "concat": {
+        "xs": lambda g, out, a: ivy.split(
+            g,
+            num_or_size_splits=[x.shape[a["axis"]] for x in a["xs"]],
+            axis=a["axis"],
+        )
+    },
+    "constant_pad": {"x": _vjp_pad},
+    "copy_array": {"x": lambda g, out, a: g},
+    "expand_dims": {"x": lambda g, out, a: ivy.reshape(g, a["x"].shape)},
+    "flip": {"x": lambda g, out, a: ivy.flip(g, axis=a["axis"])},
+    "get_item": {"x": _vjp_get_item},
+    "permute_dims": {
+        "x": lambda g, out, a: ivy.permute_dims(
+            g, axes=[int(i) for i in np.argsort(a["axes"])]
+        )
+    },
+    "reshape": {"x": lambda g, out, a: ivy.reshape(g, a["x"].shape)},
+    "roll": {
+        "x": lambda g, out, a: ivy.roll(
+            g,
+            -a["shift"] if isinstance(a["shift"], int) else [-s for s in a["shift"]],
+            axis=a["axis"],
+        )
+    },
+    "split": {"x": lambda g, out, a: ivy.concat(g, axis=a["axis"])},
+    "squeeze": {"x": lambda g, out, a: ivy.reshape(g, a["x"].shape)},
+    "stack": {"arrays": lambda g, out, a: ivy.unstack(g, axis=a["axis"])},
+    "swapaxes": {
+        "x": lambda g, out, a: ivy.swapaxes(g, a["axis0"], a["axis1"]),
+    },
+    "tile": {"x": _vjp_tile},
+    "unstack": {
+        "x": lambda g, out, a: (
+            ivy.concat(g, axis=a["axis"])
+            if a["keepdims"]
+            else ivy.stack(g, axis=a["axis"])
+        )
+    },
+    "zero_pad": {"x": _vjp_pad},
+}
+
+# functions whose floating point outputs are constant with respect to their inputs
+_NON_DIFFERENTIABLE = {
+    "ceil",
+    "empty_like",
+    "floor",
+    "floor_divide",
+    "full_like",
+    "ones_like",
+    "round",
+    "sign",
+    "stop_gradient",
+    "to_numpy",
+    "trunc",
+    "zeros_like",
+}
 
 
 def variable(x, /):
-    logging.warning(
-        "NumPy does not support autograd, declaring a 'variable' "
-        "is identical to declaring an 'array' when using numpy backend."
-    )
     return x
 
 
 def is_variable(x, /, *, exclusive=False):
-    # NumPy does not support autograd, checking if x is a variable does have any meaning
-    # for NumPy. Return False.
+    # NumPy has no variable type, the arrays to differentiate with respect to are
+    # tracked by the tape instead
     return False
 
 
@@ -33,67 +802,111 @@ def execute_with_gradients(
     xs_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = [[0]],
     ret_grad_idxs: Optional[Sequence[Sequence[Union[str, int]]]] = [[0]],
 ):
-    logging.warning(
-        "NumPy does not support autograd, "
-        "'execute_with_gradients' returns None in place of function gradients."
+    # Conversion of required arrays to float variables and duplicate index chains
+    xs, xs_grad_idxs, xs_required, required_duplicate_index_chains, _ = (
+        _get_required_float_variables(xs, xs_grad_idxs)
     )
-    xs = ivy.to_ivy(xs)
-    func_ret = func(xs)
-    return func_ret, None
 
+    # Recording the operations on a tape
+    with _Tape(xs_required) as tape:
+        func_ret = func(xs)
 
-def value_and_grad(func):
-    logging.warning(
-        "NumPy does not support autograd, 'value_and_grad' "
-        "has no effect on the array, as gradients are not supported in the first place."
+    # Getting the relevant outputs from the function return for gradient calculation
+    ret_grad_idxs, y, ret_idxs = _get_y_and_ret_idxs(
+        func_ret, ret_grad_idxs, reshape=False
     )
 
-    def grad_fn(xs):
-        grads = ivy.nested_map(
-            lambda x: ivy.zeros_like(x), xs, include_derived=True, shallow=False
+    if isinstance(y, np.ndarray):
+        # Gradient calculation for a single output
+        grads = _set_duplicates(
+            ivy.to_ivy(tape.gradient(y, xs_required)),
+            required_duplicate_index_chains,
         )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return y, grads
-
-    return grad_fn
+    else:
+        # Gradient calculation for multiple outputs
+        y = _get_native_y(y)
+        grads_ = ivy.nested_map(
+            lambda x: tape.gradient(x, xs_required),
+            y,
+            include_derived=True,
+            shallow=False,
+        )
+        grads = grads_
+        if isinstance(ret_idxs, list) and len(ret_idxs):
+            grads = {
+                ret_idxs[i]: _set_duplicates(grad, required_duplicate_index_chains)
+                for i, grad in enumerate(grads_)
+            }
 
+    # Stop further gradient propagation if not retaining gradients
+    return _process_func_ret_and_grads(func_ret, grads, retain_grads)
 
-def jac(func):
-    logging.warning(
-        "NumPy does not support autograd, 'jac' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
 
+def value_and_grad(func):
     def grad_fn(xs):
-        jacobian = ivy.nested_map(
-            lambda x: ivy.zeros_like(x), xs, include_derived=True, shallow=False
-        )
-        return jacobian
+        xs = ivy.to_ivy(xs, nested=True, include_derived=True)
+        with _Tape(xs) as tape:
+            y = func(xs)
+        grads = ivy.to_ivy(tape.gradient(y, xs), nested=True, include_derived=True)
+        return ivy.to_ivy(y), grads
 
     return grad_fn
 
 
-def grad(func, argnums=0):
-    logging.warning(
-        "NumPy does not support autograd, 'grad' "
-        "has no effect on the array, as gradients are not supported in the first place."
+def stop_gradient(x, /, *, preserve_type=True, out=None):
+    # a view is not tracked by the tape, but shares the data of the array
+    return x.view() if isinstance(x, np.ndarray) else x
+
+
+def jac(func: Callable):
+    grad_fn = lambda x_in: ivy.to_native(
+        func(ivy.to_ivy(x_in, nested=True)),
+        nested=True,
+        include_derived=True,
     )
 
-    def grad_fn(xs):
-        grad = ivy.nested_map(
-            lambda x: ivy.zeros_like(x), xs, include_derived=True, shallow=False
-        )
-        y = func(xs)
-        y = ivy.to_ivy(y)
-        return grad
+    def callback_fn(x_in):
+        x_in = ivy.to_native(x_in, nested=True)
+        with _Tape(x_in) as tape:
+            y = grad_fn(x_in)
 
-    return grad_fn
+        # Deal with multiple outputs
+        if not isinstance(y, np.ndarray):
+            return ivy.nested_map(
+                lambda yi: ivy.to_ivy(tape.jacobian(yi, x_in), nested=True),
+                y,
+                include_derived=True,
+            )
+        return ivy.to_ivy(tape.jacobian(y, x_in), nested=True)
 
+    return callback_fn
 
-def stop_gradient(x, /, *, preserve_type=True, out=None):
-    logging.warning(
-        "NumPy does not support autograd, 'stop_gradient' "
-        "has no effect on the array, as gradients are not supported in the first place."
-    )
-    return x
+
+def grad(f, argnums=0):
+    # the function is called with ivy arrays, so that its array operators are ivy
+    # function calls recorded by the tape, rather than numpy operations
+    @outputs_to_ivy_arrays
+    @inputs_to_ivy_arrays
+    def _inner(*args, **kwargs):
+        max_argnum = argnums if isinstance(argnums, int) else max(argnums)
+        if max_argnum >= len(args):
+            raise TypeError(
+                f"differentiating with respect to {argnums=} requires at least "
+                f"{max_argnum + 1} positional arguments to be passed by the "
+                f"caller, but got only {len(args)} positional arguments."
+            )
+        if isinstance(argnums, int):
+            x = args[argnums]
+        elif isinstance(argnums, (tuple, list)):
+            x = [args[i] for i in argnums]
+        else:
+            raise TypeError(
+                "argnums should be passed as int or a list/tuple of ints."
+                f" Found {type(argnums)}"
+            )
+        # nesting grad records the backward pass on the enclosing tape
+        with _Tape(x) as tape:
+            y = f(*args, **kwargs)
+        return tape.gradient(y, x)
+
+    return _inner
@@ -10,7 +10,6 @@ import ivy
 from ivy.functional.ivy.layers import (
     _handle_padding,
     _deconv_length,
-    _get_x_data_format,
 )
 
 
@@ -23,13 +22,14 @@ def _add_dilations(x, dilations, axis, values=0):
     )
 
 
-def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
-    for j in range(dims):
-        if dilations[j] > 1:
-            filters = _add_dilations(filters, dilations[j], axis=j)
+def _conv_pad_list(x, kernel_shape, strides, padding, dilations):
+    # the (before, after) padding of each spatial dimension of a channel last input
+    dims = len(kernel_shape)
+    # size of the dilated kernel, computed without materializing it
+    kernel_shape = [(kernel_shape[i] - 1) * dilations[i] + 1 for i in range(dims)]
     if isinstance(padding, str):
         pad_specific = [
-            _handle_padding(x.shape[1 + i], strides[i], filters.shape[i], padding)
+            _handle_padding(x.shape[1 + i], strides[i], kernel_shape[i], padding)
             for i in range(dims)
         ]
         pad_list = [
@@ -40,15 +40,111 @@ def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
         pad_list = [(padding, padding)] * dims
     else:
         pad_list = [(_p, _p) if isinstance(_p, int) else _p for _p in padding]
-
-    pad_width = [(0, 0), *pad_list, (0, 0)]
-
-    x = np.pad(
+    return pad_list
+
+
+def _pad_conv(x, kernel_shape, strides, padding, dilations):
+    pad_list = _conv_pad_list(x, kernel_shape, strides, padding, dilations)
+    if not any(any(_p) for _p in pad_list):
+        return x
+    return np.pad(x, pad_width=[(0, 0), *pad_list, (0, 0)], mode="constant")
+
+
+# largest im2col buffer (in bytes) gathered at once, above this the kernel
+# offsets are contracted one at a time to bound peak memory
+_IM2COL_MAX_BYTES = 1 << 27
+
+
+def _conv(x, filters, strides, padding, dilations, feature_group_count=1):
+    """
+    Compute an N-d grouped convolution of a channel last input.
+
+    The input windows are taken as a strided view and contracted with the
+    filters through matrix multiplications, either all at once on an im2col
+    buffer or one kernel offset at a time when that buffer would be too large.
+
+    Parameters
+    ----------
+    x
+        Input of shape [batch_size, *spatial_dims, d_in].
+    filters
+        Filters of shape [*kernel_dims, d_in // feature_group_count, d_out].
+    strides
+        The strides of the sliding window for each spatial dimension.
+    padding
+        "SAME", "VALID", an int or a sequence of explicit (before, after) pads.
+    dilations
+        The dilation factor of the filters for each spatial dimension.
+    feature_group_count
+        The number of groups the input and output channels are split into.
+
+    Returns
+    -------
+    ret
+        The result of shape [batch_size, *out_spatial_dims, d_out].
+    """
+    dims = x.ndim - 2
+    strides = [strides] * dims if isinstance(strides, int) else strides
+    dilations = [dilations] * dims if isinstance(dilations, int) else dilations
+    kernel_shape = filters.shape[:dims]
+    x = _pad_conv(x, kernel_shape, strides, padding, dilations)
+    out_shape = [
+        (x.shape[i + 1] - (kernel_shape[i] - 1) * dilations[i] - 1) // strides[i] + 1
+        for i in range(dims)
+    ]
+    groups = feature_group_count
+    group_in, out_dim = filters.shape[-2:]
+    group_out = out_dim // groups
+    dtype = np.result_type(x, filters)
+    # B x O... x K... x G x Cg
+    windows = np.lib.stride_tricks.as_strided(
         x,
-        pad_width=pad_width,
-        mode="constant",
-    )
-    return x, filters
+        [x.shape[0], *out_shape, *kernel_shape, x.shape[-1]],
+        (
+            x.strides[0],
+            *[x.strides[i + 1] * strides[i] for i in range(dims)],
+            *[x.strides[i + 1] * dilations[i] for i in range(dims)],
+            x.strides[-1],
+        ),
+        writeable=False,
+    ).reshape([x.shape[0], *out_shape, *kernel_shape, groups, group_in])
+    # K... x Cg x G x Og
+    filters = filters.reshape([*kernel_shape, group_in, groups, group_out])
+    num_windows = int(np.prod(windows.shape[: dims + 1]))
+    kernel_size = int(np.prod(kernel_shape))
+    offsets = (np.unravel_index(k, kernel_shape) for k in range(kernel_size))
+    window_slice = (slice(None),) * (dims + 1)
+
+    if group_in == 1:
+        # depthwise, B x O... x G x Og accumulated with broadcasting
+        res = np.zeros([*windows.shape[: dims + 1], groups, group_out], dtype)
+        for k in offsets:
+            res += windows[window_slice + k] * filters[k][0]
+        return res.reshape([*res.shape[: dims + 1], out_dim])
+
+    if num_windows * kernel_size * x.shape[-1] * x.itemsize <= _IM2COL_MAX_BYTES:
+        # G x N x (K... x Cg) @ G x (K... x Cg) x Og
+        cols = np.moveaxis(windows, -2, 0).reshape(
+            [groups, num_windows, kernel_size * group_in]
+        )
+        res = np.matmul(
+            cols,
+            np.moveaxis(filters, -2, 0).reshape(
+                [groups, kernel_size * group_in, group_out]
+            ),
+        )
+    else:
+        res = np.zeros([groups, num_windows, group_out], dtype)
+        for k in offsets:
+            # G x N x Cg @ G x Cg x Og
+            res += np.matmul(
+                np.moveaxis(windows[window_slice + k], -2, 0).reshape(
+                    [groups, num_windows, group_in]
+                ),
+                np.moveaxis(filters[k], -2, 0),
+            )
+    # G x N x Og -> B x O... x (G x Og)
+    return np.moveaxis(res, 0, -2).reshape([*windows.shape[: dims + 1], out_dim])
 
 
 def _dilate_pad_conv_tranpose(
@@ -69,23 +165,23 @@ def _dilate_pad_conv_tranpose(
     for i in reversed(range(dims)):
         if strides[i] > 1:
             x = _add_dilations(x, strides[i], axis=i + 1)
-        if dilations[i] > 1:
-            filters = _add_dilations(filters, dilations[i], axis=i)
+    # the filters are dilated by the convolution itself
+    kernel_shape = [(filters.shape[i] - 1) * dilations[i] + 1 for i in range(dims)]
     pad_specific = [
-        _handle_padding(output_shape[i + 1], strides[i], filters.shape[i], padding)
+        _handle_padding(output_shape[i + 1], strides[i], kernel_shape[i], padding)
         for i in range(dims)
     ]
     extra_pad = [
         max(
             0,
             output_shape[i + 1]
-            - (x.shape[i + 1] + filters.shape[i] - 1 - pad_specific[i]),
+            - (x.shape[i + 1] + kernel_shape[i] - 1 - pad_specific[i]),
         )
         for i in range(dims)
     ]
-    pad_top = [filters.shape[i] - 1 - (pad_specific[i] // 2) for i in range(dims)]
+    pad_top = [kernel_shape[i] - 1 - (pad_specific[i] // 2) for i in range(dims)]
     pad_bot = [
-        filters.shape[i] - 1 - (pad_specific[i] - pad_specific[i] // 2)
+        kernel_shape[i] - 1 - (pad_specific[i] - pad_specific[i] // 2)
         for i in range(dims)
     ]
     pad_list = [(pad_top[i], pad_bot[i] + extra_pad[i]) for i in range(dims)]
@@ -98,7 +194,7 @@ def _dilate_pad_conv_tranpose(
         ],
         "constant",
     )
-    return x, filters
+    return x, filters, dilations
 
 
 def _ff_xd_before_conv(x, filters, dims, filter_format, x_dilations):
@@ -127,39 +223,10 @@ def conv1d(
     bias: Optional[np.ndarray] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    strides = [strides] if isinstance(strides, int) else strides
-    dilations = [dilations] if isinstance(dilations, int) else dilations
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
     x, filters = _ff_xd_before_conv(x, filters, 1, filter_format, x_dilations)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 1, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:1])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_w = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OW x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 4 + [output_dim]
-    )
-    # B x OW x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 2 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OW x O
-    res = np.sum(mult, (2, 3))
+    res = _conv(x, filters, strides, padding, dilations)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -181,14 +248,11 @@ def conv1d_transpose(
 ) -> np.ndarray:
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
-    x, filters = _dilate_pad_conv_tranpose(
+    x, filters, dilations = _dilate_pad_conv_tranpose(
         x, filters, strides, padding, 1, dilations, output_shape
     )
     x = np.flip(x, (1,))
-    res = np.flip(
-        conv1d(x, filters, 1, "VALID", data_format="NWC", dilations=1),
-        (1,),
-    )
+    res = np.flip(_conv(x, filters, 1, "VALID", dilations), (1,))
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -209,45 +273,13 @@ def conv2d(
     bias: Optional[np.ndarray] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    strides = [strides] * 2 if isinstance(strides, int) else strides
-    dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
     if data_format == "NCHW":
         x = np.transpose(x, (0, 2, 3, 1))
     x, filters = _ff_xd_before_conv(x, filters, 2, filter_format, x_dilations)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:2])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _conv(x, filters, strides, padding, dilations)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCHW":
-        return np.transpose(res, (0, 3, 1, 2))
+        res = np.transpose(res, (0, 3, 1, 2))
     return res
 
 
@@ -266,14 +298,11 @@ def conv2d_transpose(
 ):
     if data_format == "NCHW":
         x = np.transpose(x, (0, 2, 3, 1))
-    x, filters = _dilate_pad_conv_tranpose(
+    x, filters, dilations = _dilate_pad_conv_tranpose(
         x, filters, strides, padding, 2, dilations, output_shape
     )
     x = np.flip(x, (1, 2))
-    res = np.flip(
-        conv2d(x, filters, 1, "VALID", data_format="NHWC", dilations=1),
-        (1, 2),
-    )
+    res = np.flip(_conv(x, filters, 1, "VALID", dilations), (1, 2))
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCHW":
         res = np.transpose(res, (0, 3, 1, 2))
@@ -291,49 +320,17 @@ def depthwise_conv2d(
     dilations: Union[int, Tuple[int, int]] = 1,
     out: Optional[np.ndarray] = None,
 ):
-    strides = [strides] * 2 if isinstance(strides, int) else strides
-    dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    if isinstance(padding, int):
-        padding = [(padding, padding)] * 2
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
-    filters = np.transpose(filters, (2, 0, 1))
-    filters = np.expand_dims(filters, (-1, -2))
-    filter_h = filters.shape[1] + (filters.shape[1] - 1) * (dilations[0] - 1)
-    filter_w = filters.shape[2] + (filters.shape[2] - 1) * (dilations[1] - 1)
-    if isinstance(padding, str):
-        if padding == "VALID":
-            out_height = np.ceil(float(x.shape[2] - filter_h + 1) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3] - filter_w + 1) / float(strides[1]))
-        else:
-            out_height = np.ceil(float(x.shape[2]) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3]) / float(strides[1]))
-    else:
-        out_height = np.ceil(
-            float(x.shape[2] - filter_h + padding[0][0] + padding[0][1] + 1)
-            / float(strides[0])
-        )
-        out_width = np.ceil(
-            float(x.shape[3] - filter_w + padding[1][0] + padding[1][1] + 1)
-            / float(strides[1])
-        )
-    if data_format == "NHWC":
-        outputs = np.empty([x.shape[1], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x.shape[1], 0, int(out_height), int(out_width)], x.dtype)
-    x = np.expand_dims(x, -1)
-    for i in range(x.shape[0]):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    # a depthwise convolution is a grouped one with a group per channel
+    filters = np.expand_dims(filters, -2)
+    res = _conv(
+        x, filters, strides, padding, dilations, feature_group_count=x.shape[-1]
+    )
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -350,48 +347,13 @@ def conv3d(
     bias: Optional[np.ndarray] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    strides = [strides] * 3 if isinstance(strides, int) else strides
-    dilations = [dilations] * 3 if isinstance(dilations, int) else dilations
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
     x, filters = _ff_xd_before_conv(x, filters, 3, filter_format, x_dilations)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 3, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:3])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    res = _conv(x, filters, strides, padding, dilations)
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCDHW":
-        return np.transpose(res, (0, 4, 1, 2, 3))
+        res = np.transpose(res, (0, 4, 1, 2, 3))
     return res
 
 
@@ -410,14 +372,11 @@ def conv3d_transpose(
 ):
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
-    x, filters = _dilate_pad_conv_tranpose(
+    x, filters, dilations = _dilate_pad_conv_tranpose(
         x, filters, strides, padding, 3, dilations, output_shape
     )
     x = np.flip(x, (1, 2, 3))
-    res = np.flip(
-        conv3d(x, filters, 1, "VALID", data_format="NDHWC", dilations=1),
-        (1, 2, 3),
-    )
+    res = np.flip(_conv(x, filters, 1, "VALID", dilations), (1, 2, 3))
     res = np.add(res, bias) if bias is not None else res
     if data_format == "NCDHW":
         res = np.transpose(res, (0, 4, 1, 2, 3))
@@ -446,55 +405,18 @@ def conv_general_dilated(
     if filter_format == "channel_first":
         filters = np.transpose(filters, (*range(2, dims + 2), 1, 0))
 
-    strides = [strides] * dims if isinstance(strides, int) else strides
-    dilations = [dilations] * dims if isinstance(dilations, int) else dilations
     x_dilations = [x_dilations] * dims if isinstance(x_dilations, int) else x_dilations
-
     for j in range(dims):
         if x_dilations[j] > 1:
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, dims, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:dims])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
+    res = _conv(
+        x,
+        filters,
+        strides,
+        padding,
+        dilations,
+        feature_group_count=feature_group_count,
+    )
     res = np.add(res, bias) if bias is not None else res
 
     if data_format == "channel_first":
@@ -520,30 +442,32 @@ def conv_general_transpose(
     if data_format == "channel_first":
         x = np.transpose(x, (0, *range(2, dims + 2), 1))
 
-    x, filters = _dilate_pad_conv_tranpose(
+    x, filters, dilations = _dilate_pad_conv_tranpose(
         x, filters, strides, padding, dims, dilations, output_shape
     )
+    # K... x (G x Cg) x Og -> K... x Cg x (G x Og), so that each group of input
+    # channels produces its own block of output channels
+    kernel_shape = filters.shape[:dims]
+    group_in = filters.shape[-2] // feature_group_count
+    filters = np.moveaxis(
+        filters.reshape(
+            [*kernel_shape, feature_group_count, group_in, filters.shape[-1]]
+        ),
+        -3,
+        -2,
+    ).reshape([*kernel_shape, group_in, -1])
 
     x = np.flip(x, (*range(1, dims + 1),))
-    res = np.concatenate(
-        [
-            np.flip(
-                conv_general_dilated(
-                    x[..., j : j + filters.shape[-2] // feature_group_count],
-                    filters[..., j : j + filters.shape[-2] // feature_group_count, :],
-                    1,
-                    "VALID",
-                    dims=dims,
-                    data_format=_get_x_data_format(dims, "channel_last"),
-                    dilations=1,
-                ),
-                (*range(1, dims + 1),),
-            )
-            for j in range(
-                0, filters.shape[-2], filters.shape[-2] // feature_group_count
-            )
-        ],
-        axis=-1,
+    res = np.flip(
+        _conv(
+            x,
+            filters,
+            1,
+            "VALID",
+            dilations,
+            feature_group_count=feature_group_count,
+        ),
+        (*range(1, dims + 1),),
     )
     res = np.add(res, bias) if bias is not None else res
 
@@ -8,6 +8,7 @@ from ivy.func_wrapper import with_unsupported_dtypes
 from ivy.functional.backends.numpy.helpers import _scalar_output_to_0d_array
 from . import backend_version
 from ivy.utils.einsum_parser import legalise_einsum_expr
+from ivy.utils.einsum_path_helpers import contract
 
 
 # Array API Standard #
@@ -243,8 +244,17 @@ cumsum.support_native_out = True
 def einsum(
     equation: str, *operands: np.ndarray, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    equation = legalise_einsum_expr(*[equation, *operands])
-    return np.einsum(equation, *operands, out=out)
+    if out is not None:
+        equation = legalise_einsum_expr(*[equation, *operands])
+        return np.einsum(equation, *operands, out=out)
+    return contract(
+        equation,
+        operands,
+        einsum=np.einsum,
+        matmul=np.matmul,
+        transpose=np.transpose,
+        reshape=np.reshape,
+    )
 
 
 einsum.support_native_out = True
@@ -12,7 +12,7 @@ from ivy.func_wrapper import (
     with_supported_device_and_dtypes,
 )
 import ivy.functional.backends.paddle as paddle_backend
-from ivy.utils.einsum_parser import legalise_einsum_expr
+from ivy.utils.einsum_path_helpers import contract
 from ivy.functional.ivy.statistical import _get_promoted_type_of_operands
 
 # local
@@ -330,5 +330,17 @@ def einsum(
     out: Optional[paddle.Tensor] = None,
 ) -> paddle.Tensor:
     dtype = _get_promoted_type_of_operands(operands)
-    equation = legalise_einsum_expr(*[equation, *operands])
-    return paddle.einsum(equation, *operands).astype(dtype)
+    operands = [operand.astype(dtype) for operand in operands]
+
+    def _einsum(equation, *operands):
+        # the integer operands summed on their own are promoted to int64
+        return paddle.einsum(equation, *operands).astype(dtype)
+
+    return contract(
+        equation,
+        operands,
+        einsum=_einsum,
+        matmul=paddle.matmul,
+        transpose=paddle.transpose,
+        reshape=paddle.reshape,
+    )
@@ -18,7 +18,7 @@ from ivy.functional.ivy.gradients import _is_variable
 from ivy.func_wrapper import with_unsupported_dtypes
 from ivy.utils.exceptions import _check_inplace_update_support
 from . import backend_version
-from ...ivy.general import _broadcast_to
+from ...ivy.general import _broadcast_to, _vmap_batched
 
 _round = round
 
@@ -428,7 +428,12 @@ def vmap(
     func: Callable,
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
     out_axes: int = 0,
+    *,
+    batch_ops: bool = False,
 ) -> Callable:
+    # the input signatures which can't be batched, see _vmap_batched
+    unbatchable = set()
+
     @ivy.output_to_native_arrays
     @ivy.inputs_to_native_arrays
     def _vmap(*args, **kwargs):
@@ -474,33 +479,33 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = tf.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
         # set up the axis to be mapped
-        if isinstance(in_axes, (tuple, list)):
-            for i in range(len(in_axes)):
-                args[i] = tf.experimental.numpy.moveaxis(args[i], in_axes[i], 0)
-        elif isinstance(in_axes, int):
-            args[0] = tf.experimental.numpy.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation - applying map_fn if only one arg provided as reduce requires
-        # two elements to begin with.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = ivy.stack(arr_results)
+        axes = in_axes if isinstance(in_axes, (tuple, list)) else [in_axes] * len(args)
+        for i, axis in enumerate(axes):
+            if axis is not None:
+                args[i] = tf.experimental.numpy.moveaxis(args[i], axis, 0)
+
+        # vectorisation, through the batching rules of the ivy functions called by
+        # func if requested, with a loop over the slices otherwise or for the
+        # functions which have none.
+        res = None
+        if batch_ops:
+            res = _vmap_batched(
+                func, args, [axis is not None for axis in axes], unbatchable
+            )
+        if res is None:
+            # Handling None in in_axes by broadcasting the axis_size
+            for i, axis in enumerate(axes):
+                if axis is None:
+                    args[i] = tf.broadcast_to(
+                        args[i], (tuple(axis_size) + tuple(args[i].shape))
+                    )
+
+            arr_results = []
+            for arrays in zip(*args):
+                single_op = func(*arrays)
+                arr_results.append(single_op)
+            res = ivy.stack(arr_results)
 
         if out_axes:
             res = tf.experimental.numpy.moveaxis(res, 0, out_axes)
@@ -7,7 +7,7 @@ import ivy
 from ivy.functional.ivy.statistical import _get_promoted_type_of_operands
 from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
-from ivy.utils.einsum_parser import legalise_einsum_expr
+from ivy.utils.einsum_path_helpers import contract
 
 # Array API Standard #
 # -------------------#
@@ -218,5 +218,12 @@ def einsum(
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     dtype = _get_promoted_type_of_operands(operands)
-    equation = legalise_einsum_expr(*[equation, *operands])
-    return tf.cast(tf.einsum(equation, *operands), dtype)
+    operands = [tf.cast(operand, dtype) for operand in operands]
+    return contract(
+        equation,
+        operands,
+        einsum=tf.einsum,
+        matmul=tf.matmul,
+        transpose=tf.transpose,
+        reshape=tf.reshape,
+    )
@@ -511,6 +511,8 @@ def vmap(
     func: Callable,
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
     out_axes: int = 0,
+    *,
+    batch_ops: bool = False,
 ) -> Callable:
     @ivy.output_to_native_arrays
     @ivy.inputs_to_native_arrays
@@ -8,6 +8,7 @@ import torch
 import ivy
 from ivy.functional.ivy.statistical import _get_promoted_type_of_operands
 from ivy.func_wrapper import with_unsupported_dtypes, with_supported_dtypes
+from ivy.utils.einsum_path_helpers import contract
 from . import backend_version
 
 # Array API Standard #
@@ -328,4 +329,17 @@ def einsum(
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     dtype = _get_promoted_type_of_operands(operands)
-    return ivy.astype(torch.einsum(equation, *operands), dtype, copy=False)
+    operands = [ivy.astype(operand, dtype, copy=False) for operand in operands]
+
+    def _einsum(equation, *operands):
+        # the integer operands summed on their own are promoted to int64
+        return torch.einsum(equation, *operands).to(dtype)
+
+    return contract(
+        equation,
+        operands,
+        einsum=_einsum,
+        matmul=torch.matmul,
+        transpose=torch.permute,
+        reshape=torch.reshape,
+    )
@@ -29,57 +29,98 @@ class AccumulateGrad:
         return self.__name__ == __value
 
     def __call__(self, grads):
-        for i in range(self.__self__.ndim):
-            grads = grads.sum(-1)
-        self.__self__._grads = grads
+        # accumulate the gradient into the .grad of the leaf tensor
+        leaf = self.__self__
+        if leaf._grads is not None:
+            grads = leaf._grads.ivy_array + grads
+        leaf._grads = torch_frontend.Tensor(grads, _init_overload=True)
         return None
 
 
 class GradFn:
-    def __init__(self, fn, inputs) -> None:
-        self._inputs = []
-        self._fns = []
+    def __init__(self, fn, inputs, kwargs=None, output=None) -> None:
+        self._fn = fn
+        self._inputs = [_to_ivy_array(x) for x in inputs]
+        self._kwargs = {k: v for k, v in (kwargs or {}).items() if k != "out"}
+        self._output = _to_ivy_array(output)
+        self._released = False
+        # the positions of the inputs which gradients flow to, and for each of them
+        # the grad_fn of the input, or the AccumulateGrad of the leaf input
+        self._idxs = []
         self.next_functions = []
-        assert len(inputs) <= 2
-        if len(inputs) == 1 and isinstance(inputs[0], torch_frontend.Tensor):
-            self._inputs.append(inputs[0].detach())
-            d_fn = lambda x: fn(x)
-            self._fns.append(to_ivy_arrays_and_back(ivy.jac(d_fn)))
-            if inputs[0].grad_fn is not None:
-                self.next_functions.append(inputs[0].grad_fn)
-            elif inputs[0].requires_grad and inputs[0].is_leaf:
-                acc_grad = AccumulateGrad()
-                acc_grad.__self__ = inputs[0]
-                self.next_functions.append(acc_grad)
-        elif len(inputs) == 2:
-            if isinstance(inputs[0], torch_frontend.Tensor):
-                self._inputs.append(inputs[0].detach())
-                d_fn = lambda x: fn(x, inputs[1])
-                self._fns.append(to_ivy_arrays_and_back(ivy.jac(d_fn)))
-                if inputs[0].grad_fn is not None:
-                    self.next_functions.append(inputs[0].grad_fn)
-                elif inputs[0].requires_grad and inputs[0].is_leaf:
-                    acc_grad = AccumulateGrad()
-                    acc_grad.__self__ = inputs[0]
-                    self.next_functions.append(acc_grad)
-            if isinstance(inputs[1], torch_frontend.Tensor):
-                self._inputs.append(inputs[1].detach())
-                d_fn = lambda x: fn(inputs[0], x)
-                self._fns.append(to_ivy_arrays_and_back(ivy.jac(d_fn)))
-                if inputs[1].grad_fn is not None:
-                    self.next_functions.append(inputs[1].grad_fn)
-                elif inputs[1].requires_grad and inputs[1].is_leaf:
-                    acc_grad = AccumulateGrad()
-                    acc_grad.__self__ = inputs[1]
-                    self.next_functions.append(acc_grad)
+        for idx, x in enumerate(inputs):
+            if not isinstance(x, torch_frontend.Tensor):
+                continue
+            if x.grad_fn is not None:
+                next_function = x.grad_fn
+            elif x.requires_grad and x.is_leaf:
+                next_function = getattr(x, "_grad_accumulator", None)
+                if next_function is None:
+                    next_function = AccumulateGrad()
+                    next_function.__self__ = x
+                    x._grad_accumulator = next_function
+            else:
+                continue
+            self._idxs.append(idx)
+            self.next_functions.append(next_function)
         self.__name__ = fn.__name__.capitalize() + "Backward"
 
     def __call__(self, prev_grads):
+        """
+        Return the vector-Jacobian products of prev_grads with the inputs of the
+        function, aligned with next_functions.
+
+        The products of the functions with a rule in ``_VJP_RULES`` are computed in
+        closed form, and the others as the gradients of the inner product of the
+        output with prev_grads, without building the Jacobians.
+        """
+        if self._released:
+            raise RuntimeError(
+                "Trying to backward through the graph a second time, but the saved "
+                "intermediate results have already been freed. Specify "
+                "retain_graph=True when calling .backward() the first time."
+            )
+        prev_grads = _to_ivy_array(prev_grads)
+        rule = _VJP_RULES.get(self._fn.__name__)
+        grads = None
+        if rule is not None:
+            grads = [
+                rule(prev_grads, self._output, self._inputs, self._kwargs, idx)
+                for idx in self._idxs
+            ]
+        if grads is None or any(grad is None for grad in grads):
+            grads = self._generic_vjp(prev_grads)
         return [
-            jac_fn(input_tensor) * prev_grads
-            for input_tensor, jac_fn in zip(self._inputs, self._fns)
+            _unbroadcast(grad, self._inputs[idx].shape)
+            for idx, grad in zip(self._idxs, grads)
         ]
 
+    def _generic_vjp(self, prev_grads):
+        def _inner_product(xs):
+            inputs = list(self._inputs)
+            for idx in self._idxs:
+                inputs[idx] = xs[str(idx)]
+            ret = _to_ivy_array(self._fn(*inputs, **self._kwargs))
+            return ivy.sum(ret * ivy.astype(prev_grads, ret.dtype))
+
+        _, grads = ivy.execute_with_gradients(
+            _inner_product,
+            {str(idx): self._inputs[idx] for idx in self._idxs},
+            xs_grad_idxs=None,
+        )
+        if grads is None:
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                f"{self.__name__} needs autograd, which the "
+                f"{ivy.current_backend_str()} backend does not support"
+            )
+        return [grads[str(idx)] for idx in self._idxs]
+
+    def _release(self):
+        # free the saved inputs and output once the graph has been backpropagated
+        self._inputs = None
+        self._output = None
+        self._released = True
+
     def __repr__(self):
         return self.__name__
 
@@ -91,6 +132,160 @@ class GradFn:
 # --------------- #
 
 
+def _unbroadcast(grad, shape):
+    # sum grad over the dimensions which an input of the given shape was broadcast
+    # along
+    shape = tuple(shape)
+    if tuple(grad.shape) == shape:
+        return grad
+    num_extra = len(grad.shape) - len(shape)
+    if num_extra > 0:
+        grad = ivy.sum(grad, axis=tuple(range(num_extra)))
+    axes = tuple(i for i, dim in enumerate(shape) if dim == 1 and grad.shape[i] != 1)
+    if axes:
+        grad = ivy.sum(grad, axis=axes, keepdims=True)
+    return ivy.reshape(grad, shape)
+
+
+def _reduced_axes(inputs, kwargs):
+    # the axes reduced by a sum or mean, and whether they were kept
+    dim = inputs[1] if len(inputs) > 1 else kwargs.get("dim")
+    keepdim = inputs[2] if len(inputs) > 2 else kwargs.get("keepdim", False)
+    ndim = len(inputs[0].shape)
+    if dim is None:
+        return tuple(range(ndim)), keepdim
+    dim = (dim,) if isinstance(dim, int) else tuple(dim)
+    return tuple(d % ndim for d in dim), keepdim
+
+
+def _vjp_sum(g, out, inputs, kwargs, idx):
+    axes, keepdim = _reduced_axes(inputs, kwargs)
+    if not keepdim:
+        g = ivy.expand_dims(g, axis=axes)
+    return ivy.broadcast_to(g, inputs[0].shape)
+
+
+def _vjp_mean(g, out, inputs, kwargs, idx):
+    axes, _ = _reduced_axes(inputs, kwargs)
+    count = 1
+    for axis in axes:
+        count *= inputs[0].shape[axis]
+    return _vjp_sum(g, out, inputs, kwargs, idx) / count
+
+
+def _vjp_div(g, out, inputs, kwargs, idx):
+    if kwargs.get("rounding_mode") is not None:
+        return None
+    if idx == 0:
+        return g / inputs[1]
+    return -g * out / inputs[1]
+
+
+def _vjp_pow(g, out, inputs, kwargs, idx):
+    x, exponent = inputs
+    if idx == 0:
+        return g * exponent * x ** (exponent - 1)
+    return g * out * ivy.log(x)
+
+
+def _vjp_matmul(g, out, inputs, kwargs, idx):
+    # 1-d inputs are promoted to matrices as by matmul, as is the gradient
+    x, y = inputs
+    if len(y.shape) == 1:
+        y, g = ivy.expand_dims(y, axis=1), ivy.expand_dims(g, axis=-1)
+    if len(x.shape) == 1:
+        x, g = ivy.expand_dims(x, axis=0), ivy.expand_dims(g, axis=-2)
+    if idx == 0:
+        grad = ivy.matmul(g, ivy.swapaxes(y, -1, -2))
+        return grad if len(inputs[0].shape) > 1 else ivy.squeeze(grad, axis=-2)
+    grad = ivy.matmul(ivy.swapaxes(x, -1, -2), g)
+    return grad if len(inputs[1].shape) > 1 else ivy.squeeze(grad, axis=-1)
+
+
+# closed form vector-Jacobian products, taking the gradient of the output, the
+# output, the inputs and the keyword arguments of the function, and the position
+# of the input to return the gradient of, before unbroadcasting. They may return
+# None to fall back to GradFn._generic_vjp
+_VJP_RULES = {
+    "add": lambda g, out, inputs, kwargs, idx: (
+        g if idx == 0 else g * kwargs.get("alpha", 1)
+    ),
+    "subtract": lambda g, out, inputs, kwargs, idx: (
+        g if idx == 0 else -g * kwargs.get("alpha", 1)
+    ),
+    "mul": lambda g, out, inputs, kwargs, idx: g * inputs[1 - idx],
+    "div": _vjp_div,
+    "pow": _vjp_pow,
+    "negative": lambda g, out, inputs, kwargs, idx: -g,
+    "exp": lambda g, out, inputs, kwargs, idx: g * out,
+    "log": lambda g, out, inputs, kwargs, idx: g / inputs[0],
+    "sqrt": lambda g, out, inputs, kwargs, idx: g / (2 * out),
+    "abs": lambda g, out, inputs, kwargs, idx: g * ivy.sign(inputs[0]),
+    "tanh": lambda g, out, inputs, kwargs, idx: g * (1 - out**2),
+    "sigmoid": lambda g, out, inputs, kwargs, idx: g * out * (1 - out),
+    "relu": lambda g, out, inputs, kwargs, idx: g * ivy.astype(out > 0, g.dtype),
+    "sum": _vjp_sum,
+    "mean": _vjp_mean,
+    "matmul": _vjp_matmul,
+    "reshape": lambda g, out, inputs, kwargs, idx: ivy.reshape(g, inputs[0].shape),
+}
+
+
+def _run_backward(grad_fn, gradient, retain_graph=False):
+    """
+    Backpropagate the gradient through the graph of grad_fn in a single pass.
+
+    The nodes of the graph are visited in topological order, so that each node is
+    called once with the sum of the gradients of all of the nodes depending on it,
+    however many paths lead to it. The gradients of the nodes are freed as soon as
+    they have been propagated, and the saved inputs of the nodes too unless
+    retain_graph is True.
+    """
+    # reverse post order of a depth first search, so that every node comes before
+    # the nodes it depends on
+    order = []
+    visited = set()
+    stack = [(grad_fn, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        stack.append((node, True))
+        for next_function in node.next_functions:
+            if id(next_function) not in visited:
+                stack.append((next_function, False))
+    order.reverse()
+
+    inplace = ivy.inplace_arrays_supported()
+    grads = {id(grad_fn): gradient}
+    owned = set()
+    for node in order:
+        grad = grads.pop(id(node), None)
+        if grad is None:
+            continue
+        if isinstance(node, AccumulateGrad):
+            node(grad)
+            continue
+        next_grads = node(grad)
+        if not retain_graph:
+            node._release()
+        for next_function, next_grad in zip(node.next_functions, next_grads):
+            key = id(next_function)
+            if key not in grads:
+                grads[key] = next_grad
+            elif key in owned and inplace:
+                ivy.add(grads[key], next_grad, out=grads[key])
+            else:
+                # the first gradient may be shared with other nodes, so it is only
+                # accumulated in place once it has been copied
+                grads[key] = grads[key] + next_grad
+                owned.add(key)
+
+
 def _from_ivy_array_to_torch_frontend_tensor(
     x, nested=False, include_derived=None, requires_grad=False
 ):
@@ -240,7 +435,7 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
             [isinstance(i, torch_frontend.Tensor) and i.requires_grad for i in args]
         ):
             # ToDo: Implement for unbind
-            grad_fn = GradFn(fn, args)
+            grad_fn = GradFn(fn, args, kwargs, ret)
             grad_fn.__self__ = ret
             ret.grad_fn = grad_fn
 
@@ -12,6 +12,7 @@ from ivy.functional.frontends.numpy.creation_routines.from_existing_data import
 from ivy.func_wrapper import with_unsupported_dtypes
 from ivy.func_wrapper import with_supported_dtypes
 from ivy.functional.frontends.torch.func_wrapper import (
+    _run_backward,
     _to_ivy_array,
     numpy_to_torch_style_args,
 )
@@ -1748,14 +1749,15 @@ class Tensor:
             assert self.shape == gradient.shape, "Mismatch in shape"
             self._grads = gradient
             return
-        _grad_list = self.grad_fn(
-            gradient if gradient is not None else torch_frontend.tensor(1.0)
+        _run_backward(
+            self.grad_fn,
+            (
+                ivy.ones_like(self.ivy_array)
+                if gradient is None
+                else _to_ivy_array(gradient)
+            ),
+            retain_graph=create_graph if retain_graph is None else retain_graph,
         )
-        for idx, next_function in enumerate(self.grad_fn.next_functions):
-            if next_function.__self__.grad_fn is not None:
-                next_function.__self__.backward(_grad_list[idx])
-            else:
-                next_function(_grad_list[idx])
 
     @with_unsupported_dtypes({"2.0.1 and below": ("float16", "bfloat16")}, "torch")
     def logaddexp(self, other):
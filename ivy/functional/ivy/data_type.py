@@ -24,6 +24,7 @@ from ivy.func_wrapper import (
     handle_backend_invalid,
 )
 from ivy.utils.exceptions import handle_exceptions
+from ivy.utils._thread_modes import ModeStack
 from collections.abc import Hashable
 
 
@@ -819,11 +820,11 @@ def result_type(
 # Extra #
 # ------#
 
-default_dtype_stack = list()
-default_float_dtype_stack = list()
-default_int_dtype_stack = list()
-default_uint_dtype_stack = list()
-default_complex_dtype_stack = list()
+default_dtype_stack = ModeStack()
+default_float_dtype_stack = ModeStack()
+default_int_dtype_stack = ModeStack()
+default_uint_dtype_stack = ModeStack()
+default_complex_dtype_stack = ModeStack()
 
 
 class DefaultDtype:
@@ -38,9 +38,10 @@ from ivy.func_wrapper import (
     handle_backend_invalid,
 )
 from ivy.utils.exceptions import handle_exceptions
+from ivy.utils._thread_modes import ModeStack
 
-default_device_stack = list()
-soft_device_mode_stack = list()
+default_device_stack = ModeStack()
+soft_device_mode_stack = ModeStack()
 dev_handles = dict()
 split_factors = dict()
 max_chunk_sizes = dict()
@@ -2,9 +2,15 @@
 
 # global
 import gc
+import hashlib
 import inspect
+import itertools
 import math
-from functools import wraps
+import string
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache, wraps
 from numbers import Number
 from typing import (
     Callable,
@@ -24,9 +30,11 @@ import numpy as np
 
 # local
 import ivy
+from ivy import func_wrapper
 from ivy.utils.backend import current_backend, backend_stack
 from ivy.functional.ivy.gradients import _is_variable
 from ivy.utils.exceptions import handle_exceptions
+from ivy.utils._thread_modes import ModeStack
 from ivy.func_wrapper import (
     handle_array_function,
     inputs_to_ivy_arrays,
@@ -48,22 +56,24 @@ from ivy.functional.ivy.device import dev
 FN_CACHE = dict()
 INF = float("inf")
 
-precise_mode_stack = list()
-queue_timeout_stack = list()
-array_mode_stack = list()
-shape_array_mode_stack = list()
-nestable_mode_stack = list()
-exception_trace_mode_stack = list()
-inplace_mode_stack = list()
+precise_mode_stack = ModeStack()
+queue_timeout_stack = ModeStack()
+array_mode_stack = ModeStack()
+shape_array_mode_stack = ModeStack()
+nestable_mode_stack = ModeStack()
+exception_trace_mode_stack = ModeStack()
+inplace_mode_stack = ModeStack()
 trace_mode_dict = dict()
 trace_mode_dict["frontend"] = "ivy/functional/frontends"
 trace_mode_dict["ivy"] = "ivy/"
 trace_mode_dict["full"] = ""
 trace_mode_dict["none"] = ""
-show_func_wrapper_trace_mode_stack = list()
-min_denominator_stack = list()
-min_base_stack = list()
-tmp_dir_stack = list()
+show_func_wrapper_trace_mode_stack = ModeStack()
+fused_dispatch_mode_stack = ModeStack()
+container_parallelism_stack = ModeStack()
+min_denominator_stack = ModeStack()
+min_base_stack = ModeStack()
+tmp_dir_stack = ModeStack()
 
 
 # Extra #
@@ -636,6 +646,150 @@ def unset_show_func_wrapper_trace_mode() -> None:
         ivy.__setattr__("show_func_wrapper_trace_mode", mode, True)
 
 
+ivy.fused_dispatch_mode = (
+    fused_dispatch_mode_stack[-1] if fused_dispatch_mode_stack else False
+)
+
+
+@handle_exceptions
+def set_fused_dispatch_mode(mode: bool) -> None:
+    """
+    Set the mode of whether to wrap backend functions with a single fused dispatch
+    wrapper instead of the full stack of function wrappers.
+
+    The fused wrapper handles calls with plain, array and flat sequence arguments
+    in a single pass, and falls back to the stack of wrappers for everything else.
+    The mode is applied when the backend functions are wrapped, so it takes effect
+    the next time a backend is set.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to use fused dispatch wrappers
+
+    Examples
+    --------
+    >>> ivy.set_fused_dispatch_mode(True)
+    >>> ivy.fused_dispatch_mode
+    True
+
+    >>> ivy.set_fused_dispatch_mode(False)
+    >>> ivy.fused_dispatch_mode
+    False
+    """
+    global fused_dispatch_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    fused_dispatch_mode_stack.append(mode)
+    ivy.__setattr__("fused_dispatch_mode", mode, True)
+
+
+@handle_exceptions
+def unset_fused_dispatch_mode() -> None:
+    """
+    Reset the mode of whether to wrap backend functions with a single fused dispatch
+    wrapper to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_fused_dispatch_mode(True)
+    >>> ivy.fused_dispatch_mode
+    True
+
+    >>> ivy.unset_fused_dispatch_mode()
+    >>> ivy.fused_dispatch_mode
+    False
+    """
+    global fused_dispatch_mode_stack
+    if fused_dispatch_mode_stack:
+        fused_dispatch_mode_stack.pop(-1)
+        mode = fused_dispatch_mode_stack[-1] if fused_dispatch_mode_stack else False
+        ivy.__setattr__("fused_dispatch_mode", mode, True)
+
+
+ivy.container_parallelism = (
+    container_parallelism_stack[-1][0] if container_parallelism_stack else 1
+)
+ivy.container_parallel_min_size = (
+    container_parallelism_stack[-1][1] if container_parallelism_stack else 65536
+)
+
+
+@handle_exceptions
+def set_container_parallelism(num_threads: int, /, *, min_size: int = 65536) -> None:
+    """
+    Set the number of threads which container mapping dispatches leaves to.
+
+    With more than one thread, ``ivy.Container.cont_map``,
+    ``ivy.Container.cont_multi_map`` and ivy functions called on containers apply
+    the function to the leaves with at least ``min_size`` elements on a shared pool
+    of threads, while the smaller leaves are still mapped one by one. The results
+    are assembled in the order of the leaves, so the returned containers are the
+    same as when mapping sequentially. This is only faster when the backend
+    releases the GIL inside its kernels, as numpy and torch on cpu do, and when
+    the mapped function doesn't depend on the order in which the leaves are
+    processed. The threads each map their leaves with a copy of the modes set when
+    the container is mapped, such as the default device, and the modes they set
+    aren't seen by the other threads. The leaves are still mapped sequentially
+    while gradients are computed, as the gradient tapes of the backends only record
+    the calls made on their own thread.
+
+    Parameters
+    ----------
+    num_threads
+        The number of threads, ``1`` to map the leaves sequentially.
+    min_size
+        The minimum number of elements of the leaves dispatched to the threads.
+        Default is ``65536``.
+
+    Examples
+    --------
+    >>> ivy.set_container_parallelism(4)
+    >>> ivy.container_parallelism
+    4
+
+    >>> ivy.set_container_parallelism(1)
+    >>> ivy.container_parallelism
+    1
+    """
+    global container_parallelism_stack
+    ivy.utils.assertions.check_isinstance(num_threads, int)
+    ivy.utils.assertions.check_isinstance(min_size, int)
+    ivy.utils.assertions.check_true(
+        num_threads >= 1, "the number of threads must be at least 1"
+    )
+    container_parallelism_stack.append((num_threads, min_size))
+    ivy.__setattr__("container_parallelism", num_threads, True)
+    ivy.__setattr__("container_parallel_min_size", min_size, True)
+
+
+@handle_exceptions
+def unset_container_parallelism() -> None:
+    """
+    Reset the number of threads which container mapping dispatches leaves to, and
+    the minimum size of those leaves, to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_container_parallelism(4)
+    >>> ivy.container_parallelism
+    4
+
+    >>> ivy.unset_container_parallelism()
+    >>> ivy.container_parallelism
+    1
+    """
+    global container_parallelism_stack
+    if container_parallelism_stack:
+        container_parallelism_stack.pop(-1)
+        num_threads, min_size = (
+            container_parallelism_stack[-1]
+            if container_parallelism_stack
+            else (1, 65536)
+        )
+        ivy.__setattr__("container_parallelism", num_threads, True)
+        ivy.__setattr__("container_parallel_min_size", min_size, True)
+
+
 @handle_exceptions
 @handle_backend_invalid
 @handle_nestable
@@ -1749,18 +1903,174 @@ def match_kwargs(
     return split_kwargs
 
 
+class _IdentityKey:
+    # cache key component for objects which are unhashable or must not be
+    # compared by value, such as arrays. The object is weakly referenced when it
+    # can be, so that the cache doesn't keep it alive, and the entries keyed on
+    # it are evicted once it dies, before its id can be reused
+    __slots__ = ("id", "ref", "obj")
+
+    def __init__(self, obj):
+        self.id = id(obj)
+        try:
+            self.ref = weakref.ref(obj)
+            self.obj = None
+        except TypeError:
+            self.ref = None
+            self.obj = obj
+
+    def get(self):
+        return self.obj if self.ref is None else self.ref()
+
+    def __hash__(self):
+        return self.id
+
+    def __eq__(self, other):
+        if not isinstance(other, _IdentityKey) or self.id != other.id:
+            return False
+        obj = self.get()
+        return obj is not None and obj is other.get()
+
+
+_SCALAR_KEY_TYPES = (int, float, complex, bool, str, bytes, type(None))
+
+
+def _cache_key(obj, hash_arrays, identity_keys):
+    if obj.__class__ in _SCALAR_KEY_TYPES:
+        # the class is part of the key so that 1, 1.0 and True are told apart
+        return obj.__class__, obj
+    if isinstance(obj, (list, tuple)):
+        return obj.__class__, tuple(
+            _cache_key(o, hash_arrays, identity_keys) for o in obj
+        )
+    if isinstance(obj, dict) and not isinstance(obj, ivy.Container):
+        return obj.__class__, frozenset(
+            (k, _cache_key(v, hash_arrays, identity_keys)) for k, v in obj.items()
+        )
+    if isinstance(obj, ivy.Shape):
+        return ivy.Shape, tuple(obj)
+    if ivy.is_array(obj):
+        if hash_arrays:
+            obj = np.ascontiguousarray(ivy.to_numpy(obj))
+            return obj.dtype.str, obj.shape, hashlib.sha1(obj.tobytes()).digest()
+    else:
+        try:
+            hash(obj)
+            return obj.__class__, obj
+        except TypeError:
+            pass
+    key = _IdentityKey(obj)
+    identity_keys.append(key)
+    return key
+
+
+class _FnCache:
+    __slots__ = ("entries", "max_size", "hits", "misses", "evictions", "lock")
+
+    def __init__(self, max_size):
+        # maps the keys to (output, finalizers) pairs, the finalizers evicting
+        # the entry once one of the weakly referenced arguments dies
+        self.entries = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # reentrant, as finalizers may run while the lock is held
+        self.lock = threading.RLock()
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "max_size": self.max_size,
+        }
+
+    def lookup(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False, None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return True, entry[0]
+
+    def insert(self, key, ret, identity_keys):
+        with self.lock:
+            self.misses += 1
+            finalizers = []
+            for identity_key in identity_keys:
+                obj = identity_key.get()
+                if identity_key.ref is None or obj is None:
+                    continue
+                finalizer = weakref.finalize(obj, self.evict, key)
+                finalizer.atexit = False
+                finalizers.append(finalizer)
+            self._drop(self.entries.pop(key, None))
+            self.entries[key] = (ret, finalizers)
+            if self.max_size is not None:
+                while len(self.entries) > self.max_size:
+                    self._drop(self.entries.popitem(last=False)[1])
+                    self.evictions += 1
+
+    def evict(self, key):
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self._drop(entry)
+                self.evictions += 1
+
+    @staticmethod
+    def _drop(entry):
+        if entry is not None:
+            for finalizer in entry[1]:
+                finalizer.detach()
+
+    def clear(self):
+        with self.lock:
+            for entry in self.entries.values():
+                self._drop(entry)
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
 @handle_exceptions
-def cache_fn(func: Callable) -> Callable:
+def cache_fn(
+    func: Callable,
+    /,
+    *,
+    max_size: Optional[int] = 1024,
+    hash_arrays: bool = False,
+) -> Callable:
     """
     Cache function outputs.
 
     A decorator to wrap a function, such that computed outputs are cached to avoid
-    recalculating them later.
+    recalculating them later. The cache is keyed on the structure of the arguments:
+    scalars, strings, dtypes, devices and shapes are compared by value (and type),
+    lists, tuples and dicts are compared element-wise, and arrays are compared by
+    identity unless ``hash_arrays`` is set. The least recently used outputs are
+    evicted once the cache holds ``max_size`` of them.
+
+    Arrays and other objects keyed by identity are only weakly referenced where
+    possible, the outputs computed for them being evicted once they are garbage
+    collected.
+
+    The wrappers of a same function with the same ``max_size`` and ``hash_arrays``
+    share one cache, its statistics are returned by the ``cache_info`` attribute of
+    the wrapper and the cache is emptied by its ``cache_clear`` attribute.
 
     Parameters
     ----------
     func
         The function to wrap, whose output should be cached for later.
+    max_size
+        The maximum number of outputs cached for the function, ``None`` for an
+        unbounded cache. Default is ``1024``.
+    hash_arrays
+        Whether to key array arguments on a hash of their dtype, shape and contents
+        rather than on their identity. Default is ``False``.
 
     Returns
     -------
@@ -1782,25 +2092,38 @@ def cache_fn(func: Callable) -> Callable:
     >>> cached_line_eq = ivy.cache_fn(line_eq)
     >>> print(cached_line_eq(3, itc=5, slp=2))
     11
+
+    With a bounded cache:
+
+    >>> cached_sum = ivy.cache_fn(my_sum, max_size=1)
+    >>> cached_sum.cache_clear()
+    >>> print(cached_sum(1, 2), cached_sum(3, 4), cached_sum(3, 4))
+    3 7 7
+    >>> print(cached_sum.cache_info())
+    {'hits': 1, 'misses': 2, 'evictions': 1, 'size': 1, 'max_size': 1}
     """
     global FN_CACHE
-    if func not in FN_CACHE:
-        FN_CACHE[func] = dict()
+    cache_id = (func, max_size, hash_arrays)
+    if cache_id not in FN_CACHE:
+        FN_CACHE[cache_id] = _FnCache(max_size)
+    cache = FN_CACHE[cache_id]
 
     @wraps(func)
     def cached_fn(*args, **kwargs):
-        key = "".join(
-            [str(i) + ", " for i in args]
-            + [" kw, "]
-            + [str(i) + ", " for i in sorted(kwargs.items())]
+        identity_keys = []
+        key = (
+            _cache_key(args, hash_arrays, identity_keys),
+            _cache_key(kwargs, hash_arrays, identity_keys) if kwargs else None,
         )
-        cache = FN_CACHE[func]
-        if key in cache:
-            return cache[key]
+        found, ret = cache.lookup(key)
+        if found:
+            return ret
         ret = func(*args, **kwargs)
-        cache[key] = ret
+        cache.insert(key, ret, identity_keys)
         return ret
 
+    cached_fn.cache_info = cache.info
+    cached_fn.cache_clear = cache.clear
     return cached_fn
 
 
@@ -4090,11 +4413,676 @@ def function_unsupported_devices_and_dtypes(fn: Callable, recurse: bool = True)
     return unsupported_devices_dtypes
 
 
+# Batching #
+# ---------#
+
+# `vmap` in the numpy and tensorflow backends calls the function once with the whole
+# batch, rather than once per slice. The ivy function calls with batched inputs are
+# intercepted through an op hook registered with `ivy.func_wrapper`, and are
+# rewritten by the batching rules below to carry the batch along a leading axis.
+
+
+class _BatchTrace(func_wrapper._OpHook):
+    def __init__(self, size):
+        # the batched native arrays, by id, holding a reference so that the id of
+        # an array can't be reused by another one while the trace is active
+        self.size = size
+        self._batched = dict()
+        # the calls may be made from several threads, such as those mapping the
+        # leaves of containers in parallel, each with its own depth of nested
+        # batched calls
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def batch(self, x):
+        with self._lock:
+            self._batched[id(x)] = x
+        return x
+
+    def is_batched(self, x):
+        if isinstance(x, ivy.Array):
+            x = x.data
+        return id(x) in self._batched
+
+    def _has_batched(self, x):
+        if isinstance(x, (list, tuple)):
+            return any(map(self.is_batched, x))
+        return self.is_batched(x)
+
+    def __enter__(self):
+        # enclosing traces, tapes and profilers stay registered, so they still see
+        # every call
+        func_wrapper._register_op_hook(self)
+        return self
+
+    def __exit__(self, *exc):
+        func_wrapper._unregister_op_hook(self)
+
+    def call(self, name, fn, args, kwargs, call_next):
+        # the calls made within a batched ivy function are not batched again
+        depth = getattr(self._local, "depth", 0)
+        if depth or not any(
+            map(self._has_batched, itertools.chain(args, kwargs.values()))
+        ):
+            return call_next(args, kwargs)
+        rule = _BATCH_RULES.get(name)
+        if rule is None:
+            # functions without a rule may still be composed of batched calls, such
+            # as the compositional ones, otherwise their outputs aren't batched
+            ret = call_next(args, kwargs)
+            if not all(map(self.is_batched, _batch_leaves(ret))):
+                _no_batching_rule(name)
+            return ret
+        arguments = _signature(fn).bind(*args, **kwargs)
+        arguments.apply_defaults()
+        a = arguments.arguments
+        if a.get("out") is not None:
+            _no_batching_rule(name)
+        for k, v in a.items():
+            a[k] = _to_native_argument(v)
+        _check_not_derived(self, name, a)
+        self._local.depth = depth + 1
+        try:
+            ret = rule(
+                self,
+                lambda: call_next(arguments.args, arguments.kwargs),
+                a,
+            )
+        finally:
+            self._local.depth = depth
+        for r in _batch_leaves(ret):
+            if isinstance(r, ivy.Array):
+                self.batch(r.data)
+            elif isinstance(r, ivy.NativeArray):
+                self.batch(r)
+        return ret
+
+
+@lru_cache(maxsize=None)
+def _signature(fn):
+    return inspect.signature(fn)
+
+
+def _batch_leaves(ret):
+    return list(ret) if isinstance(ret, (list, tuple)) else [ret]
+
+
+def _to_native_argument(x):
+    if isinstance(x, ivy.Array):
+        return x.data
+    if isinstance(x, (list, tuple)) and any(isinstance(x_, ivy.Array) for x_ in x):
+        return type(x)(x_.data if isinstance(x_, ivy.Array) else x_ for x_ in x)
+    return x
+
+
+class _BatchingError(ivy.utils.exceptions.IvyNotImplementedException):
+    # raised by the trace for the calls it can't batch, for vmap to fall back to the
+    # loop over the slices, while any other error is raised as is
+    pass
+
+
+def _no_batching_rule(name):
+    raise _BatchingError(f"vmap has no batching rule for {name}")
+
+
+def _check_not_derived(trace, name, a):
+    # an unbatched argument of the shape of a batched one was most likely computed
+    # from the batch through the native arrays, which the trace doesn't see, such as
+    # the condition of ivy.where(x > 0, x, 0.0), and would be wrongly broadcast
+    # along the batch
+    arrays = [
+        x
+        for v in a.values()
+        for x in _batch_leaves(v)
+        if isinstance(x, ivy.NativeArray)
+    ]
+    batched_shapes = {tuple(x.shape) for x in arrays if trace.is_batched(x)}
+    if any(
+        not trace.is_batched(x) and tuple(x.shape) in batched_shapes for x in arrays
+    ):
+        _no_batching_rule(f"{name} with unbatched arguments of the batch's shape")
+
+
+def _example_ndim(trace, x):
+    return len(x.shape) - trace.is_batched(x)
+
+
+def _align(x, ndim, target_ndim):
+    # insert unit axes after the batch axis of an array with ndim example dimensions,
+    # so that it broadcasts against arrays with target_ndim example dimensions
+    if ndim >= target_ndim:
+        return x
+    shape = tuple(x.shape)
+    return ivy.to_native(
+        ivy.reshape(x, shape[:1] + (1,) * (target_ndim - ndim) + shape[1:])
+    )
+
+
+def _with_batch_axis(trace, x):
+    # broadcast an unbatched array along a new leading batch axis
+    if trace.is_batched(x):
+        return x
+    return ivy.to_native(
+        ivy.broadcast_to(ivy.expand_dims(x, axis=0), (trace.size,) + tuple(x.shape))
+    )
+
+
+def _shift_axis(axis):
+    # the non-negative axes of an example are one further along in the batch, the
+    # negative ones are unchanged
+    if isinstance(axis, (list, tuple)):
+        return type(axis)(_shift_axis(a) for a in axis)
+    return axis + 1 if axis >= 0 else axis
+
+
+def _check_only_batched(trace, a, param="x"):
+    if not trace.is_batched(a[param]) or any(
+        trace._has_batched(v) for k, v in a.items() if k != param
+    ):
+        _no_batching_rule(f"batched arguments other than {param}")
+
+
+def _batch_unchanged(trace, call, a):
+    # functions which act on the trailing axes, or which don't depend on the batch
+    return call()
+
+
+def _batch_elementwise(trace, call, a):
+    arrays = [k for k, v in a.items() if isinstance(v, ivy.NativeArray)]
+    ndim = max(_example_ndim(trace, a[k]) for k in arrays)
+    for k in arrays:
+        if trace.is_batched(a[k]):
+            a[k] = _align(a[k], _example_ndim(trace, a[k]), ndim)
+    return call()
+
+
+def _batch_axis(name, none="all", flatten=False):
+    # functions of x along a, possibly None, axis argument. With none="all" a None
+    # axis means all the axes, with none="keep" it's passed on, with flatten=True it
+    # means the flattened example, otherwise the function isn't batched
+    def _rule(trace, call, a):
+        _check_only_batched(trace, a)
+        ndim = _example_ndim(trace, a["x"])
+        if a["axis"] is not None:
+            a["axis"] = _shift_axis(a["axis"])
+        elif flatten and not a.get("keepdims"):
+            a["x"] = ivy.to_native(ivy.reshape(a["x"], (trace.size, -1)))
+            a["axis"] = 1
+        elif none == "all":
+            a["axis"] = tuple(range(1, ndim + 1))
+        elif none != "keep":
+            _no_batching_rule(name)
+        return call()
+
+    return _rule
+
+
+def _batch_squeeze(trace, call, a):
+    _check_only_batched(trace, a)
+    if a["axis"] is None:
+        a["axis"] = tuple(i for i, d in enumerate(a["x"].shape) if i and d == 1)
+        if not a["axis"]:
+            return ivy.copy_array(a["x"])
+    else:
+        a["axis"] = _shift_axis(a["axis"])
+    return call()
+
+
+def _batch_permute_dims(trace, call, a):
+    _check_only_batched(trace, a)
+    ndim = _example_ndim(trace, a["x"])
+    a["axes"] = (0,) + tuple(axis % ndim + 1 for axis in a["axes"])
+    return call()
+
+
+def _batch_swapaxes(trace, call, a):
+    _check_only_batched(trace, a)
+    a["axis0"], a["axis1"] = _shift_axis(a["axis0"]), _shift_axis(a["axis1"])
+    return call()
+
+
+def _batch_reshape(trace, call, a):
+    _check_only_batched(trace, a)
+    if a.get("order", "C") != "C":
+        _no_batching_rule("reshape")
+    shape = a["shape"]
+    a["shape"] = (trace.size,) + ((shape,) if isinstance(shape, int) else tuple(shape))
+    return call()
+
+
+def _batch_broadcast_to(trace, call, a):
+    _check_only_batched(trace, a)
+    shape = tuple(a["shape"])
+    a["x"] = _align(a["x"], _example_ndim(trace, a["x"]), len(shape))
+    a["shape"] = (trace.size,) + shape
+    return call()
+
+
+def _batch_tile(trace, call, a):
+    _check_only_batched(trace, a)
+    repeats = a["repeats"]
+    repeats = (repeats,) if isinstance(repeats, int) else tuple(map(int, repeats))
+    ndim = _example_ndim(trace, a["x"])
+    a["x"] = _align(a["x"], ndim, len(repeats))
+    a["repeats"] = (1,) * (max(ndim - len(repeats), 0) + 1) + repeats
+    return call()
+
+
+def _batch_pad(trace, call, a):
+    _check_only_batched(trace, a)
+    a["pad_width"] = [(0, 0)] + [tuple(p) for p in a["pad_width"]]
+    return call()
+
+
+def _batch_join(param):
+    # concat and stack, the unbatched arrays are broadcast along the batch axis
+    def _rule(trace, call, a):
+        if a["axis"] is None:
+            _no_batching_rule(param)
+        a[param] = [_with_batch_axis(trace, x) for x in a[param]]
+        a["axis"] = _shift_axis(a["axis"])
+        return call()
+
+    return _rule
+
+
+_BASIC_INDEX_TYPES = (int, np.integer, slice, type(None), type(Ellipsis))
+
+
+def _batch_get_item(trace, call, a):
+    _check_only_batched(trace, a)
+    query = a["query"] if isinstance(a["query"], tuple) else (a["query"],)
+    # basic indexing, or a single index array, keep the batch axis in front
+    advanced = [q for q in query if not isinstance(q, _BASIC_INDEX_TYPES)]
+    if advanced and (len(query) > 1 or not isinstance(query[0], ivy.NativeArray)):
+        _no_batching_rule("advanced indexing with several indices")
+    a["query"] = (slice(None),) + query
+    return call()
+
+
+def _batch_matmul(trace, call, a):
+    x1, x2 = a["x1"], a["x2"]
+    ndim1, ndim2 = _example_ndim(trace, x1), _example_ndim(trace, x2)
+    if 1 in (ndim1, ndim2) and any(
+        a[k] for k in ("transpose_a", "transpose_b", "adjoint_a", "adjoint_b")
+    ):
+        _no_batching_rule("matmul")
+    a["x1"], a["x2"], squeeze = _matmul_operands(trace, x1, x2)
+    ret = call()
+    return ivy.squeeze(ret, axis=squeeze) if squeeze else ret
+
+
+def _matmul_operands(trace, x1, x2):
+    # vectors are promoted to matrices explicitly, as the batch axis would otherwise
+    # be taken as one of their dimensions, and the example batch dimensions of the
+    # operands are aligned
+    batched1, batched2 = trace.is_batched(x1), trace.is_batched(x2)
+    ndim1, ndim2 = _example_ndim(trace, x1), _example_ndim(trace, x2)
+    squeeze = list()
+    if ndim1 == 1:
+        x1, ndim1 = ivy.to_native(ivy.expand_dims(x1, axis=-2)), 2
+        squeeze.append(-2)
+    if ndim2 == 1:
+        x2, ndim2 = ivy.to_native(ivy.expand_dims(x2, axis=-1)), 2
+        squeeze.append(-1)
+    ndim = max(ndim1, ndim2)
+    if batched1:
+        x1 = _align(x1, ndim1, ndim)
+    if batched2:
+        x2 = _align(x2, ndim2, ndim)
+    return x1, x2, tuple(squeeze)
+
+
+def _batch_linear(trace, call, a):
+    # a batched weight, such as that of an ensemble, is applied with matmul, a
+    # batched input alone is already supported by the leading axes of linear
+    weight, bias = a["weight"], a["bias"]
+    if not trace.is_batched(weight) and not trace._has_batched(bias):
+        return call()
+    if _example_ndim(trace, weight) != 2:
+        _no_batching_rule("linear")
+    transposed = ivy.to_native(ivy.swapaxes(weight, -1, -2))
+    if trace.is_batched(weight):
+        trace.batch(transposed)
+    x1, x2, squeeze = _matmul_operands(trace, a["x"], transposed)
+    ret = ivy.matmul(x1, x2)
+    if squeeze:
+        ret = ivy.squeeze(ret, axis=squeeze)
+    if bias is not None:
+        ndim = len(ret.shape) - 1
+        if trace.is_batched(bias):
+            bias = _align(bias, _example_ndim(trace, bias), ndim)
+        ret = ivy.add(ret, bias)
+    return ret
+
+
+def _batch_contraction(trace, x1, x2, subscripts1, subscripts2, output):
+    # contract with einsum, the batch gets a subscript of its own
+    b = next(c for c in string.ascii_letters if c not in subscripts1 + subscripts2)
+    if trace.is_batched(x1):
+        subscripts1 = b + subscripts1
+    if trace.is_batched(x2):
+        subscripts2 = b + subscripts2
+    ret = ivy.einsum(f"{subscripts1},{subscripts2}->{b}{output}", x1, x2)
+    return ivy.astype(ret, ivy.promote_types(x1.dtype, x2.dtype))
+
+
+def _tensordot_subscripts(ndim1, ndim2, axes1, axes2):
+    axes1 = [axis % ndim1 for axis in axes1]
+    axes2 = [axis % ndim2 for axis in axes2]
+    letters = iter(string.ascii_letters)
+    subscripts1 = [next(letters) for _ in range(ndim1)]
+    subscripts2 = [next(letters) for _ in range(ndim2)]
+    for axis1, axis2 in zip(axes1, axes2):
+        subscripts2[axis2] = subscripts1[axis1]
+    output = [s for i, s in enumerate(subscripts1) if i not in axes1] + [
+        s for i, s in enumerate(subscripts2) if i not in axes2
+    ]
+    return "".join(subscripts1), "".join(subscripts2), "".join(output)
+
+
+def _batch_tensordot(trace, call, a):
+    x1, x2, axes = a["x1"], a["x2"], a["axes"]
+    ndim1, ndim2 = _example_ndim(trace, x1), _example_ndim(trace, x2)
+    if isinstance(axes, int):
+        axes = (range(ndim1 - axes, ndim1), range(axes))
+    axes1, axes2 = ([a_] if isinstance(a_, int) else list(a_) for a_ in axes)
+    return _batch_contraction(
+        trace, x1, x2, *_tensordot_subscripts(ndim1, ndim2, axes1, axes2)
+    )
+
+
+def _batch_vecdot(trace, call, a):
+    x1, x2, axis = a["x1"], a["x2"], a["axis"]
+    ndim1, ndim2 = _example_ndim(trace, x1), _example_ndim(trace, x2)
+    return _batch_contraction(
+        trace, x1, x2, *_tensordot_subscripts(ndim1, ndim2, [axis], [axis])
+    )
+
+
+def _batch_outer(trace, call, a):
+    if _example_ndim(trace, a["x1"]) != 1 or _example_ndim(trace, a["x2"]) != 1:
+        _no_batching_rule("outer")
+    return _batch_contraction(trace, a["x1"], a["x2"], "i", "j", "ij")
+
+
+def _batch_einsum(trace, call, a):
+    equation = a["equation"].replace(" ", "")
+    inputs, arrow, output = equation.partition("->")
+    inputs = inputs.split(",")
+    if not arrow:
+        # the implicit output has the subscripts appearing once, in order
+        if "." in equation:
+            _no_batching_rule("einsum")
+        subscripts = "".join(inputs)
+        output = "".join(sorted(s for s in subscripts if subscripts.count(s) == 1))
+    b = next(c for c in string.ascii_letters if c not in equation)
+    inputs = [
+        b + s if trace.is_batched(x) else s for s, x in zip(inputs, a["operands"])
+    ]
+    a["equation"] = ",".join(inputs) + "->" + b + output
+    return call()
+
+
+def _batch_conv(trace, call, a):
+    # the batch is folded into the batch dimension of the examples
+    _check_only_batched(trace, a)
+    x = a["x"]
+    shape = tuple(x.shape)
+    a["x"] = ivy.to_native(ivy.reshape(x, (shape[0] * shape[1],) + shape[2:]))
+    ret = call()
+    return ivy.reshape(ret, shape[:2] + tuple(ret.shape[1:]))
+
+
+def _batch_shape(trace, call, a):
+    if a["as_array"]:
+        _no_batching_rule("shape")
+    ret = call()
+    return ret.__class__(tuple(ret)[1:])
+
+
+def _batch_get_num_dims(trace, call, a):
+    if a["as_array"]:
+        _no_batching_rule("get_num_dims")
+    return call() - 1
+
+
+_BATCH_RULES = {
+    **{
+        name: _batch_elementwise
+        for name in (
+            "abs",
+            "acos",
+            "acosh",
+            "add",
+            "angle",
+            "asarray",
+            "asin",
+            "asinh",
+            "astype",
+            "atan",
+            "atan2",
+            "atanh",
+            "bitwise_and",
+            "bitwise_invert",
+            "bitwise_left_shift",
+            "bitwise_or",
+            "bitwise_right_shift",
+            "bitwise_xor",
+            "ceil",
+            "clip",
+            "copy_array",
+            "cos",
+            "cosh",
+            "deg2rad",
+            "divide",
+            "empty_like",
+            "equal",
+            "erf",
+            "exp",
+            "exp2",
+            "expm1",
+            "floor",
+            "floor_divide",
+            "fmin",
+            "fmod",
+            "full_like",
+            "gcd",
+            "gelu",
+            "greater",
+            "greater_equal",
+            "hardswish",
+            "imag",
+            "isfinite",
+            "isinf",
+            "isnan",
+            "isreal",
+            "lcm",
+            "leaky_relu",
+            "less",
+            "less_equal",
+            "log",
+            "log10",
+            "log1p",
+            "log2",
+            "logaddexp",
+            "logaddexp2",
+            "logical_and",
+            "logical_not",
+            "logical_or",
+            "logical_xor",
+            "maximum",
+            "minimum",
+            "mish",
+            "multiply",
+            "nan_to_num",
+            "negative",
+            "not_equal",
+            "ones_like",
+            "positive",
+            "pow",
+            "rad2deg",
+            "real",
+            "reciprocal",
+            "relu",
+            "remainder",
+            "round",
+            "sigmoid",
+            "sign",
+            "sin",
+            "sinh",
+            "softplus",
+            "softsign",
+            "sqrt",
+            "square",
+            "stop_gradient",
+            "subtract",
+            "tan",
+            "tanh",
+            "to_device",
+            "trunc",
+            "trunc_divide",
+            "where",
+            "zeros_like",
+        )
+    },
+    # functions of the trailing axes, or of the array metadata
+    **{
+        name: _batch_unchanged
+        for name in (
+            "cholesky",
+            "det",
+            "dev",
+            "dtype",
+            "eigvalsh",
+            "inv",
+            "is_array",
+            "is_bool_dtype",
+            "is_complex_dtype",
+            "is_float_dtype",
+            "is_int_dtype",
+            "is_ivy_array",
+            "is_native_array",
+            "is_uint_dtype",
+            "matrix_transpose",
+            "pinv",
+            "slogdet",
+            "svdvals",
+        )
+    },
+    # reductions and functions along an axis
+    **{
+        name: _batch_axis(name)
+        for name in (
+            "all",
+            "any",
+            "flip",
+            "max",
+            "mean",
+            "min",
+            "prod",
+            "std",
+            "sum",
+            "var",
+            "vector_norm",
+        )
+    },
+    "argmax": _batch_axis("argmax", flatten=True),
+    "argmin": _batch_axis("argmin", flatten=True),
+    "softmax": _batch_axis("softmax", none="keep"),
+    **{
+        name: _batch_axis(name, none=None)
+        for name in (
+            "argsort",
+            "cumprod",
+            "cumsum",
+            "expand_dims",
+            "log_softmax",
+            "repeat",
+            "roll",
+            "sort",
+            "split",
+            "unstack",
+        )
+    },
+    "squeeze": _batch_squeeze,
+    "permute_dims": _batch_permute_dims,
+    "swapaxes": _batch_swapaxes,
+    "reshape": _batch_reshape,
+    "broadcast_to": _batch_broadcast_to,
+    "tile": _batch_tile,
+    "constant_pad": _batch_pad,
+    "zero_pad": _batch_pad,
+    "concat": _batch_join("xs"),
+    "stack": _batch_join("arrays"),
+    "get_item": _batch_get_item,
+    # contractions
+    "matmul": _batch_matmul,
+    "linear": _batch_linear,
+    "tensordot": _batch_tensordot,
+    "vecdot": _batch_vecdot,
+    "outer": _batch_outer,
+    "einsum": _batch_einsum,
+    # convolutions
+    **{
+        name: _batch_conv
+        for name in (
+            "conv",
+            "conv1d",
+            "conv1d_transpose",
+            "conv2d",
+            "conv2d_transpose",
+            "conv3d",
+            "conv3d_transpose",
+            "conv_general_dilated",
+            "conv_general_transpose",
+            "depthwise_conv2d",
+        )
+    },
+    "shape": _batch_shape,
+    "get_num_dims": _batch_get_num_dims,
+}
+
+
+def _vmap_batched(func, args, mapped, unbatchable):
+    # call func once on the whole batch, with the mapped axes of args in front,
+    # returning None when it can't be batched, in which case its input signature is
+    # added to unbatchable and func is called again by the loop over the slices.
+    # Only the ivy functions called by func are seen by the trace, not the
+    # operations on the native arrays themselves, which is why the batching is left
+    # for the caller to opt into
+    sizes = [arg.shape[0] for arg, m in zip(args, mapped) if m]
+    if not sizes or not sizes[0]:
+        return None
+    key = tuple(
+        (tuple(getattr(arg, "shape", ())), str(getattr(arg, "dtype", type(arg))), m)
+        for arg, m in zip(args, mapped)
+    )
+    if key in unbatchable:
+        return None
+    trace = _BatchTrace(sizes[0])
+    for arg, m in zip(args, mapped):
+        if m:
+            trace.batch(arg)
+    try:
+        with trace:
+            ret = func(*args)
+    except _BatchingError:
+        ret = None
+    ret = ret.data if isinstance(ret, ivy.Array) else ret
+    if ret is None or not trace.is_batched(ret):
+        unbatchable.add(key)
+        return None
+    return ret
+
+
 @handle_exceptions
 def vmap(
     func: Callable,
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
     out_axes: int = 0,
+    *,
+    batch_ops: bool = False,
 ) -> Callable:
     """
     Vectorizing map. Creates a function which maps func over argument axes.
@@ -4119,6 +5107,17 @@ def vmap(
        corresponding input array.
     out_axes
         An integer indicating where the mapped axis should appear in the output.
+    batch_ops
+        Whether to call func once on the whole batch, the ivy functions it calls
+        being rewritten by their batching rules, rather than once per slice. This
+        only applies to the backends without a native vmap, and is only valid when
+        func handles its mapped arguments through ivy functions alone, not through
+        the methods, operators or attributes such as the shape of the native
+        arrays, which would see the whole batch. Calls which can't be batched fall
+        back to the loop over the slices, calling func again, while any other error
+        is raised. Batching stays opt-in as the operations on the native arrays
+        aren't seen by the batching rules, so that a func using them would silently
+        return wrong results if it were batched by default. Default is ``False``.
 
     Returns
     -------
@@ -4145,8 +5144,8 @@ def vmap(
     >>> print(z.shape)
     (3, 5, 2)
     """
-    # TODO: optimize in the numpy and tensorflow backends and extend functionality
-    return current_backend().vmap(func, in_axes, out_axes)
+    # TODO: extend functionality
+    return current_backend().vmap(func, in_axes, out_axes, batch_ops=batch_ops)
 
 
 @handle_exceptions
@@ -2,6 +2,8 @@
 
 # global
 from builtins import map as _map
+from functools import lru_cache
+import operator
 from typing import Callable, Any, Union, List, Tuple, Optional, Dict, Iterable, Sequence
 from collections import UserDict, OrderedDict
 
@@ -1107,9 +1109,45 @@ def nested_map(
         include_derived = {"tuple": True, "list": True, "dict": True}
     elif not include_derived:
         include_derived = {}
-    for t in ("tuple", "list", "dict"):
-        if t not in include_derived:
-            include_derived[t] = False
+    # the checks are chosen once, rather than on every recursive call
+    tuple_check_fn = ivy.default(
+        _tuple_check_fn,
+        isinstance if include_derived.get("tuple", False) else _is_exact_type,
+    )
+    list_check_fn = ivy.default(
+        _list_check_fn,
+        isinstance if include_derived.get("list", False) else _is_exact_type,
+    )
+    dict_check_fn = ivy.default(
+        _dict_check_fn,
+        isinstance if include_derived.get("dict", False) else _is_exact_type,
+    )
+    return _nested_map(
+        fn,
+        x,
+        to_ignore,
+        to_mutable,
+        tuple_check_fn,
+        list_check_fn,
+        dict_check_fn,
+        shallow,
+    )
+
+
+def _is_exact_type(x, t):
+    return type(x) is t
+
+
+def _nested_map(
+    fn,
+    x,
+    to_ignore,
+    to_mutable,
+    tuple_check_fn,
+    list_check_fn,
+    dict_check_fn,
+    shallow,
+):
     class_instance = type(x)
     # TODO: Fixes iterating over tracked instances from the graph
     # during transpilation. However, there might be a better fix
@@ -1120,36 +1158,11 @@ def nested_map(
         and not set(class_instance.__bases__).intersection(set(to_ignore))
     ):
         to_ignore += (class_instance,)
-    tuple_check_fn = ivy.default(
-        _tuple_check_fn,
-        (
-            (lambda x_, t_: isinstance(x_, t_))
-            if include_derived["tuple"]
-            else (lambda x_, t_: type(x_) is t_)
-        ),
-    )
-    list_check_fn = ivy.default(
-        _list_check_fn,
-        (
-            (lambda x_, t_: isinstance(x_, t_))
-            if include_derived["list"]
-            else (lambda x_, t_: type(x_) is t_)
-        ),
-    )
-    dict_check_fn = ivy.default(
-        _dict_check_fn,
-        (
-            (lambda x_, t_: isinstance(x_, t_))
-            if include_derived["dict"]
-            else (lambda x_, t_: type(x_) is t_)
-        ),
-    )
     if tuple_check_fn(x, tuple) and not isinstance(x, to_ignore):
         ret_list = [
-            nested_map(
+            _nested_map(
                 fn,
                 i,
-                include_derived,
                 to_ignore,
                 to_mutable,
                 tuple_check_fn,
@@ -1168,10 +1181,9 @@ def nested_map(
             return class_instance(ret_list)
     elif list_check_fn(x, list) and not isinstance(x, to_ignore):
         ret_list = [
-            nested_map(
+            _nested_map(
                 fn,
                 i,
-                include_derived,
                 to_ignore,
                 to_mutable,
                 tuple_check_fn,
@@ -1188,12 +1200,10 @@ def nested_map(
     elif (dict_check_fn(x, dict) or isinstance(x, UserDict)) and not isinstance(
         x, to_ignore
     ):
-        class_instance = type(x)
         ret = {
-            k: nested_map(
+            k: _nested_map(
                 fn,
                 v,
-                include_derived,
                 to_ignore,
                 to_mutable,
                 tuple_check_fn,
@@ -1585,3 +1595,262 @@ def prune_empty(nest):
     if not valid and not (ivy.is_array(nest) or isinstance(nest, (int, float, str))):
         return None
     return nest
+
+
+# Structure Plans #
+# ----------------#
+
+
+class NestPlan:
+    """
+    The structure of a nest, flattened once into the index chains of its leaves and
+    compiled into a function rebuilding the nest from a list of leaves.
+
+    Plans are created by :func:`ivy.flatten_nest`, and are shared by all the nests
+    with the same structure, so they mustn't be modified.
+
+    Attributes
+    ----------
+    indices
+        A tuple with the index chain of each leaf, in the order of the leaves.
+    num_leaves
+        The number of leaves of the nest.
+    """
+
+    __slots__ = ("indices", "num_leaves", "_build", "_positions")
+
+    def __init__(self, indices, build):
+        self.indices = indices
+        self.num_leaves = len(indices)
+        self._build = build
+        self._positions = None
+
+    def unflatten(self, leaves):
+        """
+        Build a new nest with this structure, holding ``leaves``.
+
+        Parameters
+        ----------
+        leaves
+            The leaves of the new nest, in the order returned by
+            :func:`ivy.flatten_nest`.
+
+        Returns
+        -------
+        ret
+            The new nest. All of its lists, tuples and dicts are new objects.
+        """
+        ivy.utils.assertions.check_equal(
+            len(leaves),
+            self.num_leaves,
+            message="the number of leaves doesn't match the plan",
+            as_array=False,
+        )
+        return self._build(leaves)
+
+    def map(self, fn, leaves):
+        """
+        Build a new nest with this structure, holding ``fn`` applied to each leaf.
+
+        Parameters
+        ----------
+        fn
+            The function to map onto the leaves.
+        leaves
+            The leaves, in the order returned by :func:`ivy.flatten_nest`.
+
+        Returns
+        -------
+        ret
+            The new nest.
+        """
+        return self.unflatten([fn(x) for x in leaves])
+
+    def argwhere(self, leaves, fn):
+        """
+        Return the index chains and the values of the leaves for which ``fn``
+        evaluates as True, as :func:`ivy.nested_argwhere` followed by
+        :func:`ivy.multi_index_nest` would, without traversing the nest.
+
+        Parameters
+        ----------
+        leaves
+            The leaves, in the order returned by :func:`ivy.flatten_nest`.
+        fn
+            The condition function, returning True or False.
+
+        Returns
+        -------
+        ret
+            The list of index chains, and the list of the corresponding leaves.
+        """
+        positions = [i for i, x in enumerate(leaves) if fn(x)]
+        return (
+            [list(self.indices[i]) for i in positions],
+            [leaves[i] for i in positions],
+        )
+
+    def positions(self, indices):
+        """
+        Return the positions in the leaves of the leaves at the given index chains.
+
+        Parameters
+        ----------
+        indices
+            The index chains of leaves of the nest.
+
+        Returns
+        -------
+        ret
+            The list of the positions of the leaves.
+        """
+        if self._positions is None:
+            self._positions = {index: i for i, index in enumerate(self.indices)}
+        return [self._positions[tuple(index)] for index in indices]
+
+
+def _flatten_nest(x, to_ignore, leaves, signature):
+    # a single pass collecting the leaves of x, and its structure in preorder, where
+    # each sequence is recorded with its length, each dict with its keys and their
+    # types, so that equal keys such as 1, 1.0 and True don't share a plan, and each
+    # leaf with None
+    if isinstance(x, (tuple, list)) and not isinstance(x, to_ignore):
+        signature.append((type(x), len(x)))
+        for item in x:
+            _flatten_nest(item, to_ignore, leaves, signature)
+    elif isinstance(x, (dict, UserDict)) and not isinstance(x, to_ignore):
+        keys = tuple(x.keys())
+        signature.append((type(x), keys, tuple(type(k) for k in keys)))
+        for v in x.values():
+            _flatten_nest(v, to_ignore, leaves, signature)
+    else:
+        signature.append(None)
+        leaves.append(x)
+
+
+def _sequence_constructor(cls):
+    if cls is list or cls is tuple:
+        return cls
+    if hasattr(cls, "_fields"):
+        return lambda values: cls(*values)
+    return cls
+
+
+def _dict_constructor(cls, keys):
+    if cls is dict:
+        return lambda values: dict(zip(keys, values))
+    return lambda values: cls(dict(zip(keys, values)))
+
+
+def _compile_node(signature, pos, index, indices):
+    # compile the node of the signature at pos into a function building it from the
+    # leaves, returning the function and the position of the next node
+    token = signature[pos]
+    pos += 1
+    if token is None:
+        getter = operator.itemgetter(len(indices))
+        indices.append(index)
+        return getter, pos
+    cls, aux = token[0], token[1]
+    if isinstance(aux, int):
+        keys = range(aux)
+        constructor = _sequence_constructor(cls)
+    else:
+        keys = aux
+        constructor = _dict_constructor(cls, aux)
+    start = len(indices)
+    fns = list()
+    for k in keys:
+        fn, pos = _compile_node(signature, pos, index + (k,), indices)
+        fns.append(fn)
+    stop = len(indices)
+    if all(isinstance(fn, operator.itemgetter) for fn in fns):
+        # the children are all leaves, so they are sliced at once
+        return (lambda leaves: constructor(leaves[start:stop])), pos
+    return (lambda leaves: constructor([fn(leaves) for fn in fns])), pos
+
+
+@lru_cache(maxsize=1024)
+def _compile_nest_plan(signature):
+    indices = list()
+    build, _ = _compile_node(signature, 0, (), indices)
+    return NestPlan(tuple(indices), build)
+
+
+@handle_exceptions
+def flatten_nest(
+    nest: Iterable,
+    /,
+    *,
+    to_ignore: Optional[Union[type, Tuple[type]]] = None,
+) -> Tuple[List, NestPlan]:
+    """
+    Flatten a nest into the list of its leaves and the plan of its structure.
+
+    The nest is traversed once, and the plan is compiled once for each structure,
+    then cached, so that the index chains of the leaves are computed, and the nest
+    can be rebuilt or mapped over, without traversing it again. Lists, tuples, dicts
+    and UserDicts are traversed, including derived classes, as with
+    :func:`ivy.nested_argwhere`.
+
+    Parameters
+    ----------
+    nest
+        The nest to flatten.
+    to_ignore
+        Types to treat as leaves rather than traversing them. Default is ``None``.
+
+    Returns
+    -------
+    ret
+        The list of the leaves of the nest, and the plan of its structure.
+
+    Examples
+    --------
+    >>> nest = {"a": [1, 2], "b": (3, {"c": 4})}
+    >>> leaves, plan = ivy.flatten_nest(nest)
+    >>> print(leaves)
+    [1, 2, 3, 4]
+    >>> print(plan.indices)
+    (('a', 0), ('a', 1), ('b', 0), ('b', 1, 'c'))
+    >>> print(plan.unflatten([5, 6, 7, 8]))
+    {'a': [5, 6], 'b': (7, {'c': 8})}
+
+    With :class:`ivy.Container` leaves:
+
+    >>> x = ivy.Container(a=ivy.array([1.]))
+    >>> leaves, plan = ivy.flatten_nest([x, 2.], to_ignore=ivy.Container)
+    >>> print(plan.indices)
+    ((0,), (1,))
+    """
+    to_ignore = ivy.default(to_ignore, ())
+    leaves = list()
+    signature = list()
+    _flatten_nest(nest, to_ignore, leaves, signature)
+    return leaves, _compile_nest_plan(tuple(signature))
+
+
+@handle_exceptions
+def unflatten_nest(plan: NestPlan, leaves: Sequence, /) -> Any:
+    """
+    Build a new nest with the structure of ``plan``, holding ``leaves``.
+
+    Parameters
+    ----------
+    plan
+        The plan returned by :func:`ivy.flatten_nest`.
+    leaves
+        The leaves of the new nest, in the order of the flattened leaves.
+
+    Returns
+    -------
+    ret
+        The new nest.
+
+    Examples
+    --------
+    >>> leaves, plan = ivy.flatten_nest([1, (2, 3)])
+    >>> print(ivy.unflatten_nest(plan, [x * 2 for x in leaves]))
+    [2, (4, 6)]
+    """
+    return plan.unflatten(leaves)
@@ -165,6 +165,10 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         self._lazy_traced = False
         self._dynamic_backend = dynamic_backend
         self.training = training
+        self._frozen_forward = None
+        self._frozen_v = None
+        self._frozen_submods = None
+        self._frozen_vs = None
         if build_mode != "on_init":
             return
         if hasattr(Module, "_init_var"):
@@ -420,6 +424,116 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
                 )
         return
 
+    def _find_submodules(self, /, *, key="", obj=None, _visited=None):
+        """
+        Find the submodules whose call methods were wrapped by this module, looping
+        over all the items within the module like _wrap_call_methods.
+
+        Parameters
+        ----------
+        key
+            The keychain of the object obj, used for recursion.
+        obj
+            The object to look for submodules in.
+        _visited
+            Placeholder for tracking the visited nodes, do not set this parameter.
+
+        Returns
+        -------
+        ret
+            A list of (submodule, keychain, keychain_mappings) tuples, with the
+            keychain of the variables of each submodule in those of the module, and
+            the keychain mappings of their duplicate variables.
+        """
+        _visited = ivy.default(_visited, {})
+        if id(obj) in _visited or not isinstance(key, str):
+            return []
+        _visited[id(obj)] = True
+        if isinstance(obj, Module) and obj is not self:
+            call = obj.__dict__.get("__call__")
+            keychain_mappings = (
+                call.keywords["keychain_mappings"]
+                if isinstance(call, functools.partial)
+                else {}
+            )
+            return [(obj, key[1:] if key[0] == "_" else key, keychain_mappings)]
+        elif isinstance(obj, (list, tuple)):
+            items = [(f"{key}/v{str(i)}", val) for i, val in enumerate(obj)]
+        elif isinstance(obj, dict):
+            items = [
+                (f"{key}/{k}" if key != "" and isinstance(k, str) else k, val)
+                for k, val in obj.items()
+            ]
+        elif hasattr(obj, "__dict__"):
+            items = [
+                (f"{key}/{k}" if key != "" else k, val)
+                for k, val in obj.__dict__.items()
+                if k[0:2] != "__" and val is not None
+            ]
+        else:
+            return []
+        return [
+            found
+            for k, val in items
+            for found in self._find_submodules(key=k, obj=val, _visited=_visited)
+        ]
+
+    def _freeze(self, frozen_vs, /):
+        """
+        Resolve the submodule call graph below this module once, and set the
+        frozen forward of each module in it.
+
+        Parameters
+        ----------
+        frozen_vs
+            Dict storing the original variables of the frozen submodules by id, which
+            are restored when unfreezing.
+        """
+        self._frozen_submods = self._find_submodules(obj=self)
+        for submod, _, _ in self._frozen_submods:
+            if id(submod) not in frozen_vs:
+                frozen_vs[id(submod)] = (submod, submod.v)
+                submod._freeze(frozen_vs)
+        # after the submodules, whose frozen forwards it may call directly
+        self._frozen_forward = self._frozen_forward_fn()
+
+    def _set_frozen_v(self, v, /):
+        """
+        Assign the views of the variables `v` of this module to the submodules, down
+        the frozen call graph, as _extract_v would on every call.
+
+        Parameters
+        ----------
+        v
+            The variables of this module.
+        """
+        self._frozen_v = v
+        for submod, key_chain, keychain_mappings in self._frozen_submods:
+            submod.v = self._extract_v(v, keychain_mappings, key_chain)
+            submod._set_frozen_v(submod.v)
+
+    def _frozen_call(self, *args, v=None, **kwargs):
+        """
+        Call the frozen module when its variables were replaced since they were
+        resolved, or when `v` is given for this call only.
+
+        Returns
+        -------
+        ret
+            Result of the forward pass of the layer.
+        """
+        if v is None:
+            self._set_frozen_v(self.v)
+            return self._frozen_forward(*args, **kwargs)
+        v_orig = self.v
+        self.v = v if isinstance(v, Container) else Container(v)
+        self._set_frozen_v(self.v)
+        try:
+            return self._frozen_forward(*args, **kwargs)
+        finally:
+            self.v = v_orig
+            self._set_frozen_v(v_orig)
+
     @staticmethod
     def _remove_duplicate_variables(vs, created, /):
         """
@@ -524,6 +638,18 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         """
         return True
 
+    def _frozen_forward_fn(self):
+        """
+        Return the forward pass of the frozen module, called with the variables of
+        the module and its submodules already resolved. Overridable.
+
+        Returns
+        -------
+        ret
+            The forward pass of the layer.
+        """
+        return self._forward
+
     # Abstract #
 
     @abc.abstractmethod
@@ -642,6 +768,11 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         -------
         ret
         """
+        if self._frozen_forward is not None and buffers is None:
+            if v is None and self.v is self._frozen_v:
+                return self._frozen_forward(*args, **kwargs)
+            return self._frozen_call(*args, v=v, **kwargs)
+
         if self._lazy_traced:
             # we are creating graph since we want to transpile module,
             # so set the appropriate backend
@@ -673,21 +804,53 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         self._unset_submod_flags()
         return ret
 
-    def save_weights(self, weights_path, /):
+    def save_weights(self, weights_path, /, *, format="h5py"):
         """
         Save the weights on the Module.
 
         Parameters
         ----------
         weights_path
-            The hdf5 file for saving the weights.
+            The file for saving the weights.
+        format
+            The format of the file, any of those supported by
+            :meth:`ivy.Container.cont_save`. "mmap" saves a file which
+            :meth:`load_weights` memory-maps rather than reads. An existing file is
+            overwritten. Default is "h5py".
+
+        Returns
+        -------
+        None
+        """
+        weights_dir = "/".join(weights_path.split("/")[:-1])
+        if weights_dir:
+            os.makedirs(weights_dir, exist_ok=True)
+        if format == "h5py":
+            # overwrite rather than append to the weights saved before
+            self.v.cont_to_disk_as_hdf5(weights_path, mode="w")
+        else:
+            self.v.cont_save(weights_path, format=format)
+
+    def load_weights(self, weights_path, /, *, format="h5py"):
+        """
+        Load the weights on the Module, saved by :meth:`save_weights`.
+
+        Parameters
+        ----------
+        weights_path
+            The file of the saved weights.
+        format
+            The format of the file, any of those supported by
+            :meth:`ivy.Container.cont_load`. With "mmap", the weights are views of
+            the memory-mapped file with the numpy backend. Default is "h5py".
 
         Returns
         -------
         None
         """
-        os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.cont_to_disk_as_hdf5(weights_path)
+        v = ivy.Container.cont_load(weights_path, format=format)
+        ivy.Container.cont_assert_identical_structure([self.v, v])
+        self.v = self.v.cont_map(lambda x, kc: v[kc])
 
     def build(
         self,
@@ -846,6 +1009,50 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             if isinstance(module, ivy.Module):
                 module.train(mode=mode)
 
+    def freeze(self):
+        """
+        Freeze the module for inference. The variables of every submodule and the
+        submodule call graph are resolved once, so that calls skip the tracking of
+        submodule returns and call order, and the extraction of the variables of
+        each submodule from those of its parent. The variables are resolved again
+        on the next call if ``v`` is replaced, and for that call only if ``v`` is
+        passed.
+
+        Returns
+        -------
+        ret
+            The frozen module.
+        """
+        if not self._built:
+            raise ivy.utils.exceptions.IvyException(
+                "the module must be built before it can be frozen"
+            )
+        self.unfreeze()
+        frozen_vs = {id(self): (self, self.v)}
+        self._freeze(frozen_vs)
+        del frozen_vs[id(self)]
+        self._frozen_vs = list(frozen_vs.values())
+        self._set_frozen_v(self.v)
+        return self
+
+    def unfreeze(self):
+        """
+        Unfreeze the module, restoring the variables of its submodules.
+
+        Returns
+        -------
+        ret
+            The unfrozen module.
+        """
+        for module, v in self._frozen_vs or []:
+            module.v = v
+        for module in [m for m, _ in self._frozen_vs or []] + [self]:
+            module._frozen_forward = None
+            module._frozen_v = None
+            module._frozen_submods = None
+        self._frozen_vs = None
+        return self
+
     def to_device(self, device):
         # moves the weights and buffers
         # to the specified device
@@ -910,6 +1117,10 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
     def device(self):
         return self._device
 
+    @property
+    def frozen(self):
+        return self._frozen_forward is not None
+
     def show_graph(
         self,
         randomness_factor: float = 0.1,
@@ -9,6 +9,15 @@ from typing import Union, Optional, Callable
 import ivy
 
 
+# Helpers #
+# --------#
+
+
+def _segment_vector_norms(x, segment_ids, num_segments):
+    # the euclidean norm of each segment of the flat array x
+    return ivy.sqrt(ivy.unsorted_segment_sum(x**2, segment_ids, num_segments))
+
+
 # Base #
 # -----#
 
@@ -23,6 +32,7 @@ class Optimizer(abc.ABC):
         trace_on_next_step: bool = False,
         fallback_to_non_traced: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """
         Construct a general Optimizer. This is an abstract class, and must be derived.
@@ -50,6 +60,10 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update the variables of each dtype and device together, packed
+            into one contiguous buffer with :meth:`ivy.Container.cont_pack`, rather
+            than one variable at a time. Default is ``False``.
         """
         self._lr = lr
         self._inplace = inplace
@@ -62,6 +76,7 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._traced_step_fn = None
         self._traced = False
+        self._foreach = foreach
 
     # Private #
     # --------#
@@ -90,6 +105,66 @@ class Optimizer(abc.ABC):
 
     # Given #
 
+    def _pack(self, *conts):
+        """
+        Pack the containers which aren't packed already, when updating the variables
+        of each dtype and device together.
+
+        Parameters
+        ----------
+        conts
+            Nested containers to pack, or arrays which are returned unchanged.
+
+        Returns
+        -------
+        ret
+            The packed containers, or the containers unchanged if not in foreach mode.
+        """
+        if not self._foreach:
+            return conts
+        return tuple(
+            (
+                cont.cont_pack()
+                if isinstance(cont, ivy.Container) and cont.cont_packed_buffers is None
+                else cont
+            )
+            for cont in conts
+        )
+
+    def _apply_update(self, fn, *conts, segmented_fn=None):
+        """
+        Apply an update to the containers, once to each group of their buffers if
+        they are packed with the same layout, otherwise leaf by leaf.
+
+        Parameters
+        ----------
+        fn
+            The update, taking the containers or one buffer of each packed container,
+            and returning one or more updated containers or buffers.
+        conts
+            Nested containers to update.
+        segmented_fn
+            The update to apply to the buffers in place of fn, for updates which
+            depend on reductions over each variable. It is also passed the
+            ``segment_ids`` mapping each element of the buffers to its variable and
+            the ``num_segments`` of the buffers. Default is ``None``.
+
+        Returns
+        -------
+        ret
+            The updated containers.
+        """
+        if self._foreach:
+            ret = ivy.Container._cont_packed_map(
+                fn if segmented_fn is None else segmented_fn,
+                conts,
+                {},
+                segmented_fn is not None,
+            )
+            if ret is not None:
+                return ret
+        return fn(*conts)
+
     def _step_fn(
         self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
     ):
@@ -168,6 +243,7 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        foreach: bool = False,
     ):
         """
         Construct a Stochastic-Gradient-Descent (SGD) optimizer.
@@ -186,9 +262,18 @@ class SGD(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to update the variables of each dtype and device together, packed
+            into one contiguous buffer with :meth:`ivy.Container.cont_pack`, rather
+            than one variable at a time. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -210,12 +295,14 @@ class SGD(Optimizer):
         ret
             The new updated variables container, following gradient descent step.
         """
-        return ivy.gradient_descent_update(
-            v,
-            grads,
-            self._lr if isinstance(self._lr, float) else self._lr(),
-            stop_gradients=self._stop_gradients,
-        )
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+
+        def _update(w, dcdw):
+            return ivy.gradient_descent_update(
+                w, dcdw, lr, stop_gradients=self._stop_gradients
+            )
+
+        return self._apply_update(_update, *self._pack(v, grads))
 
     def set_state(self, state: ivy.Container):
         """
@@ -241,6 +328,7 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        foreach: bool = False,
     ):
         """
         Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
@@ -261,10 +349,19 @@ class LARS(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        foreach
+            Whether to update the variables of each dtype and device together, packed
+            into one contiguous buffer with :meth:`ivy.Container.cont_pack`, rather
+            than one variable at a time. Default is ``False``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -286,12 +383,36 @@ class LARS(Optimizer):
         ret
             The new updated variables container, following LARS step.
         """
-        return ivy.lars_update(
-            v,
-            grads,
-            self._lr if isinstance(self._lr, float) else self._lr(),
-            decay_lambda=self._decay_lambda,
-            stop_gradients=self._stop_gradients,
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+
+        def _update(w, dcdw):
+            return ivy.lars_update(
+                w,
+                dcdw,
+                lr,
+                decay_lambda=self._decay_lambda,
+                stop_gradients=self._stop_gradients,
+            )
+
+        def _segmented_update(w, dcdw, segment_ids, num_segments):
+            # the learning rate of each variable, computed for all of them at once
+            w_norm = _segment_vector_norms(w, segment_ids, num_segments)
+            lrs = ivy.stable_divide(
+                w_norm, _segment_vector_norms(dcdw, segment_ids, num_segments)
+            )
+            if self._decay_lambda > 0:
+                lrs /= w_norm * self._decay_lambda
+            # in the dtype of the variables, so that they keep their layout
+            lrs = ivy.astype(lrs * lr, w.dtype, copy=False)
+            return ivy.gradient_descent_update(
+                w,
+                dcdw,
+                ivy.gather(lrs, segment_ids),
+                stop_gradients=self._stop_gradients,
+            )
+
+        return self._apply_update(
+            _update, *self._pack(v, grads), segmented_fn=_segmented_update
         )
 
     def set_state(self, state: ivy.Container):
@@ -321,6 +442,7 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """
         Construct an ADAM optimizer.
@@ -349,6 +471,10 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update the variables of each dtype and device together, packed
+            into one contiguous buffer with :meth:`ivy.Container.cont_pack`, rather
+            than one variable at a time. Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -359,7 +485,14 @@ class Adam(Optimizer):
         self._should_trace = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            foreach=foreach,
         )
 
     # Custom Step
@@ -381,22 +514,29 @@ class Adam(Optimizer):
         ret
             The updated variables, following Adam update step.
         """
+        v, grads = self._pack(v, grads)
         if self._first_pass:
             self._mw = grads
             self._vw = grads**2
             self._first_pass = False
-
-        new_v, self._mw, self._vw = ivy.adam_update(
-            v,
-            grads,
-            self._lr if isinstance(self._lr, float) else self._lr(),
-            self._mw,
-            self._vw,
-            self._count,
-            beta1=self._beta1,
-            beta2=self._beta2,
-            epsilon=self._epsilon,
-            stop_gradients=self._stop_gradients,
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+
+        def _update(w, dcdw, mw, vw):
+            return ivy.adam_update(
+                w,
+                dcdw,
+                lr,
+                mw,
+                vw,
+                self._count,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+                stop_gradients=self._stop_gradients,
+            )
+
+        new_v, self._mw, self._vw = self._apply_update(
+            _update, v, grads, *self._pack(self._mw, self._vw)
         )
         return new_v
 
@@ -430,6 +570,7 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        foreach: bool = False,
     ):
         """
         Construct an LAMB optimizer.
@@ -463,9 +604,20 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        foreach
+            Whether to update the variables of each dtype and device together, packed
+            into one contiguous buffer with :meth:`ivy.Container.cont_pack`, rather
+            than one variable at a time. Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            foreach=foreach,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -495,24 +647,67 @@ class LAMB(Optimizer):
         ret
             The updated variables, following LAMB update step.
         """
+        v, grads = self._pack(v, grads)
         if self._first_pass:
             self._mw = grads
             self._vw = grads**2
             self._first_pass = False
-
-        new_v, self._mw, self._vw = ivy.lamb_update(
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+
+        def _update(w, dcdw, mw, vw):
+            return ivy.lamb_update(
+                w,
+                dcdw,
+                lr,
+                mw,
+                vw,
+                self._count,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+                max_trust_ratio=self._max_trust_ratio,
+                decay_lambda=self._decay_lambda,
+                stop_gradients=self._stop_gradients,
+            )
+
+        def _segmented_update(w, dcdw, mw, vw, segment_ids, num_segments):
+            # the trust ratio of each variable, computed for all of them at once
+            eff_grads, mw, vw = ivy.adam_step(
+                dcdw,
+                mw,
+                vw,
+                self._count,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+            )
+            r1 = _segment_vector_norms(w, segment_ids, num_segments)
+            if self._decay_lambda > 0:
+                r2 = _segment_vector_norms(
+                    eff_grads + self._decay_lambda * w, segment_ids, num_segments
+                )
+            else:
+                r2 = _segment_vector_norms(eff_grads, segment_ids, num_segments)
+            r = ivy.minimum(
+                ivy.stable_divide(r1, r2),
+                ivy.array(self._max_trust_ratio, dtype=r1.dtype),
+            )
+            # in the dtype of the variables, so that they keep their layout
+            lrs = ivy.astype(r * lr, w.dtype, copy=False)
+            new_w = ivy.optimizer_update(
+                w,
+                eff_grads,
+                ivy.gather(lrs, segment_ids),
+                stop_gradients=self._stop_gradients,
+            )
+            return new_w, mw, vw
+
+        new_v, self._mw, self._vw = self._apply_update(
+            _update,
             v,
             grads,
-            self._lr if isinstance(self._lr, float) else self._lr(),
-            self._mw,
-            self._vw,
-            self._count,
-            beta1=self._beta1,
-            beta2=self._beta2,
-            epsilon=self._epsilon,
-            max_trust_ratio=self._max_trust_ratio,
-            decay_lambda=self._decay_lambda,
-            stop_gradients=self._stop_gradients,
+            *self._pack(self._mw, self._vw),
+            segmented_fn=_segmented_update,
         )
         return new_v
 
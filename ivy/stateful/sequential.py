@@ -48,6 +48,28 @@ class Sequential(Module):
     def __iter__(self):
         return iter(self._submodules)
 
+    def _frozen_forward_fn(self):
+        """
+        Return the forward pass of the frozen Sequential container, which chains the
+        frozen forward passes of the submodules directly.
+
+        Returns
+        -------
+        ret
+            The forward pass of the Sequential container.
+        """
+        forwards = [
+            ivy.default(submod._frozen_forward, submod) for submod in self._submodules
+        ]
+
+        def _forward(inputs):
+            x = inputs
+            for forward in forwards:
+                x = forward(x)
+            return x
+
+        return _forward
+
     def _forward(self, inputs):
         """
         Perform forward pass of the Sequential container.
@@ -0,0 +1,108 @@
+"""Thread-local copies of the global mode stacks and properties of ivy."""
+
+import threading
+from contextlib import contextmanager
+
+import ivy
+
+# the mode stacks, along with the local copies of the threads within `local_modes`
+# and the number of those threads, which is checked first so that the shared stacks
+# and properties are accessed directly while there is none
+_stacks = list()
+_local = threading.local()
+_num_local = 0
+_num_local_lock = threading.Lock()
+
+
+def _local_stack(stack):
+    if _num_local:
+        stacks = getattr(_local, "stacks", None)
+        if stacks is not None:
+            return stacks.get(id(stack))
+    return None
+
+
+class ModeStack(list):
+    """
+    Stack of the values set for a global mode of ivy.
+
+    The threads within ``local_modes`` push to and pop from their own copy of the
+    stack, such as the threads mapping the leaves of containers in parallel, while
+    the other threads share it.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        _stacks.append(self)
+
+    def append(self, value):
+        stack = _local_stack(self)
+        if stack is None:
+            return list.append(self, value)
+        stack.append(value)
+
+    def pop(self, index=-1):
+        stack = _local_stack(self)
+        if stack is None:
+            return list.pop(self, index)
+        return stack.pop(index)
+
+    def __getitem__(self, index):
+        stack = _local_stack(self)
+        if stack is None:
+            return list.__getitem__(self, index)
+        return stack[index]
+
+    def __len__(self):
+        stack = _local_stack(self)
+        if stack is None:
+            return list.__len__(self)
+        return len(stack)
+
+    def __iter__(self):
+        stack = _local_stack(self)
+        if stack is None:
+            return list.__iter__(self)
+        return iter(stack)
+
+
+def local_props(module):
+    """Return the local copy of the global properties of module, if any."""
+    if _num_local:
+        props = getattr(_local, "props", None)
+        if props is not None and props[0] is module:
+            return props[1]
+    return None
+
+
+def mode_snapshot():
+    """Return the modes of the calling thread, to be entered with ``local_modes``."""
+    return (
+        {id(stack): list(stack) for stack in _stacks},
+        {name: getattr(ivy, name) for name in ivy.GLOBAL_PROPS if name in ivy.__dict__},
+    )
+
+
+@contextmanager
+def local_modes(snapshot):
+    """
+    Give the calling thread its own copy of the modes of ``snapshot``.
+
+    The modes set and unset by the thread within the context, such as the default
+    device set by the ivy functions it calls, aren't seen by the other threads.
+    """
+    global _num_local
+    stacks, props = snapshot
+    prev = getattr(_local, "stacks", None), getattr(_local, "props", None)
+    _local.stacks = {k: list(v) for k, v in stacks.items()}
+    _local.props = (ivy, dict(props))
+    with _num_local_lock:
+        _num_local += 1
+    try:
+        yield
+    finally:
+        with _num_local_lock:
+            _num_local -= 1
+        _local.stacks, _local.props = prev
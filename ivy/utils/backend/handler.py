@@ -7,6 +7,7 @@ import importlib
 import functools
 import numpy as np
 import gc
+import weakref
 from ivy.utils import _importlib, verbosity
 
 # local
@@ -23,6 +24,13 @@ _compiled_backends_ids = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = {}
+# wrapped namespaces built by `set_backend`, keyed by the backend and the
+# global modes affecting the wrapping, see `_set_backend_namespace`
+_backend_namespace_cache = {}
+# the arrays and containers following the backend when it is set with
+# `dynamic=True`, see `convert_from_source_backend_to_numpy`. None until the first
+# dynamic backend change, so that creating them costs nothing before it
+_dynamic_backend_objs = None
 
 
 class ContextManager:
@@ -200,22 +208,39 @@ def current_backend(*args, **kwargs):
 
 
 def _set_module_backend(
-    original_dict, target, backend, invalid_dtypes=None, backend_str=None
+    original_dict,
+    target,
+    backend,
+    invalid_dtypes=None,
+    backend_str=None,
+    _namespace=None,
 ):
     invalid_dtypes = (
         backend.invalid_dtypes if invalid_dtypes is None else invalid_dtypes
     )
     backend_str = backend.current_backend_str() if backend_str is None else backend_str
+    # record the entries set and deleted in each module, so that these can be
+    # replayed without wrapping the backend again
+    if _namespace is not None:
+        assigned, deleted = _namespace.setdefault(target, ({}, []))
     for k, v in original_dict.items():
+        if k in ivy.GLOBAL_PROPS:
+            # global modes belong to ivy, neither the value in the original dict
+            # nor one copied into the backend module may override the set mode
+            continue
         compositional = k not in backend.__dict__
         if compositional:
             if k in invalid_dtypes and k in target.__dict__:
                 del target.__dict__[k]
+                if _namespace is not None:
+                    deleted.append(k)
                 continue
             backend.__dict__[k] = v
         target.__dict__[k] = _wrap_function(
             key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
         )
+        if _namespace is not None:
+            assigned[k] = target.__dict__[k]
         if (
             isinstance(v, types.ModuleType)
             and "ivy.functional." in v.__name__
@@ -227,9 +252,78 @@ def _set_module_backend(
                 backend.__dict__[k],
                 invalid_dtypes=invalid_dtypes,
                 backend_str=backend_str,
+                _namespace=_namespace,
             )
 
 
+def _namespace_key(backend):
+    return (
+        backend,
+        backend.backend_version["version"],
+        ivy.inplace_mode,
+        ivy.fused_dispatch_mode,
+    )
+
+
+def _is_namespace_source(original_dict):
+    # whether the ivy namespace a cached namespace was built from is still the
+    # original ivy namespace, global modes are not part of the built namespace
+    if original_dict is ivy_original_dict:
+        return True
+    if len(original_dict) != len(ivy_original_dict):
+        return False
+    return all(
+        k in ivy.GLOBAL_PROPS or ivy_original_dict.get(k, original_dict) is v
+        for k, v in original_dict.items()
+    )
+
+
+def _get_cached_namespace(backend):
+    cached = _backend_namespace_cache.get(_namespace_key(backend))
+    if cached is None or not _is_namespace_source(cached[0]):
+        return None
+    return cached[1]
+
+
+def _replay_namespace(namespace):
+    for target, (assigned, deleted) in namespace.items():
+        target.__dict__.update(assigned)
+        for k in deleted:
+            target.__dict__.pop(k, None)
+
+
+def _set_backend_namespace(backend):
+    """
+    Wrap the functions of `backend` into the ivy namespace.
+
+    The entries set in each module are cached per backend, backend version, inplace
+    mode and fused dispatch mode, so switching back to a backend only needs to
+    update the module dicts, unless the original ivy namespace has changed since.
+    Sub-backends are not part of the cached namespace, they are set on top of it.
+
+    Parameters
+    ----------
+    backend
+        the backend module to set.
+    """
+    namespace = _get_cached_namespace(backend)
+    if namespace is not None:
+        _replay_namespace(namespace)
+        return
+    namespace = {}
+    _set_module_backend(ivy_original_dict, ivy, backend, _namespace=namespace)
+    # following snippet is required to update the ivy.functional namespace with
+    # backend-specific functions
+    functional = {
+        key: value
+        for key, value in ivy.__dict__.items()
+        if key in ivy.functional.__dict__ and not key.startswith("__")
+    }
+    ivy.functional.__dict__.update(functional)
+    namespace.setdefault(ivy.functional, ({}, []))[0].update(functional)
+    _backend_namespace_cache[_namespace_key(backend)] = (ivy_original_dict, namespace)
+
+
 def _handle_backend_specific_vars(target, backend):
     if backend.current_backend_str() == "numpy":
         target.set_default_device("cpu")
@@ -237,6 +331,54 @@ def _handle_backend_specific_vars(target, backend):
         target.set_global_attr("RNG", target.functional.backends.jax.random.RNG)
 
 
+def _register_dynamic_backend_obj(obj):
+    """
+    Register an array or container to be converted on dynamic backend changes.
+
+    Only a weak reference is kept, so registering does not extend the lifetime of
+    `obj`. Objects are only registered once a dynamic backend change has happened,
+    those created before it are found by `_enable_dynamic_backend_registry`.
+
+    Parameters
+    ----------
+    obj
+        the ivy.Array or ivy.Container to register.
+    """
+    if _dynamic_backend_objs is not None:
+        _dynamic_backend_objs[id(obj)] = obj
+
+
+def _enable_dynamic_backend_registry():
+    # on the first dynamic backend change, the arrays and containers created before
+    # it are found by scanning gc once, and the later ones register themselves
+    global _dynamic_backend_objs
+    if _dynamic_backend_objs is not None:
+        return
+    _dynamic_backend_objs = weakref.WeakValueDictionary()
+    for obj in gc.get_objects():
+        if (
+            isinstance(obj, (ivy.Array, ivy.Container))
+            and "ivy" in type(obj).__module__
+            and obj.__dict__.get("_dynamic_backend", False)
+        ):
+            _dynamic_backend_objs[id(obj)] = obj
+
+
+def _get_dynamic_backend_arrays():
+    # the live registered arrays, along with the arrays held in registered
+    # containers
+    _enable_dynamic_backend_registry()
+    objs = list(_dynamic_backend_objs.values())
+    array_list = [obj for obj in objs if isinstance(obj, ivy.Array)]
+    container_list = [obj for obj in objs if isinstance(obj, ivy.Container)]
+    if container_list:
+        cont_array_idxs = ivy.nested_argwhere(
+            container_list, lambda x: isinstance(x, ivy.Array)
+        )
+        array_list.extend(ivy.multi_index_nest(container_list, cont_array_idxs))
+    return array_list
+
+
 def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
     # Dynamic Backend
     from ivy.functional.ivy.gradients import _is_variable, _variable_data
@@ -267,22 +409,8 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
                 return False
             return _is_variable(obj)
 
-    # get all ivy array instances in the project scope
-    container_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Container)
-    ]
-    cont_array_idxs = ivy.nested_argwhere(
-        container_list, lambda x: isinstance(x, ivy.Array)
-    )
-    cont_array_vals = ivy.multi_index_nest(container_list, cont_array_idxs)
-    array_list = [
-        obj
-        for obj in gc.get_objects()
-        if "ivy" in type(obj).__module__ and isinstance(obj, ivy.Array)
-    ]
-    array_list.extend(cont_array_vals)
+    # get all registered ivy array instances
+    array_list = _get_dynamic_backend_arrays()
 
     # filter uninitialized arrays and arrays with other bakcends, and ensure the order
     array_list = [
@@ -409,12 +537,7 @@ def set_backend(backend: str, dynamic: bool = False):
             ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
         backend_stack.append(backend)
         set_backend_to_specific_version(backend)
-        _set_module_backend(ivy_original_dict, ivy, backend)
-        # following snippet is required to update the ivy.functional namespace with
-        # backend-specific functions
-        for key, _ in ivy.__dict__.items():
-            if key in ivy.functional.__dict__ and not key.startswith("__"):
-                ivy.functional.__dict__[key] = ivy.__dict__[key]
+        _set_backend_namespace(backend)
 
         if dynamic:
             convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices)
@@ -530,12 +653,19 @@ def previous_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
+        namespace = _get_cached_namespace(backend_stack[-1]) if backend_stack else None
         new_backend_dict = (
             backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
         )
+        if namespace is not None:
+            # the namespace of the backend was built when it was set
+            _replay_namespace(namespace)
+            new_backend_dict = {}
         # wrap backend functions if there still is a backend, and add functions
         # to ivy namespace
         for k, v in new_backend_dict.items():
+            if k in ivy.GLOBAL_PROPS:
+                continue
             if backend_stack and k in ivy_original_dict:
                 v = _wrap_function(k, v, ivy_original_dict[k])
             if k in ivy_original_dict:
@@ -1,8 +1,6 @@
 import os
 import logging
 import json
-from pip._vendor.packaging import tags
-from urllib import request
 
 
 def _get_paths_from_binaries(binaries, root_dir=""):
@@ -57,6 +55,11 @@ def check_for_binaries():
 
 
 def cleanup_and_fetch_binaries(clean=True):
+    # only needed to download the binaries, imported here to keep them off the
+    # import path of ivy
+    from pip._vendor.packaging import tags
+    from urllib import request
+
     folder_path = os.sep.join(__file__.split(os.sep)[:-3])
     binaries_path = os.path.join(folder_path, "binaries.json")
     available_configs_path = os.path.join(folder_path, "available_configs.json")
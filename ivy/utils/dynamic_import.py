@@ -1,6 +1,8 @@
 # NOQA
 import ivy
 from importlib import import_module as builtin_import
+from importlib.util import find_spec
+from types import ModuleType
 
 
 def import_module(name, package=None):
@@ -8,3 +10,30 @@ def import_module(name, package=None):
         with ivy.utils._importlib.LocalIvyImporter():
             return ivy.utils._importlib._import_module(name=name, package=package)
     return builtin_import(name=name, package=package)
+
+
+class _LazyModule(ModuleType):
+    def __getattr__(self, attr):
+        module = builtin_import(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name):
+    """
+    Return a module which is only imported when one of its attributes is first
+    accessed, or None if it isn't installed.
+
+    Parameters
+    ----------
+    name
+        the name of the module to import.
+
+    Returns
+    -------
+    ret
+        the lazily imported module, or None.
+    """
+    if find_spec(name) is None:
+        return None
+    return _LazyModule(name)
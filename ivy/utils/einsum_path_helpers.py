@@ -0,0 +1,495 @@
+# Einsum contraction path optimizer, the path search has been adapted from the
+# `optimal` and `greedy` strategies of numpy's `einsum_path` here
+# https://github.com/numpy/numpy/blob/main/numpy/core/einsumfunc.py
+
+import functools
+import itertools
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from ivy.utils.einsum_parser import legalise_einsum_expr
+
+TensorShapeType = Tuple[int, ...]
+
+# operand counts up to which the optimal path is searched, beyond it the greedy one
+_OPTIMAL_MAX_OPERANDS = 4
+
+
+def compute_size_by_dict(indices: Sequence[str], idx_dict: Dict[str, int]) -> int:
+    """
+    Compute the product of the sizes of ``indices``, based on ``idx_dict``.
+
+    Examples
+    --------
+    >>> compute_size_by_dict("abbc", {"a": 2, "b": 3, "c": 5})
+    90
+    """
+    ret = 1
+    for i in indices:
+        ret *= idx_dict[i]
+    return ret
+
+
+def find_contraction(
+    positions: Sequence[int], input_sets: List[Set[str]], output_set: Set[str]
+) -> Tuple[Set[str], List[Set[str]], Set[str], Set[str]]:
+    """
+    Find the indices kept and removed by contracting the operands at ``positions``.
+
+    Returns
+    -------
+    new_result
+        The indices of the contraction result, those which are also in the output or
+        in the remaining operands.
+    remaining
+        The index sets of the remaining operands, with the result appended.
+    idx_removed
+        The indices summed over by the contraction.
+    idx_contract
+        All the indices of the contracted operands.
+
+    Examples
+    --------
+    >>> isets = [set("ab"), set("bc"), set("cd")]
+    >>> new_result, remaining, idx_removed, _ = find_contraction((0, 1), isets, {"a"})
+    >>> sorted(new_result), [sorted(s) for s in remaining], idx_removed
+    (['a', 'c'], [['c', 'd'], ['a', 'c']], {'b'})
+    """
+    idx_contract = set()
+    idx_remain = output_set.copy()
+    remaining = list()
+    for i, value in enumerate(input_sets):
+        if i in positions:
+            idx_contract |= value
+        else:
+            remaining.append(value)
+            idx_remain |= value
+    new_result = idx_remain & idx_contract
+    remaining.append(new_result)
+    return new_result, remaining, idx_contract - new_result, idx_contract
+
+
+def flop_count(
+    idx_contraction: Set[str],
+    inner: bool,
+    num_terms: int,
+    size_dictionary: Dict[str, int],
+) -> int:
+    """
+    Estimate the number of floating point operations of a contraction.
+
+    Examples
+    --------
+    >>> flop_count("abc", False, 1, {"a": 2, "b": 3, "c": 5})
+    30
+    >>> flop_count("abc", True, 2, {"a": 2, "b": 3, "c": 5})
+    60
+    """
+    overall_size = compute_size_by_dict(idx_contraction, size_dictionary)
+    op_factor = max(1, num_terms - 1)
+    if inner:
+        op_factor += 1
+    return overall_size * op_factor
+
+
+def optimal_path(
+    input_sets: List[Set[str]],
+    output_set: Set[str],
+    idx_dict: Dict[str, int],
+    memory_limit: Optional[int] = None,
+) -> List[Tuple[int, ...]]:
+    """
+    Find the contraction order of the lowest cost, by trying every pairwise order.
+
+    The search grows factorially with the number of operands, it's meant for a few
+    of them only.
+
+    Examples
+    --------
+    >>> isets = [set("abd"), set("ac"), set("bdc")]
+    >>> optimal_path(isets, set(""), {"a": 1, "b": 2, "c": 3, "d": 4})
+    [(0, 2), (0, 1)]
+    """
+    full_results = [(0, [], input_sets)]
+    for iteration in range(len(input_sets) - 1):
+        iter_results = list()
+        for cost, positions, remaining in full_results:
+            for con in itertools.combinations(range(len(input_sets) - iteration), 2):
+                new_result, new_input_sets, idx_removed, idx_contract = (
+                    find_contraction(con, remaining, output_set)
+                )
+                if (
+                    memory_limit is not None
+                    and compute_size_by_dict(new_result, idx_dict) > memory_limit
+                ):
+                    continue
+                total_cost = cost + flop_count(
+                    idx_contract, bool(idx_removed), len(con), idx_dict
+                )
+                iter_results.append((total_cost, positions + [con], new_input_sets))
+        if not iter_results:
+            # the remaining operands are contracted all at once
+            path = min(full_results, key=lambda x: x[0])[1]
+            return path + [tuple(range(len(input_sets) - iteration))]
+        full_results = iter_results
+    return min(full_results, key=lambda x: x[0])[1]
+
+
+def parse_possible_contraction(
+    positions: Tuple[int, int],
+    input_sets: List[Set[str]],
+    output_set: Set[str],
+    idx_dict: Dict[str, int],
+    memory_limit: Optional[int],
+    path_cost: int,
+    naive_cost: int,
+) -> Optional[List[Any]]:
+    """
+    Compute the cost of a pairwise contraction for the greedy path.
+
+    Returns
+    -------
+    ret
+        ``[(-removed_size, cost), positions, new_input_sets]``, where removed_size
+        is the number of elements the contraction saves, or None if the contraction
+        exceeds the memory limit or makes the path costlier than the naive one.
+    """
+    idx_result, new_input_sets, idx_removed, idx_contract = find_contraction(
+        positions, input_sets, output_set
+    )
+    new_size = compute_size_by_dict(idx_result, idx_dict)
+    if memory_limit is not None and new_size > memory_limit:
+        return None
+    old_sizes = (compute_size_by_dict(input_sets[p], idx_dict) for p in positions)
+    removed_size = sum(old_sizes) - new_size
+    cost = flop_count(idx_contract, bool(idx_removed), len(positions), idx_dict)
+    if (path_cost + cost) > naive_cost:
+        return None
+    return [(-removed_size, cost), positions, new_input_sets]
+
+
+def update_other_results(results: List[List[Any]], best: List[Any]) -> List[Any]:
+    """
+    Update the positions and the index sets of the candidate contractions of the
+    greedy path, once the ``best`` one has been made.
+    """
+    bx, by = best[1]
+    mod_results = list()
+    for cost, (x, y), con_sets in results:
+        # contractions involving the operands of the best one are dropped
+        if x in best[1] or y in best[1]:
+            continue
+        del con_sets[by - int(by > x) - int(by > y)]
+        del con_sets[bx - int(bx > x) - int(bx > y)]
+        con_sets.insert(-1, best[2][-1])
+        mod_con = x - int(x > bx) - int(x > by), y - int(y > bx) - int(y > by)
+        mod_results.append((cost, mod_con, con_sets))
+    return mod_results
+
+
+def greedy_path(
+    input_sets: List[Set[str]],
+    output_set: Set[str],
+    idx_dict: Dict[str, int],
+    memory_limit: Optional[int] = None,
+) -> List[Tuple[int, ...]]:
+    """
+    Find a contraction order by making the pairwise contraction which removes the
+    most elements at each step, breaking ties by the lowest cost.
+
+    Examples
+    --------
+    >>> isets = [set("abd"), set("ac"), set("bdc")]
+    >>> greedy_path(isets, set(""), {"a": 1, "b": 2, "c": 3, "d": 4})
+    [(0, 2), (0, 1)]
+    """
+    if len(input_sets) == 1:
+        return [(0,)]
+    elif len(input_sets) == 2:
+        return [(0, 1)]
+
+    # the cost of contracting everything at once bounds that of the path
+    _, _, idx_removed, idx_contract = find_contraction(
+        range(len(input_sets)), input_sets, output_set
+    )
+    naive_cost = flop_count(idx_contract, bool(idx_removed), len(input_sets), idx_dict)
+
+    comb_iter = itertools.combinations(range(len(input_sets)), 2)
+    known_contractions = list()
+    path_cost = 0
+    path = list()
+    for _ in range(len(input_sets) - 1):
+        # the operands sharing indices are contracted first
+        for positions in comb_iter:
+            if input_sets[positions[0]].isdisjoint(input_sets[positions[1]]):
+                continue
+            result = parse_possible_contraction(
+                positions,
+                input_sets,
+                output_set,
+                idx_dict,
+                memory_limit,
+                path_cost,
+                naive_cost,
+            )
+            if result is not None:
+                known_contractions.append(result)
+
+        # then the outer products
+        if not known_contractions:
+            for positions in itertools.combinations(range(len(input_sets)), 2):
+                result = parse_possible_contraction(
+                    positions,
+                    input_sets,
+                    output_set,
+                    idx_dict,
+                    memory_limit,
+                    path_cost,
+                    naive_cost,
+                )
+                if result is not None:
+                    known_contractions.append(result)
+            if not known_contractions:
+                path.append(tuple(range(len(input_sets))))
+                break
+
+        best = min(known_contractions, key=lambda x: x[0])
+        known_contractions = update_other_results(known_contractions, best)
+        input_sets = best[2]
+        new_tensor_pos = len(input_sets) - 1
+        comb_iter = ((i, new_tensor_pos) for i in range(new_tensor_pos))
+        path.append(best[1])
+        path_cost += best[0][1]
+    return path
+
+
+# Plans #
+# ------#
+
+
+def _kept_order(subscripts: str, kept: Set[str]) -> str:
+    # the kept indices, once each, in their order of appearance
+    return "".join(dict.fromkeys(s for s in subscripts if s in kept))
+
+
+def _permutation(subscripts: str, order: List[str]) -> Optional[List[int]]:
+    # the transpose of ``subscripts`` to ``order``, None if it's the identity
+    permutation = [subscripts.index(s) for s in order]
+    return None if permutation == list(range(len(order))) else permutation
+
+
+def _num_transposes(a: str, b: str, batch: List[str], contract: List[str]) -> int:
+    # the number of operands of a matmul step which need to be transposed
+    left = [s for s in a if s not in b]
+    right = [s for s in b if s not in a]
+    return (_permutation(a, batch + left + contract) is not None) + (
+        _permutation(b, batch + contract + right) is not None
+    )
+
+
+def _matmul_shape(
+    batch_shape: TensorShapeType, rows: List[str], cols: List[str], idx_dict
+) -> Optional[TensorShapeType]:
+    # the shape of a matmul operand, None if no indices need to be merged
+    if len(rows) == len(cols) == 1:
+        return None
+    return batch_shape + (
+        compute_size_by_dict(rows, idx_dict),
+        compute_size_by_dict(cols, idx_dict),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def contraction_plan(
+    equation: str, shapes: Tuple[TensorShapeType, ...], optimize: str = "auto"
+) -> Optional[SimpleNamespace]:
+    """
+    Plan the contraction of einsum operands of ``shapes`` as a sequence of pairwise
+    steps. Those summing over indices are lowered to a single ``matmul``, as a
+    ``tensordot`` when no index is kept from both operands and batched over the kept
+    ones otherwise, the others to ``einsum``. Plans are cached by equation and
+    shapes.
+
+    Parameters
+    ----------
+    equation
+        The einsum equation.
+    shapes
+        The shapes of the operands.
+    optimize
+        "optimal", "greedy", or "auto" which searches the optimal path for up to
+        four operands and the greedy one beyond.
+
+    Returns
+    -------
+    ret
+        The legalised ``equation``, the contraction ``path``, the ``steps`` as
+        ``(positions, kind, spec)`` tuples, and the ``permutation`` of the last
+        result to the output. None if there is at most one operand, if some sizes
+        are unknown, or if sizes of an index differ between operands, which is left
+        to the native einsum.
+
+    Examples
+    --------
+    >>> plan = contraction_plan("ij,jk,kl->il", ((64, 64), (64, 64), (64, 2)))
+    >>> plan.path
+    [(1, 2), (0, 1)]
+    >>> [kind for _, kind, _ in plan.steps]
+    ['tensordot', 'tensordot']
+    """
+    equation = legalise_einsum_expr(
+        equation, *[SimpleNamespace(shape=shape) for shape in shapes]
+    )
+    if len(shapes) < 2 or None in sum(shapes, ()):
+        return None
+    inputs, output = equation.split("->")
+    inputs = inputs.split(",")
+    idx_dict = dict()
+    for subscripts, shape in zip(inputs, shapes):
+        for s, d in zip(subscripts, shape):
+            if idx_dict.setdefault(s, d) != d:
+                return None
+
+    steps = list()
+    # indices repeated within an operand, or appearing nowhere else, are summed
+    # over first
+    for i, subscripts in enumerate(inputs):
+        elsewhere = set(output).union(*(inputs[:i] + inputs[i + 1 :]))
+        reduced = _kept_order(subscripts, elsewhere)
+        if reduced != subscripts:
+            steps.append(((i,), "reduce", f"{subscripts}->{reduced}"))
+            inputs[i] = reduced
+
+    input_sets = [set(subscripts) for subscripts in inputs]
+    output_set = set(output)
+    if optimize == "optimal" or (
+        optimize == "auto" and len(inputs) <= _OPTIMAL_MAX_OPERANDS
+    ):
+        path = optimal_path(input_sets, output_set, idx_dict)
+    else:
+        path = greedy_path(input_sets, output_set, idx_dict)
+
+    for positions in path:
+        positions = tuple(sorted(positions, reverse=True))
+        kept, input_sets, _, _ = find_contraction(positions, input_sets, output_set)
+        operands = [inputs.pop(p) for p in positions]
+        if len(operands) != 2:
+            result = _kept_order("".join(operands), kept)
+            steps.append((positions, "einsum", f"{','.join(operands)}->{result}"))
+            inputs.append(result)
+            continue
+        a, b = operands
+        shared = [s for s in a if s in b]
+        batch = [s for s in shared if s in kept]
+        left = [s for s in a if s not in b]
+        right = [s for s in b if s not in a]
+        if len(batch) == len(shared):
+            # outer and elementwise products sum over nothing
+            result = a + "".join(right)
+            steps.append((positions, "einsum", f"{a},{b}->{result}"))
+            inputs.append(result)
+            continue
+        # (*batch, left, contract) @ (*batch, contract, right), with the operands
+        # swapped and the summed over indices ordered so as to need the fewest
+        # transposes
+        swap, contract = min(
+            (
+                (swap, [s for s in x if s in shared and s not in batch])
+                for swap in (False, True)
+                for x in (a, b)
+            ),
+            key=lambda option: _num_transposes(
+                *((b, a) if option[0] else (a, b)), batch, option[1]
+            ),
+        )
+        if swap:
+            a, b, left, right = b, a, right, left
+        result = "".join(batch + left + right)
+        batch_shape = tuple(idx_dict[s] for s in batch)
+        spec = (
+            swap,
+            _permutation(a, batch + left + contract),
+            _matmul_shape(batch_shape, left, contract, idx_dict),
+            _permutation(b, batch + contract + right),
+            _matmul_shape(batch_shape, contract, right, idx_dict),
+            (
+                None
+                if len(left) == len(right) == 1
+                else tuple(idx_dict[s] for s in result)
+            ),
+        )
+        steps.append((positions, "matmul" if batch else "tensordot", spec))
+        inputs.append(result)
+
+    permutation = [inputs[0].index(s) for s in output]
+    if permutation == list(range(len(output))):
+        permutation = None
+    return SimpleNamespace(
+        equation=equation, path=path, steps=steps, permutation=permutation
+    )
+
+
+def contract(
+    equation: str,
+    operands: Sequence[Any],
+    *,
+    einsum: Callable,
+    matmul: Callable,
+    transpose: Callable,
+    reshape: Callable,
+) -> Any:
+    """
+    Evaluate an einsum equation along its cached contraction plan, with the given
+    native functions of a backend.
+
+    Parameters
+    ----------
+    equation
+        The einsum equation.
+    operands
+        The native arrays to contract.
+    einsum
+        ``einsum(equation, *operands)``, for the steps which sum over nothing.
+    matmul
+        ``matmul(x1, x2)``, broadcast over the leading dimensions.
+    transpose
+        ``transpose(x, permutation)``.
+    reshape
+        ``reshape(x, shape)``.
+
+    Returns
+    -------
+    ret
+        The result of the contraction.
+    """
+    plan = contraction_plan(equation, tuple(tuple(o.shape) for o in operands))
+    if plan is None:
+        return einsum(legalise_einsum_expr(equation, *operands), *operands)
+    operands = list(operands)
+    for positions, kind, spec in plan.steps:
+        if kind == "reduce":
+            operands[positions[0]] = einsum(spec, operands[positions[0]])
+            continue
+        args = [operands.pop(p) for p in positions]
+        if kind == "einsum":
+            operands.append(einsum(spec, *args))
+            continue
+        # the transposes and reshapes which would be no-ops are None
+        swap, *operand_specs, shape = spec
+        if swap:
+            args.reverse()
+        for i, (permutation, operand_shape) in enumerate(
+            zip(operand_specs[::2], operand_specs[1::2])
+        ):
+            if permutation is not None:
+                args[i] = transpose(args[i], permutation)
+            if operand_shape is not None:
+                args[i] = reshape(args[i], operand_shape)
+        ret = matmul(*args)
+        if shape is not None:
+            ret = reshape(ret, shape)
+        operands.append(ret)
+    ret = operands[0]
+    if plan.permutation is not None:
+        ret = transpose(ret, plan.permutation)
+    return ret
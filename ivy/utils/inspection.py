@@ -118,6 +118,33 @@ def fn_array_spec(fn):
     return array_idxs
 
 
+def get_array_spec(fn):
+    """
+    Return the array specification of the function, inspecting its type hints the
+    first time it is requested and caching it in its ``array_spec`` attribute.
+
+    Parameters
+    ----------
+    fn
+        function to inspect
+
+    Returns
+    -------
+    ret
+        specification
+    """
+    try:
+        return fn.__dict__["array_spec"]
+    except (AttributeError, KeyError):
+        pass
+    array_spec = fn_array_spec(fn)
+    try:
+        fn.array_spec = array_spec
+    except AttributeError:
+        pass
+    return array_spec
+
+
 def add_array_specs():
     for k, v in ivy.__dict__.items():
         if callable(v) and k[0].islower():
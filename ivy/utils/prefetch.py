@@ -0,0 +1,227 @@
+"""Background loading of container batches, overlapping loading with compute."""
+
+# global
+import collections
+import concurrent.futures
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory as _shared_memory
+
+import numpy as np
+
+# local
+import ivy
+
+
+def _to_numpy_nest(batch):
+    # the batch as a nested dict, with numpy arrays in place of any arrays
+    return ivy.Container(batch).cont_map(
+        lambda x, kc: ivy.to_numpy(x) if ivy.is_array(x) else x
+    )
+
+
+def _to_shared_memory(batch):
+    # copy the numpy leaves of the batch into one shared memory block, returning its
+    # name, the key chain, dtype, shape and offset of each numpy leaf, and the other
+    # leaves, which are pickled as they are
+    arrays = list()
+    others = list()
+    offset = 0
+    for key_chain, value in batch.cont_to_iterator():
+        if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            value = np.asarray(value, order="C")
+            arrays.append((key_chain, value, offset))
+            offset += -(-value.nbytes // 64) * 64
+        else:
+            others.append((key_chain, value))
+    block = _shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    try:
+        for _, value, value_offset in arrays:
+            np.ndarray(value.shape, value.dtype, buffer=block.buf, offset=value_offset)[
+                ...
+            ] = value
+        leaves = [
+            (key_chain, value.dtype.str, value.shape, value_offset)
+            for key_chain, value, value_offset in arrays
+        ]
+        # the consumer unlinks the block, so the producer mustn't track it
+        resource_tracker.unregister(block._name, "shared_memory")
+        return block.name, leaves, others
+    finally:
+        block.close()
+
+
+def _from_shared_memory(name, leaves, others):
+    # rebuild the batch sent by _to_shared_memory, releasing the shared memory
+    block = _shared_memory.SharedMemory(name=name)
+    try:
+        batch = ivy.Container()
+        for key_chain, dtype, shape, offset in leaves:
+            batch.cont_set_at_key_chain(
+                key_chain,
+                np.ndarray(shape, dtype, buffer=block.buf, offset=offset).copy(),
+                inplace=True,
+            )
+        for key_chain, value in others:
+            batch.cont_set_at_key_chain(key_chain, value, inplace=True)
+        return batch
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _load_in_process(load_fn, key, shared_memory):
+    # runs in the worker processes, which only send back numpy arrays
+    batch = _to_numpy_nest(load_fn(key))
+    if shared_memory:
+        return _to_shared_memory(batch)
+    return batch
+
+
+def _release_unconsumed(future):
+    # the shared memory of a batch which was loaded but never consumed
+    if not future.cancelled() and future.exception() is None:
+        _from_shared_memory(*future.result())
+
+
+class Prefetcher:
+    def __init__(
+        self,
+        load_fn,
+        keys,
+        /,
+        *,
+        num_workers=1,
+        buffer_size=2,
+        executor="thread",
+        ordered=True,
+        shared_memory=True,
+        timeout=None,
+    ):
+        """
+        Iterate over container batches, loaded in the background by a pool of
+        producers while the previous batches are being consumed.
+
+        Unlike containers created from ``queues``, which block on the first access of
+        each batch, at most ``buffer_size`` batches are loaded ahead of the consumer,
+        so that loading overlaps with compute without growing unbounded.
+
+        Parameters
+        ----------
+        load_fn
+            Function taking a key and returning the batch for it, as a container or a
+            nested dict of arrays. With process producers, it must be picklable.
+        keys
+            Iterable of the keys of the batches to load, which may be infinite.
+        num_workers
+            The number of producers. Default is ``1``.
+        buffer_size
+            The maximum number of batches loaded or being loaded ahead of the
+            consumer. Default is ``2``.
+        executor
+            "thread" for producer threads, suited to loaders which release the GIL,
+            such as file reads or numpy, or "process" for producer processes.
+            Default is "thread".
+        ordered
+            Whether to deliver the batches in the order of their keys, or as soon as
+            they are loaded. Default is ``True``.
+        shared_memory
+            Whether process producers send the numpy arrays of the batches through
+            shared memory rather than pickling them through a pipe. The other leaves
+            are pickled. Default is ``True``.
+        timeout
+            The timeout in seconds when waiting for a batch, after which a
+            ``TimeoutError`` is raised. Default is ``None``, in which case
+            ``ivy.queue_timeout`` is used.
+
+        Examples
+        --------
+        >>> def load_fn(i):
+        ...     return {"x": np.full((2,), i, dtype="float32")}
+        >>> for batch in Prefetcher(load_fn, range(3)):
+        ...     print(batch.x)
+        ivy.array([0., 0.])
+        ivy.array([1., 1.])
+        ivy.array([2., 2.])
+        """
+        ivy.utils.assertions.check_true(
+            buffer_size >= 1, "buffer_size must be at least 1"
+        )
+        ivy.utils.assertions.check_elem_in_list(executor, ["thread", "process"])
+        self._load_fn = load_fn
+        self._keys = keys
+        self._num_workers = num_workers
+        self._buffer_size = buffer_size
+        self._executor = executor
+        self._ordered = ordered
+        self._shared_memory = shared_memory
+        self._timeout = timeout
+
+    def _load(self, key):
+        # runs in the producer threads, which also build the containers
+        return ivy.Container(self._load_fn(key)).to_ivy()
+
+    def _submit(self, pool, key):
+        if self._executor == "thread":
+            return pool.submit(self._load, key)
+        return pool.submit(_load_in_process, self._load_fn, key, self._shared_memory)
+
+    def _result(self, future, timeout):
+        ret = future.result(timeout)
+        if self._executor == "thread":
+            return ret
+        if self._shared_memory:
+            ret = _from_shared_memory(*ret)
+        return ivy.Container(ret).to_ivy()
+
+    def __iter__(self):
+        timeout = ivy.default(self._timeout, ivy.queue_timeout)
+        pool_cls = (
+            concurrent.futures.ThreadPoolExecutor
+            if self._executor == "thread"
+            else concurrent.futures.ProcessPoolExecutor
+        )
+        pool = pool_cls(self._num_workers)
+        keys = iter(self._keys)
+        pending = collections.deque()
+        timed_out = False
+        try:
+            for key in keys:
+                pending.append(self._submit(pool, key))
+                if len(pending) == self._buffer_size:
+                    break
+            while pending:
+                if self._ordered:
+                    future = pending[0]
+                else:
+                    done, _ = concurrent.futures.wait(
+                        pending,
+                        timeout,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    if not done:
+                        timed_out = True
+                        raise TimeoutError(
+                            f"no batch was loaded within {timeout} seconds"
+                        )
+                    future = done.pop()
+                try:
+                    ret = self._result(future, timeout)
+                except concurrent.futures.TimeoutError:
+                    timed_out = True
+                    raise TimeoutError(
+                        f"the next batch wasn't loaded within {timeout} seconds"
+                    ) from None
+                pending.remove(future)
+                # start loading the next batch before this one is consumed
+                for key in keys:
+                    pending.append(self._submit(pool, key))
+                    break
+                yield ret
+        finally:
+            # the loaders still running after a timeout aren't waited for
+            pool.shutdown(wait=not timed_out, cancel_futures=True)
+            # release the shared memory of the batches which were never consumed,
+            # once those still loading are done
+            if self._executor == "process" and self._shared_memory:
+                for future in pending:
+                    future.add_done_callback(_release_unconsumed)
@@ -1,10 +1,18 @@
 import cProfile
+import json
+import os
 import pstats
 import subprocess
 import logging
+import threading
+import time
+from typing import Optional
 from tempfile import NamedTemporaryFile
 from importlib.util import find_spec
 
+import ivy
+from ivy import func_wrapper
+
 is_snakeviz = find_spec("snakeviz")
 
 
@@ -54,3 +62,251 @@ class Profiler(cProfile.Profile):
 
             if self.print_stats:
                 stats.print_stats()
+
+
+def _array_signature(x):
+    shape = getattr(x, "shape", None)
+    dtype = getattr(x, "dtype", None)
+    if shape is None or dtype is None:
+        return None
+    try:
+        shape = list(shape)
+    except TypeError:
+        return None
+    return f"{str(dtype).split('.')[-1]}{shape}"
+
+
+def _input_signature(args, kwargs):
+    # dtypes and shapes of the arrays passed directly or within a flat sequence
+    signatures = []
+    items = [(None, arg) for arg in args] + list(kwargs.items())
+    for name, value in items:
+        if isinstance(value, (list, tuple)):
+            signature = [_array_signature(v) for v in value]
+            signature = (
+                f"[{', '.join(s for s in signature if s)}]" if any(signature) else None
+            )
+        else:
+            signature = _array_signature(value)
+        if signature is not None:
+            signatures.append(signature if name is None else f"{name}={signature}")
+    return ", ".join(signatures)
+
+
+class OpProfiler(func_wrapper._OpHook):
+    """
+    Record per-op statistics of the ivy functions called while it is active.
+
+    For every ivy function called, the number of calls, the cumulative wall time,
+    the time spent inside the backend implementation and the dtypes and shapes of
+    the input arrays are recorded. The difference between the wall time and the
+    backend time is the time spent in ivy's wrappers. A single hook is installed on
+    every function when a backend is set, which only checks whether a profiler is
+    active while none is, so it can be left in production code. The backend
+    implementations are only timed while a profiler is active.
+
+    Parameters
+    ----------
+    trace
+        Whether to also record every call, so that the calls can be exported to the
+        Chrome trace format. (Default value = ``False``).
+
+    Examples
+    --------
+    >>> from ivy.utils.profiler import OpProfiler
+    >>> ivy.set_backend("numpy")
+    >>> with OpProfiler() as profiler:
+    ...     y = ivy.add(ivy.ones((2,)), 1.0)
+    >>> profiler.stats()["add"]["calls"]
+    1
+    >>> print(profiler.table())  # doctest: +SKIP
+    """
+
+    def __init__(self, trace: bool = False):
+        self.trace = trace
+        self._stats = {}
+        self._events = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start recording the ivy function calls."""
+        func_wrapper._register_op_hook(self)
+
+    def stop(self):
+        """Stop recording the ivy function calls."""
+        func_wrapper._unregister_op_hook(self)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def clear(self):
+        """Remove all the recorded statistics and calls."""
+        with self._lock:
+            self._stats = {}
+            self._events = []
+
+    def _entry(self, name):
+        entry = self._stats.get(name)
+        if entry is None:
+            entry = self._stats[name] = {
+                "calls": 0,
+                "wall_time": 0.0,
+                "backend_calls": 0,
+                "backend_time": 0.0,
+                "inputs": {},
+            }
+        return entry
+
+    def call(self, name, fn, args, kwargs, call_next):
+        signature = _input_signature(args, kwargs)
+        start = time.perf_counter()
+        try:
+            return call_next(args, kwargs)
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                entry = self._entry(name)
+                entry["calls"] += 1
+                entry["wall_time"] += end - start
+                entry["inputs"][signature] = entry["inputs"].get(signature, 0) + 1
+                if self.trace:
+                    self._events.append(
+                        (name, start, end, threading.get_ident(), signature)
+                    )
+
+    def call_backend(self, name, fn, args, kwargs, call_next):
+        start = time.perf_counter()
+        try:
+            return call_next(args, kwargs)
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                entry = self._entry(name)
+                entry["backend_calls"] += 1
+                entry["backend_time"] += end - start
+                if self.trace:
+                    self._events.append(
+                        (f"{name} (backend)", start, end, threading.get_ident(), None)
+                    )
+
+    def stats(self) -> dict:
+        """
+        Return the recorded statistics.
+
+        Returns
+        -------
+        ret
+            A dict mapping the name of each function called to a dict containing its
+            number of calls, cumulative wall time in seconds, number of calls to and
+            cumulative time in seconds inside its backend implementation, time in
+            seconds spent in the wrappers, and the number of calls per input
+            signature.
+        """
+        with self._lock:
+            stats = {}
+            for name, entry in self._stats.items():
+                stats[name] = dict(entry, inputs=dict(entry["inputs"]))
+                stats[name]["wrapper_time"] = (
+                    entry["wall_time"] - entry["backend_time"]
+                    if entry["backend_calls"]
+                    else None
+                )
+            return stats
+
+    def to_container(self) -> ivy.Container:
+        """
+        Return the recorded statistics as a container.
+
+        Returns
+        -------
+        ret
+            A container with the statistics returned by ``stats`` at each function
+            name.
+        """
+        return ivy.Container(self.stats())
+
+    def table(self, sort_by: str = "wall_time", limit: Optional[int] = None) -> str:
+        """
+        Return the recorded statistics as a table.
+
+        Parameters
+        ----------
+        sort_by
+            The statistic the functions are sorted by, in descending order.
+            (Default value = "wall_time").
+        limit
+            The maximum number of functions listed. (Default value = ``None``, in
+            which case all functions are listed).
+
+        Returns
+        -------
+        ret
+            The table, with times in milliseconds and the most frequent input
+            signature of each function.
+        """
+        stats = sorted(self.stats().items(), key=lambda item: -(item[1][sort_by] or 0))[
+            :limit
+        ]
+        rows = [("op", "calls", "wall (ms)", "backend (ms)", "wrapper (ms)", "inputs")]
+        for name, entry in stats:
+            inputs = max(entry["inputs"].items(), key=lambda item: item[1])[0]
+            rows.append(
+                (
+                    name,
+                    str(entry["calls"]),
+                    f"{entry['wall_time'] * 1e3:.3f}",
+                    f"{entry['backend_time'] * 1e3:.3f}",
+                    (
+                        f"{entry['wrapper_time'] * 1e3:.3f}"
+                        if entry["wrapper_time"] is not None
+                        else "-"
+                    ),
+                    inputs,
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(5)]
+        return "\n".join(
+            "  ".join(
+                [row[0].ljust(widths[0])]
+                + [row[i].rjust(widths[i]) for i in range(1, 5)]
+                + [row[5]]
+            )
+            for row in rows
+        )
+
+    def export_chrome_trace(self, path: str):
+        """
+        Export the recorded calls to the Chrome trace format.
+
+        The backend implementation of each call is nested within it, the file can be
+        opened in chrome://tracing or Perfetto. Calls are only recorded by profilers
+        created with ``trace=True``.
+
+        Parameters
+        ----------
+        path
+            The path of the json file to write.
+        """
+        with self._lock:
+            events = list(self._events)
+        origin = min((event[1] for event in events), default=0.0)
+        pid = os.getpid()
+        trace_events = []
+        for name, start, end, tid, signature in events:
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": (start - origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+            if signature:
+                event["args"] = {"inputs": signature}
+            trace_events.append(event)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace_events}, f)
@@ -4394,9 +4394,6 @@ def test_torch_tensor_backward(
     backend_fw,
 ):
     ivy.set_backend(backend_fw)
-    if ivy.current_backend_str() == "numpy":
-        ivy.warnings.warn("Gradient calculation unavailable for numpy backend")
-        return
     if ivy.current_backend_str() == "paddle":
         ivy.warnings.warn("torch.Tensor.backward() unavailable for paddle backend")
         return
@@ -4450,6 +4447,37 @@ def test_torch_tensor_backward(
     )
 
 
+def test_torch_tensor_backward_shared_graph(backend_fw):
+    ivy.set_backend(backend_fw)
+    if ivy.current_backend_str() == "paddle":
+        ivy.warnings.warn("torch.Tensor.backward() unavailable for paddle backend")
+        ivy.previous_backend()
+        return
+    x = Tensor(ivy.array([1.0, 2.0]), requires_grad=True)
+    w = Tensor(ivy.array([[1.0, 2.0], [3.0, 4.0]]), requires_grad=True)
+    b = Tensor(ivy.array([0.5]), requires_grad=True)
+    # a is used by two ops, and b is broadcast
+    a = x.matmul(w) + b
+    c = (a * a + a).mean()
+    c.backward(retain_graph=True)
+    # dc/da = (2 * a + 1) / 2, with a = [7.5, 10.5]
+    dcda = np.array([8.0, 11.0])
+    assert np.allclose(
+        ivy.to_numpy(x.grad.ivy_array), np.array([[1, 2], [3, 4]]) @ dcda
+    )
+    assert np.allclose(ivy.to_numpy(w.grad.ivy_array), np.outer([1.0, 2.0], dcda))
+    assert np.allclose(ivy.to_numpy(b.grad.ivy_array), np.array([dcda.sum()]))
+
+    # the gradients of a second backward pass are accumulated
+    c.backward()
+    assert np.allclose(ivy.to_numpy(b.grad.ivy_array), np.array([2 * dcda.sum()]))
+
+    # the graph was freed by the second backward pass
+    with pytest.raises(RuntimeError):
+        c.backward()
+    ivy.previous_backend()
+
+
 @handle_frontend_method(
     class_tree=CLASS_TREE,
     init_tree="torch.tensor",
@@ -1,6 +1,7 @@
 """Collection of tests for unified general functions."""
 
 # global
+import gc
 import time
 import math
 from types import SimpleNamespace
@@ -12,6 +13,7 @@ from collections.abc import Sequence
 
 # local
 import threading
+import weakref
 import ivy
 
 import ivy_tests.test_ivy.helpers as helpers
@@ -524,6 +526,100 @@ def test_cache_fn_with_args():
     assert ret0 is not ret1
 
 
+def test_cache_fn_eviction_and_stats():
+    calls = []
+
+    def func(x, *, y=0):
+        calls.append(x)
+        return x + y
+
+    cached_fn = ivy.cache_fn(func, max_size=2)
+    assert cached_fn(1) == 1
+    assert cached_fn(1) == 1
+    # keys are typed, so 1.0 and True don't hit the entry of 1
+    assert cached_fn(1.0) == 1.0
+    assert cached_fn(True) == 1
+    assert calls == [1, 1.0, True]
+    assert cached_fn.cache_info() == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+        "size": 2,
+        "max_size": 2,
+    }
+    # the least recently used entry was evicted
+    cached_fn(1)
+    assert len(calls) == 4
+    assert cached_fn(2, y=1) == cached_fn(2, y=1) == 3
+    assert len(calls) == 5
+
+    cached_fn.cache_clear()
+    assert cached_fn.cache_info()["size"] == 0
+    cached_fn(1)
+    assert len(calls) == 6
+
+
+def test_cache_fn_array_keys():
+    def func(x, shape=None):
+        return ivy.random_uniform(shape=x.shape)
+
+    x = ivy.array([1.0, 2.0])
+    x_equal = ivy.array([1.0, 2.0])
+
+    # arrays are keyed by identity by default
+    cached_fn = ivy.cache_fn(func)
+    assert cached_fn(x, shape=[1, 2]) is cached_fn(x, shape=[1, 2])
+    assert cached_fn(x, shape=[1, 2]) is not cached_fn(x, shape=[2, 1])
+    assert cached_fn(x) is not cached_fn(x_equal)
+
+    # or by content
+    cached_fn = ivy.cache_fn(
+        lambda x: ivy.random_uniform(shape=x.shape), hash_arrays=True
+    )
+    assert cached_fn(x) is cached_fn(x_equal)
+    assert cached_fn(x) is not cached_fn(ivy.array([1.0, 3.0]))
+    assert cached_fn(x) is not cached_fn(ivy.array([1, 2]))
+
+
+def test_cache_fn_weak_array_keys():
+    def func(*xs):
+        return [x.shape for x in xs]
+
+    cached_fn = ivy.cache_fn(func)
+    cached_fn.cache_clear()
+    x = ivy.array([1.0, 2.0])
+    y = ivy.array([3.0])
+    cached_fn(x)
+    cached_fn(y)
+    cached_fn(x, y)
+    assert cached_fn.cache_info()["size"] == 3
+    # the cache doesn't keep the arrays alive, their entries go along with them
+    x_ref = weakref.ref(x)
+    del x
+    gc.collect()
+    assert x_ref() is None
+    assert cached_fn.cache_info()["size"] == 1
+    cached_fn.cache_clear()
+    del y
+    gc.collect()
+    assert cached_fn.cache_info()["size"] == 0
+
+
+def test_cache_fn_max_size_per_wrapper():
+    def func(x):
+        return x
+
+    small = ivy.cache_fn(func, max_size=1)
+    large = ivy.cache_fn(func, max_size=4)
+    for i in range(3):
+        small(i)
+        large(i)
+    assert small.cache_info()["max_size"] == 1
+    assert small.cache_info()["size"] == 1
+    assert large.cache_info()["max_size"] == 4
+    assert large.cache_info()["size"] == 3
+
+
 # clip_matrix_norm
 @handle_test(
     fn_tree="functional.ivy.clip_matrix_norm",
@@ -1663,6 +1759,20 @@ def test_set_item(
     )
 
 
+# set_container_parallelism
+@given(
+    num_threads=st.integers(min_value=1, max_value=8),
+    min_size=st.integers(min_value=0, max_value=2**20),
+)
+def test_set_container_parallelism(num_threads, min_size):
+    ivy.set_container_parallelism(num_threads, min_size=min_size)
+    assert ivy.container_parallelism == num_threads
+    assert ivy.container_parallel_min_size == min_size
+    ivy.unset_container_parallelism()
+    assert ivy.container_parallelism == 1
+    assert ivy.container_parallel_min_size == 65536
+
+
 # set_min_base
 @given(x=st.floats(allow_nan=False, allow_infinity=False))
 def test_set_min_base(x):
@@ -2023,6 +2133,119 @@ def test_vmap(func, dtype_and_arrays_and_axes, in_axes_as_cont, backend_fw):
         assert False, "One of the results is None while other isn't"
 
 
+# vmap, compared with a loop over the slices
+@pytest.mark.parametrize(
+    ("fn", "shapes", "in_axes", "batch_ops", "batched"),
+    [
+        (lambda ivy, x, y: ivy.add(x, y), [(4, 3), (4, 2, 3)], 0, True, True),
+        (lambda ivy, x: ivy.mean(x, axis=0), [(2, 4, 3)], 1, True, True),
+        (lambda ivy, x, y: ivy.matmul(x, y), [(4, 3), (4, 3, 2)], 0, True, True),
+        (lambda ivy, x, y: ivy.matmul(x, y), [(2, 3), (4, 3)], (None, 0), True, True),
+        (
+            lambda ivy, w, b, x: ivy.relu(ivy.linear(x, w, bias=b)),
+            [(4, 5, 3), (4, 5), (2, 3)],
+            (0, 0, None),
+            True,
+            True,
+        ),
+        (
+            lambda ivy, x, y: ivy.einsum("ij,jk", x, y),
+            [(4, 2, 3), (3, 2)],
+            (0, None),
+            True,
+            True,
+        ),
+        (
+            lambda ivy, x: ivy.permute_dims(ivy.reshape(x, (3, 2)), (1, 0)),
+            [(4, 2, 3)],
+            0,
+            True,
+            True,
+        ),
+        (
+            lambda ivy, x, y: ivy.concat([x, y], axis=-1),
+            [(4, 2, 3), (2, 1)],
+            (0, None),
+            True,
+            True,
+        ),
+        (
+            lambda ivy, x: ivy.get_item(x, (0, slice(1, None))),
+            [(4, 2, 3)],
+            0,
+            True,
+            True,
+        ),
+        (lambda ivy, x: ivy.softmax(ivy.sum(x, axis=-1)), [(4, 2, 3)], 0, True, True),
+        (lambda ivy, x: ivy.divide(x, ivy.max(x)), [(4, 2, 3)], 0, True, True),
+        # an unbatched argument of the batch's shape, so it falls back to the loop
+        (
+            lambda ivy, x: ivy.where(x > 0, x, 0.0),
+            [(4, 3, 2)],
+            0,
+            True,
+            False,
+        ),
+        # depend on the native arrays themselves, so they're looped over
+        (
+            lambda ivy, x: ivy.multiply(ivy.sum(x), x.shape[0]),
+            [(4, 2, 3)],
+            0,
+            False,
+            False,
+        ),
+        (lambda ivy, x: ivy.divide(x, float(np.max(x))), [(4, 2, 3)], 0, False, False),
+    ],
+)
+def test_vmap_batching(fn, shapes, in_axes, batch_ops, batched, backend_fw):
+    if not batch_ops and backend_fw not in ("numpy", "tensorflow"):
+        # the native vmaps trace the native arrays, which can't be converted to
+        # python scalars
+        pytest.skip("the native array cases only apply to the looped vmaps")
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        rng = np.random.RandomState(0)
+        arrays = [rng.normal(size=shape).astype("float32") for shape in shapes]
+        axes = in_axes if isinstance(in_axes, tuple) else (in_axes,) * len(arrays)
+        calls = []
+
+        def func(*args):
+            calls.append(None)
+            return fn(ivy_backend, *args)
+
+        vmapped_func = ivy_backend.vmap(func, in_axes=in_axes, batch_ops=batch_ops)
+        args = [ivy_backend.native_array(array) for array in arrays]
+        ret = ivy_backend.to_numpy(vmapped_func(*args))
+        ret_again = ivy_backend.to_numpy(vmapped_func(*args))
+        (size,) = {
+            array.shape[axis] for array, axis in zip(arrays, axes) if axis is not None
+        }
+        calls_batched = len(calls)
+        expected = np.stack(
+            [
+                ivy_backend.to_numpy(
+                    func(
+                        *[
+                            ivy_backend.native_array(
+                                array if axis is None else np.take(array, i, axis)
+                            )
+                            for array, axis in zip(arrays, axes)
+                        ]
+                    )
+                )
+                for i in range(size)
+            ]
+        )
+        assert_all_close(ret, expected, backend=backend_fw, rtol=1e-5, atol=1e-5)
+        assert_all_close(ret_again, expected, backend=backend_fw, rtol=1e-5, atol=1e-5)
+        if backend_fw in ("numpy", "tensorflow"):
+            # once per call with the batch if it can be batched, otherwise once per
+            # slice, after a single attempt with the batch if opted into
+            if batched:
+                assert calls_batched == 2
+            else:
+                assert calls_batched == 2 * size + batch_ops
+
+
 _composition_1.test_unsupported_devices_and_dtypes = {
     "cpu": {
         "numpy": ("bfloat16",),
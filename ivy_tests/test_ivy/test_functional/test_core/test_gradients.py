@@ -194,9 +194,6 @@ def test_adam_update(
 def test_execute_with_gradients(
     *, dtype_and_xs, retain_grads, test_flags, backend_fw, fn_name, on_device
 ):
-    if backend_fw == "numpy":
-        return
-
     def func(xs):
         with BackendHandler.update_backend(
             ivy.current_backend(xs.to_native()).backend
@@ -228,23 +225,46 @@ def test_execute_with_gradients(
     )
 
 
+def test_execute_with_gradients_container_parallelism(backend_fw):
+    # the leaves of the containers are mapped on several threads while recording
+    ivy.set_backend(backend_fw)
+    rng = np.random.RandomState(0)
+    xs = ivy.Container(
+        {k: ivy.array(rng.uniform(size=(64, 64)) * 0.01) for k in "abcd"}
+    )
+
+    def func(xs):
+        ys = ivy.tanh(ivy.matmul(xs, xs))
+        return sum(ivy.sum(ys[k]) for k in "abcd")
+
+    try:
+        _, expected = ivy.execute_with_gradients(func, xs)
+        ivy.set_container_parallelism(4, min_size=1)
+        for _ in range(5):
+            _, grads = ivy.execute_with_gradients(func, xs)
+            for k in "abcd":
+                assert np.allclose(ivy.to_numpy(grads[k]), ivy.to_numpy(expected[k]))
+                assert np.any(ivy.to_numpy(grads[k]) != 0)
+    finally:
+        ivy.unset_container_parallelism()
+        ivy.previous_backend()
+
+
 # grad
 @pytest.mark.parametrize(
     "x", [[[4.6, 2.1, 5], [2.8, 1.3, 6.2]], [[4.6, 2.1], [5, 2.8], [1.3, 6.2]]]
 )
 @pytest.mark.parametrize("dtype", ["float32", "float64"])
-@pytest.mark.parametrize(
-    "func", [lambda x: ivy.mean(ivy.square(x)), lambda x: ivy.mean(ivy.cos(x))]
-)
+@pytest.mark.parametrize("func_str", ["square", "cos", "atan", "exp2", "vector_norm"])
 @pytest.mark.parametrize("nth", [1, 2, 3])
-def test_grad(x, dtype, func, backend_fw, nth):
+def test_grad(x, dtype, func_str, backend_fw, nth):
     # ToDo: Remove skipping for paddle and jax for nth > 1
-    if backend_fw == "numpy" or (
-        (backend_fw == "paddle" or backend_fw == "jax") and nth > 1
-    ):
+    if (backend_fw == "paddle" or backend_fw == "jax") and nth > 1:
         return
 
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        f = ivy_backend.__dict__[func_str]
+        func = lambda x: ivy_backend.mean(f(x))
         _variable_fn = ivy_backend.ivy.functional.ivy.gradients._variable
         var = _variable_fn(ivy_backend.array(x, dtype=dtype))
         fn = ivy_backend.grad(func)
@@ -255,8 +275,10 @@ def test_grad(x, dtype, func, backend_fw, nth):
         grad_np = helpers.flatten_and_to_np(ret=grad, backend=backend_fw)
 
     with BackendHandler.update_backend("tensorflow") as gt_backend:
+        f = gt_backend.__dict__[func_str]
+        func = lambda x: gt_backend.mean(f(x))
         _variable_fn = gt_backend.ivy.functional.ivy.gradients._variable
-        var = _variable_fn(ivy.array(x, dtype=dtype))
+        var = _variable_fn(gt_backend.array(x, dtype=dtype))
         fn = gt_backend.grad(func)
         if nth > 1:
             for _ in range(1, nth):
@@ -308,9 +330,6 @@ def test_gradient_descent_update(
 @pytest.mark.parametrize("dtype", ["float32", "float64"])
 @pytest.mark.parametrize("func_str", ["square", "cos"])
 def test_jac(x, dtype, func_str, backend_fw):
-    if backend_fw == "numpy":
-        pytest.skip()
-
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
         f = ivy_backend.__dict__[func_str]
         func = lambda x: ivy_backend.mean(f(x))
@@ -553,13 +572,11 @@ def test_stop_gradient(
     "x", [[[4.6, 2.1, 5], [2.8, 1.3, 6.2]], [[4.6, 2.1], [5, 2.8], [1.3, 6.2]]]
 )
 @pytest.mark.parametrize("dtype", ["float32", "float64"])
-@pytest.mark.parametrize(
-    "func", [lambda x: ivy.mean(ivy.square(x)), lambda x: ivy.mean(ivy.cos(x))]
-)
-def test_value_and_grad(x, dtype, func, backend_fw):
-    if backend_fw == "numpy":
-        return
+@pytest.mark.parametrize("func_str", ["square", "cos"])
+def test_value_and_grad(x, dtype, func_str, backend_fw):
     with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        f = ivy_backend.__dict__[func_str]
+        func = lambda x: ivy_backend.mean(f(x))
         var = ivy_backend.ivy.functional.ivy.gradients._variable(
             ivy_backend.array(x, dtype=dtype)
         )
@@ -570,6 +587,8 @@ def test_value_and_grad(x, dtype, func, backend_fw):
         ), helpers.flatten_and_to_np(ret=grad, backend=backend_fw)
 
     with BackendHandler.update_backend("tensorflow") as gt_backend:
+        f = gt_backend.__dict__[func_str]
+        func = lambda x: gt_backend.mean(f(x))
         var = gt_backend.ivy.functional.ivy.gradients._variable(
             gt_backend.array(x, dtype=dtype)
         )
@@ -3,6 +3,7 @@
 # global
 import copy
 import warnings
+from collections import namedtuple, OrderedDict
 import pytest
 import numpy as np
 
@@ -142,6 +143,40 @@ def test_duplicate_array_index_chains(nest, x, y):
 # ------#
 
 
+# flatten_nest
+@pytest.mark.parametrize(
+    "nest", [{"a": [[0], [1]], "b": {"c": (((2,), (4,)), ((6,), (8,)))}}]
+)
+def test_flatten_nest(nest):
+    leaves, plan = ivy.flatten_nest(nest)
+    assert leaves == [0, 1, 2, 4, 6, 8]
+    assert [list(index) for index in plan.indices] == ivy.nested_argwhere(
+        nest, lambda _: True
+    )
+    assert ivy.multi_index_nest(nest, plan.indices) == leaves
+    # the plan is compiled once per structure
+    assert ivy.flatten_nest(copy.deepcopy(nest))[1] is plan
+    assert ivy.flatten_nest({"a": [[0], [1]], "b": 2})[1] is not plan
+    # keys which are equal but of different types get their own plans
+    for key in (1, True, 1.0):
+        key_plan = ivy.flatten_nest({key: 0})[1]
+        assert type(key_plan.indices[0][0]) is type(key)
+        assert type(next(iter(key_plan.unflatten([0])))) is type(key)
+    indices, values = plan.argwhere(leaves, lambda x: x < 5)
+    assert indices == ivy.nested_argwhere(nest, lambda x: x < 5)
+    assert values == [0, 1, 2, 4]
+    assert plan.positions(indices) == [0, 1, 2, 3]
+    # containers are left whole when ignored
+    x = ivy.Container(a=ivy.array([1.0]))
+    leaves, plan = ivy.flatten_nest([x, {"b": x}], to_ignore=ivy.Container)
+    assert leaves[0] is x and leaves[1] is x
+    assert plan.indices == ((0,), (1, "b"))
+
+
+# Tests #
+# ------#
+
+
 # index_nest
 @pytest.mark.parametrize(
     "nest", [{"a": [[0], [1]], "b": {"c": (((2,), (4,)), ((6,), (8,)))}}]
@@ -440,3 +475,24 @@ def test_set_nest_at_indices(nest, indices, values, shallow):
         assert nest == nest_copy
     else:
         assert nest != nest_copy
+
+
+# unflatten_nest
+@pytest.mark.parametrize(
+    "nest",
+    [
+        {"a": [[0], [1]], "b": {"c": (((2,), (4,)), ((6,), (8,)))}},
+        [namedtuple("Pair", ["x", "y"])(x=0, y=[1, 2]), OrderedDict(z=3), 4, []],
+        5,
+    ],
+)
+def test_unflatten_nest(nest):
+    leaves, plan = ivy.flatten_nest(nest)
+    assert ivy.unflatten_nest(plan, leaves) == nest
+    result = plan.map(lambda x: x * 2, leaves)
+    assert result == ivy.nested_map(
+        lambda x: x * 2, copy.deepcopy(nest), include_derived=True
+    )
+    assert type(result) is type(nest)
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.unflatten_nest(plan, leaves + [0])
@@ -1,11 +1,14 @@
 """Collection of tests for statistical functions."""
 # global
 import numpy as np
+import pytest
 from hypothesis import strategies as st, assume
 
 # local
 import ivy_tests.test_ivy.helpers as helpers
-from ivy_tests.test_ivy.helpers import handle_test
+from ivy_tests.test_ivy.helpers import handle_test, BackendHandler
+from ivy_tests.test_ivy.helpers.assertions import assert_all_close
+from ivy.utils.einsum_path_helpers import contraction_plan
 
 
 # --- Helpers --- #
@@ -206,6 +209,47 @@ def test_einsum(
     )
 
 
+# einsum, contracted pairwise along the planned path
+@pytest.mark.parametrize(
+    ("equation", "shapes", "kinds", "dtype"),
+    [
+        ("ij,jk,kl->il", [(32, 32), (32, 32), (32, 2)], ["tensordot"] * 2, "float32"),
+        ("bij,bjk->bik", [(4, 2, 3), (4, 3, 5)], ["matmul"], "float32"),
+        ("...ij,...jk->...ik", [(2, 4, 2, 3), (4, 3, 5)], ["matmul"], "float32"),
+        ("bhqd,bhkd->bhqk", [(2, 3, 4, 5), (2, 3, 6, 5)], ["matmul"], "float32"),
+        ("ii,ij->j", [(3, 3), (3, 4)], ["reduce", "tensordot"], "float32"),
+        ("ij,kl->ijkl", [(2, 3), (4, 5)], ["einsum"], "float32"),
+        ("ij,ij->i", [(3, 4), (3, 4)], ["matmul"], "float32"),
+        ("abc,bcd,da,e->e", [(2, 3, 4), (3, 4, 5), (5, 2), (3,)], None, "float32"),
+        (
+            "ea,fb,abcd,gc,hd->efgh",
+            [(3, 4), (2, 5), (4, 5, 6, 2), (3, 6), (2, 2)],
+            None,
+            "float32",
+        ),
+        ("a,b,c,d,e,f->", [(2,), (3,), (2,), (3,), (4,), (2,)], None, "float32"),
+        # the operands reduced on their own keep their integer dtype
+        ("be,dee->b", [(2, 3), (4, 3, 3)], None, "int32"),
+        ("dcb,ac->da", [(2, 3, 4), (5, 3)], None, "int32"),
+    ],
+)
+def test_einsum_contraction_path(equation, shapes, kinds, dtype, backend_fw):
+    plan = contraction_plan(equation, tuple(shapes))
+    if kinds is not None:
+        assert [kind for _, kind, _ in plan.steps] == kinds
+    rng = np.random.RandomState(0)
+    operands = [rng.normal(size=shape).astype(dtype) for shape in shapes]
+    with BackendHandler.update_backend(backend_fw) as ivy_backend:
+        ret = ivy_backend.einsum(
+            equation, *[ivy_backend.native_array(operand) for operand in operands]
+        )
+        ret = ivy_backend.to_numpy(ret)
+    expected = np.einsum(equation, *operands)
+    assert ret.shape == expected.shape
+    assert ret.dtype == dtype
+    assert_all_close(ret, expected, backend=backend_fw, rtol=1e-4, atol=1e-4)
+
+
 # max
 @handle_test(
     fn_tree="functional.ivy.max",
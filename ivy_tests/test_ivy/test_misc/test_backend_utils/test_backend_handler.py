@@ -154,6 +154,36 @@ def test_dynamic_backend_context_manager():
     assert d.dynamic_backend is False
 
 
+def test_dynamic_backend_registry():
+    from ivy.utils.backend import handler
+
+    ivy.unset_backend()
+    ivy.set_backend("numpy")
+    a = ivy.array([1.0, 2.0])
+    cont = ivy.Container({"w": ivy.array([3.0])})
+    with ivy.dynamic_backend_as(False):
+        c = ivy.array([4.0])
+
+    # the objects created before the first dynamic backend change are found then
+    ivy.set_backend("tensorflow", dynamic=True)
+    assert isinstance(a.data, tf.Tensor)
+    assert isinstance(cont["w"].data, tf.Tensor)
+    assert isinstance(c.data, np.ndarray)
+    assert id(a) in handler._dynamic_backend_objs
+    assert id(cont) in handler._dynamic_backend_objs
+    assert id(c) not in handler._dynamic_backend_objs
+
+    # and those created after it register themselves
+    d = ivy.array([5.0])
+    assert id(d) in handler._dynamic_backend_objs
+
+    # the registry only holds weak references
+    a_id = id(a)
+    del a
+    assert a_id not in handler._dynamic_backend_objs
+    ivy.unset_backend()
+
+
 def test_dynamic_backend_setter():
     a = ivy.array([1, 2, 3])
     type_a = type(a.data)
@@ -212,6 +242,8 @@ def test_previous_backend(backend):
     available_array_types_class,
 )
 def test_set_backend(backend, array_type):
+    # set backends keep their wrapped functions, so start without any backend set
+    ivy.unset_backend()
     # recording data before backend change
     stack_before = []
     func_address_before = id(ivy.sum)
@@ -234,6 +266,31 @@ def test_set_backend(backend, array_type):
     )
 
 
+@pytest.mark.parametrize("backend", _available_frameworks())
+def test_set_backend_reuses_namespace(backend):
+    ivy.unset_backend()
+    ivy.set_backend(backend)
+    wrapped_sum = ivy.sum
+    ivy.set_backend("numpy")
+    ivy.previous_backend()
+    # the namespace built when the backend was first set is swapped back in
+    assert ivy.sum is wrapped_sum
+    assert ivy.functional.sum is wrapped_sum
+    ivy.previous_backend()
+    ivy.set_backend(backend)
+    assert ivy.sum is wrapped_sum
+    x = ivy.array([1.0, 2.0])
+    assert np.allclose(ivy.to_numpy(ivy.sum(x)), 3.0)
+    ivy.previous_backend()
+
+    # changing the inplace mode rebuilds the namespace
+    ivy.set_inplace_mode("strict")
+    ivy.set_backend(backend)
+    assert ivy.sum is not wrapped_sum
+    ivy.previous_backend()
+    ivy.unset_inplace_mode()
+
+
 @pytest.mark.parametrize("backend", ["torch", "numpy"])
 def test_set_backend_no_warning_when_inplace_update_supported(backend):
     with pytest.warns(None):
@@ -1,8 +1,11 @@
 # global
+import itertools
 import os
 import queue
 import pytest
 import random
+import threading
+import time
 import numpy as np
 import multiprocessing
 import pickle
@@ -482,6 +485,27 @@ def test_container_copy(on_device):
     assert id(cont.b.d) == id(cont_deepcopy.b.d)
 
 
+def test_container_copy_shares_config(on_device):
+    cont = Container(
+        {"b": {"c": ivy.array([1.0], device=on_device)}, "a": {}},
+        print_limit=5,
+        alphabetical_keys=True,
+    )
+    cont["0"] = ivy.array([0.0], device=on_device)
+    for derived in (cont.cont_copy(), cont.cont_map(lambda x, kc: x + 1)):
+        assert derived.cont_config == cont.cont_config
+        assert derived.b.cont_config == cont.cont_config
+        # keys are sorted as if the container was constructed again
+        assert list(derived.keys()) == ["0", "a", "b"]
+        # the structure and config of either container can be updated on its own
+        derived.b.c = ivy.array([3.0], device=on_device)
+        derived.cont_update_config(print_limit=2)
+        assert derived.cont_config["print_limit"] == 2
+        assert cont.cont_config["print_limit"] == 5
+        assert np.allclose(ivy.to_numpy(cont.b.c), np.array([1.0]))
+        assert cont.b is not derived.b
+
+
 def test_container_create_if_absent(on_device):
     dict_in = {
         "a": ivy.array([[[1.0], [2.0], [3.0]]], device=on_device),
@@ -1191,6 +1215,89 @@ def test_container_from_queues(on_device):
     del container
 
 
+def _prefetch_load_fn(i):
+    # module level, so that it can be sent to producer processes
+    return {"a": np.full((2, 3), i, dtype="float32"), "b": {"c": np.arange(i)}, "i": i}
+
+
+@pytest.mark.parametrize(
+    ("executor", "ordered", "shared_memory"),
+    [
+        ("thread", True, False),
+        ("thread", False, False),
+        ("process", True, True),
+        ("process", False, False),
+    ],
+)
+def test_container_prefetch(executor, ordered, shared_memory, on_device):
+    if executor == "process" and "gpu" in on_device:
+        # Cannot re-initialize CUDA in forked subprocess.
+        pytest.skip()
+    from ivy.utils.prefetch import Prefetcher
+
+    batches = list(
+        Prefetcher(
+            _prefetch_load_fn,
+            range(6),
+            num_workers=2,
+            executor=executor,
+            ordered=ordered,
+            shared_memory=shared_memory,
+        )
+    )
+    if ordered:
+        assert [batch.i for batch in batches] == list(range(6))
+    else:
+        assert sorted(batch.i for batch in batches) == list(range(6))
+    for batch in batches:
+        assert isinstance(batch, Container)
+        assert isinstance(batch.a, ivy.Array)
+        assert np.array_equal(ivy.to_numpy(batch.a), np.full((2, 3), batch.i))
+        assert np.array_equal(ivy.to_numpy(batch.b.c), np.arange(batch.i))
+
+
+def test_container_prefetch_buffer_size(on_device):
+    from ivy.utils.prefetch import Prefetcher
+
+    loaded = list()
+
+    def load_fn(i):
+        loaded.append(i)
+        return {"a": ivy.array([i], device=on_device)}
+
+    # the keys are infinite, so only the buffered batches are ever loaded
+    prefetcher = Prefetcher(load_fn, itertools.count(), buffer_size=3)
+    for i, batch in enumerate(prefetcher):
+        assert len(loaded) <= i + 4
+        if i == 5:
+            break
+    assert len(loaded) <= 9
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_container_prefetch_timeout(ordered, on_device):
+    from ivy.utils.prefetch import Prefetcher
+
+    release = threading.Event()
+
+    def load_fn(i):
+        if i == 1:
+            release.wait(10)
+        return {"a": ivy.array([i], device=on_device)}
+
+    # the timeout isn't extended by waiting for the loader still running
+    start = time.perf_counter()
+    try:
+        with pytest.raises(TimeoutError, match="within 0.2 seconds"):
+            for _ in Prefetcher(
+                load_fn, range(3), num_workers=1, ordered=ordered, timeout=0.2
+            ):
+                pass
+        assert time.perf_counter() - start < 5
+    finally:
+        release.set()
+
+
 def test_container_from_tuple(on_device):
     tuple_in = (
         ivy.array([1], device=on_device),
@@ -1696,6 +1803,77 @@ def test_container_map(inplace, on_device):
     assert np.allclose(ivy.to_numpy(container_mapped["b"][1]), np.array([4]))
 
 
+@pytest.mark.parametrize("inplace", [True, False])
+def test_container_map_parallel(inplace, on_device):
+    dict_in = {
+        "a": ivy.array([1.0, 2.0, 3.0], device=on_device),
+        "b": {
+            "c": ivy.array([4.0], device=on_device),
+            "d": ivy.array([[5.0, 6.0], [7.0, 8.0]], device=on_device),
+        },
+        "e": "not an array",
+    }
+    container = Container(dict_in)
+    expected = container.cont_map(lambda x, _: x * 2 if ivy.is_array(x) else x)
+
+    # leaves with at least 2 elements are mapped on the threads
+    ivy.set_container_parallelism(2, min_size=2)
+    try:
+        container_mapped = container.cont_map(
+            lambda x, _: x * 2 if ivy.is_array(x) else x, inplace=inplace
+        )
+        container_added = ivy.Container.cont_multi_map(
+            lambda xs, _: xs[0] + xs[1] if ivy.is_array(xs[0]) else xs[0],
+            [expected, expected],
+        )
+        container_sqrt = ivy.sqrt(expected.cont_prune_key_chain("e"))
+    finally:
+        ivy.unset_container_parallelism()
+    if inplace:
+        container_mapped = container
+    assert list(container_mapped.cont_to_iterator_keys()) == list(
+        expected.cont_to_iterator_keys()
+    )
+    for key_chain, value in expected.cont_to_iterator():
+        if key_chain == "e":
+            assert container_mapped.e == "not an array"
+            continue
+        assert np.allclose(ivy.to_numpy(container_mapped[key_chain]), value)
+        assert np.allclose(ivy.to_numpy(container_added[key_chain]), value * 2)
+        assert np.allclose(ivy.to_numpy(container_sqrt[key_chain]), value**0.5)
+
+
+def test_container_map_parallel_many_leaves(backend_fw, on_device):
+    # the ivy functions called on the threads set and unset their own modes
+    ivy.set_backend(backend_fw)
+    stacks = (
+        ivy.functional.ivy.device.default_device_stack,
+        ivy.functional.ivy.device.soft_device_mode_stack,
+        ivy.functional.ivy.general.array_mode_stack,
+    )
+    stack_lens = [len(stack) for stack in stacks]
+    try:
+        container = Container(
+            {
+                f"x{i}": ivy.array(np.random.uniform(size=(4, 3)), device=on_device)
+                for i in range(64)
+            }
+        )
+        ivy.set_container_parallelism(8, min_size=1)
+        try:
+            rets = [ivy.sin(container) for _ in range(10)]
+        finally:
+            ivy.unset_container_parallelism()
+        assert [len(stack) for stack in stacks] == stack_lens
+        for ret in rets:
+            for key_chain, value in container.cont_to_iterator():
+                assert np.allclose(
+                    ivy.to_numpy(ret[key_chain]), np.sin(ivy.to_numpy(value))
+                )
+    finally:
+        ivy.previous_backend()
+
+
 @pytest.mark.parametrize("inplace", [True, False])
 def test_container_map_sub_conts(inplace, on_device):
     # without key_chains specification
@@ -1811,6 +1989,43 @@ def test_container_multi_map(on_device):
     assert np.allclose(ivy.to_numpy(container_mapped["d"].f), 3)
 
 
+def test_container_multi_map_in_function(on_device):
+    container0 = Container(
+        {
+            "a": ivy.array([1.0], device=on_device),
+            "b": {"c": ivy.array([2.0], device=on_device), "e": {}},
+        }
+    )
+    container1 = Container(
+        {
+            "a": ivy.array([3.0], device=on_device),
+            "b": {"c": ivy.array([4.0], device=on_device), "e": {}},
+        }
+    )
+
+    # with containers of the same structure, nested in the arguments
+    ret = ivy.Container.cont_multi_map_in_function(
+        "concat", [container0, container1], axis=0
+    )
+    assert list(ret.cont_all_key_chains()) == ["a", "b/c"]
+    assert np.allclose(ivy.to_numpy(ret.a), np.array([1.0, 3.0]))
+    assert np.allclose(ivy.to_numpy(ret.b.c), np.array([2.0, 4.0]))
+
+    # with containers of different structures
+    container2 = Container({"a": ivy.array([5.0], device=on_device)})
+    ret = ivy.Container.cont_multi_map_in_function("add", container0, container2)
+    assert np.allclose(ivy.to_numpy(ret.a), np.array([6.0]))
+
+    # with an out container
+    out = container0.cont_deep_copy()
+    ret = ivy.Container.cont_multi_map_in_function(
+        "add", container0, container1, out=out
+    )
+    assert ret is out
+    assert np.allclose(ivy.to_numpy(out.a), np.array([4.0]))
+    assert np.allclose(ivy.to_numpy(out.b.c), np.array([6.0]))
+
+
 def test_container_num_arrays(on_device):
     dict_in = {
         "a": ivy.array([[0.0, 1.0, 2.0, 3.0]], device=on_device),
@@ -1904,6 +2119,134 @@ def test_container_overwrite_at_key_chains(on_device):
     assert exception_raised
 
 
+def test_container_pack(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {
+                "c": ivy.array([[3.0]], device=on_device),
+                "d": ivy.array([1, 2], device=on_device),
+            },
+        }
+    )
+    packed = container.cont_pack()
+    buffers = packed.cont_packed_buffers
+    # one buffer per dtype
+    assert len(buffers) == 2
+    assert sorted(buffer.shape[0] for buffer in buffers) == [2, 3]
+    assert container.cont_packed_buffers is None
+    assert ivy.Container.cont_identical_structure([container, packed])
+
+    # elementwise functions and operators apply once per buffer
+    ret = packed * 2 + 1
+    assert ret.cont_packed_buffers is not None
+    assert np.allclose(ivy.to_numpy(ret.a), np.array([3.0, 5.0]))
+    assert np.allclose(ivy.to_numpy(ret.b.c), np.array([[7.0]]))
+    assert np.allclose(ivy.to_numpy(ret.b.d), np.array([3, 5]))
+    ret = ivy.add(ret, packed)
+    assert ret.cont_packed_buffers is not None
+    assert np.allclose(ivy.to_numpy(ret.b.c), np.array([[10.0]]))
+
+    # adam updates of packed containers match the per-leaf ones
+    ws = Container(a=ivy.array([1.0, 2.0]), b=ivy.array([[3.0]]))
+    dcdws = Container(a=ivy.array([0.1, 0.2]), b=ivy.array([[0.3]]))
+    packed_ws, packed_dcdws = ws.cont_pack(), dcdws.cont_pack()
+    rets = ivy.adam_update(ws, dcdws, 0.1, dcdws, dcdws**2, 1)
+    packed_rets = ivy.adam_update(
+        packed_ws, packed_dcdws, 0.1, packed_dcdws, packed_dcdws**2, 1
+    )
+    for ret, packed_ret in zip(rets, packed_rets):
+        assert np.allclose(ivy.to_numpy(ret.a), ivy.to_numpy(packed_ret.a), atol=1e-6)
+        assert np.allclose(ivy.to_numpy(ret.b), ivy.to_numpy(packed_ret.b), atol=1e-6)
+
+    # the leaves of backends with mutable arrays are views of the buffers
+    if ivy.current_backend_str() in ["numpy", "torch"]:
+        packed.a[0] = 10.0
+        assert 10.0 in ivy.to_numpy(packed.cont_packed_buffers[0]).tolist()
+
+    # replacing a leaf invalidates the packing
+    packed.b.c = ivy.array([[5.0]], device=on_device)
+    assert packed.cont_packed_buffers is None
+    assert np.allclose(ivy.to_numpy((packed * 2).b.c), np.array([[10.0]]))
+
+    # unpacking copies the leaves out of the buffers
+    unpacked = container.cont_pack().cont_unpack()
+    assert unpacked.cont_packed_buffers is None
+    assert np.allclose(ivy.to_numpy(unpacked.b.d), np.array([1, 2]))
+
+
+def test_container_pack_mixed_dtypes(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], dtype="float32", device=on_device),
+            "b": {
+                "c": ivy.array([[3.0]], dtype="float64", device=on_device),
+                "d": ivy.array([1, 2], dtype="int32", device=on_device),
+            },
+        }
+    )
+    packed = container.cont_pack()
+    assert len(packed.cont_packed_buffers) == 3
+
+    # functions keeping the dtype of each buffer return packed containers
+    ret = packed * 2
+    assert ret.cont_packed_buffers is not None
+    assert ivy.dtype(ret.b.c) == "float64"
+    assert ivy.dtype(ret.b.d) == "int32"
+    assert np.allclose(ivy.to_numpy(ret.b.d), np.array([2, 4]))
+
+    # those changing the dtype of a buffer, such as the true division of integers,
+    # and functions which aren't elementwise, are applied leaf by leaf
+    for ret in [packed / 2, ivy.greater(packed, 1.5), ivy.astype(packed, "float32")]:
+        assert ret.cont_packed_buffers is None
+    assert np.allclose(ivy.to_numpy((packed / 2).b.d), np.array([0.5, 1.0]))
+    assert ivy.to_numpy(ivy.greater(packed, 1.5).b.d).tolist() == [False, True]
+
+    # as are functions of containers packed with other layouts
+    other = Container(
+        {
+            "a": ivy.array([1.0, 2.0], dtype="float32", device=on_device),
+            "b": {
+                "c": ivy.array([[3.0]], dtype="float32", device=on_device),
+                "d": ivy.array([1.0, 2.0], dtype="float32", device=on_device),
+            },
+        }
+    ).cont_pack()
+    ret = packed + other
+    assert ret.cont_packed_buffers is None
+    assert np.allclose(ivy.to_numpy(ret.b.c), np.array([[6.0]]))
+    assert np.allclose(ivy.to_numpy(ret.b.d), np.array([2.0, 4.0]))
+
+
+def test_container_pack_mutated_leaf(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": ivy.array([3.0], device=on_device),
+        }
+    )
+
+    # replacing the data of a leaf after packing leaves the buffers stale, which
+    # is detected through the leaves recorded by cont_pack
+    packed = container.cont_pack()
+    packed.a.data = ivy.native_array([5.0, 6.0], device=on_device)
+    assert packed.cont_packed_buffers is None
+    ret = packed * 2
+    assert ret.cont_packed_buffers is None
+    assert np.allclose(ivy.to_numpy(ret.a), np.array([10.0, 12.0]))
+    assert np.allclose(ivy.to_numpy(ret.b), np.array([6.0]))
+
+    # in-place updates of the leaves of backends with mutable arrays are written
+    # to the buffers they are views of, which stay valid
+    if ivy.current_backend_str() in ["numpy", "torch"]:
+        packed = container.cont_pack()
+        ivy.inplace_update(packed.a, ivy.array([7.0, 8.0], device=on_device))
+        assert packed.cont_packed_buffers is not None
+        ret = packed * 2
+        assert ret.cont_packed_buffers is not None
+        assert np.allclose(ivy.to_numpy(ret.a), np.array([14.0, 16.0]))
+
+
 def test_container_pickle(on_device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=on_device),
@@ -2970,6 +3313,49 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize(
+    "save_kwargs",
+    [
+        {"chunks": False},
+        {"chunks": (2, 3)},
+        {"compression": "gzip", "compression_opts": 4},
+    ],
+)
+def test_container_to_and_from_disk_as_hdf5_with_storage(save_kwargs, on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    container = Container(
+        {
+            "a": ivy.reshape(ivy.arange(12, dtype="float32", device=on_device), (4, 3)),
+            "b": {"c": ivy.ones((4, 2), dtype="int32", device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath, mode="w", **save_kwargs)
+
+    # contiguous datasets are memory-mapped, and the others read in full
+    for mmap in [False, True]:
+        loaded_container = Container.cont_from_disk_as_hdf5(
+            save_filepath, slice(1, 3), mmap=mmap
+        )
+        assert np.array_equal(
+            ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a)[1:3]
+        )
+        assert np.array_equal(
+            ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)[1:3]
+        )
+        assert ivy.dtype(loaded_container.b.c) == "int32"
+
+        # the memory maps are copy-on-write, updates don't reach the file
+        ivy.inplace_update(loaded_container.a, ivy.zeros_like(loaded_container.a))
+        assert np.all(ivy.to_numpy(loaded_container.a) == 0)
+    reloaded_container = Container.cont_from_disk_as_hdf5(save_filepath)
+    assert np.array_equal(ivy.to_numpy(reloaded_container.a), ivy.to_numpy(container.a))
+
+    os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -3256,6 +3642,54 @@ def test_container_unify(on_device):
         assert np.allclose(ivy.to_numpy(container_unified.b.d[1]), np.array([6]))
 
 
+@pytest.mark.parametrize("num_workers", [None, 2])
+def test_container_unify_sum_mean(num_workers, on_device):
+    conts = {
+        f"worker_{i}": Container(
+            {
+                "a": ivy.array([1.0, 2.0], device=on_device) * (i + 1),
+                "b": {"c": ivy.array([[3.0]], device=on_device) * (i + 1), "d": {}},
+            }
+        )
+        for i in range(3)
+    }
+
+    # sum
+    container_summed = ivy.Container.cont_unify(
+        conts, on_device, "sum", num_workers=num_workers
+    )
+    assert np.allclose(ivy.to_numpy(container_summed.a), np.array([6.0, 12.0]))
+    assert np.allclose(ivy.to_numpy(container_summed.b.c), np.array([[18.0]]))
+    # empty sub-containers are pruned by all unify modes
+    assert "d" not in container_summed.b
+
+    # mean
+    container_mean = ivy.Container.cont_unify(
+        conts, on_device, "mean", num_workers=num_workers
+    )
+    assert np.allclose(ivy.to_numpy(container_mean.a), np.array([2.0, 4.0]))
+    assert np.allclose(ivy.to_numpy(container_mean.b.c), np.array([[6.0]]))
+    assert "d" not in container_mean.b
+    container_concat = ivy.Container.cont_unify(
+        conts, on_device, "concat", num_workers=num_workers
+    )
+    assert np.allclose(ivy.to_numpy(container_concat.a[2:4]), np.array([2.0, 4.0]))
+    assert "d" not in container_concat.b
+
+    # reduce and list stack
+    containers = list(conts.values())
+    container_reduced = ivy.Container.cont_reduce(
+        containers, lambda x: x[0] + x[1] + x[2], num_workers=num_workers
+    )
+    assert np.allclose(ivy.to_numpy(container_reduced.a), np.array([6.0, 12.0]))
+    # while they are kept by reduce and list stack
+    assert "d" in container_reduced.b
+    container_stacked = ivy.Container.cont_list_stack(containers, 0)
+    assert "d" in container_stacked.b
+    assert len(container_stacked.b.c) == 3
+    assert np.allclose(ivy.to_numpy(container_stacked.b.c[2]), np.array([[9.0]]))
+
+
 def test_container_unstack_conts(on_device):
     dict_in = {
         "a": ivy.array([[1], [2], [3]], device=on_device),
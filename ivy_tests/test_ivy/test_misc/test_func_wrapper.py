@@ -1,9 +1,11 @@
+import copy
+
 import numpy as np
 
 import ivy
 import pytest
 from unittest.mock import patch
-from ivy.func_wrapper import handle_array_like_without_promotion
+from ivy.func_wrapper import handle_array_like_without_promotion, _ArgsInfo
 from typing import Union, Tuple, List, Sequence
 
 
@@ -71,6 +73,101 @@ def test_handle_array_like_without_promotion(fn, x, expected_type, backend_fw):
     ivy.previous_backend()
 
 
+@pytest.mark.parametrize(
+    ("args", "kwargs", "expected"),
+    [
+        ((1.0, "a"), {"axis": 0}, (True, False, False, False, False)),
+        (("ivy",), {"y": "native"}, (True, False, False, True, True)),
+        ((["ivy", 2.0],), {}, (True, False, False, True, False)),
+        ((("native", "ivy"),), {"dtype": None}, (True, False, False, True, True)),
+        ((["cont"],), {}, (False, True, False, True, False)),
+        (({"a": [["native"]]},), {}, (False, False, False, False, True)),
+        (([[1.0, 2.0]],), {"x": "cont"}, (False, True, False, True, False)),
+    ],
+)
+def test_args_info(args, kwargs, expected, backend_fw):
+    ivy.set_backend(backend_fw)
+    try:
+        values = {
+            "ivy": ivy.array([1.0]),
+            "native": ivy.native_array([1.0]),
+            "cont": ivy.Container(a=ivy.array([1.0])),
+        }
+        # nested_map works in place, so the shared parameters are copied first
+        args, kwargs = ivy.nested_map(
+            lambda x: values.get(x, x), copy.deepcopy([args, kwargs])
+        )
+        info = _ArgsInfo(args, kwargs)
+        assert (
+            info.simple,
+            info.has_container,
+            info.has_nested_array,
+            info.has_ivy_array,
+            info.has_native_array,
+        ) == expected
+        assert info.describes(args, kwargs)
+        assert not info.describes(args, {**kwargs, "z": None})
+        if info.simple:
+            # the arrays held in flat arguments are found without any traversal
+            assert len(info.flat_arrays()) == len(
+                ivy.nested_argwhere([args, kwargs], ivy.is_array)
+            )
+    finally:
+        ivy.previous_backend()
+
+
+@pytest.mark.parametrize(
+    ("fn_name", "args", "kwargs"),
+    [
+        ("add", ([1.0, 2.0], [3.0, 4.0]), {}),
+        ("add", ([1.0, 2.0], 2), {"alpha": 2}),
+        ("sum", ([[1.0, 2.0], [3.0, 4.0]],), {"axis": (0, 1)}),
+        ("mean", ([1.0, 2.0, 3.0],), {"axis": 0, "keepdims": True}),
+        ("relu", ([-1.0, 2.0],), {}),
+        ("concat", ([[1.0], [2.0, 3.0]],), {}),
+        ("zeros", ((2, 3),), {"dtype": "int32"}),
+        ("full", ((2,), 3.0), {}),
+    ],
+)
+def test_fused_dispatch(fn_name, args, kwargs, backend_fw):
+    def _to_arrays(x):
+        if isinstance(x, list) and isinstance(x[0], list):
+            return [ivy.array(x_) for x_ in x]
+        return ivy.array(x) if isinstance(x, list) else x
+
+    results = []
+    for mode in [False, True]:
+        ivy.set_fused_dispatch_mode(mode)
+        ivy.set_backend(backend_fw)
+        fn = ivy.__dict__[fn_name]
+        assert hasattr(fn, "fused_dispatch") == mode
+        ivy_args = [_to_arrays(arg) for arg in args]
+        results.append(fn(*ivy_args, **kwargs))
+        # containers and the out argument fall back to the decorator stack
+        results.append(fn(ivy.Container(a=ivy_args[0]), *ivy_args[1:], **kwargs).a)
+        results.append(fn(*[ivy.to_native(arg) for arg in ivy_args], **kwargs))
+        ivy.previous_backend()
+        ivy.unset_fused_dispatch_mode()
+    for ret, fused_ret in zip(results[:3], results[3:]):
+        assert isinstance(fused_ret, ivy.Array)
+        assert ret.dtype == fused_ret.dtype
+        assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(fused_ret))
+
+
+def test_fused_dispatch_out_and_exceptions(backend_fw):
+    ivy.set_fused_dispatch_mode(True)
+    ivy.set_backend(backend_fw)
+    x = ivy.array([1.0, 2.0])
+    out = ivy.zeros(2)
+    ret = ivy.add(x, x, out=out)
+    assert ret is out
+    assert np.allclose(ivy.to_numpy(out), [2.0, 4.0])
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.add(x, ivy.array([1.0, 2.0, 3.0]))
+    ivy.previous_backend()
+    ivy.unset_fused_dispatch_mode()
+
+
 @pytest.mark.parametrize(
     ("x", "mode", "jax_like", "expected"),
     [
@@ -158,6 +255,45 @@ def test_inputs_to_ivy_arrays(backend_fw):
     ivy.previous_backend()
 
 
+def test_inputs_to_ivy_arrays_numpy_inputs(backend_fw):
+    # numpy arrays are converted on every backend, not only where they're native,
+    # so that the compositional functions accept them
+    ivy.set_backend(backend_fw)
+    try:
+        ivy.inputs_to_ivy_arrays(_fn6)(np.array(1.0))
+        ivy.inputs_to_ivy_arrays(lambda x: _fn6(x[0]))([np.array(1.0)])
+        x = np.array([0.2, 0.8], dtype="float32")
+        y = np.array([0.0, 1.0], dtype="float32")
+        ret = ivy.binary_cross_entropy(y, x, reduction="mean")
+        assert isinstance(ret, ivy.Array)
+        expected = -np.mean(y * np.log(x) + (1 - y) * np.log(1 - x))
+        assert np.allclose(ivy.to_numpy(ret), expected)
+        ret = ivy.stable_divide(x, np.array([2.0, 4.0], dtype="float32"))
+        assert isinstance(ret, ivy.Array)
+        assert np.allclose(ivy.to_numpy(ret), [0.1, 0.2])
+    finally:
+        ivy.previous_backend()
+
+
+def test_inputs_to_ivy_arrays_implicit_backend(backend_fw):
+    # without a backend set, the native arrays of the inferred backend are converted
+    ivy.set_backend(backend_fw)
+    x = ivy.native_array([0.2, 0.8], dtype="float32")
+    y = ivy.native_array([0.5, 0.5], dtype="float32")
+    ivy.unset_backend()
+    ivy.inputs_to_ivy_arrays(_fn6)(x)
+    ret = ivy.array(x)
+    assert isinstance(ret, ivy.Array)
+    assert np.allclose(ivy.to_numpy(ret), [0.2, 0.8])
+    ret = ivy.sum(x)
+    assert isinstance(ret, ivy.Array)
+    assert np.allclose(ivy.to_numpy(ret), 1.0)
+    ret = ivy.kl_div(x, y)
+    assert isinstance(ret, ivy.Array)
+    x, y = np.array([0.2, 0.8]), np.array([0.5, 0.5])
+    assert np.allclose(ivy.to_numpy(ret), np.mean(y * (np.log(y) - x)))
+
+
 def test_inputs_to_native_arrays(backend_fw):
     ivy.set_backend(backend_fw)
     ivy.inputs_to_native_arrays(_fn5)(ivy.array(1))
@@ -209,3 +345,35 @@ def test_views(array_to_update, backend_fw):
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
     ivy.previous_backend()
+
+
+def test_op_profiler(backend_fw, tmp_path):
+    import json
+    from ivy.utils.profiler import OpProfiler
+
+    ivy.set_backend(backend_fw)
+    x = ivy.array([[1.0, 2.0]])
+    # nothing is recorded while the profiler isn't active
+    profiler = OpProfiler(trace=True)
+    ivy.add(x, x)
+    assert profiler.stats() == {}
+    with profiler:
+        ivy.add(x, x)
+        ivy.add(x, 1.0)
+    stats = profiler.stats()["add"]
+    assert stats["calls"] == 2
+    assert stats["backend_calls"] == 2
+    assert 0 < stats["backend_time"] <= stats["wall_time"]
+    assert stats["inputs"] == {"float32[1, 2], float32[1, 2]": 1, "float32[1, 2]": 1}
+    assert profiler.to_container()["add"]["calls"] == 2
+    # the rows are sorted by wall time, so other functions called may come first
+    rows = {row.split()[0]: row.split() for row in profiler.table().splitlines()[1:]}
+    assert rows["add"][1] == "2"
+    assert len(profiler.table(limit=1).splitlines()) == 2
+    path = str(tmp_path / "trace.json")
+    profiler.export_chrome_trace(path)
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    assert {"add", "add (backend)"} <= {event["name"] for event in events}
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+    ivy.previous_backend()
@@ -48,3 +48,17 @@ def test_fn_array_spec(fn_n_spec, backend_fw):
     fn, spec = fn_n_spec
     assert ivy.fn_array_spec(fn) == spec
     ivy.previous_backend()
+
+
+def test_get_array_spec(backend_fw):
+    from ivy.utils.inspection import get_array_spec
+
+    ivy.set_backend(backend_fw)
+    fn = ivy.__dict__["matmul"]
+    # the spec of a function is only inspected when it is first requested
+    assert "array_spec" not in fn.__dict__
+    spec = get_array_spec(fn)
+    assert spec == ivy.fn_array_spec(fn)
+    assert fn.array_spec is spec
+    assert ivy.array([[1.0]]).matmul(ivy.array([[2.0]])) == ivy.array([[2.0]])
+    ivy.previous_backend()
@@ -264,6 +264,63 @@ def test_module_check_submod_rets(
         pass
 
 
+# frozen module
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    channels=st.integers(min_value=2, max_value=5),
+    module_cls=st.sampled_from(
+        [
+            TrainableModule,
+            TrainableModuleWithList,
+            TrainableModuleWithDict,
+            WithNestedModules,
+            "duplicate",
+            "sequential",
+        ]
+    ),
+)
+def test_module_freeze(batch_shape, channels, module_cls, on_device):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), channels),
+        "float32",
+    )
+    if module_cls == "duplicate":
+        module = TrainableModuleWithDuplicate(channels, False, device=on_device)
+    elif module_cls == "sequential":
+        module = ivy.Sequential(
+            ivy.Linear(channels, channels, device=on_device),
+            ivy.Sequential(
+                ivy.Linear(channels, channels, device=on_device),
+                ivy.GELU(),
+            ),
+            ivy.Linear(channels, channels, device=on_device),
+        )
+    else:
+        module = module_cls(channels, channels, device=on_device)
+    v = module.v.cont_map(lambda x_, kc: x_ * 2)
+    ret = ivy.to_numpy(module(x))
+    ret_with_v = ivy.to_numpy(module(x, v=v))
+
+    module.freeze()
+    assert module.frozen
+    assert np.allclose(ivy.to_numpy(module(x)), ret, atol=1e-6)
+    # variables given for the call only
+    assert np.allclose(ivy.to_numpy(module(x, v=v)), ret_with_v, atol=1e-6)
+    assert np.allclose(ivy.to_numpy(module(x)), ret, atol=1e-6)
+    # replaced variables
+    v_orig = module.v
+    module.v = v
+    assert np.allclose(ivy.to_numpy(module(x)), ret_with_v, atol=1e-6)
+    module.v = v_orig
+
+    module.unfreeze()
+    assert not module.frozen
+    assert np.allclose(ivy.to_numpy(module(x)), ret, atol=1e-6)
+    assert np.allclose(ivy.to_numpy(module(x, v=v)), ret_with_v, atol=1e-6)
+
+
 # module depth
 @given(
     batch_shape=helpers.get_shape(
@@ -373,6 +430,40 @@ def test_module_save_and_load_as_pickled(
     os.remove(save_filepath)
 
 
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+    format=st.sampled_from(["h5py", "mmap"]),
+)
+def test_module_save_and_load_weights(
+    batch_shape, input_channels, output_channels, format, on_device, tmp_path_factory
+):
+    # a new directory for each example, the session-scoped factory is used since
+    # hypothesis doesn't reset function-scoped fixtures between examples
+    save_dir = tmp_path_factory.mktemp("weights")
+    save_filepath = str(save_dir / ("module_weights." + format))
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = TrainableModule(input_channels, output_channels, device=on_device)
+    module.save_weights(save_filepath, format=format)
+    assert os.path.exists(save_filepath)
+
+    # a module with other initial weights
+    loaded_module = TrainableModule(input_channels, output_channels, device=on_device)
+    loaded_module.load_weights(save_filepath, format=format)
+
+    # value test
+    assert ivy.Container.all(loaded_module.v == module.v).cont_all_true()
+    assert np.allclose(ivy.to_numpy(loaded_module(x)), ivy.to_numpy(module(x)))
+
+    os.remove(save_filepath)
+
+
 @given(dummy=st.booleans())
 def test_module_to_device(dummy, on_device):
     model = TrainableModule(5, 5)
@@ -645,9 +736,6 @@ def test_module_track_submod_rets(
 )
 def test_module_training(batch_shape, input_channels, output_channels, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
         "float32",
@@ -696,9 +784,6 @@ def test_module_training(batch_shape, input_channels, output_channels, on_device
 )
 def test_module_training_with_duplicate(batch_shape, channels, same_layer, on_device):
     # smoke test
-    if ivy.current_backend_str() == "numpy":
-        # NumPy does not support gradients
-        return
     x = ivy.astype(
         ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), channels), "float32"
     )
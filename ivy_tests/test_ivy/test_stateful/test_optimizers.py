@@ -1,9 +1,12 @@
 """Collection of tests for Ivy optimizers."""
 
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -200,6 +203,55 @@ def test_lars_optimizer(
     )
 
 
+# foreach
+@pytest.mark.parametrize(
+    ("optimizer", "kwargs"),
+    [
+        (ivy.SGD, {}),
+        (ivy.LARS, {"decay_lambda": 0.1}),
+        (ivy.Adam, {}),
+        (ivy.LAMB, {}),
+        (ivy.LAMB, {"decay_lambda": 0.1}),
+    ],
+)
+def test_optimizer_foreach(optimizer, kwargs, on_device, backend_fw):
+    def _containers():
+        v = ivy.Container(
+            a=ivy.array([1.0, 2.0, -1.0], device=on_device),
+            b={
+                "c": ivy.array([[3.0, 0.5]], device=on_device),
+                "d": ivy.array([0.2], device=on_device),
+            },
+        )
+        grads = ivy.Container(
+            a=ivy.array([0.1, 0.2, 0.3], device=on_device),
+            b={
+                "c": ivy.array([[0.3, -0.4]], device=on_device),
+                "d": ivy.array([0.5], device=on_device),
+            },
+        )
+        return v, grads
+
+    ivy.set_backend(backend_fw)
+    try:
+        rets = []
+        for foreach in [False, True]:
+            v, grads = _containers()
+            opt = optimizer(lr=0.1, foreach=foreach, **kwargs)
+            for _ in range(3):
+                v = opt.step(v, grads)
+            rets.append(v)
+        ret, foreach_ret = rets
+        # the variables stay packed between the steps
+        assert foreach_ret.cont_packed_buffers is not None
+        for x, y in zip(
+            ret.cont_to_iterator_values(), foreach_ret.cont_to_iterator_values()
+        ):
+            assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y), atol=1e-6)
+    finally:
+        ivy.previous_backend()
+
+
 # sgd
 @handle_method(
     method_tree="SGD._step",
@@ -0,0 +1,105 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import timeit
+
+import ivy
+
+
+# functions exercised by default, along with the positional arguments they are
+# called with, built lazily so that the arrays are created with the set backend
+DEFAULT_CALLS = {
+    "add": lambda: (ivy.ones((4,)), ivy.ones((4,))),
+    "multiply": lambda: (ivy.ones((4,)), 2.0),
+    "sum": lambda: (ivy.ones((4, 4)),),
+    "mean": lambda: (ivy.ones((4, 4)),),
+    "relu": lambda: (ivy.ones((4,)),),
+    "matmul": lambda: (ivy.ones((4, 4)), ivy.ones((4, 4))),
+    "reshape": lambda: (ivy.ones((4, 4)), (16,)),
+    "concat": lambda: ([ivy.ones((4,)), ivy.ones((4,))],),
+    "exp": lambda: (ivy.ones((4,)),),
+}
+
+
+def _time_per_call(fn: Callable, args: Tuple, number: int, repeat: int) -> float:
+    timer = timeit.Timer(lambda: fn(*args))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def dispatch_overhead_benchmark(
+    backend: str = "numpy",
+    calls: Optional[Dict[str, Callable]] = None,
+    number: int = 2000,
+    repeat: int = 5,
+) -> List[Dict]:
+    """
+    Measure the per-call time of ivy functions with the stacked function wrappers
+    and with the fused dispatch wrapper.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    calls
+        Dictionary mapping function names in the ivy namespace to callables which
+        return the positional arguments for the call. (Default value = ``None``, in
+        which case ``DEFAULT_CALLS`` is used).
+    number
+        The number of calls timed in each repetition. (Default value = 2000).
+    repeat
+        The number of repetitions, the fastest of which is reported.
+        (Default value = 5).
+
+    Returns
+    -------
+    ret
+        A list with one dict per function, containing the per-call time in
+        microseconds for the native backend function, the stacked wrappers and the
+        fused wrapper.
+
+    Examples
+    --------
+    >>> from dispatch_overhead import dispatch_overhead_benchmark
+    >>> results = dispatch_overhead_benchmark("numpy", number=100, repeat=1)
+    """
+    calls = DEFAULT_CALLS if calls is None else calls
+    results = {name: {"function": name} for name in calls}
+    for fused in [False, True]:
+        ivy.set_fused_dispatch_mode(fused)
+        ivy.set_backend(backend)
+        backend_module = ivy.current_backend()
+        for name, get_args in calls.items():
+            args = get_args()
+            if not fused:
+                native_args = ivy.to_native(args, nested=True)
+                results[name]["native (us)"] = 1e6 * _time_per_call(
+                    backend_module.__dict__[name], native_args, number, repeat
+                )
+            key = "fused (us)" if fused else "stacked (us)"
+            results[name][key] = 1e6 * _time_per_call(
+                ivy.__dict__[name], args, number, repeat
+            )
+        ivy.previous_backend()
+        ivy.unset_fused_dispatch_mode()
+    for result in results.values():
+        result["speed up"] = result["stacked (us)"] / result["fused (us)"]
+    return list(results.values())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parsed = parser.parse_args()
+    rows = dispatch_overhead_benchmark(
+        parsed.backend, number=parsed.number, repeat=parsed.repeat
+    )
+    columns = list(rows[0].keys())
+    print("".join(f"{column:>16}" for column in columns))
+    for row in rows:
+        print(
+            "".join(
+                f"{v:>16.2f}" if isinstance(v, float) else f"{v:>16}"
+                for v in row.values()
+            )
+        )
@@ -0,0 +1,112 @@
+from typing import Dict, List, Sequence
+import argparse
+import importlib
+import time
+
+import numpy as np
+
+import ivy
+
+_NATIVE_MODULES = {
+    "numpy": "numpy",
+    "tensorflow": "tensorflow",
+    "torch": "torch",
+    "paddle": "paddle",
+    "jax": "jax.numpy",
+}
+
+_EQUATIONS = {
+    "chain": ("ij,jk,kl,lm->im", [(32, 64), (64, 64), (64, 64), (64, 8)]),
+    "attention": ("bhqd,bhkd,bhkv->bhqv", [(4, 8, 64, 32)] * 3),
+    "tensor network": (
+        "ea,fb,abcd,gc,hd->efgh",
+        [(8, 8), (8, 8), (8, 8, 8, 8), (8, 8), (8, 8)],
+    ),
+}
+
+
+def einsum_paths_benchmark(
+    backends: Sequence[str] = ("numpy", "tensorflow"),
+    equations: Sequence[str] = tuple(_EQUATIONS),
+    number: int = 5,
+) -> List[Dict]:
+    """
+    Measure the time of ``ivy.einsum``, contracted pairwise along the planned path,
+    against that of the native einsum of each backend. The former includes the
+    overhead of the ivy function wrapping.
+
+    Parameters
+    ----------
+    backends
+        The backends to benchmark with. (Default value = ("numpy", "tensorflow")).
+    equations
+        The names of the equations to benchmark, out of "chain", "attention" and
+        "tensor network". (Default value = all of them).
+    number
+        The number of timed calls. (Default value = 5).
+
+    Returns
+    -------
+    ret
+        A list with one dict per backend and equation, containing the call times in
+        milliseconds, and the largest difference between the two outputs.
+
+    Examples
+    --------
+    >>> from einsum_paths import einsum_paths_benchmark
+    >>> results = einsum_paths_benchmark(["numpy"], ["chain"], number=1)
+    """
+    rng = np.random.RandomState(0)
+    results = []
+    for backend in backends:
+        ivy.set_backend(backend)
+        native_einsum = importlib.import_module(_NATIVE_MODULES[backend]).einsum
+        for name in equations:
+            equation, shapes = _EQUATIONS[name]
+            operands = [
+                ivy.native_array(rng.normal(size=shape).astype("float32"))
+                for shape in shapes
+            ]
+            times = dict()
+            for mode, fn in (("ivy", ivy.einsum), ("native", native_einsum)):
+                fn(equation, *operands)
+                start = time.perf_counter()
+                for _ in range(number):
+                    ret = ivy.to_numpy(fn(equation, *operands))
+                times[mode] = (time.perf_counter() - start) / number
+                times[f"{mode} ret"] = ret
+            results.append(
+                {
+                    "backend": backend,
+                    "equation": name,
+                    "ivy (ms)": 1e3 * times["ivy"],
+                    "native (ms)": 1e3 * times["native"],
+                    "max diff": float(
+                        np.abs(times["ivy ret"] - times["native ret"]).max()
+                    ),
+                }
+            )
+        ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", default="numpy,tensorflow")
+    parser.add_argument("--equations", default=",".join(_EQUATIONS))
+    parser.add_argument("--number", type=int, default=5)
+    parsed = parser.parse_args()
+    rows = einsum_paths_benchmark(
+        parsed.backends.split(","),
+        parsed.equations.split(","),
+        number=parsed.number,
+    )
+    columns = list(rows[0].keys())
+    print("".join(f"{column:>16}" for column in columns))
+    for row in rows:
+        print(
+            "".join(
+                f"{v:>16.4g}" if isinstance(v, float) else f"{v:>16}"
+                for v in row.values()
+            )
+        )
@@ -0,0 +1,113 @@
+from typing import Dict, List, Sequence
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def frozen_module_benchmark(
+    backends: Sequence[str] = ("numpy", "tensorflow"),
+    depth: int = 32,
+    width: int = 16,
+    batch_size: int = 4,
+    number: int = 20,
+) -> List[Dict]:
+    """
+    Measure the time of calling a deep ``ivy.Sequential`` MLP, frozen and not, against
+    that of calling its ops directly, on each backend.
+
+    Parameters
+    ----------
+    backends
+        The backends to benchmark with. (Default value = ("numpy", "tensorflow")).
+    depth
+        The number of linear layers, each followed by a ReLU. (Default value = 32).
+    width
+        The number of features of each layer. (Default value = 16).
+    batch_size
+        The number of samples in the batch. (Default value = 4).
+    number
+        The number of timed calls. (Default value = 20).
+
+    Returns
+    -------
+    ret
+        A list with one dict per backend, containing the call times in milliseconds,
+        and the largest difference between the frozen and the unfrozen outputs.
+
+    Examples
+    --------
+    >>> from frozen_module import frozen_module_benchmark
+    >>> results = frozen_module_benchmark(["numpy"], depth=4, number=1)
+    """
+    x = np.random.RandomState(0).normal(size=(batch_size, width)).astype("float32")
+    results = []
+    for backend in backends:
+        ivy.set_backend(backend)
+        module = ivy.Sequential(
+            *[
+                layer
+                for _ in range(depth)
+                for layer in (ivy.Linear(width, width), ivy.ReLU())
+            ]
+        )
+        x_ = ivy.array(x)
+        weights = [(layer.v.w, layer.v.b) for layer in module._submodules[::2]]
+
+        def ops(y):
+            for w, b in weights:
+                y = ivy.relu(ivy.linear(y, w, bias=b))
+            return y
+
+        times = dict()
+        for mode, fn in (("unfrozen", module), ("frozen", module), ("ops", ops)):
+            if mode == "frozen":
+                module.freeze()
+            fn(x_)
+            start = time.perf_counter()
+            for _ in range(number):
+                ret = ivy.to_numpy(fn(x_))
+            times[mode] = (time.perf_counter() - start) / number
+            times[f"{mode} ret"] = ret
+        module.unfreeze()
+        results.append(
+            {
+                "backend": backend,
+                "unfrozen (ms)": 1e3 * times["unfrozen"],
+                "frozen (ms)": 1e3 * times["frozen"],
+                "ops (ms)": 1e3 * times["ops"],
+                "max diff": float(
+                    np.abs(times["frozen ret"] - times["unfrozen ret"]).max()
+                ),
+            }
+        )
+        ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", default="numpy,tensorflow")
+    parser.add_argument("--depth", type=int, default=32)
+    parser.add_argument("--width", type=int, default=16)
+    parser.add_argument("--batch_size", type=int, default=4)
+    parser.add_argument("--number", type=int, default=20)
+    parsed = parser.parse_args()
+    rows = frozen_module_benchmark(
+        parsed.backends.split(","),
+        depth=parsed.depth,
+        width=parsed.width,
+        batch_size=parsed.batch_size,
+        number=parsed.number,
+    )
+    columns = list(rows[0].keys())
+    print("".join(f"{column:>16}" for column in columns))
+    for row in rows:
+        print(
+            "".join(
+                f"{v:>16.4g}" if isinstance(v, float) else f"{v:>16}"
+                for v in row.values()
+            )
+        )
@@ -0,0 +1,103 @@
+from typing import Dict, List, Sequence
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _mlp_loss(v: ivy.Container, x, y):
+    for i in range(len(v) - 1):
+        x = ivy.relu(ivy.linear(x, v[f"layer_{i}"].w, bias=v[f"layer_{i}"].b))
+    x = ivy.linear(x, v[f"layer_{len(v) - 1}"].w, bias=v[f"layer_{len(v) - 1}"].b)
+    return ivy.mean(ivy.square(x - y))
+
+
+def mlp_gradients_benchmark(
+    backends: Sequence[str] = ("numpy", "tensorflow"),
+    batch_size: int = 32,
+    layer_sizes: Sequence[int] = (16, 64, 64, 1),
+    number: int = 20,
+) -> List[Dict]:
+    """
+    Measure the time of computing the loss and the gradients of a small MLP with
+    ``ivy.execute_with_gradients``, on each backend.
+
+    Parameters
+    ----------
+    backends
+        The backends to benchmark with. (Default value = ("numpy", "tensorflow")).
+    batch_size
+        The number of samples in the batch. (Default value = 32).
+    layer_sizes
+        The sizes of the input, hidden and output layers.
+        (Default value = (16, 64, 64, 1)).
+    number
+        The number of timed steps. (Default value = 20).
+
+    Returns
+    -------
+    ret
+        A list with one dict per backend, containing the step time in milliseconds,
+        and the largest difference of the gradients from those of the first backend.
+
+    Examples
+    --------
+    >>> from mlp_gradients import mlp_gradients_benchmark
+    >>> results = mlp_gradients_benchmark(["numpy"], number=1)
+    """
+    rng = np.random.RandomState(0)
+    weights = {
+        f"layer_{i}": {
+            "w": rng.normal(0, 0.1, (n_out, n_in)).astype("float32"),
+            "b": np.zeros((n_out,), "float32"),
+        }
+        for i, (n_in, n_out) in enumerate(zip(layer_sizes[:-1], layer_sizes[1:]))
+    }
+    x = rng.normal(size=(batch_size, layer_sizes[0])).astype("float32")
+    y = rng.normal(size=(batch_size, layer_sizes[-1])).astype("float32")
+    results, reference = [], None
+    for backend in backends:
+        ivy.set_backend(backend)
+        v = ivy.Container(weights).cont_map(lambda w, kc: ivy.array(w))
+        x_, y_ = ivy.array(x), ivy.array(y)
+        step = lambda: ivy.execute_with_gradients(lambda v: _mlp_loss(v, x_, y_), v)
+        _, grads = step()
+        start = time.perf_counter()
+        for _ in range(number):
+            step()
+        elapsed = (time.perf_counter() - start) / number
+        grads = {kc: ivy.to_numpy(g) for kc, g in grads.cont_to_iterator()}
+        if reference is None:
+            reference = grads
+        error = max(float(np.abs(g - reference[kc]).max()) for kc, g in grads.items())
+        results.append(
+            {"backend": backend, "step (ms)": 1e3 * elapsed, "max grad diff": error}
+        )
+        ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", default="numpy,tensorflow")
+    parser.add_argument("--batch_size", type=int, default=32)
+    parser.add_argument("--layer_sizes", default="16,64,64,1")
+    parser.add_argument("--number", type=int, default=20)
+    parsed = parser.parse_args()
+    rows = mlp_gradients_benchmark(
+        parsed.backends.split(","),
+        batch_size=parsed.batch_size,
+        layer_sizes=[int(n) for n in parsed.layer_sizes.split(",")],
+        number=parsed.number,
+    )
+    columns = list(rows[0].keys())
+    print("".join(f"{column:>16}" for column in columns))
+    for row in rows:
+        print(
+            "".join(
+                f"{v:>16.4g}" if isinstance(v, float) else f"{v:>16}"
+                for v in row.values()
+            )
+        )
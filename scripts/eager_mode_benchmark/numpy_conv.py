@@ -0,0 +1,152 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from ivy.functional.backends.numpy.layers import conv2d
+
+
+# ResNet-50 convolutions as (name, input spatial size, kernel size, stride,
+# input channels, output channels)
+RESNET_CONVS = [
+    ("conv1", 224, 7, 2, 3, 64),
+    ("conv2_x 1x1", 56, 1, 1, 64, 64),
+    ("conv2_x 3x3", 56, 3, 1, 64, 64),
+    ("conv3_x 3x3", 28, 3, 1, 128, 128),
+    ("conv4_x 3x3", 14, 3, 1, 256, 256),
+    ("conv5_x 3x3", 7, 3, 1, 512, 512),
+    ("conv5_x 1x1", 7, 1, 1, 2048, 512),
+]
+
+
+def _tile_conv2d(x, filters, strides, padding):
+    # the tile and sum implementation the numpy backend used before its
+    # convolutions were contracted with matrix multiplications
+    pad = [
+        (
+            max(filters.shape[i] - strides, 0)
+            if padding == "SAME" and x.shape[i + 1] % strides == 0
+            else (
+                max(filters.shape[i] - x.shape[i + 1] % strides, 0)
+                if padding == "SAME"
+                else 0
+            )
+        )
+        for i in range(2)
+    ]
+    x = np.pad(x, [(0, 0), *[(p // 2, p - p // 2) for p in pad], (0, 0)])
+    kh, kw, input_dim, output_dim = filters.shape
+    new_h = (x.shape[1] - kh) // strides + 1
+    new_w = (x.shape[2] - kw) // strides + 1
+    sub_matrices = np.lib.stride_tricks.as_strided(
+        x,
+        [x.shape[0], new_h, new_w, kh, kw, x.shape[-1]],
+        (
+            x.strides[0],
+            x.strides[1] * strides,
+            x.strides[2] * strides,
+            *x.strides[1:],
+        ),
+        writeable=False,
+    )
+    sub_matrices_w_output_dim = np.tile(
+        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
+    )
+    mult = sub_matrices_w_output_dim * filters.reshape(
+        [1] * 3 + [kh, kw, input_dim, output_dim]
+    )
+    return np.sum(mult, (3, 4, 5))
+
+
+def _measure(fn: Callable, args: Tuple, repeat: int) -> Tuple[float, float]:
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return min(times), peak / 2**20
+
+
+def numpy_conv_benchmark(
+    batch_size: int = 1,
+    convs: Optional[List[Tuple]] = None,
+    repeat: int = 3,
+    dtype: str = "float32",
+) -> List[Dict]:
+    """
+    Compare the peak memory and throughput of the numpy backend's conv2d with the
+    previous tile and sum implementation.
+
+    Parameters
+    ----------
+    batch_size
+        The batch size of the inputs. (Default value = 1).
+    convs
+        The convolutions to benchmark, as tuples of name, input spatial size,
+        kernel size, stride, input channels and output channels.
+        (Default value = ``None``, in which case ``RESNET_CONVS`` is used).
+    repeat
+        The number of timed calls, the fastest of which is reported.
+        (Default value = 3).
+    dtype
+        The dtype of the inputs and filters. (Default value = "float32").
+
+    Returns
+    -------
+    ret
+        A list with one dict per convolution, containing the peak memory in MiB
+        allocated during a call and the throughput in images per second of both
+        implementations.
+
+    Examples
+    --------
+    >>> from numpy_conv import numpy_conv_benchmark
+    >>> results = numpy_conv_benchmark(convs=[("small", 8, 3, 1, 4, 4)], repeat=1)
+    """
+    convs = RESNET_CONVS if convs is None else convs
+    rng = np.random.default_rng(0)
+    results = []
+    for name, size, kernel, stride, input_dim, output_dim in convs:
+        x = rng.standard_normal((batch_size, size, size, input_dim)).astype(dtype)
+        filters = rng.standard_normal((kernel, kernel, input_dim, output_dim))
+        filters = filters.astype(dtype)
+        assert np.allclose(
+            _tile_conv2d(x, filters, stride, "SAME"),
+            conv2d(x, filters, stride, "SAME"),
+            rtol=1e-3,
+            atol=1e-3,
+        )
+        result = {"conv": name}
+        for label, fn in [("tile", _tile_conv2d), ("gemm", conv2d)]:
+            seconds, peak = _measure(fn, (x, filters, stride, "SAME"), repeat)
+            result[f"{label} peak (MiB)"] = peak
+            result[f"{label} (img/s)"] = batch_size / seconds
+        result["speed up"] = result["gemm (img/s)"] / result["tile (img/s)"]
+        results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch_size", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--dtype", default="float32")
+    parsed = parser.parse_args()
+    rows = numpy_conv_benchmark(
+        parsed.batch_size, repeat=parsed.repeat, dtype=parsed.dtype
+    )
+    columns = list(rows[0].keys())
+    print("".join(f"{column:>18}" for column in columns))
+    for row in rows:
+        print(
+            "".join(
+                f"{v:>18.2f}" if isinstance(v, float) else f"{v:>18}"
+                for v in row.values()
+            )
+        )
@@ -0,0 +1,318 @@
+from typing import Dict, List, Optional
+import argparse
+import importlib
+import inspect
+import json
+import pkgutil
+import subprocess
+
+import numpy as np
+from hypothesis import given, settings, HealthCheck, Phase
+
+import ivy
+import ivy_tests.test_ivy.helpers as helpers
+import ivy_tests.test_ivy.helpers.globals as test_globals
+from ivy_tests.test_ivy.helpers.available_frameworks import _available_frameworks
+from ivy_tests.test_ivy.helpers.function_testing import (
+    kwargs_to_args_n_kwargs,
+    test_function,
+)
+from dispatch_overhead import _time_per_call
+
+
+# packages whose test modules hold the strategies of ivy.functional.ivy functions
+TEST_PACKAGES = [
+    "ivy_tests.test_ivy.test_functional.test_core",
+    "ivy_tests.test_ivy.test_functional.test_nn",
+    "ivy_tests.test_ivy.test_functional.test_experimental.test_core",
+    "ivy_tests.test_ivy.test_functional.test_experimental.test_nn",
+]
+
+# keyword arguments of helpers.test_function which aren't passed to the function
+_TEST_FUNCTION_KWARGS = {
+    name
+    for name, param in inspect.signature(test_function).parameters.items()
+    if param.kind == param.KEYWORD_ONLY
+}
+
+
+def public_functions() -> List[str]:
+    """Return the names of the public functions defined in ivy.functional.ivy."""
+    return sorted(
+        name
+        for name, fn in ivy.functional.ivy.__dict__.items()
+        if not name.startswith("_")
+        and inspect.isfunction(fn)
+        and fn.__module__.startswith("ivy.functional.ivy")
+    )
+
+
+def _function_tests(fn_names):
+    tests = {}
+    for package_name in TEST_PACKAGES:
+        try:
+            package = importlib.import_module(package_name)
+        except ImportError:
+            continue
+        for module_info in pkgutil.iter_modules(package.__path__):
+            try:
+                module = importlib.import_module(f"{package_name}.{module_info.name}")
+            except Exception:
+                continue
+            for test in module.__dict__.values():
+                test_data = getattr(test, "test_data", None)
+                if test_data is None or not hasattr(test, "hypothesis"):
+                    continue
+                if test_data.fn_name in fn_names and test_data.fn_tree in (
+                    f"ivy.functional.ivy.{test_data.fn_name}",
+                    f"ivy.functional.ivy.experimental.{test_data.fn_name}",
+                ):
+                    tests.setdefault(test_data.fn_name, test)
+    return tests
+
+
+def _num_elements(x):
+    if isinstance(x, np.ndarray):
+        return x.size
+    if isinstance(x, (list, tuple)):
+        return sum(_num_elements(x_) for x_ in x)
+    if isinstance(x, dict):
+        return sum(_num_elements(x_) for x_ in x.values())
+    return 0
+
+
+def _draw_inputs(test, backend, device, max_examples):
+    # runs the hypothesis test with helpers.test_function replaced by a function
+    # recording its arguments, the backend being benchmarked is also used as the
+    # ground truth backend so that the drawn dtypes are valid for it
+    captured = []
+    hypothesis = test.hypothesis
+    fixtures = {"backend_fw": backend, "on_device": device}
+    params = inspect.signature(hypothesis.inner_test).parameters
+    if any(
+        name not in hypothesis._given_kwargs and name not in fixtures for name in params
+    ):
+        return []
+    hypothesis_test = settings(
+        max_examples=max_examples,
+        database=None,
+        deadline=None,
+        phases=[Phase.generate],
+        suppress_health_check=list(HealthCheck),
+    )(given(**hypothesis._given_kwargs)(hypothesis.inner_test))
+    original_test_function = helpers.test_function
+    helpers.test_function = lambda **kwargs: captured.append(kwargs)
+    test_globals.setup_api_test(backend, backend, device, test.test_data)
+    try:
+        hypothesis_test(**{k: v for k, v in fixtures.items() if k in params})
+    except Exception:
+        pass
+    finally:
+        test_globals.teardown_api_test()
+        helpers.test_function = original_test_function
+    inputs = []
+    for kwargs in captured:
+        all_as_kwargs_np = {
+            k: v for k, v in kwargs.items() if k not in _TEST_FUNCTION_KWARGS
+        }
+        args, kwargs_np = kwargs_to_args_n_kwargs(
+            num_positional_args=kwargs["test_flags"].num_positional_args,
+            kwargs=all_as_kwargs_np,
+        )
+        inputs.append((args, kwargs_np))
+    return inputs
+
+
+def _to_arrays(x, to_array):
+    if isinstance(x, np.ndarray):
+        return to_array(x)
+    if isinstance(x, (list, tuple)):
+        return type(x)(_to_arrays(x_, to_array) for x_ in x)
+    if isinstance(x, dict):
+        return {k: _to_arrays(v, to_array) for k, v in x.items()}
+    return x
+
+
+def op_benchmark(
+    backends: Optional[List[str]] = None,
+    fn_names: Optional[List[str]] = None,
+    device: str = "cpu",
+    max_examples: int = 10,
+    number: int = 100,
+    repeat: int = 3,
+) -> Dict:
+    """
+    Measure the wrapper overhead, native time and total time of the public
+    functions of ivy.functional.ivy for each backend.
+
+    The inputs of each function are drawn from the hypothesis strategies of its
+    test, the example with the most array elements out of ``max_examples`` being
+    benchmarked. The native time is the time of the backend function called with
+    native arrays, the total time that of the ivy function called with ivy arrays,
+    and the wrapper overhead the difference between the two.
+
+    Parameters
+    ----------
+    backends
+        The backends to benchmark. (Default value = ``None``, in which case all the
+        installed backends are benchmarked).
+    fn_names
+        The functions to benchmark. (Default value = ``None``, in which case all the
+        public functions of ivy.functional.ivy are benchmarked).
+    device
+        The device to benchmark on. (Default value = "cpu").
+    max_examples
+        The number of examples drawn from the strategies of each test.
+        (Default value = 10).
+    number
+        The number of calls timed in each repetition. (Default value = 100).
+    repeat
+        The number of repetitions, the fastest of which is reported.
+        (Default value = 3).
+
+    Returns
+    -------
+    ret
+        A dict mapping each backend to a dict mapping each function to its times in
+        microseconds, or to the reason it couldn't be benchmarked.
+
+    Examples
+    --------
+    >>> from op_benchmark import op_benchmark
+    >>> results = op_benchmark(["numpy"], ["abs", "add"], number=10, repeat=1)
+    """
+    backends = _available_frameworks() if backends is None else backends
+    fn_names = public_functions() if fn_names is None else fn_names
+    tests = _function_tests(set(fn_names))
+    results = {}
+    for backend in backends:
+        results[backend] = backend_results = {}
+        for fn_name in fn_names:
+            if fn_name not in tests:
+                backend_results[fn_name] = {"skipped": "no test strategy"}
+                continue
+            inputs = _draw_inputs(tests[fn_name], backend, device, max_examples)
+            if not inputs:
+                backend_results[fn_name] = {"skipped": "no input drawn"}
+                continue
+            args, kwargs = max(inputs, key=_num_elements)
+            ivy.set_backend(backend)
+            try:
+                ivy_args, ivy_kwargs = _to_arrays((args, kwargs), ivy.array)
+                native_args, native_kwargs = _to_arrays(
+                    (args, kwargs), ivy.native_array
+                )
+                result = {
+                    "total (us)": 1e6 * _time_per_call(
+                        lambda *a: ivy.__dict__[fn_name](*a, **ivy_kwargs),
+                        ivy_args,
+                        number,
+                        repeat,
+                    )
+                }
+                native_fn = ivy.current_backend().__dict__.get(fn_name)
+                if native_fn is not None:
+                    result["native (us)"] = 1e6 * _time_per_call(
+                        lambda *a: native_fn(*a, **native_kwargs),
+                        native_args,
+                        number,
+                        repeat,
+                    )
+                    result["wrapper (us)"] = (
+                        result["total (us)"] - result["native (us)"]
+                    )
+                backend_results[fn_name] = result
+            except Exception as e:
+                backend_results[fn_name] = {"skipped": f"{type(e).__name__}: {e}"}
+            finally:
+                ivy.previous_backend()
+    return results
+
+
+def compare(base: Dict, new: Dict, threshold: float = 1.2) -> List[Dict]:
+    """
+    Compare two benchmark results and list the regressions.
+
+    Parameters
+    ----------
+    base
+        The results benchmarked at the base commit.
+    new
+        The results benchmarked at the new commit.
+    threshold
+        The ratio of the new time to the base time above which a time is considered
+        to have regressed. (Default value = 1.2).
+
+    Returns
+    -------
+    ret
+        A list with one dict per regressed time, containing the backend, the
+        function, the measurement and both times.
+    """
+    regressions = []
+    for backend, fn_results in new["results"].items():
+        base_results = base["results"].get(backend, {})
+        for fn_name, result in fn_results.items():
+            for key in ("wrapper (us)", "native (us)", "total (us)"):
+                base_time = base_results.get(fn_name, {}).get(key)
+                new_time = result.get(key)
+                if base_time is None or new_time is None or base_time <= 0:
+                    continue
+                if new_time / base_time > threshold:
+                    regressions.append(
+                        {
+                            "backend": backend,
+                            "function": fn_name,
+                            "time": key,
+                            "base": base_time,
+                            "new": new_time,
+                        }
+                    )
+    return regressions
+
+
+def _commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="*", default=None)
+    parser.add_argument("--functions", nargs="*", default=None)
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--max_examples", type=int, default=10)
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="./op_benchmark.json")
+    parser.add_argument(
+        "--compare", default=None, help="results of a base commit to compare with"
+    )
+    parser.add_argument("--threshold", type=float, default=1.2)
+    parsed = parser.parse_args()
+    report = {
+        "commit": _commit(),
+        "device": parsed.device,
+        "results": op_benchmark(
+            parsed.backends,
+            parsed.functions,
+            device=parsed.device,
+            max_examples=parsed.max_examples,
+            number=parsed.number,
+            repeat=parsed.repeat,
+        ),
+    }
+    with open(parsed.output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    if parsed.compare is not None:
+        with open(parsed.compare) as f:
+            base_report = json.load(f)
+        for row in compare(base_report, report, parsed.threshold):
+            print(
+                f"{row['backend']:>12}{row['function']:>32}{row['time']:>16}"
+                f"{row['base']:>12.2f}{row['new']:>12.2f}"
+            )
@@ -0,0 +1,108 @@
+from typing import Dict, List, Optional, Tuple
+import argparse
+import time
+
+import ivy
+
+
+# optimizers exercised by default, along with their keyword arguments
+DEFAULT_OPTIMIZERS = {
+    "SGD": (ivy.SGD, {}),
+    "LARS": (ivy.LARS, {}),
+    "Adam": (ivy.Adam, {}),
+    "LAMB": (ivy.LAMB, {}),
+}
+
+
+def _time_per_step(
+    optimizer, v: ivy.Container, grads: ivy.Container, number: int
+) -> float:
+    # the first step initializes the state of the optimizer, and packs the variables
+    # in foreach mode, so it isn't timed
+    v = optimizer.step(v, grads)
+    start = time.perf_counter()
+    for _ in range(number):
+        v = optimizer.step(v, grads)
+    return (time.perf_counter() - start) / number
+
+
+def optimizer_step_benchmark(
+    backend: str = "numpy",
+    num_leaves: int = 200,
+    leaf_shape: Tuple = (8,),
+    optimizers: Optional[Dict[str, Tuple]] = None,
+    number: int = 5,
+) -> List[Dict]:
+    """
+    Measure the step time of optimizers updating many small variables, both one
+    variable at a time and in foreach mode.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    num_leaves
+        The number of variables. (Default value = 200).
+    leaf_shape
+        The shape of each variable. (Default value = (8,)).
+    optimizers
+        Dictionary mapping names to optimizer classes and their keyword arguments.
+        (Default value = ``None``, in which case ``DEFAULT_OPTIMIZERS`` is used).
+    number
+        The number of timed steps. (Default value = 5).
+
+    Returns
+    -------
+    ret
+        A list with one dict per optimizer, containing the step time in milliseconds
+        with and without foreach mode.
+
+    Examples
+    --------
+    >>> from optimizer_step import optimizer_step_benchmark
+    >>> results = optimizer_step_benchmark("numpy", num_leaves=10, number=1)
+    """
+    optimizers = DEFAULT_OPTIMIZERS if optimizers is None else optimizers
+    ivy.set_backend(backend)
+    v = ivy.Container(
+        {f"layer_{i}": ivy.random_uniform(shape=leaf_shape) for i in range(num_leaves)}
+    )
+    grads = v.cont_map(lambda x, kc: ivy.random_uniform(shape=x.shape))
+    results = []
+    for name, (optimizer, kwargs) in optimizers.items():
+        per_leaf = _time_per_step(optimizer(**kwargs), v, grads, number)
+        foreach = _time_per_step(optimizer(foreach=True, **kwargs), v, grads, number)
+        results.append(
+            {
+                "optimizer": name,
+                "per leaf (ms)": 1e3 * per_leaf,
+                "foreach (ms)": 1e3 * foreach,
+                "speed up": per_leaf / foreach,
+            }
+        )
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--num_leaves", type=int, default=200)
+    parser.add_argument("--leaf_size", type=int, default=8)
+    parser.add_argument("--number", type=int, default=5)
+    parsed = parser.parse_args()
+    rows = optimizer_step_benchmark(
+        parsed.backend,
+        num_leaves=parsed.num_leaves,
+        leaf_shape=(parsed.leaf_size,),
+        number=parsed.number,
+    )
+    columns = list(rows[0].keys())
+    print("".join(f"{column:>16}" for column in columns))
+    for row in rows:
+        print(
+            "".join(
+                f"{v:>16.2f}" if isinstance(v, float) else f"{v:>16}"
+                for v in row.values()
+            )
+        )
@@ -0,0 +1,116 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import timeit
+
+import ivy
+
+
+# updates exercised by default, each called with the weights and the gradients
+DEFAULT_UPDATES = {
+    "scale": lambda ws, dcdws: ws * 0.5,
+    "add": lambda ws, dcdws: ivy.add(ws, dcdws),
+    "sgd": lambda ws, dcdws: ivy.gradient_descent_update(ws, dcdws, 0.1),
+    "adam": lambda ws, dcdws: ivy.adam_update(ws, dcdws, 0.1, dcdws, dcdws**2, 1),
+}
+
+
+def _containers(num_leaves: int, leaf_shape: Tuple) -> Tuple:
+    ws = ivy.Container(
+        {f"layer_{i}": ivy.random_uniform(shape=leaf_shape) for i in range(num_leaves)}
+    )
+    dcdws = ivy.Container(
+        {f"layer_{i}": ivy.random_uniform(shape=leaf_shape) for i in range(num_leaves)}
+    )
+    return ws, dcdws
+
+
+def _time_per_call(fn: Callable, args: Tuple, number: int, repeat: int) -> float:
+    timer = timeit.Timer(lambda: fn(*args))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def packed_container_benchmark(
+    backend: str = "numpy",
+    num_leaves: int = 200,
+    leaf_shape: Tuple = (8,),
+    updates: Optional[Dict[str, Callable]] = None,
+    number: int = 5,
+    repeat: int = 3,
+) -> List[Dict]:
+    """
+    Measure the time of updates applied to containers with many small leaves, both
+    leaf by leaf and on the packed buffers of the containers.
+
+    Parameters
+    ----------
+    backend
+        The backend to benchmark with. (Default value = "numpy").
+    num_leaves
+        The number of leaves of the weights and gradients. (Default value = 200).
+    leaf_shape
+        The shape of each leaf. (Default value = (8,)).
+    updates
+        Dictionary mapping update names to callables which take the weights and the
+        gradients. (Default value = ``None``, in which case ``DEFAULT_UPDATES`` is
+        used).
+    number
+        The number of calls timed in each repetition. (Default value = 5).
+    repeat
+        The number of repetitions, the fastest of which is reported.
+        (Default value = 3).
+
+    Returns
+    -------
+    ret
+        A list with one dict per update, containing the per-call time in
+        milliseconds for the unpacked and the packed containers.
+
+    Examples
+    --------
+    >>> from packed_container import packed_container_benchmark
+    >>> results = packed_container_benchmark("numpy", num_leaves=10, number=1)
+    """
+    updates = DEFAULT_UPDATES if updates is None else updates
+    ivy.set_backend(backend)
+    ws, dcdws = _containers(num_leaves, leaf_shape)
+    packed_ws, packed_dcdws = ws.cont_pack(), dcdws.cont_pack()
+    results = []
+    for name, update in updates.items():
+        unpacked = _time_per_call(update, (ws, dcdws), number, repeat)
+        packed = _time_per_call(update, (packed_ws, packed_dcdws), number, repeat)
+        results.append(
+            {
+                "update": name,
+                "unpacked (ms)": 1e3 * unpacked,
+                "packed (ms)": 1e3 * packed,
+                "speed up": unpacked / packed,
+            }
+        )
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--num_leaves", type=int, default=200)
+    parser.add_argument("--leaf_size", type=int, default=8)
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    parsed = parser.parse_args()
+    rows = packed_container_benchmark(
+        parsed.backend,
+        num_leaves=parsed.num_leaves,
+        leaf_shape=(parsed.leaf_size,),
+        number=parsed.number,
+        repeat=parsed.repeat,
+    )
+    columns = list(rows[0].keys())
+    print("".join(f"{column:>16}" for column in columns))
+    for row in rows:
+        print(
+            "".join(
+                f"{v:>16.2f}" if isinstance(v, float) else f"{v:>16}"
+                for v in row.values()
+            )
+        )
@@ -0,0 +1,146 @@
+from typing import Dict, List, Optional
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+# run in a fresh interpreter, prints the peak resident memory in KiB
+_IMPORT_SCRIPT = (
+    "import resource{imports}; "
+    "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+)
+
+
+def _run(modules: List[str], env: Dict) -> Dict:
+    imports = "".join(f", {module}" for module in modules)
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT.format(imports=imports)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    seconds = time.perf_counter() - start
+    return {"seconds": seconds, "peak (MiB)": int(output.split()[-1]) / 1024}
+
+
+def _slowest_imports(module: str, env: Dict, limit: int) -> List[Dict]:
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split("|")
+        rows.append(
+            {
+                "module": name.strip(),
+                "self (ms)": int(self_us.split(":")[1]) / 1e3,
+                "cumulative (ms)": int(cumulative_us) / 1e3,
+            }
+        )
+    return sorted(rows, key=lambda row: -row["self (ms)"])[:limit]
+
+
+def startup_benchmark(
+    module: str = "ivy",
+    repeat: int = 10,
+    warmup: int = 1,
+    env: Optional[Dict] = None,
+    num_slowest: int = 10,
+) -> Dict:
+    """
+    Measure the time and peak memory of importing a module in a fresh interpreter.
+
+    Each import runs in a new process, so that nothing is cached in memory, after
+    ``warmup`` imports which populate the bytecode cache. The time and memory of an
+    interpreter importing nothing are measured the same way and subtracted.
+
+    Parameters
+    ----------
+    module
+        The module to import. (Default value = "ivy").
+    repeat
+        The number of timed imports. (Default value = 10).
+    warmup
+        The number of untimed imports before the timed ones. (Default value = 1).
+    env
+        The environment variables of the interpreters. (Default value = ``None``, in
+        which case those of the current process are used).
+    num_slowest
+        The number of modules with the highest self import time to report.
+        (Default value = 10).
+
+    Returns
+    -------
+    ret
+        A dict with the best and median import times in milliseconds, the peak
+        memory in MiB, and the modules with the highest self import time.
+
+    Examples
+    --------
+    >>> from startup import startup_benchmark
+    >>> result = startup_benchmark(repeat=2, num_slowest=3)
+    """
+    env = dict(os.environ if env is None else env)
+    for _ in range(warmup):
+        _run([module], env)
+    baseline = [_run([], env) for _ in range(repeat)]
+    runs = [_run([module], env) for _ in range(repeat)]
+    base_seconds = min(run["seconds"] for run in baseline)
+    base_peak = min(run["peak (MiB)"] for run in baseline)
+    times = [(run["seconds"] - base_seconds) * 1e3 for run in runs]
+    return {
+        "module": module,
+        "best (ms)": min(times),
+        "median (ms)": statistics.median(times),
+        "peak (MiB)": max(run["peak (MiB)"] for run in runs) - base_peak,
+        "slowest imports": _slowest_imports(module, env, num_slowest),
+    }
+
+
+def _commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="ivy")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--num_slowest", type=int, default=10)
+    parser.add_argument("--output", default=None)
+    parsed = parser.parse_args()
+    result = startup_benchmark(
+        parsed.module,
+        repeat=parsed.repeat,
+        warmup=parsed.warmup,
+        num_slowest=parsed.num_slowest,
+    )
+    print(
+        f"import {result['module']}: best {result['best (ms)']:.1f} ms, median "
+        f"{result['median (ms)']:.1f} ms, peak memory {result['peak (MiB)']:.1f} MiB"
+    )
+    for row in result["slowest imports"]:
+        print(
+            f"{row['module']:>48}{row['self (ms)']:>12.2f}"
+            f"{row['cumulative (ms)']:>12.2f}"
+        )
+    if parsed.output is not None:
+        with open(parsed.output, "w") as f:
+            json.dump({"commit": _commit(), **result}, f, indent=2)
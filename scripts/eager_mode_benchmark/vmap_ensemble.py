@@ -0,0 +1,109 @@
+from typing import Dict, List, Sequence
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _mlp(w1, b1, w2, x):
+    return ivy.mean(ivy.linear(ivy.relu(ivy.linear(x, w1, bias=b1)), w2))
+
+
+def vmap_ensemble_benchmark(
+    backends: Sequence[str] = ("numpy", "tensorflow"),
+    ensemble_size: int = 1000,
+    batch_size: int = 32,
+    layer_sizes: Sequence[int] = (16, 64),
+    number: int = 5,
+) -> List[Dict]:
+    """
+    Measure the time of evaluating an ensemble of small MLPs on a shared batch with
+    ``ivy.vmap``, batched and looped over the ensemble members, on each backend.
+
+    Parameters
+    ----------
+    backends
+        The backends to benchmark with. (Default value = ("numpy", "tensorflow")).
+    ensemble_size
+        The number of MLPs in the ensemble. (Default value = 1000).
+    batch_size
+        The number of samples in the batch. (Default value = 32).
+    layer_sizes
+        The sizes of the input and hidden layers. (Default value = (16, 64)).
+    number
+        The number of timed calls. (Default value = 5).
+
+    Returns
+    -------
+    ret
+        A list with one dict per backend, containing the call times in milliseconds,
+        and the largest difference between the batched and the looped outputs.
+
+    Examples
+    --------
+    >>> from vmap_ensemble import vmap_ensemble_benchmark
+    >>> results = vmap_ensemble_benchmark(["numpy"], ensemble_size=10, number=1)
+    """
+    rng = np.random.RandomState(0)
+    n_in, n_hidden = layer_sizes
+    weights = (
+        rng.normal(0, 0.1, (ensemble_size, n_hidden, n_in)).astype("float32"),
+        np.zeros((ensemble_size, n_hidden), "float32"),
+        rng.normal(0, 0.1, (ensemble_size, 1, n_hidden)).astype("float32"),
+    )
+    x = rng.normal(size=(batch_size, n_in)).astype("float32")
+    results = []
+    for backend in backends:
+        ivy.set_backend(backend)
+        args = [ivy.native_array(w) for w in weights] + [ivy.native_array(x)]
+        times = dict()
+        for mode in ("batched", "looped"):
+            vmapped = ivy.vmap(
+                _mlp, in_axes=(0, 0, 0, None), batch_ops=mode == "batched"
+            )
+            vmapped(*args)
+            start = time.perf_counter()
+            for _ in range(number):
+                ret = ivy.to_numpy(vmapped(*args))
+            times[mode] = (time.perf_counter() - start) / number
+            times[f"{mode} ret"] = ret
+        results.append(
+            {
+                "backend": backend,
+                "batched (ms)": 1e3 * times["batched"],
+                "looped (ms)": 1e3 * times["looped"],
+                "max diff": float(
+                    np.abs(times["batched ret"] - times["looped ret"]).max()
+                ),
+            }
+        )
+        ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", default="numpy,tensorflow")
+    parser.add_argument("--ensemble_size", type=int, default=1000)
+    parser.add_argument("--batch_size", type=int, default=32)
+    parser.add_argument("--layer_sizes", default="16,64")
+    parser.add_argument("--number", type=int, default=5)
+    parsed = parser.parse_args()
+    rows = vmap_ensemble_benchmark(
+        parsed.backends.split(","),
+        ensemble_size=parsed.ensemble_size,
+        batch_size=parsed.batch_size,
+        layer_sizes=[int(n) for n in parsed.layer_sizes.split(",")],
+        number=parsed.number,
+    )
+    columns = list(rows[0].keys())
+    print("".join(f"{column:>16}" for column in columns))
+    for row in rows:
+        print(
+            "".join(
+                f"{v:>16.4g}" if isinstance(v, float) else f"{v:>16}"
+                for v in row.values()
+            )
+        )